@@ -1,250 +0,0 @@
--- Clear existing data
-DELETE FROM maintenance_records;
-DELETE FROM failure_records;
-DELETE FROM cranes;
-
--- Insert all cranes
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, grade, drive_type, unmanned_operation, is_urgent) VALUES
-('4P1000927', '정정-1 Yard(CT09)', '3연주공장', '정상', '정정-1 Yard(CT09)', 'Tong', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1000928', '정정-1 Yard(CT10)', '3연주공장', '정상', '정정-1 Yard(CT10)', 'Tong', 'B', '운전실/자동운전', '무인', false),
-('4P1001010', 'Slab Yard(CT11)', '1열연공장', '정상', 'Slab Yard(CT11)', 'Tong', 'A', '운전실/리모트/자동운전', '무인', false),
-('4P1029403', 'Slab Yard(CT12)', '1열연공장', '정상', 'Slab Yard(CT12)', 'Tong', 'A', '운전실/리모트/자동운전', '무인', false),
-('4P1001021', '1열연제품(CT23)', '제품출하섹션', '정상', '1열연제품(CT23)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1000919', 'Slab Yard(CT31)', '1열연공장', '정상', 'Slab Yard(CT31)', 'Tong', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001026', '정정(CT31)', '1열연공장', '정상', '정정(CT31)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001024', '1열연제품(CT32)', '제품출하섹션', '정상', '1열연제품(CT32)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1000929', 'Slab Yard(CT32)', '1열연공장', '정상', 'Slab Yard(CT32)', 'Tong', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001027', '정정 Yard(CT41)', '1열연공장', '정상', '정정 Yard(CT41)', 'Coil Lifter', 'B', '운전실', '무인', false),
-('4P1001025', '1열연제품(CT42)', '제품출하섹션', '정상', '1열연제품(CT42)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1000917', '정정-1 Yard(M01)', '3연주공장', '정상', '정정-1 Yard(M01)', 'Magnet', 'B', '리모트/운전실', '유인', false),
-('4P1000925', '정정-1 Yard(M02)', '3연주공장', '정상', '정정-1 Yard(M02)', 'Magnet', 'B', '리모트/운전실', '유인', false),
-('4P1001012', 'Mill Line 구.(ML01)', '1열연공장', '정상', 'Mill Line 구.(ML01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001014', 'Mill Line #2(ML02)', '1열연공장', '정상', 'Mill Line #2(ML02)', 'Hyd` Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001013', 'Mill Line #3(ML03)', '1열연공장', '정상', 'Mill Line #3(ML03)', 'Hyd` Tong', 'B', '운전실', '유인', false),
-('4P1001020', 'Mill Line #4(ML04)', '1열연공장', '정상', 'Mill Line #4(ML04)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001015', 'Mill Line #5(ML05)', '1열연공장', '정상', 'Mill Line #5(ML05)', 'Single Hook', 'B', '리모트', '유인', false),
-('4P1001023', '정정 Yard(CT21)', '1열연공장', '정상', '정정 Yard(CT21)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001047', 'Roll 정비장 #1(RS01)', '1열연공장', '정상', 'Roll 정비장 #1(RS01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001049', 'Roll정비장 #2(RS02)', '1열연공장', '정상', 'Roll정비장 #2(RS02)', 'Hyd` Tong', 'A', '리모트/운전실', '유인', false),
-('4P1001048', 'Roll 정비장 #3(RS03)', '1열연공장', '정상', 'Roll 정비장 #3(RS03)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1000915', 'Slab Yard(CT21)', '1열연공장', '정상', 'Slab Yard(CT21)', 'Tong', 'A', '운전실/리모트/자동운전', '무인', false),
-('4P1001022', '정정 Yard 2동 (CT22)', '1열연공장', '정상', '정정 Yard 2동 (CT22)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1000916', 'Slab Yard(CT22)', '1열연공장', '정상', 'Slab Yard(CT22)', 'Tong', 'A', '운전실/리모트/자동운전', '무인', false),
-('4P1001079', '2열연제품(CT13)', '제품출하섹션', '정상', '2열연제품(CT13)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001057', 'Slab Yard(CT22)', '2열연공장', '정상', 'Slab Yard(CT22)', 'Tong', 'A', '운전실/자동운전', '무인', false),
-('4P1001061', 'Slab Yard(CT23)', '2열연공장', '정상', 'Slab Yard(CT23)', 'Tong', 'B', '운전실/자동운전', '무인', false),
-('4P1001076', '#2 HSL(HS11)', '2열연공장', '정상', '#2 HSL(HS11)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001075', '#2 HSL(HS12)', '2열연공장', '정상', '#2 HSL(HS12)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001065', 'Mill Line #1(ML01)', '2열연공장', '정상', 'Mill Line #1(ML01)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001070', 'Mill Line #3(ML03)', '2열연공장', '정상', 'Mill Line #3(ML03)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001074', 'Mill Line #4(ML04)', '2열연공장', '정상', 'Mill Line #4(ML04)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001073', 'Mill Line(ML05)', '2열연공장', '정상', 'Mill Line(ML05)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001054', 'Slab Yard(CT21)', '2열연공장', '정상', 'Slab Yard(CT21)', 'Tong', 'A', '운전실/자동운전', '무인', false),
-('4P1001089', 'Roll Shop #1(RS02)', '2열연공장', '정상', 'Roll Shop #1(RS02)', 'Tong', 'A', '리모트/운전실', '유인', false),
-('4P1001091', 'Roll Shop #2(RS03)', '2열연공장', '정상', 'Roll Shop #2(RS03)', 'Hyd` Tong', 'B', '리모트/운전실', '유인', false),
-('4P1042523', 'Slab Yard(SY11)', '2열연공장', '정상', 'Slab Yard(SY11)', 'Tong', 'A', '운전실', '유인', false),
-('4P1001056', 'Slab Yard(SY12)', '2열연공장', '정상', 'Slab Yard(SY12)', 'Tong', 'A', '운전실', '유인', false),
-('4P1001116', '2후판 Shipping(A-1)', '후판제품공장', '정상', '2후판 Shipping(A-1)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001112', '2후판 Shipping(A-2)', '후판제품공장', '정상', '2후판 Shipping(A-2)', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001113', '2후판 Shipping(B01)', '후판제품공장', '정상', '2후판 Shipping(B01)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001110', '2후판 Shipping(B02)', '후판제품공장', '정상', '2후판 Shipping(B02)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001111', '2후판 Shipping(C01)', '후판제품공장', '정상', '2후판 Shipping(C01)', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001139', '2후판 Shipping(C02)', '후판제품공장', '정상', '2후판 Shipping(C02)', 'Magnet', 'B', '리모트/운전실', '유인', false),
-('4P1001170', '3후판 냉간교정(CL01)', '후판제품공장', '정상', '3후판 냉간교정(CL01)', 'Magnet+Magnet', 'A', '운전실', '무인', false),
-('4P1001188', '3후판 냉간교정(CL02)', '후판제품공장', '정상', '3후판 냉간교정(CL02)', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001140', '2후판 Shipping(D01)', '후판제품공장', '정상', '2후판 Shipping(D01)', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001155', '2후판 Shipping(D02)', '후판제품공장', '정상', '2후판 Shipping(D02)', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001109', '2후판 Shipping(E01)', '후판제품공장', '정상', '2후판 Shipping(E01)', 'Magnet+Magnet', 'B', '운전실/자동운전', '유인', false);
-
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, grade, drive_type, unmanned_operation, is_urgent) VALUES
-('4P1031287', '2후판 Shipping(E02)', '후판제품공장', '정상', '2후판 Shipping(E02)', 'Magnet+Magnet', 'B', '리모트/운전실', '유인', false),
-('4P1001119', '2후판 열처리(HY01)', '후판제품공장', '정상', '2후판 열처리(HY01)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001120', '2후판 열처리(HY02)', '후판제품공장', '정상', '2후판 열처리(HY02)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1043941', '2후판 열처리 (HY04)', '후판제품공장', '정상', '2후판 열처리 (HY04)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001183', '3후판(UST1)', '후판제품공장', '정상', '3후판(UST1)', 'Magnet+Magnet', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001181', '3후판(UST2)', '후판제품공장', '정상', '3후판(UST2)', 'Magnet+Magnet', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1038710', '통합정정 연마(B01)', '1선재공장', '정상', '통합정정 연마(B01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1029747', '강편 Bloom Yard #4(BL01A)', '1선재공장', '정상', '강편 Bloom Yard #4(BL01A)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1035573', '강편 Bloom Yard #5(BL03A)', '1선재공장', '정상', '강편 Bloom Yard #5(BL03A)', 'Tong', 'B', '운전실', '유인', false),
-('4P1000943', '강편 Bloom Yard #1(BL01)', '1선재공장', '정상', '강편 Bloom Yard #1(BL01)', 'Magnet', 'B', '리모트/운전실', '유인', false),
-('4P1000944', '강편 Bloom Yard #2(BL02)', '1선재공장', '정상', '강편 Bloom Yard #2(BL02)', 'Tong', 'A', '운전실', '유인', false),
-('4P1000946', '강편 B/T Yard #1(BT01)', '1선재공장', '정상', '강편 B/T Yard #1(BT01)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1000953', '강편 B/T Yard #2(BT02)', '1선재공장', '정상', '강편 B/T Yard #2(BT02)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1000942', '강편 B/T Yard #3(BT03)', '1선재공장', '정상', '강편 B/T Yard #3(BT03)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1000950', '강편 B/T Yard #4(BT04)', '1선재공장', '정상', '강편 B/T Yard #4(BT04)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1038712', '통합정정 B/T 입측(C01)', '1선재공장', '정상', '통합정정 B/T 입측(C01)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1038912', '통합정정 B/T(C02)', '1선재공장', '정상', '통합정정 B/T(C02)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1038913', '통합정정 B/T 출측(C03)', '1선재공장', '정상', '통합정정 B/T 출측(C03)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1038911', '통합정정 연마(D01)', '1선재공장', '정상', '통합정정 연마(D01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1000949', '강편 H.C.R Yard #1(HR01)', '1선재공장', '정상', '강편 H.C.R Yard #1(HR01)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1000961', '선재 Mill Line #1 [ML01]', '1선재공장', '정상', '선재 Mill Line #1 [ML01]', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1000959', '선재 Mill Line #2 [ML02]', '1선재공장', '정상', '선재 Mill Line #2 [ML02]', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1029744', '강편 압연 Yard #5(MY05)', '1선재공장', '정상', '강편 압연 Yard #5(MY05)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1000962', '선재 Roll Shop #1 [RS01]', '1선재공장', '정상', '선재 Roll Shop #1 [RS01]', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1000963', '선재 Roll Shop #2 [RS02]', '1선재공장', '정상', '선재 Roll Shop #2 [RS02]', 'Single Hook', 'B', '리모트', '유인', false),
-('4P1001001', '가열로(BC01)', '3선재공장', '정상', '가열로(BC01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1000976', '장입 C동(BL01)', '4선재공장', '정상', '장입 C동(BL01)', 'Magnet', 'A', '운전실', '유인', false),
-('4P1000990', 'B/T #1(BT01)', '2선재공장', '정상', 'B/T #1(BT01)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1039641', '장입 A동(BT02)', '4선재공장', '정상', '장입 A동(BT02)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1000987', 'B/T #2(BT02)', '2선재공장', '정상', 'B/T #2(BT02)', 'Magnet', 'A', '운전실', '유인', false),
-('4P1000974', 'B/T #2(BL02)', '3선재공장', '정상', 'B/T #2(BL02)', 'Magnet', 'A', '운전실', '유인', false),
-('4P1000988', 'B/T #3(BT03)', '2선재공장', '정상', 'B/T #3(BT03)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001005', 'B/T #4(BL04)', '3선재공장', '정상', 'B/T #4(BL04)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1043347', '2선재제품(CY01)', '제품출하섹션', '정상', '2선재제품(CY01)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000992', '3선재제품(CY10)', '제품출하섹션', '정상', '3선재제품(CY10)', 'C-Hook', 'B', '리모트/운전실', '유인', false),
-('4P1000981', '2선재제품(CY02)', '제품출하섹션', '정상', '2선재제품(CY02)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000971', '2선재 제품창고 C동 (CY03)', '제품출하섹션', '정상', '2선재 제품창고 C동 (CY03)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000978', '2선재 제품창고 D동 (CY04)', '제품출하섹션', '정상', '2선재 제품창고 D동 (CY04)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000975', '2선재제품(CY05)', '제품출하섹션', '정상', '2선재제품(CY05)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000997', '3선재제품(CY06)', '제품출하섹션', '정상', '3선재제품(CY06)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000993', '3선재제품(CY07)', '제품출하섹션', '정상', '3선재제품(CY07)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000994', '3선재제품(CY08)', '제품출하섹션', '정상', '3선재제품(CY08)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1000991', '3선재제품(CY09)', '제품출하섹션', '정상', '3선재제품(CY09)', 'C-Hook', 'B', '운전실', '유인', false),
-('4P1039642', 'Mill Line #1(ML01)', '4선재공장', '정상', 'Mill Line #1(ML01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001006', 'Mill Line #1(ML01)', '3선재공장', '정상', 'Mill Line #1(ML01)', 'Single Hook', 'B', '운전실', '유인', false),
-('4P1000973', 'Mill Line #1(MY01)', '2선재공장', '정상', 'Mill Line #1(MY01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001002', 'Mill Line #2(ML02)', '3선재공장', '정상', 'Mill Line #2(ML02)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001008', 'Mill Line #2(MY02)', '2선재공장', '정상', 'Mill Line #2(MY02)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1039644', 'Roll Shop Chock 정비장(RS01)', '4선재공장', '정상', 'Roll Shop Chock 정비장(RS01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1000986', 'Roll Shop #1(RS01)', '2선재공장', '정상', 'Roll Shop #1(RS01)', 'Single Hook', 'B', '리모트/펜던트', '유인', false);
-
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, grade, drive_type, unmanned_operation, is_urgent) VALUES
-('4P1039645', 'Roll Shop 조압연선반(RS02)', '4선재공장', '정상', 'Roll Shop 조압연선반(RS02)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1001000', 'Roll Shop #1(RS01)', '3선재공장', '정상', 'Roll Shop #1(RS01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001210', '2C04_#2CAL 출측', '1냉연공장', '정상', '#2CAL 출측(2C04)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001196', '수냉장 #11 (A11)', '1냉연공장', '정상', '수냉장 #11 (A11)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001197', 'A12_수냉장 #12', '1냉연공장', '정상', '수냉장 #12(A12)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001198', '정정 Yard(CT13)', '1열연공장', '정상', '정정 Yard(CT13)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001218', '1냉연제품(CT11)', '제품출하섹션', '정상', '1냉연제품(CT11)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001224', 'CT23_#2RCL 출측', '1냉연공장', '정상', '#2RCL 출측(CT23)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001219', '1냉연제품(CT31)', '제품출하섹션', '정상', '1냉연제품(CT31)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1028755', '1냉연제품(CT32)', '제품출하섹션', '정상', '1냉연제품(CT32)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001225', 'CT33_#2RCL', '1냉연공장', '정상', '#2RCL(CT33)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001221', '1냉연제품(CT41)', '제품출하섹션', '정상', '1냉연제품(CT41)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001223', 'CT42_#2 CPL', '1냉연공장', '정상', '#2 CPL(CT42)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001222', 'CT43_#2 CPL 입측', '1냉연공장', '정상', '#2 CPL 입측(CT43)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001211', 'CT52_#2CAL 출측', '1냉연공장', '정상', '#2 CAL 출측(CT52)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001201', 'CT73_PCM', '1냉연공장', '정상', '7동 소재야드 PCM', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001199', 'CT74_PCM', '1냉연공장', '정상', 'PCM(CT74)', 'Coil Lifter', 'A', '운전실/리모트/자동운전', '무인', false),
-('4P1001214', 'CTA1_#1CAL 출측', '1냉연공장', '정상', '#1CAL 출측(CTA1)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001213', 'CTA2_#1 CAL 출측', '1냉연공장', '정상', '#1 CAL 출측(CTA2)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001202', 'EC01_ECL', '1냉연공장', '정상', 'ECL(EC01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001192', 'PL01_산세입측 #01', '1냉연공장', '정상', '산세입측 #01(PL01)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1001226', '1냉연제품(CT21)', '제품출하섹션', '정상', '1냉연제품(CT21)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001227', 'RS01_Roll Shop #1', '1냉연공장', '정상', 'Roll Shop #1(RS01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001228', 'RS02_R/Shop #2', '1냉연공장', '정상', 'R/Shop #2(RS02)', 'Tong', 'A', '리모트/운전실', '유인', false),
-('4P1001229', 'Dull Machine(RS04)', '1냉연공장', '정상', 'R/Shop #3(RS03)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001220', '1냉연제품(CT22)', '제품출하섹션', '정상', '1냉연제품(CT22)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001195', 'TC02_PCM 입측 #2', '1냉연공장', '정상', 'PCM 입측 #2(TC02)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001216', 'TP01_TPM #10', '1냉연공장', '정상', 'TPM #10(TP01)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1029127', '3후판 열처리(HY-1)', '후판제품공장', '정상', '3후판 열처리(HY-1)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1029128', '3후판 열처리(HY-2)', '후판제품공장', '정상', '3후판 열처리(HY-2)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1029129', '3후판 열처리 (HY-3)', '후판제품공장', '정상', '3후판 열처리 (HY-3)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1029421', 'CGL 입측(CA09)', '도금공장', '정상', 'CGL 입측(CA09)', 'Coil Lifter', 'B', '리모트/펜던트', '유인', false),
-('4P1001253', 'CGL 입측 SPM(CA10)', '도금공장', '정상', 'CGL 입측 SPM(CA10)', 'Coil Lifter', 'B', '리모트/펜던트', '유인', false),
-('4P1030810', '2 EGL 출하동(CT11)', '도금공장', '정상', '2 EGL 출하동(CT11)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001244', '#3 Yard(CT31)', '2냉연공장', '정상', '#3 Yard(CT31)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001246', '#3 Yard(CT32)', '2냉연공장', '정상', '#3 Yard(CT32)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001249', '2냉연제품(CT40)', '제품출하섹션', '정상', '2냉연제품(CT40)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001255', '#4 Yard(CT41)', '2냉연공장', '정상', '#4 Yard(CT41)', 'Coil Lifter', 'A', '운전실/리모트/자동운전', '무인', false),
-('4P1001250', '2냉연제품(CT60)', '제품출하섹션', '정상', '2냉연제품(CT60)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001251', '2냉연제품(CT61)', '제품출하섹션', '정상', '2냉연제품(CT61)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001248', '2냉연제품(CT62)', '제품출하섹션', '정상', '2냉연제품(CT62)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1036056', '2냉연 8동(CT81)', '도금공장', '정상', '2냉연 8동(CT81)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1036057', '2냉연제품(CT82)', '제품출하섹션', '정상', '2냉연제품(CT82)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001271', '1 EGL(EG01)', '도금공장', '정상', '1 EGL(EG01)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001270', '1 EGL(EG02)', '도금공장', '정상', '1 EGL(EG02)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1027956', '1 EGL(EG03)', '도금공장', '정상', '1 EGL(EG03)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1038715', 'CGL Furnace(PG01)', '도금공장', '정상', 'CGL Furnace(PG01)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1038717', 'CGL C-Tower(PG02)', '도금공장', '정상', 'CGL C-Tower(PG02)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1038716', 'CGL 출측 (PG03)', '도금공장', '정상', 'CGL 출측 (PG03)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1001256', 'Roll Shop(RS01)', '2냉연공장', '정상', 'Roll Shop(RS01)', 'Coil Lifter', 'A', '리모트/운전실', '유인', false);
-
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, grade, drive_type, unmanned_operation, is_urgent) VALUES
-('4P1001258', 'Roll Shop(RS02)', '2냉연공장', '정상', 'Roll Shop(RS02)', 'Single Hook', 'B', '리모트/운전실', '유인', false),
-('4P1001235', 'HCT(TC04)', '2냉연공장', '정상', 'HCT(TC04)', 'Coil Lifter', 'A', '운전실', '유인', false),
-('4P1001230', 'HCT(TC05)', '2냉연공장', '정상', 'HCT(TC05)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1027957', '2 EGL 출하동(TP05)', '도금공장', '정상', '2 EGL 출하동(TP05)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1102868', 'O-Yard(CTB1)', '2냉연공장', '정상', 'O-Yard(CTB1)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001257', 'Roll Shop(RS03)', '2냉연공장', '정상', 'Roll Shop(RS03)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1031472', 'Roll Shop(A01)', '3전기강판공장', '정상', 'Roll Shop(A01)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1000924', '정정통합야드(A03)', '4연주공장', '정상', '정정 통합야드(A04)', 'Magnet', 'A', '운전실', '유인', false),
-('4P1000921', '정정 통합야드(A04)', '4연주공장', '정상', '정정통합야드(A03)', 'Tong', 'B', '운전실', '유인', false),
-('4P1000920', '정정통합야드(A05)', '4연주공장', '정상', '정정통합야드(A05)', 'Tong', 'B', '운전실', '유인', false),
-('4P1000923', '관제1야드(B05)', '생산관제섹션', '정상', '관제1야드(B05)', 'Tong', 'B', '운전실', '무인', false),
-('4P1034767', 'TRM #2(CTB1)', 'STS2냉연공장', '정상', 'TRM #2(CTB1)', 'Coil Lifter', 'A', '리모트/운전실', '유인', false),
-('4P1034766', 'TRM #1(CTB2)', 'STS2냉연공장', '정상', 'TRM #1(CTB2)', 'Coil Lifter', 'B', '리모트/펜던트', '유인', false),
-('4P1034773', 'Roll Shop (CTC1)', 'STS2냉연공장', '정상', 'Roll Shop (CTC1)', 'Single Hook', 'B', '리모트', '유인', false),
-('4P1034768', 'ΙCY #1(CTC2)', 'STS2냉연공장', '정상', 'ΙCY #1(CTC2)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1031473', '2 ZRM(CT51)', '3전기강판공장', '정상', '2 ZRM(CT51)', 'Coil Lifter', 'A', '리모트/팬던트/자동운전', '무인', false),
-('4P1031474', '3 APL 출측(CT61)', '3전기강판공장', '정상', '3 APL 출측(CT61)', 'Coil Lifter', 'B', '리모트/팬던트/자동운전', '무인', false),
-('4P1031475', '3 APL 입측(CT62)', '3전기강판공장', '정상', '3 APL 입측(CT62)', 'Coil Lifter', 'B', '리모트/팬던트/자동운전', '무인', false),
-('4P1031369', '3 COF 상부(CT71)', '3전기강판공장', '정상', '3 COF 상부(CT71)', 'Coil Lifter', 'A', '리모트/펜던트', '유인', false),
-('4P1031365', '3 HCL 입측(CT72)', '3전기강판공장', '정상', '3 HCL 입측(CT72)', 'Coil Lifter', 'B', '리모트/팬던트/자동운전', '무인', false),
-('4P1031366', '3 HCL 출측(CT73)', '3전기강판공장', '정상', '3 HCL 출측(CT73)', 'Coil Lifter', 'A', '리모트/팬던트/자동운전', '무인', false),
-('4P1031371', '2 DRL(CT74)', '3전기강판공장', '정상', '2 DRL(CT74)', 'Coil Lifter', 'B', '리모트/팬던트/자동운전', '무인', false),
-('4P1031363', '3 DNL 입측(CT81)', '3전기강판공장', '정상', '3 DNL 입측(CT81)', 'Coil Lifter', 'B', '리모트/팬던트/자동운전', '무인', false),
-('4P1031364', '3 DNL 출측(CT82)', '3전기강판공장', '정상', '3 DNL 출측(CT82)', 'Coil Lifter', 'B', '리모트/팬던트/자동운전', '무인', false),
-('4P1034770', 'ΙCY #3(CTD1)', 'STS2냉연공장', '정상', 'ΙCY #3(CTD1)', 'Coil Lifter', 'A', '운전실/리모트/자동운전', '무인', false),
-('4P1034769', 'ΙCY #2(CTD2)', 'STS2냉연공장', '정상', 'ΙCY #2(CTD2)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1034772', 'APF #3(CTE1)', 'STS2냉연공장', '정상', 'APF #3(CTE1)', 'Single Hook', 'B', '리모트/펜던트', '유인', false),
-('4P1034771', 'APF #1(CTE3)', 'STS2냉연공장', '정상', 'APF #1(CTE3)', 'Coil Lifter', 'B', '리모트/펜던트', '유인', false),
-('4P1001130', 'Mill Line #1(ML01)', '2후판공장', '정상', 'Mill Line #1(ML01)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001131', 'Mill Line(ML02)', '2후판공장', '정상', 'Mill Line(ML02)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001128', 'Roll Shop #1(RS01)', '2후판공장', '정상', 'Roll Shop #1(RS01)', 'Tong', 'B', '리모트/운전실', '유인', false),
-('4P1001121', '전단Sher #1(SL01)', '2후판공장', '정상', '전단Sher #1(SL01)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001122', '전단Shear #2(SL02)', '2후판공장', '정상', '전단Shear #2(SL02)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1043619', 'Slab Yard #1(SY10)', '2후판공장', '정상', 'Slab Yard #1(SY10)', 'Tong', 'A', '운전실', '유인', false),
-('4P1001134', 'Slab Yard #2(SY11)', '2후판공장', '정상', 'Slab Yard #2(SY11)', 'Tong', 'A', '운전실', '유인', false),
-('4P1001313', '2APL(CT23)', '소둔산세공장', '정상', '2APL(CT23)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001081', '2열연제품(CT33)', '제품출하섹션', '정상', '2열연제품(CT33)', 'Single Hook', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001085', '2열연제품(CT43)', '제품출하섹션', '정상', '2열연제품(CT43)', 'Single Hook', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001083', '3HSL(CT52)', '소둔산세공장', '정상', '3HSL(CT52)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001084', '3HSL(CT53)', '소둔산세공장', '정상', '3HSL(CT53)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001303', '3APL (CT61)', '소둔산세공장', '정상', '3APL (CT61)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001306', 'STL (CT62)', '소둔산세공장', '정상', 'STL (CT62)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001316', 'STL(CT63)', '소둔산세공장', '정상', 'STL(CT63)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1039996', '1APL(CT71)', '열연기술개발섹션', '정상', '1APL(CT71)', 'Tong', 'B', '운전실', '유인', false),
-('4P1001305', '1APL(CT72)', '소둔산세공장', '정상', '1APL(CT72)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1039997', '1APL(CT73)', '열연기술개발섹션', '정상', '1APL(CT73)', 'Single Hook', 'B', '운전실', '유인', false),
-('4P1039047', '1APL(CT74)', '소둔산세공장', '정상', '1APL(CT74)', 'Coil Lifter', 'B', '운전실', '무인', false),
-('4P1001314', '3BAF(CT81)', '소둔산세공장', '정상', '3BAF(CT81)', 'Tong', 'B', '운전실', '유인', false),
-('4P1001315', '3CPL(CT82)', '소둔산세공장', '정상', '3CPL(CT82)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001309', '1CGL(CT91)', '소둔산세공장', '정상', '1CGL(CT91)', 'Coil Lifter', 'B', '운전실', '유인', false);
-
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, grade, drive_type, unmanned_operation, is_urgent) VALUES
-('4P1039049', '1CGL(CT92)', '소둔산세공장', '정상', '1CGL(CT92)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001311', '3CGL(CTA1)', '소둔산세공장', '정상', '3CGL(CTA1)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1028970', '4BAF(CTB1)', '소둔산세공장', '정상', '4BAF(CTB1)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1028971', '4BAF(CTB2)', '소둔산세공장', '정상', '4BAF(CTB2)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001078', 'HDL(HD41)', '2열연공장', '정상', 'HDL(HD41)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001086', 'HDL(HD42)', '2열연공장', '정상', 'HDL(HD42)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001308', 'APL(HS20)', '2열연공장', '정상', 'APL(HS20)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001077', '#1 HSL(HS31)', '2열연공장', '정상', '#1 HSL(HS31)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001080', '#1 HSL(HS32)', '2열연공장', '정상', '#1 HSL(HS32)', 'Coil Lifter', 'B', '운전실', '유인', false),
-('4P1001299', '2APL(CT21)', '소둔산세공장', '정상', '2APL(CT21)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001312', '2APL(CT22)', '소둔산세공장', '정상', '2APL(CT22)', 'Coil Lifter', 'B', '운전실/리모트/자동운전', '무인', false),
-('4P1001138', '제품출하 F01', '제품출하섹션', '정상', '2후판제품 F01', 'Magnet', 'B', '운전실/자동운전', '유인', false),
-('4P1001152', '2후판 Shipping(F02)', '후판제품공장', '정상', '2후판 Shipping(F02)', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001150', '제품출하 G01', '제품출하섹션', '정상', '3후판제품 G01', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001151', '제품출하 G02', '제품출하섹션', '정상', '2후판제품 G02', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001153', '제품출하 GA', '제품출하섹션', '정상', '2후판제품 GA', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001179', '제품출하 H01', '제품출하섹션', '정상', '3후판제품 H01', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001147', '제품출하 H02', '제품출하섹션', '정상', '2후판제품 H02', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001180', '제품출하 HA', '제품출하섹션', '정상', '3후판제품 HA', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001176', '제품출하 J01', '제품출하섹션', '정상', '3후판제품 J01', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001148', '제품출하 J02', '제품출하섹션', '정상', '2후판제품 J02', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001177', '제품출하 JA', '제품출하섹션', '정상', '3후판제품 JA', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1038369', '제품출하 K01', '제품출하섹션', '정상', '2후판제품 K01', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001144', '제품출하 K02', '제품출하섹션', '정상', '2후판제품 K02', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001178', '제품출하 KA', '제품출하섹션', '정상', '3후판제품 KA', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001101', '제품출하 L01', '제품출하섹션', '정상', '3후판제품 L01', 'Magnet', 'B', '운전실', '유인', false),
-('4P1001107', '제품출하 L02', '제품출하섹션', '정상', '3후판제품 L02', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001175', '제품출하 LA', '제품출하섹션', '정상', '3후판제품 LA', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001102', '제품출하 M01', '제품출하섹션', '정상', '3후판제품 M01', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1001105', '제품출하 M02', '제품출하섹션', '정상', '3후판제품 M02', 'Magnet', 'B', '운전실', '유인', false),
-('4P1026144', '제품출하 MA', '제품출하섹션', '정상', '2후판제품 MA', 'Magnet+Magnet', 'B', '운전실', '유인', false),
-('4P1002070', 'LM2 C/R', '2연주공장', '정상', 'LM2 C/R', 'Magnet', 'B', '리모트/운전실', '유인', false),
-('4P1002071', 'LM3 C/R', '2연주공장', '정상', 'LM3 C/R', 'Magnet', 'B', '리모트/운전실', '유인', false);
-
--- Total cranes: 233
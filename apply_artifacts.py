@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Load an export_artifacts.py snapshot (or a plain .sql file) into PostgreSQL.
+
+    python apply_artifacts.py artifacts/snapshot --jobs 4 [--replace]
+    python apply_artifacts.py update_by_device.sql
+
+Every artifact is checked against the manifest's SHA-256 before anything is
+loaded. COPY artifacts are streamed from the gzip file straight into COPY
+FROM STDIN. INSERT artifacts and .sql files are sent a batch of statements
+per round trip. Artifacts are applied concurrently, one connection each,
+from a pool of --jobs connections; the crane artifacts go first. An
+artifact whose connection drops is retried with backoff.
+
+Each artifact (or each statement batch of a .sql file) commits together
+with its row in artifact_loads, so rerunning after a failure skips what
+already landed and resumes with the first unapplied chunk.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from db_connection import close_pool, connect_db, connection, get_pool, release_db, run_with_retry
+from etl_events import notify_change
+from etl_locks import etl_locks
+from export_artifacts import LOAD_ORDER, file_sha256
+
+LOADS_DDL = """
+    CREATE TABLE IF NOT EXISTS artifact_loads (
+        source_sha256 TEXT NOT NULL,
+        file TEXT NOT NULL,
+        chunk INTEGER NOT NULL,
+        rows INTEGER NOT NULL,
+        applied_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (source_sha256, file, chunk)
+    );
+"""
+REPLACE_MARKER = '(replace)'
+
+
+def open_text(path):
+    return gzip.open(path, 'rt', encoding='utf-8') if path.endswith('.gz') else open(path, encoding='utf-8')
+
+
+def iter_statements(lines):
+    """Split SQL text into statements at lines ending in ';' outside a quoted literal.
+
+    Quote parity per line is enough for the standard-conforming strings the
+    exporter writes ('' inside a literal adds two quotes).
+    """
+    buffer = []
+    in_string = False
+    for line in lines:
+        if not in_string and not buffer and (not line.strip() or line.lstrip().startswith('--')):
+            continue
+        buffer.append(line)
+        in_string ^= line.count("'") % 2 == 1
+        if not in_string and line.rstrip().endswith(';'):
+            yield ''.join(buffer)
+            buffer = []
+    if ''.join(buffer).strip():
+        yield ''.join(buffer)
+
+
+def statement_batches(path, batch_size):
+    with open_text(path) as f:
+        batch = []
+        for statement in iter_statements(f):
+            batch.append(statement)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class HashingReader:
+    """File wrapper that hashes whatever COPY reads through it"""
+
+    def __init__(self, f):
+        self.f = f
+        self.digest = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.digest.update(data)
+        return data
+
+    def readline(self, size=-1):
+        data = self.f.readline(size)
+        self.digest.update(data)
+        return data
+
+
+def applied_chunks(conn, source_sha256):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT file, chunk FROM artifact_loads WHERE source_sha256 = %s", (source_sha256,))
+        return set(cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def record_chunk(cursor, source_sha256, file, chunk, rows):
+    cursor.execute("""
+        INSERT INTO artifact_loads (source_sha256, file, chunk, rows) VALUES (%s, %s, %s, %s)
+    """, (source_sha256, file, chunk, rows))
+
+
+def apply_copy_artifact(conn, directory, artifact, copy_sql, source_sha256):
+    path = os.path.join(directory, artifact['file'])
+    cursor = conn.cursor()
+    try:
+        with gzip.open(path, 'rb') as f:
+            reader = HashingReader(f)
+            cursor.copy_expert(copy_sql, reader, size=1 << 16)
+        if reader.digest.hexdigest() != artifact['content_sha256']:
+            raise RuntimeError(f"{artifact['file']}: content checksum mismatch")
+        if cursor.rowcount != artifact['rows']:
+            raise RuntimeError(f"{artifact['file']}: copied {cursor.rowcount} rows, manifest says {artifact['rows']}")
+        record_chunk(cursor, source_sha256, artifact['file'], 0, artifact['rows'])
+        notify_change(conn, artifact['table'], job='apply_artifacts')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return artifact['rows']
+
+
+def apply_insert_artifact(conn, directory, artifact, source_sha256, batch_size):
+    """An INSERT artifact is applied in one transaction, batch_size statements per round trip"""
+    path = os.path.join(directory, artifact['file'])
+    cursor = conn.cursor()
+    try:
+        rows = 0
+        for batch in statement_batches(path, batch_size):
+            cursor.execute(''.join(batch))
+            rows += max(cursor.rowcount, 0)
+        record_chunk(cursor, source_sha256, artifact['file'], 0, rows)
+        notify_change(conn, artifact['table'], job='apply_artifacts')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return rows
+
+
+def verify_artifacts(directory, manifest):
+    """Compare every artifact file with the manifest's size and SHA-256; returns the problems found"""
+    problems = []
+    for artifact in manifest['artifacts']:
+        path = os.path.join(directory, artifact['file'])
+        if not os.path.exists(path):
+            problems.append(f"{artifact['file']}: missing")
+        elif os.path.getsize(path) != artifact['compressed_bytes'] or file_sha256(path) != artifact['sha256']:
+            problems.append(f"{artifact['file']}: checksum mismatch")
+    return problems
+
+
+def replace_tables(conn, source_sha256, applied):
+    """TRUNCATE the snapshot tables once per snapshot, recorded so a resumed run does not wipe loaded chunks"""
+    if (REPLACE_MARKER, 0) in applied:
+        return
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"TRUNCATE {', '.join(LOAD_ORDER)}")
+        record_chunk(cursor, source_sha256, REPLACE_MARKER, 0, 0)
+        for table in LOAD_ORDER:
+            notify_change(conn, table, job='apply_artifacts')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    print(f"Truncated {', '.join(LOAD_ORDER)}")
+
+
+def apply_snapshot(directory, jobs, batch_size, replace=False):
+    manifest_path = os.path.join(directory, 'manifest.json')
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    source_sha256 = file_sha256(manifest_path)
+
+    problems = verify_artifacts(directory, manifest)
+    if problems:
+        for problem in problems:
+            print(f"  {problem}")
+        raise RuntimeError(f"{len(problems)} artifacts failed verification; nothing was loaded")
+
+    with connection() as conn:
+        applied = applied_chunks(conn, source_sha256)
+        if replace:
+            replace_tables(conn, source_sha256, applied)
+
+    pending = [artifact for artifact in manifest['artifacts'] if (artifact['file'], 0) not in applied]
+    skipped = len(manifest['artifacts']) - len(pending)
+    if skipped:
+        print(f"Resuming: {skipped} artifacts already applied")
+
+    # An artifact commits atomically with its artifact_loads row, so a dropped connection just reruns it
+    def apply_one(artifact):
+        if manifest['format'] == 'copy':
+            copy_sql = manifest['tables'][artifact['table']]['copy_sql']
+            return run_with_retry(apply_copy_artifact, directory, artifact, copy_sql, source_sha256)
+        return run_with_retry(apply_insert_artifact, directory, artifact, source_sha256, batch_size)
+
+    # Cranes first so history rows never land ahead of their crane; the rest are independent
+    waves = [[a for a in pending if a['table'] == 'cranes'], [a for a in pending if a['table'] != 'cranes']]
+    total = 0
+    for wave in waves:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(apply_one, artifact): artifact for artifact in wave}
+            for future in as_completed(futures):
+                rows = future.result()
+                total += rows
+                print(f"  {futures[future]['file']}: {rows} rows")
+    return total
+
+
+def apply_sql_file(path, batch_size):
+    """Apply a plain .sql(.gz) file, committing every batch so a rerun resumes after the last one"""
+    source_sha256 = file_sha256(path)
+    name = os.path.basename(path)
+    conn = connect_db()
+    cursor = conn.cursor()
+    try:
+        applied = {chunk for file, chunk in applied_chunks(conn, source_sha256) if file == name}
+        if applied:
+            print(f"Resuming: {len(applied)} batches already applied")
+        total = 0
+        for chunk, batch in enumerate(statement_batches(path, batch_size)):
+            if chunk in applied:
+                continue
+            cursor.execute(''.join(batch))
+            rows = max(cursor.rowcount, 0)
+            record_chunk(cursor, source_sha256, name, chunk, rows)
+            # A plain SQL file can touch any of the tables
+            for table in LOAD_ORDER:
+                notify_change(conn, table, job='apply_artifacts')
+            conn.commit()
+            total += rows
+        return total
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        release_db(conn)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply export_artifacts.py snapshots or .sql files')
+    parser.add_argument('source', help='snapshot directory containing manifest.json, or a .sql/.sql.gz file')
+    parser.add_argument('--jobs', type=int, default=4, help='artifacts applied concurrently')
+    parser.add_argument('--batch-size', type=int, default=50, help='statements sent per round trip')
+    parser.add_argument('--replace', action='store_true', help='truncate the snapshot tables before loading')
+    parser.add_argument('--verify-only', action='store_true', help='check artifact checksums and exit')
+    parser.add_argument('--restart', action='store_true', help='forget earlier progress for this source and load it again')
+    args = parser.parse_args()
+
+    if args.verify_only:
+        with open(os.path.join(args.source, 'manifest.json'), encoding='utf-8') as f:
+            problems = verify_artifacts(args.source, json.load(f))
+        for problem in problems:
+            print(f"  {problem}")
+        print("All artifacts verified" if not problems else f"{len(problems)} problems")
+        sys.exit(1 if problems else 0)
+
+    try:
+        # One extra connection holds the table locks while the workers load
+        get_pool(max(args.jobs, 1) + 1)
+    except Exception as e:
+        print(f"Database connection error: {e}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        conn = connect_db()
+        if not conn:
+            sys.exit(1)
+        cursor = conn.cursor()
+        cursor.execute(LOADS_DDL)
+        if args.restart:
+            source = os.path.join(args.source, 'manifest.json') if os.path.isdir(args.source) else args.source
+            cursor.execute("DELETE FROM artifact_loads WHERE source_sha256 = %s", (file_sha256(source),))
+        conn.commit()
+        cursor.close()
+
+        try:
+            with etl_locks(conn, *LOAD_ORDER, job='apply_artifacts'):
+                if os.path.isdir(args.source):
+                    rows = apply_snapshot(args.source, args.jobs, args.batch_size, args.replace)
+                else:
+                    rows = apply_sql_file(args.source, args.batch_size)
+        finally:
+            release_db(conn)
+        seconds = time.perf_counter() - start
+        print(f"Applied {rows} rows in {seconds:.1f}s ({rows / seconds if seconds else 0:.0f} rows/s)")
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,94 +1,143 @@
 #!/usr/bin/env python3
 import pandas as pd
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import execute_values
 import os
-import random
 
-def connect_db():
-    """Connect to PostgreSQL database"""
+from db_access import iter_chunks
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from failure_text_classifier import MIN_CONFIDENCE, normalize_text, train_classifiers
+
+# Label column -> (inferred label column, confidence column). Real labels are never written;
+# a guess only goes beside an empty label, so the two can always be told apart
+INFERRED_COLUMNS = {
+    'by_device': ('by_device_inferred', 'by_device_confidence'),
+    'failure_type': ('failure_type_inferred', 'failure_type_confidence'),
+}
+
+def ensure_inferred_columns(conn):
+    """Add the inferred label / confidence columns to failure_records where they are missing"""
+    cursor = conn.cursor()
     try:
-        conn = psycopg2.connect(
-            host=os.getenv('PGHOST'),
-            database=os.getenv('PGDATABASE'),
-            user=os.getenv('PGUSER'),
-            password=os.getenv('PGPASSWORD'),
-            port=os.getenv('PGPORT')
-        )
-        return conn
-    except Exception as e:
-        print(f"Database connection error: {e}")
-        return None
+        cursor.execute("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'failure_records'
+        """)
+        existing = {row[0] for row in cursor.fetchall()}
+        missing = [(column, column_type)
+                   for label_column, confidence_column in INFERRED_COLUMNS.values()
+                   for column, column_type in ((label_column, 'TEXT'), (confidence_column, 'DOUBLE PRECISION'))
+                   if column not in existing]
+        # Checked first: ALTER TABLE takes an exclusive lock even when there is nothing to add
+        if missing:
+            cursor.execute("ALTER TABLE failure_records " + ', '.join(
+                f"ADD COLUMN {column} {column_type}" for column, column_type in missing))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
 
 def assign_real_bydevice():
-    """Assign real byDevice values based on Excel data distribution"""
+    """Infer missing byDevice / failure type values from the failure text into the *_inferred columns"""
     excel_file = "attached_assets/DB용 크레인 데이터_1749738215644.xlsx"
-    
+
     if not os.path.exists(excel_file):
         print(f"Excel file not found: {excel_file}")
         return
-    
+
     conn = connect_db()
     if not conn:
         return
-    
+
+    cursor = None
     try:
-        # Read actual byDevice distribution from Excel
+        # Train the keyword classifiers on the labelled Excel rows
         df = pd.read_excel(excel_file, sheet_name='FailureReport')
-        bydevice_counts = df['byDevice'].value_counts()
-        
-        print("Real byDevice distribution from Excel:")
-        for device, count in bydevice_counts.head(15).items():
-            print(f"  {device}: {count} records")
-        
-        # Create weighted list based on actual distribution
-        weighted_devices = []
-        for device, count in bydevice_counts.items():
-            weighted_devices.extend([device] * count)
-        
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Get all failure records
-        cursor.execute("SELECT id FROM failure_records ORDER BY id")
-        db_records = cursor.fetchall()
-        print(f"\nFound {len(db_records)} records in database")
-        
-        # Randomly assign byDevice values based on real distribution
-        updated_count = 0
-        for record in db_records:
-            # Pick a random device based on weighted distribution
-            assigned_device = random.choice(weighted_devices)
-            
-            cursor.execute(
-                "UPDATE failure_records SET by_device = %s WHERE id = %s",
-                (assigned_device, record['id'])
-            )
-            updated_count += 1
-        
-        conn.commit()
-        print(f"Successfully assigned byDevice values to {updated_count} records")
-        
-        # Verify the assignment
-        cursor.execute("""
-            SELECT by_device, COUNT(*) as count 
-            FROM failure_records 
-            WHERE by_device IS NOT NULL 
-            GROUP BY by_device 
-            ORDER BY count DESC 
-            LIMIT 15
-        """)
-        results = cursor.fetchall()
-        
-        print("\nTop byDevice categories in database after assignment:")
-        for row in results:
-            print(f"  {row['by_device']}: {row['count']} records")
-            
+        classifiers = train_classifiers(df)
+        for column, classifier in classifiers.items():
+            print(f"{column} classifier: {len(classifier.votes)} keywords")
+
+        with etl_locks(conn, 'failure_records', job='assign_real_bydevice'):
+            ensure_inferred_columns(conn)
+            cursor = conn.cursor()
+
+            # Guesses for labels that have since been filled in are stale
+            for db_column, (label_column, confidence_column) in INFERRED_COLUMNS.items():
+                cursor.execute(f"""
+                    UPDATE failure_records SET {label_column} = NULL, {confidence_column} = NULL
+                    WHERE {label_column} IS NOT NULL AND TRIM(COALESCE({db_column}, '')) <> ''
+                """)
+
+            # Only records that are missing a label; existing values are never overwritten.
+            # Streamed a chunk at a time, and each chunk's labels are written before the next is read
+            targets = {'byDevice': 'by_device', 'type': 'failure_type'}
+            scanned = 0
+            inferred = {column: 0 for column in targets.values()}
+            for records in iter_chunks(conn, """
+                SELECT id, description, cause, by_device, failure_type
+                FROM failure_records
+                WHERE by_device IS NULL OR TRIM(by_device) = ''
+                   OR failure_type IS NULL OR TRIM(failure_type) = ''
+                ORDER BY id
+            """):
+                scanned += len(records)
+                updates = {column: [] for column in targets.values()}
+                for record_id, description, cause, by_device, failure_type in records:
+                    text = normalize_text(description, cause)
+                    current = {'by_device': by_device, 'failure_type': failure_type}
+                    for label_column, db_column in targets.items():
+                        if (current[db_column] or '').strip():
+                            continue
+                        label, confidence = classifiers[label_column].predict(text)
+                        # Below the threshold any earlier guess is cleared rather than kept
+                        if label is None or confidence < MIN_CONFIDENCE:
+                            label, confidence = None, None
+                        updates[db_column].append((record_id, label, confidence))
+
+                for db_column, rows in updates.items():
+                    label_column, confidence_column = INFERRED_COLUMNS[db_column]
+                    if rows:
+                        execute_values(cursor, f"""
+                            UPDATE failure_records AS f
+                            SET {label_column} = v.label, {confidence_column} = v.confidence
+                            FROM (VALUES %s) AS v(id, label, confidence)
+                            WHERE f.id = v.id
+                              AND (f.{label_column}, f.{confidence_column}) IS DISTINCT FROM (v.label, v.confidence)
+                        """, rows, template="(%s, %s::text, %s::double precision)", page_size=1000)
+                        inferred[db_column] += sum(label is not None for _, label, _ in rows)
+
+            print(f"\nFound {scanned} records with a missing byDevice or failure type")
+            for db_column, count in inferred.items():
+                print(f"Inferred {db_column} for {count} records (confidence >= {MIN_CONFIDENCE})")
+
+            notify_change(conn, 'failure_records', job='assign_real_bydevice')
+            conn.commit()
+
+            # Verify the assignment
+            cursor.execute("""
+                SELECT by_device_inferred, COUNT(*) as count
+                FROM failure_records
+                WHERE by_device_inferred IS NOT NULL
+                GROUP BY by_device_inferred
+                ORDER BY count DESC
+                LIMIT 15
+            """)
+            results = cursor.fetchall()
+
+            print("\nTop inferred byDevice categories in database after assignment:")
+            for by_device, count in results:
+                print(f"  {by_device}: {count} records")
+
     except Exception as e:
         print(f"Error assigning byDevice data: {e}")
         conn.rollback()
     finally:
-        cursor.close()
-        conn.close()
+        if cursor:
+            cursor.close()
+        release_db(conn)
 
 if __name__ == "__main__":
-    assign_real_bydevice()
\ No newline at end of file
+    assign_real_bydevice()
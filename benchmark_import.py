@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from db_connection import connect_db, release_db
+from synthetic_workbook import default_path, generate_workbook, write_workbook
+from workbook_normalize import normalize_workbook, read_workbook
+
+RESULTS_DIR = os.path.join('benchmarks', 'results')
+
+# Scratch copies of the three history tables; dropped after each run
+BENCH_DDL = """
+    CREATE TABLE cranes (
+        id SERIAL PRIMARY KEY,
+        crane_id TEXT NOT NULL UNIQUE,
+        crane_name TEXT, plant_section TEXT, status TEXT NOT NULL, location TEXT NOT NULL, model TEXT NOT NULL,
+        grade TEXT, drive_type TEXT, unmanned_operation TEXT, electrical_manager TEXT, mechanical_manager TEXT,
+        installation_date DATE, inspection_reference_date DATE, inspection_cycle INTEGER, lead_time INTEGER
+    );
+    CREATE TABLE failure_records (
+        id SERIAL PRIMARY KEY,
+        crane_id TEXT NOT NULL, date DATE NOT NULL, failure_type TEXT NOT NULL, description TEXT NOT NULL,
+        severity TEXT NOT NULL, downtime INTEGER, cause TEXT, worktime NUMERIC, by_device TEXT
+    );
+    CREATE TABLE maintenance_records (
+        id SERIAL PRIMARY KEY,
+        crane_id TEXT NOT NULL, date DATE NOT NULL, type TEXT NOT NULL, technician TEXT NOT NULL,
+        status TEXT NOT NULL, work_order TEXT, task_name TEXT, actual_start_date_time TIMESTAMPTZ,
+        actual_end_date_time TIMESTAMPTZ, total_workers INTEGER, total_work_time NUMERIC, area_name TEXT,
+        equipment_name TEXT
+    );
+    CREATE INDEX ON failure_records (crane_id, date);
+    CREATE INDEX ON maintenance_records (crane_id, date);
+"""
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class StageTimer:
+    """Collects wall time and row counts per pipeline stage"""
+
+    def __init__(self):
+        self.stages = {}
+
+    def run(self, name, func, *args):
+        start = time.perf_counter()
+        result, rows = func(*args)
+        seconds = time.perf_counter() - start
+        self.stages[name] = {
+            'seconds': round(seconds, 4),
+            'rows': rows,
+            'rows_per_sec': round(rows / seconds, 1) if seconds > 0 else None,
+        }
+        print(f"  {name:<10} {seconds:8.2f}s  {rows:>9} rows")
+        return result
+
+
+def parse_stage(path):
+    sheets = read_workbook(path)
+    return sheets, sum(len(df) for df in sheets.values())
+
+
+def normalize_stage(sheets):
+    tables = normalize_workbook(sheets)
+    return tables, sum(len(df) for df in tables.values())
+
+
+def load_stage(conn, schema, tables):
+    """COPY every normalized table into the scratch schema"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE; CREATE SCHEMA {schema}; SET search_path TO {schema}")
+        cursor.execute(BENCH_DDL)
+        for table, df in tables.items():
+            buffer = io.StringIO()
+            df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+            buffer.seek(0)
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(df.columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return None, sum(len(df) for df in tables.values())
+
+
+def verify_stage(conn, schema, tables):
+    """Row counts must match the normalized frames; also reports history rows with no crane"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SET search_path TO {schema}")
+        checks = {}
+        for table, df in tables.items():
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            loaded = cursor.fetchone()[0]
+            if loaded != len(df):
+                raise RuntimeError(f"{table}: loaded {loaded} rows, expected {len(df)}")
+            checks[f'{table}_rows'] = loaded
+        for table in ('failure_records', 'maintenance_records'):
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM {table} h
+                WHERE NOT EXISTS (SELECT 1 FROM cranes c WHERE c.crane_id = h.crane_id)
+            """)
+            checks[f'{table}_without_crane'] = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    return checks, sum(len(df) for df in tables.values())
+
+
+def benchmark_workbook(path, conn=None, keep_schema=False):
+    timer = StageTimer()
+    sheets = timer.run('parse', parse_stage, path)
+    tables = timer.run('normalize', normalize_stage, sheets)
+
+    checks = None
+    if conn is not None:
+        schema = f"bench_{os.getpid()}"
+        try:
+            timer.run('load', load_stage, conn, schema, tables)
+            checks = timer.run('verify', verify_stage, conn, schema, tables)
+        finally:
+            if not keep_schema:
+                cursor = conn.cursor()
+                cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+                conn.commit()
+                cursor.close()
+
+    return {
+        'workbook': path,
+        'input_rows': {sheet: len(df) for sheet, df in sheets.items()},
+        'stages': timer.stages,
+        'total_seconds': round(sum(stage['seconds'] for stage in timer.stages.values()), 4),
+        'checks': checks,
+    }
+
+
+def compare_results(current, baseline_path):
+    """Print the per-stage change against an earlier results file"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {run['scale']: run for run in json.load(f)['runs']}
+
+    print(f"\nCompared with {baseline_path}:")
+    for run in current['runs']:
+        previous = baseline.get(run['scale'])
+        if previous is None:
+            continue
+        for stage, result in run['stages'].items():
+            before = previous['stages'].get(stage)
+            if before and before['seconds'] > 0:
+                change = (result['seconds'] - before['seconds']) / before['seconds'] * 100
+                print(f"  {run['scale']:g}x {stage:<10} {before['seconds']:8.2f}s -> {result['seconds']:8.2f}s "
+                      f"({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time parse/normalize/load/verify on synthetic workbooks')
+    parser.add_argument('--scales', type=float, nargs='+', default=[1, 10],
+                        help='workbook sizes relative to the real export (e.g. 1 10 100 1000)')
+    parser.add_argument('--workbook', help='benchmark this workbook instead of synthetic ones')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--regenerate', action='store_true', help='rebuild cached synthetic workbooks')
+    parser.add_argument('--no-db', action='store_true', help='skip the load and verify stages')
+    parser.add_argument('--keep-schema', action='store_true', help='leave the bench_<pid> schema in place')
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--compare', help='earlier results file to diff against')
+    args = parser.parse_args()
+
+    conn = None
+    if not args.no_db:
+        conn = connect_db()
+        if not conn:
+            print("Use --no-db to benchmark parsing and normalization only")
+            sys.exit(1)
+
+    targets = [(None, args.workbook)] if args.workbook else [(scale, None) for scale in args.scales]
+    results = {
+        'created_at': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'host': platform.node(),
+        'database': conn is not None,
+        'runs': [],
+    }
+
+    try:
+        for scale, path in targets:
+            if path is None:
+                path = default_path(scale)
+                csv_path = path[:-len('.xlsx')]
+                if not args.regenerate and os.path.exists(csv_path):
+                    path = csv_path
+                elif args.regenerate or not os.path.exists(path):
+                    print(f"Generating {scale:g}x workbook...")
+                    path = write_workbook(generate_workbook(scale, args.seed), path)
+            print(f"Benchmarking {path}")
+            run = benchmark_workbook(path, conn, args.keep_schema)
+            run['scale'] = scale
+            results['runs'].append(run)
+    finally:
+        if conn:
+            release_db(conn)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ import { CircularProgressbar, buildStyles } from 'react-circular-progressbar';
 import 'react-circular-progressbar/dist/styles.css';
 import { AISummaryButton } from './ai-summary-button';
 import { WorkStandardPopup } from './work-standard-popup';
+import { fetchAllPages } from '../../lib/queryClient';
 
 interface CraneDetailKPIProps {
   selectedCraneId: string;
@@ -67,10 +68,8 @@ export function CraneDetailKPI({ selectedCraneId }: CraneDetailKPIProps) {
         if (!response.ok) throw new Error('Failed to fetch failure records');
         return response.json();
       } else if (factoryName) {
-        // Get all records for the factory
-        const response = await fetch(`/api/failure-records/factory/${encodeURIComponent(factoryName)}`);
-        if (!response.ok) throw new Error('Failed to fetch factory failure records');
-        return response.json();
+        // Get all records for the factory, page by page
+        return fetchAllPages<any>(`/api/failure-records/factory/${encodeURIComponent(factoryName)}`);
       }
       return [];
     },
@@ -23,6 +23,22 @@ export async function apiRequest(
   return res;
 }
 
+// Follow nextCursor through every page of a record list endpoint
+export async function fetchAllPages<T>(url: string, pageSize = 1000): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const separator = url.includes("?") ? "&" : "?";
+    const pageUrl = `${url}${separator}limit=${pageSize}` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : "");
+    const res = await fetch(pageUrl, { credentials: "include" });
+    await throwIfResNotOk(res);
+    const page: { items: T[]; nextCursor: string | null } = await res.json();
+    items.push(...page.items);
+    cursor = page.nextCursor;
+  } while (cursor);
+  return items;
+}
+
 type UnauthorizedBehavior = "returnNull" | "throw";
 export const getQueryFn: <T>(options: {
   on401: UnauthorizedBehavior;
@@ -1,106 +1,149 @@
 #!/usr/bin/env python3
 import pandas as pd
-import psycopg2
-import os
+import sys
+from contextlib import ExitStack
 from datetime import datetime
 
+from crane_timeline import refresh_timelines
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from etl_metrics import RunMetrics
+from fleet_digest import refresh_digests
+from history_partitions import ensure_partitions
+from history_search_index import refresh_search_index
+from workbook_normalize import format_date
+from workbook_provenance import ensure_provenance, sheet_row, workbook_provenance
+
+metrics = RunMetrics('complete_import')
+
 # Connect to database
-conn = psycopg2.connect(
-    host=os.getenv('PGHOST'),
-    database=os.getenv('PGDATABASE'),
-    user=os.getenv('PGUSER'),
-    password=os.getenv('PGPASSWORD'),
-    port=os.getenv('PGPORT')
-)
+conn = connect_db()
+if not conn:
+    sys.exit(1)
 
 # Read all sheets from Excel file
 excel_file = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
-crane_df = pd.read_excel(excel_file, sheet_name='CraneList')
-failure_df = pd.read_excel(excel_file, sheet_name='FailureReport')
-repair_df = pd.read_excel(excel_file, sheet_name='RepairReport')
+with metrics.span('read') as span:
+    crane_df = pd.read_excel(excel_file, sheet_name='CraneList')
+    failure_df = pd.read_excel(excel_file, sheet_name='FailureReport')
+    repair_df = pd.read_excel(excel_file, sheet_name='RepairReport')
+    span.add_rows(len(crane_df) + len(failure_df) + len(repair_df))
+# Every row is tagged with this file, its sheet and row, and this load
+provenance = workbook_provenance(excel_file)
 
 print(f"CraneList: {len(crane_df)} rows")
 print(f"FailureReport: {len(failure_df)} rows")
 print(f"RepairReport: {len(repair_df)} rows")
 
 # Process all unique cranes (not just 50)
-unique_cranes = {}
-for _, row in crane_df.iterrows():
-    equipment_code = str(row.get('EquipmentCode', '')).strip()
-    crane_code = str(row.get('CraneCode', '')).strip()
-    
-    # Use EquipmentCode as primary identifier
-    if equipment_code and equipment_code != 'nan' and equipment_code != '':
-        if equipment_code not in unique_cranes:
-            unique_cranes[equipment_code] = {
-                'crane_id': crane_code if crane_code and crane_code != 'nan' else equipment_code,
-                'crane_name': str(row.get('CraneName', '')).strip() or str(row.get('EquipmentName', '')).strip() or None,
-                'plant_section': str(row.get('Plant/Secsion', '')).strip() or None,
-                'status': '정상',
-                'location': str(row.get('InstallationLocation', '')).strip() or '',
-                'model': str(row.get('HoistingDevice', '')).strip() or '',
-                'grade': str(row.get('Grade', '')).strip() if pd.notna(row.get('Grade')) else None,
-                'drive_type': str(row.get('DriveType', '')).strip() if pd.notna(row.get('DriveType')) else None,
-                'unmanned_operation': str(row.get('UnmannedOperation', '')).strip() if pd.notna(row.get('UnmannedOperation')) else None,
-                'installation_date': None,
-                'last_maintenance_date': None,
-                'is_urgent': False
-            }
+with metrics.span('normalize') as span:
+    unique_cranes = {}
+    for index, row in crane_df.iterrows():
+        equipment_code = str(row.get('EquipmentCode', '')).strip()
+        crane_code = str(row.get('CraneCode', '')).strip()
+    
+        # Use EquipmentCode as primary identifier
+        if equipment_code and equipment_code != 'nan' and equipment_code != '':
+            if equipment_code not in unique_cranes:
+                unique_cranes[equipment_code] = {
+                    'crane_id': crane_code if crane_code and crane_code != 'nan' else equipment_code,
+                    'crane_name': str(row.get('CraneName', '')).strip() or str(row.get('EquipmentName', '')).strip() or None,
+                    'plant_section': str(row.get('Plant/Secsion', '')).strip() or None,
+                    'status': '정상',
+                    'location': str(row.get('InstallationLocation', '')).strip() or '',
+                    'model': str(row.get('HoistingDevice', '')).strip() or '',
+                    'grade': str(row.get('Grade', '')).strip() if pd.notna(row.get('Grade')) else None,
+                    'drive_type': str(row.get('DriveType', '')).strip() if pd.notna(row.get('DriveType')) else None,
+                    'unmanned_operation': str(row.get('UnmannedOperation', '')).strip() if pd.notna(row.get('UnmannedOperation')) else None,
+                    'installation_date': None,
+                    'last_maintenance_date': None,
+                    'is_urgent': False,
+                    'source_row': sheet_row(index)
+                }
             
-            # Handle installation date
-            if pd.notna(row.get('InstallationDate')):
-                try:
-                    install_date = pd.to_datetime(row.get('InstallationDate'))
-                    unique_cranes[equipment_code]['installation_date'] = install_date.strftime('%Y-%m-%d')
-                except:
-                    pass
+                # Handle installation date
+                if pd.notna(row.get('InstallationDate')):
+                    try:
+                        install_date = pd.to_datetime(row.get('InstallationDate'))
+                        unique_cranes[equipment_code]['installation_date'] = install_date.strftime('%Y-%m-%d')
+                    except:
+                        pass
             
-            # Handle inspection reference date as last maintenance
-            if pd.notna(row.get('InspectionReferenceDate')):
-                try:
-                    ref_date = pd.to_datetime(row.get('InspectionReferenceDate'))
-                    unique_cranes[equipment_code]['last_maintenance_date'] = ref_date.strftime('%Y-%m-%d')
-                except:
-                    pass
+                # Handle inspection reference date as last maintenance
+                if pd.notna(row.get('InspectionReferenceDate')):
+                    try:
+                        ref_date = pd.to_datetime(row.get('InspectionReferenceDate'))
+                        unique_cranes[equipment_code]['last_maintenance_date'] = ref_date.strftime('%Y-%m-%d')
+                    except:
+                        pass
+
+    # Row dates as the loads below write them; they also decide which monthly partitions must exist
+    failure_dates = format_date(failure_df['date']).fillna('2024-01-01')
+    repair_dates = (format_date(repair_df['actualStartDateTime'])
+                    .fillna(format_date(repair_df.get('actualEndDateTime'))).fillna('2024-01-01'))
+    span.add_rows(len(unique_cranes))
 
 print(f"Processed {len(unique_cranes)} unique cranes")
 
 # Clear existing data and insert all cranes
 cursor = conn.cursor()
+locks = ExitStack()
 
 try:
-    # Clear existing data
-    cursor.execute("DELETE FROM maintenance_records")
-    cursor.execute("DELETE FROM failure_records")
+    # Every table is cleared and reloaded, so no other ETL job may touch them meanwhile
+    waited = locks.enter_context(etl_locks(conn, 'cranes', 'failure_records', 'maintenance_records',
+                                           job='complete_import'))
+    metrics.record('lock_wait', waited)
+    
+    # Provenance columns and monthly partitions (both commit their own DDL, so run before the clear)
+    ensure_provenance(conn)
+    with metrics.span('partition'):
+        ensure_partitions(conn, 'failure_records', failure_dates)
+        ensure_partitions(conn, 'maintenance_records', repair_dates)
+    
+    # Clear existing data; TRUNCATE empties every monthly partition without a row-by-row DELETE
+    cursor.execute("TRUNCATE maintenance_records, failure_records")
     cursor.execute("DELETE FROM cranes")
     print("Cleared existing data")
     
     # Insert all cranes
-    for equipment_code, crane_data in unique_cranes.items():
-        try:
-            cursor.execute("""
-                INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, 
-                                  grade, drive_type, unmanned_operation, installation_date, 
-                                  last_maintenance_date, is_urgent) 
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                crane_data['crane_id'],
-                crane_data['crane_name'],
-                crane_data['plant_section'],
-                crane_data['status'],
-                crane_data['location'],
-                crane_data['model'],
-                crane_data['grade'],
-                crane_data['drive_type'],
-                crane_data['unmanned_operation'],
-                crane_data['installation_date'],
-                crane_data['last_maintenance_date'],
-                crane_data['is_urgent']
-            ))
-        except Exception as e:
-            print(f"Error inserting crane {equipment_code}: {e}")
-    
-    conn.commit()
+    with metrics.span('load') as span:
+        for equipment_code, crane_data in unique_cranes.items():
+            try:
+                cursor.execute("""
+                    INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, 
+                                      grade, drive_type, unmanned_operation, installation_date, 
+                                      last_maintenance_date, is_urgent,
+                                      source_file, source_sheet, source_row, import_batch) 
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """, (
+                    crane_data['crane_id'],
+                    crane_data['crane_name'],
+                    crane_data['plant_section'],
+                    crane_data['status'],
+                    crane_data['location'],
+                    crane_data['model'],
+                    crane_data['grade'],
+                    crane_data['drive_type'],
+                    crane_data['unmanned_operation'],
+                    crane_data['installation_date'],
+                    crane_data['last_maintenance_date'],
+                    crane_data['is_urgent'],
+                    provenance['source_file'],
+                    'CraneList',
+                    crane_data['source_row'],
+                    provenance['import_batch']
+                ))
+            except Exception as e:
+                print(f"Error inserting crane {equipment_code}: {e}")
+        span.add_rows(len(unique_cranes))
+    
+    # The clear above empties all three tables in this commit
+    for table in ('cranes', 'failure_records', 'maintenance_records'):
+        notify_change(conn, table, job='complete_import')
+    with metrics.span('commit'):
+        conn.commit()
     
     # Count inserted cranes
     cursor.execute("SELECT COUNT(*) FROM cranes")
@@ -108,80 +151,94 @@ try:
     print(f"Inserted {crane_count} cranes")
     
     # Insert failure records
-    failure_count = 0
-    for _, row in failure_df.iterrows():
-        equipment_code = str(row.get('EquipmentCode', '')).strip()
-        if equipment_code and equipment_code in unique_cranes:
-            try:
-                failure_date = None
-                if pd.notna(row.get('FailureDate')):
-                    failure_date = pd.to_datetime(row.get('FailureDate')).strftime('%Y-%m-%d')
-                
-                cursor.execute("""
-                    INSERT INTO failure_records (crane_id, date, type, description, status, severity) 
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (
-                    unique_cranes[equipment_code]['crane_id'],
-                    failure_date or '2024-01-01',
-                    str(row.get('FailureType', '기타')).strip(),
-                    str(row.get('Description', '')).strip() or '고장 발생',
-                    '완료',
-                    'medium'
-                ))
-                failure_count += 1
-            except Exception as e:
-                print(f"Error inserting failure for {equipment_code}: {e}")
+    with metrics.span('load') as span:
+        failure_count = 0
+        for index, row in failure_df.iterrows():
+            equipment_code = str(row.get('EquipmentCode', '')).strip()
+            if equipment_code and equipment_code in unique_cranes:
+                try:
+                    cursor.execute("""
+                        INSERT INTO failure_records (crane_id, date, type, description, status, severity,
+                                                     source_file, source_sheet, source_row, import_batch) 
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """, (
+                        unique_cranes[equipment_code]['crane_id'],
+                        failure_dates[index],
+                        str(row.get('FailureType', '기타')).strip(),
+                        str(row.get('Description', '')).strip() or '고장 발생',
+                        '완료',
+                        'medium',
+                        provenance['source_file'],
+                        'FailureReport',
+                        sheet_row(index),
+                        provenance['import_batch']
+                    ))
+                    failure_count += 1
+                except Exception as e:
+                    print(f"Error inserting failure for {equipment_code}: {e}")
+        span.add_rows(failure_count)
     
-    conn.commit()
+    notify_change(conn, 'failure_records', job='complete_import')
+    with metrics.span('commit'):
+        conn.commit()
     print(f"Inserted {failure_count} failure records")
     
     # Insert maintenance/repair records  
-    repair_count = 0
-    for _, row in repair_df.iterrows():
-        equipment_code = str(row.get('EquipmentCode', '')).strip()
-        if equipment_code and equipment_code in unique_cranes:
-            try:
-                repair_date = None
-                if pd.notna(row.get('ActualStartDateTime')):
-                    repair_date = pd.to_datetime(row.get('ActualStartDateTime')).strftime('%Y-%m-%d')
-                elif pd.notna(row.get('ActualEndDateTime')):
-                    repair_date = pd.to_datetime(row.get('ActualEndDateTime')).strftime('%Y-%m-%d')
-                
-                total_workers = None
-                if pd.notna(row.get('TotalWorkers')):
-                    try:
-                        total_workers = int(float(row.get('TotalWorkers')))
-                    except:
-                        pass
+    with metrics.span('load') as span:
+        repair_count = 0
+        for index, row in repair_df.iterrows():
+            equipment_code = str(row.get('EquipmentCode', '')).strip()
+            if equipment_code and equipment_code in unique_cranes:
+                try:
+                    total_workers = None
+                    if pd.notna(row.get('TotalWorkers')):
+                        try:
+                            total_workers = int(float(row.get('TotalWorkers')))
+                        except:
+                            pass
                 
-                total_work_time = None
-                if pd.notna(row.get('TotalWorkTime')):
-                    try:
-                        total_work_time = float(row.get('TotalWorkTime'))
-                    except:
-                        pass
+                    total_work_time = None
+                    if pd.notna(row.get('TotalWorkTime')):
+                        try:
+                            total_work_time = float(row.get('TotalWorkTime'))
+                        except:
+                            pass
                 
-                cursor.execute("""
-                    INSERT INTO maintenance_records (crane_id, date, type, description, status, 
-                                                   total_workers, total_work_time, technician) 
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    unique_cranes[equipment_code]['crane_id'],
-                    repair_date or '2024-01-01',
-                    '수리',
-                    str(row.get('TaskName', '')).strip() or '정비 작업',
-                    '완료',
-                    total_workers,
-                    total_work_time,
-                    str(row.get('Technician', '')).strip() or '정비팀'
-                ))
-                repair_count += 1
-            except Exception as e:
-                print(f"Error inserting repair for {equipment_code}: {e}")
+                    cursor.execute("""
+                        INSERT INTO maintenance_records (crane_id, date, type, description, status, 
+                                                       total_workers, total_work_time, technician,
+                                                       source_file, source_sheet, source_row, import_batch) 
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """, (
+                        unique_cranes[equipment_code]['crane_id'],
+                        repair_dates[index],
+                        '수리',
+                        str(row.get('TaskName', '')).strip() or '정비 작업',
+                        '완료',
+                        total_workers,
+                        total_work_time,
+                        str(row.get('Technician', '')).strip() or '정비팀',
+                        provenance['source_file'],
+                        'RepairReport',
+                        sheet_row(index),
+                        provenance['import_batch']
+                    ))
+                    repair_count += 1
+                except Exception as e:
+                    print(f"Error inserting repair for {equipment_code}: {e}")
+        span.add_rows(repair_count)
     
-    conn.commit()
+    notify_change(conn, 'maintenance_records', job='complete_import')
+    with metrics.span('commit'):
+        conn.commit()
     print(f"Inserted {repair_count} maintenance records")
     
+    # Re-index the reloaded history for keyword search, and rebuild the timelines and AI digests on it
+    with metrics.span('index'):
+        refresh_search_index(conn)
+        refresh_timelines(conn)
+        refresh_digests(conn)
+    
     # Final counts
     cursor.execute("SELECT COUNT(*) FROM cranes")
     final_crane_count = cursor.fetchone()[0]
@@ -196,11 +253,14 @@ try:
     print(f"Cranes: {final_crane_count}")
     print(f"Failure records: {final_failure_count}")
     print(f"Maintenance records: {final_maintenance_count}")
+    metrics.finish('success')
     
 except Exception as e:
     print(f"Error during import: {e}")
     conn.rollback()
+    metrics.finish('failed')
     
 finally:
+    locks.close()
     cursor.close()
-    conn.close()
\ No newline at end of file
+    release_db(conn)
\ No newline at end of file
@@ -1,315 +0,0 @@
-Total rows found: 293
-Processing 293 valid cranes out of 293 total rows
-
-Creating 6 SQL batches:
-
--- Batch 1 (50 cranes)
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model) VALUES
-('4P1001205', '1C03_#1CAL 출측', '1냉연공장', 'operating', '#1CAL 출측(1C03)', 'Bridge Crane'),
-('4P1001210', '2C04_#2CAL 출측', '1냉연공장', 'operating', '#2CAL 출측(2C04)', 'Bridge Crane'),
-('4P1001114', '2후판 A0 Crane', '후판제품공장', 'operating', '2후판 A0 Crane', 'Bridge Crane'),
-('4P1031472', 'Roll Shop(A01)', '3전기강판공장', 'operating', 'Roll Shop(A01)', 'Bridge Crane'),
-('4P1000924', '정정통합야드(A03)', '4연주공장', 'operating', '정정 통합야드(A04)', 'Bridge Crane'),
-('4P1000921', '정정 통합야드(A04)', '4연주공장', 'operating', '정정통합야드(A03)', 'Bridge Crane'),
-('4P1000920', '정정통합야드(A05)', '4연주공장', 'operating', '정정통��야드(A05)', 'Bridge Crane'),
-('4P1001116', '2후판 Shipping(A-1)', '후판제품공장', 'operating', '2후판 Shipping(A-1)', 'Bridge Crane'),
-('4P1001196', '수냉장 #11 (A11)', '1냉연공장', 'operating', '수냉장 #11 (A11)', 'Bridge Crane'),
-('4P1001197', 'A12_수냉장 #12', '1냉연공장', 'operating', '수냉장 #12(A12)', 'Bridge Crane'),
-('4P1001112', '2후판 Shipping(A-2)', '후판제품공장', 'operating', '2후판 Shipping(A-2)', 'Bridge Crane'),
-('4P1001198', '정정 Yard(CT13)', '1열연공장', 'operating', '정정 Yard(CT13)', 'Bridge Crane'),
-('4P1001079', '2열연제품(CT13)', '제품출하섹션', 'operating', '2열연제품(CT13)', 'Bridge Crane'),
-('4P1000923', '관제1야드(B05)', '생산관제섹션', 'operating', '관제1야드(B05)', 'Bridge Crane'),
-('4P1038710', '통합정정 연마(B01)', '1선재공장', 'operating', '통합정정 연마(B01)', 'Bridge Crane'),
-('4P1001113', '2후판 Shipping(B01)', '후판제품공장', 'operating', '2후판 Shipping(B01)', 'Bridge Crane'),
-('4P1034767', 'TRM #2(CTB1)', 'STS2냉연공장', 'operating', 'TRM #2(CTB1)', 'Bridge Crane'),
-('4P1001110', '2후판 Shipping(B02)', '후판제품공장', 'operating', '2후판 Shipping(B02)', 'Bridge Crane'),
-('4P1034766', 'TRM #1(CTB2)', 'STS2냉연공장', 'operating', 'TRM #1(CTB2)', 'Bridge Crane'),
-('4P1013350', '전기로 상부(B-C)', '2제강공장', 'operating', '전기로 상부(B-C)', 'Bridge Crane'),
-('4P1001001', '가열로(BC01)', '3선재공장', 'operating', '가열로(BC01)', 'Bridge Crane'),
-('4P1000976', '장입 C동(BL01)', '4선재공장', 'operating', '장입 C동(BL01)', 'Bridge Crane'),
-('4P1029747', '강편 Bloom Yard #4(BL01A)', '1선��공장', 'operating', '강편 Bloom Yard #4(BL01A)', 'Bridge Crane'),
-('4P1035573', '강편 Bloom Yard #5(BL03A)', '1선재공장', 'operating', '강편 Bloom Yard #5(BL03A)', 'Bridge Crane'),
-('4P1000943', '강편 Bloom Yard #1(BL01)', '1선재공장', 'operating', '강편 Bloom Yard #1(BL01)', 'Bridge Crane'),
-('4P1000944', '강편 Bloom Yard #2(BL02)', '1선재공장', 'operating', '강편 Bloom Yard #2(BL02)', 'Bridge Crane'),
-('4P1000990', 'B/T #1(BT01)', '2선재공장', 'operating', 'B/T #1(BT01)', 'Bridge Crane'),
-('4P1039641', '장입 A동(BT02)', '4선재공장', 'operating', '장입 A동(BT02)', 'Bridge Crane'),
-('4P1000987', 'B/T #2(BT02)', '2선재공장', 'operating', 'B/T #2(BT02)', 'Bridge Crane'),
-('4P1000946', '강편 B/T Yard #1(BT01)', '1선재공장', 'operating', '강편 B/T Yard #1(BT01)', 'Bridge Crane'),
-('4P1000953', '강편 B/T Yard #2(BT02)', '1선재공장', 'operating', '강편 B/T Yard #2(BT02)', 'Bridge Crane'),
-('4P1000974', 'B/T #2(BL02)', '3선재공장', 'operating', 'B/T #2(BL02)', 'Bridge Crane'),
-('4P1000942', '강편 B/T Yard #3(BT03)', '1선재공장', 'operating', '강편 B/T Yard #3(BT03)', 'Bridge Crane'),
-('4P1000988', 'B/T #3(BT03)', '2선재공장', 'operating', 'B/T #3(BT03)', 'Bridge Crane'),
-('4P1000950', '강편 B/T Yard #4(BT04)', '1선재공장', 'operating', '강편 B/T Yard #4(BT04)', 'Bridge Crane'),
-('4P1001005', 'B/T #4(BL04)', '3선재공장', 'operating', 'B/T #4(BL04)', 'Bridge Crane'),
-('4P1041118', '제품부두 #1 BTC', '제품출하섹션', 'operating', '제품부두 #1 BTC', 'Bridge Crane'),
-('4P1012681', '제품부두 #12 BTC', '제품출하섹션', 'operating', '제품부두 #12 BTC', 'Bridge Crane'),
-('4P1012682', '제품부두  #13 BTC', '제품출하섹션', 'operating', '제품부두  #13 BTC', 'Bridge Crane'),
-('4P1041119', '제품부두 #2 BTC', '제품출하섹션', 'operating', '제품부두 #2 BTC', 'Bridge Crane'),
-('4P1041120', '제품부��� #3 BTC', '제품출하섹션', 'operating', '제품부두 #3 BTC', 'Bridge Crane'),
-('4P1041121', '제품부두 #4 BTC', '제품출하섹션', 'operating', '제품부두 #4 BTC', 'Bridge Crane'),
-('4P1012674', '제품부두 #5 BTC', '제품출하섹션', 'operating', '제품부두 #5 BTC', 'Bridge Crane'),
-('4P1012675', '제품부두 #6 BTC', '제품출하섹션', 'operating', '제품부두 #6 BTC', 'Bridge Crane'),
-('4P1012676', '제품부두 #7 BTC', '제품출하섹션', 'operating', '제품부두 #7 BTC', 'Bridge Crane'),
-('4P1012677', '제품부두 #8 BTC', '제품출하섹션', 'operating', '제품부두 #8 BTC', 'Bridge Crane'),
-('4P1038712', '통합정정 B/T 입측(C01)', '1선재공장', 'operating', '통합정정 B/T 입측(C01)', 'Bridge Crane'),
-('4P1038912', '통합정정 B/T(C02)', '1선재공장', 'operating', '통합정정 B/T(C02)', 'Bridge Crane'),
-('4P1038913', '통합정정 B/T 출측(C03)', '1선재공장', 'operating', '통합정정 B/T 출측(C03)', 'Bridge Crane'),
-('4P1001111', '2후판 Shipping(C01)', '후판제품공장', 'operating', '2후판 Shipping(C01)', 'Bridge Crane');
-
--- Batch 2 (50 cranes)
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model) VALUES
-('4P1034773', 'Roll Shop (CTC1)', 'STS2냉연공장', 'operating', 'Roll Shop (CTC1)', 'Bridge Crane'),
-('4P1001139', '2후판 Shipping(C02)', '후판제품공장', 'operating', '2후판 Shipping(C02)', 'Bridge Crane'),
-('4P1034768', 'ΙCY #1(CTC2)', 'STS2냉연공장', 'operating', 'ΙCY #1(CTC2)', 'Bridge Crane'),
-('4P1029421', 'CGL 입측(CA09)', '도금공장', 'operating', 'CGL 입측(CA09)', 'Bridge Crane'),
-('4P1001253', 'CGL 입측 SPM(CA10)', '도금공장', 'operating', 'CGL 입측 SPM(CA10)', 'Bridge Crane'),
-('4P1013403', 'Lance(C-D)', '3제강공장', 'operating', 'Lance(C-D)', 'Bridge Crane'),
-('4P1028779', '#2 HCL(CG34)', '1전기강판공장', 'operating', '#2 HCL(CG34)', 'Bridge Crane'),
-('4P1001282', '#1 DNL(CG41)', '1전기강판공장', 'operating', '#1 DNL(CG41)', 'Bridge Crane'),
-('4P1001288', '#1 COF(CG61)', '1전기강판공장', 'operating', '#2 COF(CG62)', 'Bridge Crane'),
-('4P1028756', '#2 COF(CG62)', '1전기강판공장', 'operating', '#1 COF(CG61)', 'Bridge Crane'),
-('4P1043115', '#1 DRL(CH32)', '1전기강판공장', 'operating', '#1 DRL(CH32)', 'Bridge Crane'),
-('4P1001294', '#1 DNL(CH42)', '1전기강판공장', 'operating', '#1 DNL(CH42)', 'Bridge Crane'),
-('4P1001283', '#2 DCNL(CH51)', '1전기강판공장', 'operating', '#2 DCNL(CH51)', 'Bridge Crane'),
-('4P1001170', '3후판 냉간교정(CL01)', '후판제품공장', 'operating', '3후판 냉간교정(CL01)', 'Bridge Crane'),
-('4P1001188', '3후판 냉간교정(CL02)', '후판제품공장', 'operating', '3후판 냉간교정(CL02)', 'Bridge Crane'),
-('4P1000927', '정정-1 Yard(CT09)', '3연주공장', 'operating', '정정-1 Yard(CT09)', 'Bridge Crane'),
-('4P1000928', '정정-1 Yard(CT10)', '3연주공장', 'operating', '정정-1 Yard(CT10)', 'Bridge Crane'),
-('4P1001344', 'BAL(CT11)', '1냉연공장', 'operating', 'BAL(CT11)', 'Bridge Crane'),
-('4P1016029', '코일통합제품창고01(PS-3)', '(포항)STS제강부', 'operating', '코일통합제품창고01(PS-3)', 'Bridge Crane'),
-('4P1028776', 'APL 소재 Yard(CT-11)', '2전기강판공장', 'operating', 'APL 소재 Yard(CT-11)', 'Bridge Crane'),
-('4P1001010', 'Slab Yard(CT11)', '1열연공장', 'operating', 'Slab Yard(CT11)', 'Bridge Crane'),
-('4P1030810', '2 EGL 출하동(CT11)', '도금공장', 'operating', '2 EGL 출하동(CT11)', 'Bridge Crane'),
-('4P1001218', '1냉연제품(CT11)', '제품출하섹션', 'operating', '1냉연제품(CT11)', 'Bridge Crane'),
-('4P1029403', 'Slab Yard(CT12)', '1열연공장', 'operating', 'Slab Yard(CT12)', 'Bridge Crane'),
-('4P1001284', 'ZRM(CT-12)', '2전기강판공장', 'operating', 'ZRM(CT-12)', 'Bridge Crane'),
-('4P1029748', '코일통합창고 02동', '(포항)STS제강부', 'operating', '코일통합창고 02동', 'Bridge Crane'),
-('4P1001287', 'CRM(CT-22)', '2전기강판공장', 'operating', 'CRM(CT-22)', 'Bridge Crane'),
-('4P1001057', 'Slab Yard(CT22)', '2열연공장', 'operating', 'Slab Yard(CT22)', 'Bridge Crane'),
-('4P1001021', '1열연제품(CT23)', '제품출하섹션', 'operating', '1열연제품(CT23)', 'Bridge Crane'),
-('4P1001224', 'CT23_#2RCL 출측', '1냉연공장', 'operating', '#2RCL 출측(CT23)', 'Bridge Crane'),
-('4P1001061', 'Slab Yard(CT23)', '2열연공장', 'operating', 'Slab Yard(CT23)', 'Bridge Crane'),
-('4P1001313', '2APL(CT23)', '소둔산세공장', 'operating', '2APL(CT23)', 'Bridge Crane'),
-('4P1001219', '1냉연제품(CT31)', '제품출하섹션', 'operating', '1냉연제품(CT31)', 'Bridge Crane'),
-('4P1001330', 'ZRM(CT31)', '1냉연공장', 'operating', 'ZRM(CT31)', 'Bridge Crane'),
-('4P1000919', 'Slab Yard(CT31)', '1열연공장', 'operating', 'Slab Yard(CT31)', 'Bridge Crane'),
-('4P1001026', '정정(CT31)', '1열연공장', 'operating', '정정(CT31)', 'Bridge Crane'),
-('4P1001244', '#3 Yard(CT31)', '2냉연공장', 'operating', '#3 Yard(CT31)', 'Bridge Crane'),
-('4P1001024', '1열연제품(CT32)', '제품출하섹션', 'operating', '1열연제품(CT32)', 'Bridge Crane'),
-('4P1001332', 'CRM(CT32)', '1냉연공장', 'operating', 'CRM(CT32)', 'Bridge Crane'),
-('4P1000929', 'Slab Yard(CT32)', '1열연공장', 'operating', 'Slab Yard(CT32)', 'Bridge Crane'),
-('4P1028755', '1냉연제품(CT32)', '제품출하섹션', 'operating', '1냉연제품(CT32)', 'Bridge Crane'),
-('4P1001246', '#3 Yard(CT32)', '2냉연공장', 'operating', '#3 Yard(CT32)', 'Bridge Crane'),
-('4P1001225', 'CT33_#2RCL', '1냉연공장', 'operating', '#2RCL(CT33)', 'Bridge Crane'),
-('4P1001296', '#1 DRL(CT33)', '1전기강판공장', 'operating', '#1 DRL(CT33)', 'Bridge Crane'),
-('4P1001081', '2열연제품(CT33)', '제품출하섹션', 'operating', '2열연제품(CT33)', 'Bridge Crane'),
-('4P1001249', '2냉연제품(CT40)', '제품출하섹션', 'operating', '2냉연제품(CT40)', 'Bridge Crane'),
-('4P1001221', '1냉연제품(CT41)', '제품출하섹션', 'operating', '1냉연제품(CT41)', 'Bridge Crane'),
-('4P1001027', '정정 Yard(CT41)', '1열연공장', 'operating', '정정 Yard(CT41)', 'Bridge Crane'),
-('4P1001255', '#4 Yard(CT41)', '2냉연공장', 'operating', '#4 Yard(CT41)', 'Bridge Crane'),
-('4P1001025', '1열��제품(CT42)', '제품출하섹션', 'operating', '1열연제품(CT42)', 'Bridge Crane');
-
--- Batch 3 (50 cranes)
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model) VALUES
-('4P1001223', 'CT42_#2 CPL', '1냉연공장', 'operating', '#2 CPL(CT42)', 'Bridge Crane'),
-('4P1001222', 'CT43_#2 CPL 입측', '1냉연공장', 'operating', '#2 CPL 입측(CT43)', 'Bridge Crane'),
-('4P1001085', '2열연제품(CT43)', '제품출하섹션', 'operating', '2열연제품(CT43)', 'Bridge Crane'),
-('4P1031473', '2 ZRM(CT51)', '3전기강판공장', 'operating', '2 ZRM(CT51)', 'Bridge Crane'),
-('4P1001211', 'CT52_#2CAL 출측', '1냉연공장', 'operating', '#2 CAL 출측(CT52)', 'Bridge Crane'),
-('4P1027971', 'SPM(CT52)', '1냉연공장', 'operating', 'SPM(CT52)', 'Bridge Crane'),
-('4P1001083', '3HSL(CT52)', '소둔산세공장', 'operating', '3HSL(CT52)', 'Bridge Crane'),
-('4P1001084', '3HSL(CT53)', '소둔산세공장', 'operating', '3HSL(CT53)', 'Bridge Crane'),
-('4P1001250', '2냉연제품(CT60)', '제품출하섹션', 'operating', '2냉연제품(CT60)', 'Bridge Crane'),
-('4P1001251', '2냉연제품(CT61)', '제품출하섹션', 'operating', '2냉연제품(CT61)', 'Bridge Crane'),
-('4P1001326', 'CSY(CT61)', '1냉연공장', 'operating', 'CSY(CT61)', 'Bridge Crane'),
-('4P1001303', '3APL (CT61)', '소둔산세공장', 'operating', '3APL (CT61)', 'Bridge Crane'),
-('4P1031474', '3 APL 출측(CT61)', '3전기강판공장', 'operating', '3 APL 출측(CT61)', 'Bridge Crane'),
-('4P1001248', '2냉연제품(CT62)', '제품출하섹션', 'operating', '2냉연제품(CT62)', 'Bridge Crane'),
-('4P1001306', 'STL (CT62)', '소둔산세공장', 'operating', 'STL (CT62)', 'Bridge Crane'),
-('4P1031475', '3 APL 입측(CT62)', '3전기강판공장', 'operating', '3 APL 입측(CT62)', 'Bridge Crane'),
-('4P1001316', 'STL(CT63)', '소둔산세공장', 'operating', 'STL(CT63)', 'Bridge Crane'),
-('4P1039996', '1APL(CT71)', '열연기술개발섹션', 'operating', '1APL(CT71)', 'Bridge Crane'),
-('4P1031369', '3 COF 상부(CT71)', '3전기강판공장', 'operating', '3 COF 상부(CT71)', 'Bridge Crane'),
-('4P1001336', 'STS냉연제품(CT72)', '제품출하섹션', 'operating', 'STS냉연제품(CT72)', 'Bridge Crane'),
-('4P1031365', '3 HCL 입측(CT72)', '3전기강판공장', 'operating', '3 HCL 입측(CT72)', 'Bridge Crane'),
-('4P1001305', '1APL(CT72)', '소둔산세공장', 'operating', '1APL(CT72)', 'Bridge Crane'),
-('4P1039997', '1APL(CT73)', '열연기술개발섹션', 'operating', '1APL(CT73)', 'Bridge Crane'),
-('4P1001201', 'CT73_PCM', '1냉연공장', 'operating', '7동 소재야드 PCM', 'Bridge Crane'),
-('4P1031366', '3 HCL 출측(CT73)', '3전기강판공장', 'operating', '3 HCL 출측(CT73)', 'Bridge Crane'),
-('4P1039047', '1APL(CT74)', '소둔산세공장', 'operating', '1APL(CT74)', 'Bridge Crane'),
-('4P1001199', 'CT74_PCM', '1냉연공장', 'operating', 'PCM(CT74)', 'Bridge Crane'),
-('4P1031371', '2 DRL(CT74)', '3전기강판공장', 'operating', '2 DRL(CT74)', 'Bridge Crane'),
-('4P1001314', '3BAF(CT81)', '소둔산세공장', 'operating', '3BAF(CT81)', 'Bridge Crane'),
-('4P1031363', '3 DNL 입측(CT81)', '3전기강판공장', 'operating', '3 DNL 입측(CT81)', 'Bridge Crane'),
-('4P1036056', '2냉연 8동(CT81)', '도금공장', 'operating', '2냉연 8동(CT81)', 'Bridge Crane'),
-('4P1001343', 'STS냉연제품(CT82)', '제품출하섹션', 'operating', 'STS냉연제품(CT82)', 'Bridge Crane'),
-('4P1001315', '3CPL(CT82)', '소둔산세공장', 'operating', '3CPL(CT82)', 'Bridge Crane'),
-('4P1031364', '3 DNL 출측(CT82)', '3전기강판공장', 'operating', '3 DNL 출측(CT82)', 'Bridge Crane'),
-('4P1036057', '2냉연제품(CT82)', '제품출하섹션', 'operating', '2냉연제품(CT82)', 'Bridge Crane'),
-('4P1034765', 'STS냉연제품(CT83)', '제품출하섹션', 'operating', 'STS냉연제품(CT83)', 'Bridge Crane'),
-('4P1001345', 'TLL(CT91)', '1냉연공장', 'operating', 'TLL(CT91)', 'Bridge Crane'),
-('4P1001309', '1CGL(CT91)', '소둔산세공장', 'operating', '1CGL(CT91)', 'Bridge Crane'),
-('4P1039049', '1CGL(CT92)', '소둔산세공장', 'operating', '1CGL(CT92)', 'Bridge Crane'),
-('4P1001337', 'STS냉연제품(CT92)', '제품출하섹션', 'operating', 'STS냉연제품(CT92)', 'Bridge Crane'),
-('4P1001214', 'CTA1_#1CAL 출측', '1냉연공장', 'operating', '#1CAL 출측(CTA1)', 'Bridge Crane'),
-('4P1001328', 'ICY(CTA1)', '1냉연공장', 'operating', 'ICY(CTA1)', 'Bridge Crane'),
-('4P1001311', '3CGL(CTA1)', '소둔산세공장', 'operating', '3CGL(CTA1)', 'Bridge Crane'),
-('4P1001213', 'CTA2_#1 CAL 출측', '1냉연공장', 'operating', '#1 CAL 출측(CTA2)', 'Bridge Crane'),
-('4P1001335', 'ICY(CTA2)', '1냉연공장', 'operating', 'ICY(CTA2)', 'Bridge Crane'),
-('4P1028970', '4BAF(CTB1)', '소둔산세공장', 'operating', '4BAF(CTB1)', 'Bridge Crane'),
-('4P1028971', '4BAF(CTB2)', '소둔산세공장', 'operating', '4BAF(CTB2)', 'Bridge Crane'),
-('4P1028781', '#3 ACL #2(CT-H2)', '2전기강판공장', 'operating', '#3 ACL #2(CT-H2)', 'Bridge Crane'),
-('4P1001278', '#2 ACL #1(CT-J1)', '2전기강판공장', 'operating', '#2 ACL #1(CT-J1)', 'Bridge Crane'),
-('4P1001279', '#2 ACL #2(CT-J2)', '2전기강판공장', 'operating', '#2 ACL #2(CT-J2)', 'Bridge Crane');
-
--- Batch 4 (50 cranes)
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model) VALUES
-('4P1001274', '#2 ACL #3(CT-J3)', '2전기강판공장', 'operating', '#2 ACL #3(CT-J3)', 'Bridge Crane'),
-('4P1043347', '2선재제품(CY01)', '제품출하섹션', 'operating', '2선재제품(CY01)', 'Bridge Crane'),
-('4P1000970', '1선재 제품 (CY01)', '제품출하섹션', 'operating', '1선재 제품 (CY01)', 'Bridge Crane'),
-('4P1000992', '3선재제품(CY10)', '제품출하섹션', 'operating', '3선재제품(CY10)', 'Bridge Crane'),
-('4P1000981', '2선재제품(CY02)', '제품출하섹션', 'operating', '2선재제품(CY02)', 'Bridge Crane'),
-('4P1000964', '1선재 제품 (CY02)', '제품출하섹션', 'operating', '1선재 제품 (CY02)', 'Bridge Crane'),
-('4P1000971', '2선재 제품창고 C동 (CY03)', '제품출하섹션', 'operating', '2선재 제품창고 C동 (CY03)', 'Bridge Crane'),
-('4P1000968', '1선재 제품 (CY03)', '제품출하섹션', 'operating', '1선재 제품 (CY03)', 'Bridge Crane'),
-('4P1000978', '2선재 제품창고 D동 (CY04)', '제품출하섹션', 'operating', '2선재 제품창고 D동 (CY04)', 'Bridge Crane'),
-('4P1000969', '1선재 제품 (CY04)', '제품출하섹션', 'operating', '1선재 제품 (CY04)', 'Bridge Crane'),
-('4P1000975', '2선재제품(CY05)', '제품출하섹션', 'operating', '2선재제품(CY05)', 'Bridge Crane'),
-('4P1000966', '1선재 제품 (CY05)', '제품출하섹션', 'operating', '1선재 제품 (CY05)', 'Bridge Crane'),
-('4P1000997', '3선재제품(CY06)', '제품출하섹션', 'operating', '3선재제품(CY06)', 'Bridge Crane'),
-('4P1000993', '3선재제품(CY07)', '제품출하섹션', 'operating', '3선재제품(CY07)', 'Bridge Crane'),
-('4P1000994', '3선재제품(CY08)', '제품출��섹션', 'operating', '3선재제품(CY08)', 'Bridge Crane'),
-('4P1000991', '3선재제품(CY09)', '제품출하섹션', 'operating', '3선재제품(CY09)', 'Bridge Crane'),
-('4P1038911', '통합정정 연마(D01)', '1선재공장', 'operating', '통합정정 연마(D01)', 'Bridge Crane'),
-('4P1001140', '2후판 Shipping(D01)', '��판제품공장', 'operating', '2후판 Shipping(D01)', 'Bridge Crane'),
-('4P1034770', 'ΙCY #3(CTD1)', 'STS2냉연공장', 'operating', 'ΙCY #3(CTD1)', 'Bridge Crane'),
-('4P1001155', '2후판 Shipping(D02)', '후판제품공장', 'operating', '2후판 Shipping(D02)', 'Bridge Crane'),
-('4P1034769', 'ΙCY #2(CTD2)', 'STS2냉연공장', 'operating', 'ΙCY #2(CTD2)', 'Bridge Crane'),
-('4P1001271', '1 EGL(EG01)', '도금공장', 'operating', '1 EGL(EG01)', 'Bridge Crane'),
-('4P1001270', '1 EGL(EG02)', '도금공장', 'operating', '1 EGL(EG02)', 'Bridge Crane'),
-('4P1027956', '1 EGL(EG03)', '도금공장', 'operating', '1 EGL(EG03)', 'Bridge Crane'),
-('4P1001109', '2후판 Shipping(E01)', '후판제품공장', 'operating', '2후판 Shipping(E01)', 'Bridge Crane'),
-('4P1034772', 'APF #3(CTE1)', 'STS2냉연공장', 'operating', 'APF #3(CTE1)', 'Bridge Crane'),
-('4P1031287', '2후판 Shipping(E02)', '후판제품공장', 'operating', '2후판 Shipping(E02)', 'Bridge Crane'),
-('4P1034771', 'APF #1(CTE3)', 'STS2냉연공장', 'operating', 'APF #1(CTE3)', 'Bridge Crane'),
-('4P1001202', 'EC01_ECL', '1냉연공장', 'operating', 'ECL(EC01)', 'Bridge Crane'),
-('4P1013406', 'Ladle(E-F)', '3제강공장', 'operating', 'Ladle(E-F)', 'Bridge Crane'),
-('4P1013407', 'Casting(E-F)', '3제강공장', 'operating', 'Casting(E-F)', 'Bridge Crane'),
-('4P1001138', '제품출하 F01', '제품출하섹션', 'operating', '2후판제품 F01', 'Bridge Crane'),
-('4P1001152', '2후판 Shipping(F02)', '후판제품공장', 'operating', '2후판 Shipping(F02)', 'Bridge Crane'),
-('4P1001150', '제품출하 G01', '제품출하섹션', 'operating', '3후판제품 G01', 'Bridge Crane'),
-('4P1001151', '제품출하 G02', '제품출하섹션', 'operating', '2후판제품 G02', 'Bridge Crane'),
-('4P1013309', '(STS1제강)Slab 연마장 35톤 #1호(G-5)', '2제강공장', 'operating', '(STS1제강)Slab 연마장 35톤 #2호(G-9)', 'Bridge Crane'),
-('4P1013308', '(STS1제강)Slab 연마장 35톤 #2호(G-9)', '2제강공장', 'operating', '(STS1제강)Slab 연마장 35톤 #1호(G-5)', 'Bridge Crane'),
-('4P1001153', '제품출하 GA', '제품출하섹션', 'operating', '2후판제품 GA', 'Bridge Crane'),
-('4P1001179', '제품출하 H01', '제품출하섹션', 'operating', '3후판제품 H01', 'Bridge Crane'),
-('4P1001147', '제품출하 H02', '제품출하섹션', 'operating', '2후판제품 H02', 'Bridge Crane'),
-('4P1001180', '제품출하 HA', '제품출하섹션', 'operating', '3후판제품 HA', 'Bridge Crane'),
-('4P1001078', 'HDL(HD41)', '2열연공장', 'operating', 'HDL(HD41)', 'Bridge Crane'),
-('4P1001086', 'HDL(HD42)', '2열연공장', 'operating', 'HDL(HD42)', 'Bridge Crane'),
-('4P1001285', 'Roll Shop(HH-24)', '2전기강판공장', 'operating', 'Roll Shop(HH-24)', 'Bridge Crane'),
-('4P1000949', '강편 H.C.R Yard #1(HR01)', '1선재공장', 'operating', '강편 H.C.R Yard #1(HR01)', 'Bridge Crane'),
-('4P1001076', '#2 HSL(HS11)', '2열연공장', 'operating', '#2 HSL(HS11)', 'Bridge Crane'),
-('4P1001075', '#2 HSL(HS12)', '2열연공장', 'operating', '#2 HSL(HS12)', 'Bridge Crane'),
-('4P1001308', 'APL(HS20)', '2열연공장', 'operating', 'APL(HS20)', 'Bridge Crane'),
-('4P1001077', '#1 HSL(HS31)', '2열연공장', 'operating', '#1 HSL(HS31)', 'Bridge Crane'),
-('4P1001080', '#1 HSL(HS32)', '2열연공장', 'operating', '#1 HSL(HS32)', 'Bridge Crane');
-
--- Batch 5 (50 cranes)
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model) VALUES
-('4P1001119', '2후판 열처리(HY01)', '후판제품공장', 'operating', '2후판 열처리(HY01)', 'Bridge Crane'),
-('4P1029127', '3후판 열처리(HY-1)', '후판제품공장', 'operating', '3후판 열처리(HY-1)', 'Bridge Crane'),
-('4P1001120', '2후판 열처리(HY02)', '후판제품공장', 'operating', '2후판 열처리(HY02)', 'Bridge Crane'),
-('4P1029128', '3후판 열처리(HY-2)', '후판제품공장', 'operating', '3후판 열처리(HY-2)', 'Bridge Crane'),
-('4P1029129', '3후판 열처리 (HY-3)', '후판제품공장', 'operating', '3후판 열처리 (HY-3)', 'Bridge Crane'),
-('4P1043941', '2후판 열처리 (HY04)', '후판제품공장', 'operating', '2후판 열처리 (HY04)', 'Bridge Crane'),
-('4P1001176', '제품출하 J01', '제품출하섹션', 'operating', '3후판제품 J01', 'Bridge Crane'),
-('4P1001148', '제품출하 J02', '제품출하섹션', 'operating', '2후판제품 J02', 'Bridge Crane'),
-('4P1001177', '제품출하 JA', '제품출하섹션', 'operating', '3후판제품 JA', 'Bridge Crane'),
-('4P1038369', '제품출하 K01', '제품출하섹션', 'operating', '2후판제품 K01', 'Bridge Crane'),
-('4P1001144', '제품출하 K02', '제품출하섹션', 'operating', '2후판제품 K02', 'Bridge Crane'),
-('4P1001178', '제품출하 KA', '제품출하섹션', 'operating', '3후판제품 KA', 'Bridge Crane'),
-('4P1001101', '제품출하 L01', '제품출하섹션', 'operating', '3후판제품 L01', 'Bridge Crane'),
-('4P1001107', '제품출하 L02', '제품출하섹션', 'operating', '3후판제품 L02', 'Bridge Crane'),
-('4P1001175', '제품출하 LA', '제품출하섹션', 'operating', '3후판제품 LA', 'Bridge Crane'),
-('4P1002070', 'LM2 C/R', '2���주공장', 'operating', 'LM2 C/R', 'Bridge Crane'),
-('4P1002071', 'LM3 C/R', '2연주공장', 'operating', 'LM3 C/R', 'Bridge Crane'),
-('4P1000917', '정정-1 Yard(M01)', '3연주공장', 'operating', '정정-1 Yard(M01)', 'Bridge Crane'),
-('4P1000925', '정정-1 Yard(M02)', '3연주공장', 'operating', '정정-1 Yard(M02)', 'Bridge Crane'),
-('4P1001102', '제품출하 M01', '제품출하섹션', 'operating', '3후판제품 M01', 'Bridge Crane'),
-('4P1001105', '제품출하 M02', '제품출하섹션', 'operating', '3후판제품 M02', 'Bridge Crane'),
-('4P1026144', '제품출하 MA', '제품출하섹션', 'operating', '2후판제품 MA', 'Bridge Crane'),
-('4P1039642', 'Mill Line #1(ML01)', '4선재공장', 'operating', 'Mill Line #1(ML01)', 'Bridge Crane'),
-('4P1001012', 'Mill Line 구.(ML01)', '1열연공장', 'operating', 'Mill Line 구.(ML01)', 'Bridge Crane'),
-('4P1001065', 'Mill Line #1(ML01)', '2열연공장', 'operating', 'Mill Line #1(ML01)', 'Bridge Crane'),
-('4P1001014', 'Mill Line #2(ML02)', '1열연공장', 'operating', 'Mill Line #2(ML02)', 'Bridge Crane'),
-('4P1001013', 'Mill Line #3(ML03)', '1열연공장', 'operating', 'Mill Line #3(ML03)', 'Bridge Crane'),
-('4P1001070', 'Mill Line #3(ML03)', '2열연공장', 'operating', 'Mill Line #3(ML03)', 'Bridge Crane'),
-('4P1001020', 'Mill Line #4(ML04)', '1열연공장', 'operating', 'Mill Line #4(ML04)', 'Bridge Crane'),
-('4P1001074', 'Mill Line #4(ML04)', '2열연공장', 'operating', 'Mill Line #4(ML04)', 'Bridge Crane'),
-('4P1001015', 'Mill Line #5(ML05)', '1열연공장', 'operating', 'Mill Line #5(ML05)', 'Bridge Crane'),
-('4P1001073', 'Mill Line(ML05)', '2열연공장', 'operating', 'Mill Line(ML05)', 'Bridge Crane'),
-('4P1000961', '선재 Mill Line #1 [ML01]', '1선재공장', 'operating', '선재 Mill Line #1 [ML01]', 'Bridge Crane'),
-('4P1001006', 'Mill Line #1(ML01)', '3선재공장', 'operating', 'Mill Line #1(ML01)', 'Bridge Crane'),
-('4P1000973', 'Mill Line #1(MY01)', '2선재공장', 'operating', 'Mill Line #1(MY01)', 'Bridge Crane'),
-('4P1001299', '2APL(CT21)', '소둔산세공장', 'operating', '2APL(CT21)', 'Bridge Crane'),
-('4P1001130', 'Mill Line #1(ML01)', '2후판공장', 'operating', 'Mill Line #1(ML01)', 'Bridge Crane'),
-('4P1001023', '정정 Yard(CT21)', '1열연공장', 'operating', '정정 Yard(CT21)', 'Bridge Crane'),
-('4P1000959', '선재 Mill Line #2 [ML02]', '1선재공장', 'operating', '선재 Mill Line #2 [ML02]', 'Bridge Crane'),
-('4P1001002', 'Mill Line #2(ML02)', '3선재공장', 'operating', 'Mill Line #2(ML02)', 'Bridge Crane'),
-('4P1001008', 'Mill Line #2(MY02)', '2선재공장', 'operating', 'Mill Line #2(MY02)', 'Bridge Crane'),
-('4P1001131', 'Mill Line(ML02)', '2후판공장', 'operating', 'Mill Line(ML02)', 'Bridge Crane'),
-('4P1001054', 'Slab Yard(CT21)', '2열연공장', 'operating', 'Slab Yard(CT21)', 'Bridge Crane'),
-('4P1001132', 'Mill Line', '2후판공장', 'operating', 'Mill Line', 'Bridge Crane'),
-('4P1029744', '강편 압연 Yard #5(MY05)', '1선재공장', 'operating', '강편 압연 Yard #5(MY05)', 'Bridge Crane'),
-('4P1001413', '임항창고 4호기', '제품출하섹션', 'operating', '제품부두 임항창고 4호기', 'Bridge Crane'),
-('4P1038715', 'CGL Furnace(PG01)', '도금공장', 'operating', 'CGL Furnace(PG01)', 'Bridge Crane'),
-('4P1038717', 'CGL C-Tower(PG02)', '도금공장', 'operating', 'CGL C-Tower(PG02)', 'Bridge Crane'),
-('4P1038716', 'CGL 출측 (PG03)', '도금공장', 'operating', 'CGL 출측 (PG03)', 'Bridge Crane'),
-('4P1001192', 'PL01_산세입측 #01', '1냉연공장', 'operating', '산세입측 #01(PL01)', 'Bridge Crane');
-
--- Batch 6 (43 cranes)
-INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model) VALUES
-('4P1039644', 'Roll Shop Chock 정비장(RS01)', '4선재공장', 'operating', 'Roll Shop Chock 정비장(RS01)', 'Bridge Crane'),
-('4P1001256', 'Roll Shop(RS01)', '2냉연공장', 'operating', 'Roll Shop(RS01)', 'Bridge Crane'),
-('4P1000986', 'Roll Shop #1(RS01)', '2선재공장', 'operating', 'Roll Shop #1(RS01)', 'Bridge Crane'),
-('4P1001226', '1냉연제품(CT21)', '제품출하섹션', 'operating', '1냉연제품(CT21)', 'Bridge Crane'),
-('4P1039645', 'Roll Shop 조압연선반(RS02)', '4선재공장', 'operating', 'Roll Shop 조압연선반(RS02)', 'Bridge Crane'),
-('4P1001258', 'Roll Shop(RS02)', '2냉연공장', 'operating', 'Roll Shop(RS02)', 'Bridge Crane'),
-('4P1001227', 'RS01_Roll Shop #1', '1냉연공장', 'operating', 'Roll Shop #1(RS01)', 'Bridge Crane'),
-('4P1000962', '선재 Roll Shop #1 [RS01]', '1선재공장', 'operating', '선재 Roll Shop #1 [RS01]', 'Bridge Crane'),
-('4P1001000', 'Roll Shop #1(RS01)', '3선재공장', 'operating', 'Roll Shop #1(RS01)', 'Bridge Crane'),
-('4P1001047', 'Roll 정비장 #1(RS01)', '1열연공장', 'operating', 'Roll 정비장 #1(RS01)', 'Bridge Crane'),
-('4P1001128', 'Roll Shop #1(RS01)', '2후판공장', 'operating', 'Roll Shop #1(RS01)', 'Bridge Crane'),
-('4P1001228', 'RS02_R/Shop #2', '1냉연공장', 'operating', 'R/Shop #2(RS02)', 'Bridge Crane'),
-('4P1000963', '선재 Roll Shop #2 [RS02]', '1선재공장', 'operating', '선재 Roll Shop #2 [RS02]', 'Bridge Crane'),
-('4P1001049', 'Roll정비장 #2(RS02)', '1열연공장', 'operating', 'Roll정비장 #2(RS02)', 'Bridge Crane'),
-('4P1001129', 'Roll Shop #2', '2후판공장', 'operating', 'Roll Shop #2', 'Bridge Crane'),
-('4P1001089', 'Roll Shop #1(RS02)', '2열연공장', 'operating', 'Roll Shop #1(RS02)', 'Bridge Crane'),
-('4P1001048', 'Roll 정비장 #3(RS03)', '1열연공장', 'operating', 'Roll 정비장 #3(RS03)', 'Bridge Crane'),
-('4P1001091', 'Roll Shop #2(RS03)', '2열연공장', 'operating', 'Roll Shop #2(RS03)', 'Bridge Crane'),
-('4P1001229', 'Dull Machine(RS04)', '1냉연공장', 'operating', 'R/Shop #3(RS03)', 'Bridge Crane'),
-('4P1001121', '전단Sher #1(SL01)', '2후판공장', 'operating', '전단Sher #1(SL01)', 'Bridge Crane'),
-('4P1000915', 'Slab Yard(CT21)', '1열연공장', 'operating', 'Slab Yard(CT21)', 'Bridge Crane'),
-('4P1001122', '전단Shear #2(SL02)', '2후판공장', 'operating', '전단Shear #2(SL02)', 'Bridge Crane'),
-('4P1001169', '3후판 전단 (SL02)', '후판제품공장', 'operating', '3후판 전단 (SL02)', 'Bridge Crane'),
-('4P1001295', 'CBL (CT-21)', '2전기강판공장', 'operating', 'CBL (CT-21)', 'Bridge Crane'),
-('4P1043619', 'Slab Yard #1(SY10)', '2후판공장', 'operating', 'Slab Yard #1(SY10)', 'Bridge Crane'),
-('4P1042523', 'Slab Yard(SY11)', '2열연공장', 'operating', 'Slab Yard(SY11)', 'Bridge Crane'),
-('4P1001134', 'Slab Yard #2(SY11)', '2후판공장', 'operating', 'Slab Yard #2(SY11)', 'Bridge Crane'),
-('4P1001056', 'Slab Yard(SY12)', '2열연공장', 'operating', 'Slab Yard(SY12)', 'Bridge Crane'),
-('4P1001022', '정정 Yard 2동 (CT22)', '1열연공장', 'operating', '정정 Yard 2동 (CT22)', 'Bridge Crane'),
-('4P1001220', '1냉연제품(CT22)', '제품출하섹션', 'operating', '1냉연제품(CT22)', 'Bridge Crane'),
-('4P1001312', '2APL(CT22)', '소둔산세공장', 'operating', '2APL(CT22)', 'Bridge Crane'),
-('4P1000916', 'Slab Yard(CT22)', '1열연공장', 'operating', 'Slab Yard(CT22)', 'Bridge Crane'),
-('4P1001235', 'HCT(TC04)', '2냉연공장', 'operating', 'HCT(TC04)', 'Bridge Crane'),
-('4P1001230', 'HCT(TC05)', '2냉연공장', 'operating', 'HCT(TC05)', 'Bridge Crane'),
-('4P1001195', 'TC02_PCM 입측 #2', '1냉연공장', 'operating', 'PCM 입측 #2(TC02)', 'Bridge Crane'),
-('4P1001216', 'TP01_TPM #10', '1냉연공장', 'operating', 'TPM #10(TP01)', 'Bridge Crane'),
-('4P1027957', '2 EGL 출하동(TP05)', '도금공장', 'operating', '2 EGL 출하동(TP05)', 'Bridge Crane'),
-('4P1001183', '3후판(UST1)', '후판제품공장', 'operating', '3후판(UST1)', 'Bridge Crane'),
-('4P1001181', '3후판(UST2)', '후판제품공장', 'operating', '3후판(UST2)', 'Bridge Crane'),
-('4P1029392', '극후물절단장 #2', '후판제품공장', 'operating', '극후물절단장 #2', 'Bridge Crane'),
-('4P1029393', '극후물절단장 #3', '후판제품공장', 'operating', '극후물절단장 #3', 'Bridge Crane'),
-('4P1102868', 'O-Yard(CTB1)', '2냉연공장', 'operating', 'O-Yard(CTB1)', 'Bridge Crane'),
-('4P1001257', 'Roll Shop(RS03)', '2냉연공장', 'operating', 'Roll Shop(RS03)', 'Bridge Crane');
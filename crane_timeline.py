@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Materialize one row per crane for the crane detail view.
+
+    python crane_timeline.py refresh                      # every crane
+    python crane_timeline.py refresh --crane-id 4P1001201 # just these
+    python crane_timeline.py show CT73_PCM                # print a crane's row
+
+crane_timelines holds each crane's failures and repairs merged into one
+date-ordered timeline (newest first), the repair/failure breakdown counts
+and hours, the last completed maintenance and the next inspection. The
+server reads it with one indexed lookup by crane_name instead of loading
+and filtering both history tables per request. Imports refresh it at the
+end of a load, like the search index.
+"""
+import argparse
+import sys
+
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+
+# Repair types counted as daily (planned) repairs; failures are the emergency repairs
+DAILY_REPAIR_TYPES = ('routine', 'preventive', 'inspection')
+FAILURE_TYPES = ('hydraulic', 'electrical', 'mechanical', 'structural')
+
+# Used when a crane has no InspectionCycle and no scheduled next inspection
+DEFAULT_INSPECTION_CYCLE = 90
+
+TIMELINE_DDL = """
+    CREATE TABLE IF NOT EXISTS crane_timelines (
+        crane_id TEXT PRIMARY KEY,
+        crane_name TEXT,
+        plant_section TEXT,
+        daily_repair_count INTEGER NOT NULL,
+        emergency_repair_count INTEGER NOT NULL,
+        daily_repair_hours INTEGER NOT NULL,
+        emergency_repair_hours INTEGER NOT NULL,
+        daily_repair_breakdown JSONB NOT NULL,
+        emergency_repair_breakdown JSONB NOT NULL,
+        failure_heatmap JSONB NOT NULL,
+        last_maintenance_date DATE,
+        next_inspection_date DATE,
+        timeline JSONB NOT NULL,
+        refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+    CREATE INDEX IF NOT EXISTS crane_timelines_crane_name_idx ON crane_timelines (crane_name, plant_section);
+"""
+
+# One statement builds every target crane's row from both history tables
+MATERIALIZE_SQL = """
+    WITH targets AS (
+        SELECT crane_id, crane_name, plant_section, next_maintenance_date, inspection_cycle
+        FROM cranes
+        WHERE %(all)s OR crane_id = ANY(%(crane_ids)s)
+    ),
+    events AS (
+        SELECT m.crane_id, 'repair' AS kind, m.id, m.date, m.type, m.status, NULL AS severity, NULL AS cause,
+               COALESCE(NULLIF(m.task_name, ''), m.notes) AS summary, m.duration AS hours
+        FROM maintenance_records m JOIN targets t ON t.crane_id = m.crane_id
+        UNION ALL
+        SELECT f.crane_id, 'failure', f.id, f.date, f.failure_type, NULL, f.severity, f.cause,
+               f.description, f.downtime
+        FROM failure_records f JOIN targets t ON t.crane_id = f.crane_id
+    ),
+    stats AS (
+        SELECT crane_id,
+               count(*) FILTER (WHERE kind = 'repair' AND type = ANY(%(daily_types)s)) AS daily_repair_count,
+               count(*) FILTER (WHERE kind = 'failure') AS emergency_repair_count,
+               COALESCE(sum(hours) FILTER (WHERE kind = 'repair' AND type = ANY(%(daily_types)s)), 0) AS daily_repair_hours,
+               COALESCE(sum(hours) FILTER (WHERE kind = 'failure'), 0) AS emergency_repair_hours,
+               max(date) FILTER (WHERE kind = 'repair' AND status = 'completed') AS last_maintenance_date,
+               jsonb_agg(jsonb_strip_nulls(jsonb_build_object(
+                   'kind', kind, 'id', id, 'date', date, 'type', type, 'status', status,
+                   'severity', severity, 'cause', cause, 'summary', summary, 'hours', hours
+               )) ORDER BY date DESC, kind, id DESC) AS timeline
+        FROM events
+        GROUP BY crane_id
+    ),
+    type_counts AS (
+        SELECT crane_id, kind, type, count(*) AS n FROM events GROUP BY crane_id, kind, type
+    ),
+    cause_counts AS (
+        SELECT crane_id, COALESCE(cause, 'Unknown') AS cause, count(*) AS n
+        FROM events WHERE kind = 'failure' GROUP BY 1, 2
+    )
+    INSERT INTO crane_timelines
+        (crane_id, crane_name, plant_section, daily_repair_count, emergency_repair_count,
+         daily_repair_hours, emergency_repair_hours, daily_repair_breakdown, emergency_repair_breakdown,
+         failure_heatmap, last_maintenance_date, next_inspection_date, timeline, refreshed_at)
+    SELECT t.crane_id, t.crane_name, t.plant_section,
+           COALESCE(s.daily_repair_count, 0), COALESCE(s.emergency_repair_count, 0),
+           COALESCE(s.daily_repair_hours, 0), COALESCE(s.emergency_repair_hours, 0),
+           (SELECT jsonb_object_agg(k, COALESCE((SELECT n FROM type_counts c
+                                                 WHERE c.crane_id = t.crane_id AND c.kind = 'repair' AND c.type = k), 0))
+            FROM unnest(%(daily_types)s::text[]) AS k),
+           (SELECT jsonb_object_agg(k, COALESCE((SELECT n FROM type_counts c
+                                                 WHERE c.crane_id = t.crane_id AND c.kind = 'failure' AND c.type = k), 0))
+            FROM unnest(%(failure_types)s::text[]) AS k),
+           COALESCE((SELECT jsonb_object_agg(cause, n) FROM cause_counts c WHERE c.crane_id = t.crane_id), '{}'),
+           s.last_maintenance_date,
+           -- The materialized schedule (inspection_scheduler.py) wins; otherwise one cycle after the last maintenance
+           COALESCE(t.next_maintenance_date,
+                    s.last_maintenance_date + COALESCE(t.inspection_cycle, %(default_cycle)s)),
+           COALESCE(s.timeline, '[]'),
+           now()
+    FROM targets t
+    LEFT JOIN stats s ON s.crane_id = t.crane_id
+"""
+
+
+def refresh_timelines(conn, crane_ids=None):
+    """Rebuild crane_timelines for crane_ids (every crane when None) in one transaction; returns the rows written"""
+    crane_ids = sorted(set(crane_ids)) if crane_ids is not None else None
+    with etl_locks(conn, 'crane_timelines', job='crane_timeline'):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(TIMELINE_DDL)
+            if crane_ids is None:
+                cursor.execute("DELETE FROM crane_timelines")
+            else:
+                cursor.execute("DELETE FROM crane_timelines WHERE crane_id = ANY(%s)", (crane_ids,))
+            cursor.execute(MATERIALIZE_SQL, {
+                'all': crane_ids is None,
+                'crane_ids': crane_ids or [],
+                'daily_types': list(DAILY_REPAIR_TYPES),
+                'failure_types': list(FAILURE_TYPES),
+                'default_cycle': DEFAULT_INSPECTION_CYCLE,
+            })
+            written = cursor.rowcount
+            notify_change(conn, 'crane_timelines', crane_ids=crane_ids or (), job='crane_timeline')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    print(f"Crane timelines: {written} cranes refreshed")
+    return written
+
+
+def show_timeline(conn, crane_name):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT crane_id, plant_section, daily_repair_count, emergency_repair_count, daily_repair_hours,
+                   emergency_repair_hours, last_maintenance_date, next_inspection_date, timeline
+            FROM crane_timelines WHERE crane_name = %s ORDER BY crane_id
+        """, (crane_name,))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    if not rows:
+        print(f"No timeline for {crane_name}; run `crane_timeline.py refresh`")
+        return
+    for crane_id, plant_section, daily, emergency, daily_hours, emergency_hours, last, next_due, timeline in rows:
+        print(f"{crane_name} ({crane_id}, {plant_section or '-'})")
+        print(f"  일상수리 {daily}건 / {daily_hours}h, 긴급수리 {emergency}건 / {emergency_hours}h")
+        print(f"  최근 정비 {last or '-'}, 다음 점검 {next_due or '-'}")
+        for event in timeline[:10]:
+            print(f"  {event['date']}  {event['kind']:<7} {event.get('type', ''):<12} {event.get('summary', '')[:60]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Materialize the per-crane timeline and stats for the detail view')
+    commands = parser.add_subparsers(dest='command', required=True)
+    refresh = commands.add_parser('refresh', help='rebuild crane_timelines')
+    refresh.add_argument('--crane-id', action='append', help='only these cranes (repeatable)')
+    show = commands.add_parser('show', help="print one crane's materialized row")
+    show.add_argument('crane_name')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+    try:
+        if args.command == 'refresh':
+            refresh_timelines(conn, args.crane_id)
+        else:
+            show_timeline(conn, args.crane_name)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Streaming reads for the maintenance scripts.
+
+Large result sets are read through named (server-side) cursors, so Postgres
+holds the result and the script only ever holds one chunk:
+
+    for rows in iter_chunks(conn, "SELECT id, description FROM failure_records ORDER BY id"):
+        ...                       # rows is a list of plain tuples, at most chunk_rows long
+
+    for batch in iter_arrays(conn, "SELECT id, worktime::float8 FROM failure_records",
+                             dtypes={'id': 'int64', 'worktime': 'float64'}):
+        batch['worktime'].sum()   # one NumPy array per column
+
+Rows are tuples rather than RealDictCursor dicts; that saves a dict per row.
+The cursor lives in the caller's transaction. Writing to the same tables
+while iterating is fine, because the cursor keeps reading its own snapshot.
+Committing mid-iteration needs hold=True (DECLARE ... WITH HOLD).
+"""
+import itertools
+
+import numpy as np
+
+CHUNK_ROWS = 10000
+
+_cursor_ids = itertools.count(1)
+
+
+def iter_chunks(conn, sql, params=None, chunk_rows=CHUNK_ROWS, hold=False):
+    """Yield lists of up to chunk_rows tuples from a server-side cursor"""
+    cursor = conn.cursor(name=f"stream_{next(_cursor_ids)}", withhold=hold)
+    cursor.itersize = chunk_rows
+    try:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            yield rows
+    finally:
+        cursor.close()
+
+
+def iter_rows(conn, sql, params=None, chunk_rows=CHUNK_ROWS, hold=False):
+    """Yield single tuples, fetching chunk_rows per round trip"""
+    for rows in iter_chunks(conn, sql, params, chunk_rows, hold):
+        yield from rows
+
+
+def iter_arrays(conn, sql, params=None, chunk_rows=CHUNK_ROWS, dtypes=None, hold=False):
+    """Yield {column: ndarray} batches.
+
+    Columns named in dtypes get that NumPy dtype (NULL becomes NaN in float
+    columns, so nullable integers should be read as float64); other columns
+    are object arrays.
+    """
+    dtypes = dtypes or {}
+    cursor = conn.cursor(name=f"stream_{next(_cursor_ids)}", withhold=hold)
+    cursor.itersize = chunk_rows
+    try:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            # A named cursor only has a description once the first rows are fetched
+            names = [column[0] for column in cursor.description]
+            yield {
+                name: np.array(values, dtype=dtypes.get(name, object))
+                for name, values in zip(names, zip(*rows))
+            }
+    finally:
+        cursor.close()
+
+
+def fetch_column(conn, sql, params=None, chunk_rows=CHUNK_ROWS):
+    """Set of the first column's values, streamed (e.g. every crane_id)"""
+    return {row[0] for row in iter_rows(conn, sql, params, chunk_rows)}
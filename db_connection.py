@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""One place to get a PostgreSQL connection.
+
+    conn = connect_db()           # pooled; None (after retries) if the database is unreachable
+    try:
+        with bulk_session(conn):  # long statement timeout, synchronous_commit=off
+            prepare(conn, 'upsert_crane')
+            execute_prepared(cursor, 'upsert_crane', rows)
+        conn.commit()
+    finally:
+        release_db(conn)
+
+Settings come from DATABASE_URL when it is set, otherwise from the PG* variables.
+Connections come from one process-wide pool. A script whose subcommands run
+one after another reuses the same server connection, and a connection that
+dies mid-run is replaced instead of ending the import. Connecting and
+run_with_retry() retry transient errors (dropped connections, admin
+shutdown, serialization failures, deadlocks) with exponential backoff.
+"""
+import atexit
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import errorcodes
+from psycopg2.extras import execute_batch
+from psycopg2.pool import ThreadedConnectionPool
+
+POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '4'))
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 15.0
+
+TRANSIENT_CODES = {
+    errorcodes.SERIALIZATION_FAILURE,
+    errorcodes.DEADLOCK_DETECTED,
+    errorcodes.ADMIN_SHUTDOWN,
+    errorcodes.CANNOT_CONNECT_NOW,
+    errorcodes.TOO_MANY_CONNECTIONS,
+}
+
+# Session settings for bulk load phases; a statement stuck longer than the timeout fails (and can be retried)
+BULK_SETTINGS = {
+    'statement_timeout': os.getenv('DB_BULK_STATEMENT_TIMEOUT', '30min'),
+    'synchronous_commit': 'off',
+}
+
+# The hot row shapes of the importers, prepared once per connection
+PREPARED_STATEMENTS = {
+    'upsert_crane': """
+        INSERT INTO cranes (crane_id, crane_name, plant_section, status, location, model, grade,
+                            drive_type, unmanned_operation, electrical_manager, mechanical_manager,
+                            installation_date, inspection_reference_date,
+                            last_maintenance_date, next_maintenance_date, is_urgent,
+                            source_file, source_sheet, source_row, import_batch)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12::date, $13::date, $14::date, $15::date, $16,
+                $17, $18, $19::integer, $20)
+        ON CONFLICT (crane_id) DO UPDATE SET
+            crane_name = EXCLUDED.crane_name, plant_section = EXCLUDED.plant_section,
+            location = EXCLUDED.location, model = EXCLUDED.model, grade = EXCLUDED.grade,
+            drive_type = EXCLUDED.drive_type, unmanned_operation = EXCLUDED.unmanned_operation,
+            electrical_manager = EXCLUDED.electrical_manager, mechanical_manager = EXCLUDED.mechanical_manager,
+            installation_date = EXCLUDED.installation_date,
+            inspection_reference_date = EXCLUDED.inspection_reference_date,
+            last_maintenance_date = EXCLUDED.last_maintenance_date,
+            next_maintenance_date = EXCLUDED.next_maintenance_date,
+            source_file = EXCLUDED.source_file, source_sheet = EXCLUDED.source_sheet,
+            source_row = EXCLUDED.source_row, import_batch = EXCLUDED.import_batch
+    """,
+    'insert_failure': """
+        INSERT INTO failure_records (crane_id, date, failure_type, description, severity, cause,
+                                     reported_by, worktime, by_device,
+                                     source_file, source_sheet, source_row, import_batch)
+        VALUES ($1, $2::date, $3, $4, $5, $6, $7, $8::numeric, $9, $10, $11, $12::integer, $13)
+    """,
+    'update_failure_by_device': """
+        UPDATE failure_records SET by_device = $2 WHERE id = $1
+    """,
+    'insert_maintenance': """
+        INSERT INTO maintenance_records (crane_id, date, type, technician, status, notes, work_order,
+                                         task_name, actual_start_date_time, actual_end_date_time,
+                                         total_workers, total_work_time, area_name, equipment_name,
+                                         source_file, source_sheet, source_row, import_batch)
+        VALUES ($1, $2::date, $3, $4, $5, $6, $7, $8, $9::timestamptz, $10::timestamptz, $11,
+                $12::numeric, $13, $14, $15, $16, $17::integer, $18)
+    """,
+}
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def connection_settings():
+    """psycopg2.connect() keyword arguments from DATABASE_URL or the PG* variables"""
+    if os.getenv('DATABASE_URL'):
+        return {'dsn': os.environ['DATABASE_URL']}
+    return {
+        'host': os.getenv('PGHOST'),
+        'database': os.getenv('PGDATABASE'),
+        'user': os.getenv('PGUSER'),
+        'password': os.getenv('PGPASSWORD'),
+        'port': os.getenv('PGPORT'),
+    }
+
+
+def is_transient(error):
+    if isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError)):
+        return error.pgcode is None or error.pgcode in TRANSIENT_CODES
+    return isinstance(error, psycopg2.Error) and error.pgcode in TRANSIENT_CODES
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with jitter: ~0.5s, 1s, 2s, 4s ... capped at RETRY_MAX_DELAY"""
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+def get_pool(size=None):
+    """The process-wide pool, created on first use.
+
+    size connections are opened up front and kept open for reuse (one by
+    default); up to POOL_SIZE, or size if larger, can be borrowed at once.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.closed:
+            size = max(size or 1, 1)
+            for attempt in range(RETRY_ATTEMPTS):
+                try:
+                    _pool = ThreadedConnectionPool(size, max(size, POOL_SIZE), **connection_settings())
+                    break
+                except psycopg2.OperationalError:
+                    if attempt == RETRY_ATTEMPTS - 1:
+                        raise
+                    time.sleep(backoff_delay(attempt))
+        return _pool
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None and not _pool.closed:
+            _pool.closeall()
+        _pool = None
+
+
+atexit.register(close_pool)
+
+
+def connect_db():
+    """Connect to PostgreSQL database"""
+    try:
+        pool = get_pool()
+        for attempt in range(RETRY_ATTEMPTS):
+            conn = pool.getconn()
+            try:
+                # Pooled connections can have been dropped by the server while idle
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                conn.rollback()
+                return conn
+            except psycopg2.OperationalError:
+                pool.putconn(conn, close=True)
+                if attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                time.sleep(backoff_delay(attempt))
+    except Exception as e:
+        print(f"Database connection error: {e}")
+        return None
+
+
+def release_db(conn):
+    """Give a connection from connect_db() back to the pool.
+
+    Anything uncommitted is rolled back, session settings (including
+    set_session() and autocommit) are reset and advisory locks dropped, so the
+    next borrower starts clean; prepared statements are kept for reuse.
+    """
+    if _pool is None or _pool.closed:
+        conn.close()
+        return
+    if not conn.closed:
+        try:
+            conn.rollback()
+            conn.set_session(isolation_level='DEFAULT', readonly='DEFAULT', deferrable='DEFAULT', autocommit=False)
+            with conn.cursor() as cursor:
+                cursor.execute("RESET ALL")
+                # Session-level advisory locks (etl_locks) would otherwise outlive the job
+                cursor.execute("SELECT pg_advisory_unlock_all()")
+            conn.commit()
+        except psycopg2.Error:
+            conn.close()
+    _pool.putconn(conn, close=bool(conn.closed))
+
+
+@contextmanager
+def connection():
+    conn = connect_db()
+    if conn is None:
+        raise psycopg2.OperationalError("could not connect to the database")
+    try:
+        yield conn
+    finally:
+        release_db(conn)
+
+
+def run_with_retry(work, *args, attempts=RETRY_ATTEMPTS):
+    """Run work(conn, *args) on a pooled connection, retrying transient failures.
+
+    work must commit its own transaction and be safe to repeat after a rollback.
+    """
+    for attempt in range(attempts):
+        conn = connect_db()
+        if conn is None:
+            raise psycopg2.OperationalError("could not connect to the database")
+        try:
+            return work(conn, *args)
+        except psycopg2.Error as e:
+            if not conn.closed:
+                conn.rollback()
+            if not is_transient(e) or attempt == attempts - 1:
+                raise
+            print(f"  transient database error ({e.pgcode or type(e).__name__}); retrying")
+            time.sleep(backoff_delay(attempt))
+        finally:
+            release_db(conn)
+
+
+@contextmanager
+def session_settings(conn, **settings):
+    """SET the given parameters for the duration of the block, then RESET them.
+
+    Both run in the caller's transaction, so they stick once it commits;
+    release_db() resets everything regardless.
+    """
+    with conn.cursor() as cursor:
+        for name, value in settings.items():
+            cursor.execute(f"SET {name} = %s", (value,))
+    try:
+        yield conn
+    finally:
+        if not conn.closed and conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_INERROR:
+            with conn.cursor() as cursor:
+                for name in settings:
+                    cursor.execute(f"RESET {name}")
+
+
+def bulk_session(conn, **overrides):
+    """session_settings() with BULK_SETTINGS: a generous statement timeout and asynchronous commit.
+
+    With synchronous_commit off a crash can lose the last few commits, but never
+    corrupts anything; loaders that can be rerun are fine with that.
+    """
+    return session_settings(conn, **{**BULK_SETTINGS, **overrides})
+
+
+def prepare(conn, name):
+    """PREPARE one of PREPARED_STATEMENTS on this connection unless it already is"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = %s", (name,))
+        if cursor.fetchone() is None:
+            cursor.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+
+
+def execute_prepared(cursor, name, rows, page_size=500):
+    """EXECUTE a prepared statement for every parameter tuple, page_size executions per round trip"""
+    rows = list(rows)
+    if not rows:
+        return 0
+    placeholders = ', '.join(['%s'] * len(rows[0]))
+    execute_batch(cursor, f"EXECUTE {name} ({placeholders})", rows, page_size=page_size)
+    return len(rows)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tell the server what an ETL job changed, so it refreshes just that part of its cache.
+
+    notify_change(conn, 'maintenance_records', crane_ids=ids, months=dates, job='import_repair_data')
+    conn.commit()                             # the event goes out here, and not at all on rollback
+
+    python etl_events.py listen               # print events as the server receives them
+    python etl_events.py notify cranes        # announce a manual change to a whole table
+
+Events go out on the 'etl_changes' channel as a JSON payload:
+
+    {"table": "maintenance_records", "plantSections": [...], "craneIds": [...],
+     "from": "2024-03", "to": "2024-04", "job": "import_repair_data"}
+
+Missing fields mean "any": an event with only a table invalidates everything
+derived from that table. NOTIFY payloads are capped at 8000 bytes, so a big
+load drops its crane ids (then plant sections) and the server widens the
+invalidation to match. Postgres folds identical events sent in one transaction.
+
+The same call bumps the table's row in data_versions, and the event carries
+the new version. A server that missed the NOTIFY (it was restarting or
+reconnecting) sees the version move on its next check and re-warms that table.
+Call notify_change() right before the commit: the version row stays locked
+until then, and concurrent jobs on one table queue on it.
+"""
+import argparse
+import json
+import select
+import sys
+
+from db_connection import connect_db, release_db
+
+CHANNEL = 'etl_changes'
+
+# NOTIFY rejects payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+VERSIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS data_versions (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL,
+        changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+"""
+
+BUMP_VERSION_SQL = """
+    INSERT INTO data_versions (table_name, version, changed_at) VALUES (%s, 1, now())
+    ON CONFLICT (table_name) DO UPDATE SET version = data_versions.version + 1, changed_at = now()
+    RETURNING version
+"""
+
+
+def month_range(months):
+    """('YYYY-MM', 'YYYY-MM') spanned by dates, datetimes or 'YYYY-MM...' strings; None if there are none"""
+    keys = sorted({m[:7] if isinstance(m, str) else f"{m:%Y-%m}" for m in months if m is not None and m == m})
+    return (keys[0], keys[-1]) if keys else None
+
+
+def change_payload(table, plant_sections=(), crane_ids=(), months=(), job=None, version=None):
+    event = {'table': table}
+    if version is not None:
+        event['version'] = version
+    span = month_range(months)
+    if span:
+        event['from'], event['to'] = span
+    if job:
+        event['job'] = job
+    detail = {
+        'plantSections': sorted({str(s) for s in plant_sections if s}),
+        'craneIds': sorted({str(c) for c in crane_ids if c}),
+    }
+    # Give up the finest detail first until the payload fits
+    for dropped in ((), ('craneIds',), ('craneIds', 'plantSections')):
+        payload = json.dumps({**event, **{k: v for k, v in detail.items() if v and k not in dropped}},
+                             ensure_ascii=False)
+        if len(payload.encode('utf-8')) <= MAX_PAYLOAD_BYTES:
+            return payload
+    return json.dumps({k: v for k, v in event.items() if k in ('table', 'version')}, ensure_ascii=False)
+
+
+def notify_change(conn, table, plant_sections=(), crane_ids=(), months=(), job=None):
+    """Bump the table's data version and queue a change event; both take effect when the transaction commits"""
+    with conn.cursor() as cursor:
+        cursor.execute(VERSIONS_DDL)
+        cursor.execute(BUMP_VERSION_SQL, (table,))
+        version = cursor.fetchone()[0]
+        cursor.execute("SELECT pg_notify(%s, %s)",
+                       (CHANNEL, change_payload(table, plant_sections, crane_ids, months, job, version)))
+
+
+def listen(conn):
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {CHANNEL}")
+    print(f"Listening on {CHANNEL} (Ctrl-C to stop)")
+    try:
+        while True:
+            if select.select([conn], [], [], 60) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                notification = conn.notifies.pop(0)
+                print(f"  [pid {notification.pid}] {notification.payload}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute(f"UNLISTEN {CHANNEL}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Send or watch ETL change events for the server cache')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('listen', help='Print change events as they are committed')
+    notify_parser = subparsers.add_parser('notify', help='Announce a change made outside the ETL scripts')
+    notify_parser.add_argument('table')
+    notify_parser.add_argument('--plant-section', action='append', default=[])
+    notify_parser.add_argument('--crane-id', action='append', default=[])
+    notify_parser.add_argument('--month', action='append', default=[], help='YYYY-MM; repeat for a range')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+    try:
+        if args.command == 'listen':
+            listen(conn)
+        else:
+            notify_change(conn, args.table, args.plant_section, args.crane_id, args.month, job='manual')
+            conn.commit()
+            print(f"Sent change event for {args.table}")
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
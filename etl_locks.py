@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Advisory locks that let ETL jobs run side by side without clobbering each other.
+
+    with etl_locks(conn, 'failure_records', job='complete_import'):
+        ...                                   # whole table: waits for every other failure_records job
+
+    with etl_locks(conn, 'maintenance_records/2024-03', 'maintenance_records/2024-04', job='import_repair_data'):
+        ...                                   # only those months; other months load concurrently
+
+    python etl_locks.py                       # who holds or waits for which ETL lock
+
+A bare table name locks the whole table exclusively. 'table/key' locks one
+partition of it: a month (YYYY-MM) or a plant section ('cranes/plant=...').
+It holds the table lock in shared mode, so partition jobs on different keys
+run together, and a whole-table job queues behind all of them. shared=
+lists tables a job only needs to be stable while it reads them.
+
+The locks are session-level Postgres advisory locks, taken in one global
+order so two jobs cannot deadlock. release_db() drops any a job forgets.
+Before blocking, the job prints who holds the lock. The wait time is
+returned, so callers can record it as a metrics span.
+"""
+import argparse
+import sys
+import time
+import zlib
+from contextlib import contextmanager
+
+import psycopg2.extensions
+
+from db_connection import connect_db, release_db
+
+# Tables the ETL locks; used to put names to lock keys in the listing
+LOCKED_TABLES = ('cranes', 'failure_records', 'maintenance_records', 'alerts', 'history_search', 'crane_timelines',
+                 'ai_digests')
+
+HOLDERS_SQL = """
+    SELECT l.classid::bigint, l.objid::bigint, l.mode, l.granted, l.pid, a.application_name,
+           date_trunc('second', now() - coalesce(a.xact_start, a.state_change)) AS held_for
+    FROM pg_locks l
+    JOIN pg_stat_activity a ON a.pid = l.pid
+    WHERE l.locktype = 'advisory' AND l.objsubid = 2
+    ORDER BY l.classid, l.objid, l.granted DESC, l.pid
+"""
+
+
+def lock_key(name):
+    """Unsigned 32-bit key as pg_locks shows it; 0 is reserved for the whole table"""
+    return zlib.crc32(name.encode('utf-8')) or 1
+
+
+def signed(key):
+    """pg_advisory_lock(int4, int4) takes signed keys"""
+    return key - (1 << 32) if key >= 1 << 31 else key
+
+
+def lock_plan(resources, shared=()):
+    """[(table, key or None, exclusive)] in acquisition order, table lock before its partitions"""
+    tables = {}
+    partitions = set()
+    for resource in resources:
+        table, _, key = resource.partition('/')
+        if key:
+            tables.setdefault(table, False)
+            partitions.add((table, key))
+        else:
+            tables[table] = True
+    for table in shared:
+        tables.setdefault(table, False)
+    plan = []
+    for table in sorted(tables):
+        plan.append((table, None, tables[table]))
+        # A table held exclusively already covers its partitions
+        if not tables[table]:
+            plan.extend((table, key, True) for t, key in sorted(partitions) if t == table)
+    return plan
+
+
+def describe(table, key, exclusive):
+    name = f"{table}/{key}" if key else table
+    return name if exclusive else f"{name} (shared)"
+
+
+def key_pair(table, key):
+    return lock_key(table), (lock_key(key) if key else 0)
+
+
+def lock_holders(conn, table, key):
+    classid, objid = key_pair(table, key)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(HOLDERS_SQL)
+        return [row for row in cursor.fetchall() if row[0] == classid and row[1] == objid and row[3]]
+    finally:
+        cursor.close()
+
+
+def acquire(conn, table, key, exclusive):
+    """Take one lock, reporting the holders first if it is busy; returns the seconds waited"""
+    classid, objid = (signed(k) for k in key_pair(table, key))
+    suffix = '' if exclusive else '_shared'
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT pg_try_advisory_lock{suffix}(%s, %s)", (classid, objid))
+        if cursor.fetchone()[0]:
+            return 0.0
+        for _, _, mode, _, pid, application, held_for in lock_holders(conn, table, key):
+            print(f"  waiting for {describe(table, key, exclusive)}: held by {application or 'pid'} "
+                  f"(pid {pid}, {mode}) for {held_for}")
+        start = time.perf_counter()
+        cursor.execute(f"SELECT pg_advisory_lock{suffix}(%s, %s)", (classid, objid))
+        waited = time.perf_counter() - start
+        print(f"  acquired {describe(table, key, exclusive)} after {waited:.1f}s")
+        return waited
+    finally:
+        cursor.close()
+
+
+def release(conn, table, key, exclusive):
+    classid, objid = (signed(k) for k in key_pair(table, key))
+    suffix = '' if exclusive else '_shared'
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT pg_advisory_unlock{suffix}(%s, %s)", (classid, objid))
+    finally:
+        cursor.close()
+
+
+@contextmanager
+def etl_locks(conn, *resources, shared=(), job=None, timeout=None):
+    """Hold the locks for the block; yields the total seconds spent waiting.
+
+    Take them before the job starts its transaction. Session locks are not
+    transactional, so the job can commit and roll back freely inside the block.
+    job becomes the session's application_name, which is what other jobs see
+    as the holder. timeout (e.g. '10min') bounds each wait via lock_timeout.
+    """
+    idle = conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    cursor = conn.cursor()
+    if job:
+        cursor.execute("SET application_name = %s", (f"etl:{job}",))
+    if timeout:
+        cursor.execute("SET lock_timeout = %s", (timeout,))
+    cursor.close()
+    if idle:
+        conn.commit()
+
+    held = []
+    waited = 0.0
+    try:
+        for table, key, exclusive in lock_plan(resources, shared):
+            waited += acquire(conn, table, key, exclusive)
+            held.append((table, key, exclusive))
+        yield waited
+    finally:
+        if not conn.closed:
+            # Unlocking needs a usable transaction; anything uncommitted by now is abandoned anyway
+            if conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_INERROR:
+                conn.rollback()
+            for lock in reversed(held):
+                release(conn, *lock)
+
+
+def month_resources(table, months):
+    """'table/YYYY-MM' resources for the months a load touches"""
+    return [f"{table}/{month:%Y-%m}" for month in months]
+
+
+def list_locks(conn):
+    names = {lock_key(table): table for table in LOCKED_TABLES}
+    cursor = conn.cursor()
+    cursor.execute(HOLDERS_SQL)
+    rows = cursor.fetchall()
+    cursor.close()
+    if not rows:
+        print("No ETL advisory locks held")
+        return
+    for classid, objid, mode, granted, pid, application, held_for in rows:
+        table = names.get(classid, f"key {classid}")
+        target = table if objid == 0 else f"{table}/#{objid}"
+        state = 'holds' if granted else 'waits for'
+        print(f"  {application or '-':<32} pid {pid:<7} {state:<9} {target:<36} {mode:<14} {held_for}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show ETL advisory locks and the jobs waiting on them')
+    parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+    try:
+        list_locks(conn)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
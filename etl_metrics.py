@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Per-stage timing, row counts and memory for the import scripts.
+
+    with RunMetrics('import_repair_data') as metrics:
+        with metrics.span('read') as span:
+            df = pd.read_excel(...)
+            span.add_rows(len(df))
+
+Re-entering a span name accumulates into it, so a span can wrap one row of a
+loop. At the end of the run a JSON summary and a Prometheus textfile
+(<job>.json / <job>.prom) are written to ETL_METRICS_DIR (default: metrics/).
+ETL_PROFILE=1 (or profile=True) also runs cProfile over the whole job and
+tracemalloc per span, and writes <job>.prof.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METRICS_DIR = 'metrics'
+METRIC_PREFIX = 'crane_etl'
+
+
+def peak_rss_bytes():
+    """Process high-water RSS, or None where getrusage is unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Span:
+    __slots__ = ('name', 'seconds', 'rows', 'calls', 'peak_rss_bytes', 'peak_traced_bytes')
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.rows = 0
+        self.calls = 0
+        self.peak_rss_bytes = None
+        self.peak_traced_bytes = None
+
+    def add_rows(self, count=1):
+        self.rows += count
+
+    def as_dict(self):
+        return {
+            'seconds': round(self.seconds, 4),
+            'rows': self.rows,
+            'rows_per_sec': round(self.rows / self.seconds, 1) if self.seconds > 0 and self.rows else None,
+            'calls': self.calls,
+            'peak_rss_bytes': self.peak_rss_bytes,
+            'peak_traced_bytes': self.peak_traced_bytes,
+        }
+
+
+class RunMetrics:
+    def __init__(self, job, output_dir=None, profile=None):
+        self.job = job
+        self.output_dir = output_dir or os.getenv('ETL_METRICS_DIR', METRICS_DIR)
+        self.profile = os.getenv('ETL_PROFILE') == '1' if profile is None else profile
+        self.spans = {}
+        self.started_at = datetime.now()
+        self.status = 'running'
+        self._start = time.perf_counter()
+        self._profiler = None
+
+        if self.profile:
+            tracemalloc.start()
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        clean_exit = exc_type is None or (exc_type is SystemExit and exc.code in (None, 0))
+        self.finish('success' if clean_exit else 'failed')
+        return False
+
+    @contextmanager
+    def span(self, name, rows=0):
+        span = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = Span(name)
+        if self.profile:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.seconds += time.perf_counter() - start
+            span.calls += 1
+            span.rows += rows
+            span.peak_rss_bytes = peak_rss_bytes()
+            if self.profile:
+                traced = tracemalloc.get_traced_memory()[1]
+                span.peak_traced_bytes = max(span.peak_traced_bytes or 0, traced)
+
+    def record(self, name, seconds, rows=0):
+        """Add a stage that was timed elsewhere (e.g. the lock wait etl_locks reports)"""
+        span = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = Span(name)
+        span.seconds += seconds
+        span.calls += 1
+        span.rows += rows
+
+    def summary(self):
+        return {
+            'job': self.job,
+            'status': self.status,
+            'started_at': self.started_at.isoformat(),
+            'duration_seconds': round(time.perf_counter() - self._start, 4),
+            'peak_rss_bytes': peak_rss_bytes(),
+            'stages': {name: span.as_dict() for name, span in self.spans.items()},
+        }
+
+    def prometheus_text(self, summary):
+        def labels(**values):
+            return '{' + ','.join(f'{k}="{label_value(v)}"' for k, v in values.items()) + '}'
+
+        job = summary['job']
+        lines = []
+
+        def metric(name, help_text, samples):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+            lines.extend(f"{METRIC_PREFIX}_{name}{label} {value}" for label, value in samples if value is not None)
+
+        stages = summary['stages'].items()
+        metric('stage_duration_seconds', 'Wall time spent in the stage',
+               [(labels(job=job, stage=name), s['seconds']) for name, s in stages])
+        metric('stage_rows', 'Rows processed by the stage',
+               [(labels(job=job, stage=name), s['rows']) for name, s in stages])
+        metric('stage_rows_per_second', 'Stage throughput',
+               [(labels(job=job, stage=name), s['rows_per_sec']) for name, s in stages])
+        metric('stage_peak_rss_bytes', 'Process peak RSS at the end of the stage',
+               [(labels(job=job, stage=name), s['peak_rss_bytes']) for name, s in stages])
+        metric('run_duration_seconds', 'Wall time of the whole run',
+               [(labels(job=job), summary['duration_seconds'])])
+        metric('run_success', '1 if the last run finished without error',
+               [(labels(job=job), 1 if summary['status'] == 'success' else 0)])
+        metric('run_last_timestamp_seconds', 'Start time of the last run',
+               [(labels(job=job), int(self.started_at.timestamp()))])
+        return '\n'.join(lines) + '\n'
+
+    def finish(self, status='success'):
+        """Stop profiling and write <job>.json / <job>.prom (and <job>.prof when profiling)"""
+        if self.status != 'running':
+            return
+        self.status = status
+        summary = self.summary()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, self.job)
+        with open(f'{base}.json', 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        # Write-then-rename so the node_exporter textfile collector never reads a partial file
+        with open(f'{base}.prom.tmp', 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text(summary))
+        os.replace(f'{base}.prom.tmp', f'{base}.prom')
+
+        print(f"\n[{self.job}] {status} in {summary['duration_seconds']:.2f}s")
+        for name, stage in summary['stages'].items():
+            rate = f"{stage['rows_per_sec']:>10.1f} rows/s" if stage['rows_per_sec'] else ''
+            print(f"  {name:<10} {stage['seconds']:8.2f}s  {stage['rows']:>8} rows {rate}")
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            tracemalloc.stop()
+            self._profiler.dump_stats(f'{base}.prof')
+            report = io.StringIO()
+            pstats.Stats(self._profiler, stream=report).sort_stats('cumulative').print_stats(15)
+            print(report.getvalue())
+            print(f"Profile written to {base}.prof")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Export the normalized workbook as gzip-compressed, size-bounded load artifacts.
+
+    python export_artifacts.py                          # COPY text format into artifacts/snapshot/
+    python export_artifacts.py --format insert --chunk-mb 4
+
+Rows are rendered a slice at a time and streamed into <table>.<nnnn>.<format>.gz
+files. A new file starts once the current one holds --chunk-mb of
+uncompressed SQL/COPY text. manifest.json is written last. It lists every
+artifact in load order with its row count, sizes and SHA-256 checksums
+(compressed file and content).
+
+copy artifacts are COPY text-format data only (the statement is in the
+manifest): gunzip -c cranes.0001.copy.gz | psql -c "\\copy cranes (...) from stdin"
+insert artifacts are standalone multi-row INSERT ... ON CONFLICT statements.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import subprocess
+from datetime import datetime
+
+import pandas as pd
+
+from workbook_normalize import normalize_workbook, read_workbook
+
+EXCEL_FILE = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
+OUTPUT_DIR = os.path.join('artifacts', 'snapshot')
+LOAD_ORDER = ('cranes', 'failure_records', 'maintenance_records')
+# ON CONFLICT clause per table for insert artifacts; the history tables have no natural key
+CONFLICT_KEYS = {'cranes': 'crane_id'}
+RENDER_ROWS = 10000
+COPY_ESCAPES = (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r'))
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def copy_lines(df):
+    """COPY text-format lines: tab-separated, \\N for NULL, backslash escapes"""
+    columns = []
+    for column in df.columns:
+        text = df[column].astype('string')
+        for raw, escaped in COPY_ESCAPES:
+            text = text.str.replace(raw, escaped, regex=False)
+        columns.append(text.fillna('\\N'))
+    return columns[0].str.cat(columns[1:], sep='\t')
+
+
+def sql_literals(series):
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype('string').fillna('NULL')
+    text = series.astype('string')
+    return ("'" + text.str.replace("'", "''", regex=False) + "'").fillna('NULL')
+
+
+def value_tuples(df):
+    literals = [sql_literals(df[column]) for column in df.columns]
+    return '(' + literals[0].str.cat(literals[1:], sep=', ') + ')'
+
+
+def insert_statement(table, columns):
+    head = f"INSERT INTO {table} ({', '.join(columns)}) VALUES\n"
+    key = CONFLICT_KEYS.get(table)
+    if key:
+        updates = ', '.join(f"{column} = EXCLUDED.{column}" for column in columns if column != key)
+        tail = f"\nON CONFLICT ({key}) DO UPDATE SET {updates};\n"
+    else:
+        tail = "\nON CONFLICT DO NOTHING;\n"
+    return head, tail
+
+
+def render_blocks(table, df, fmt, rows_per_statement):
+    """Yield (text, row_count) blocks; a block is never split across artifacts"""
+    if fmt == 'copy':
+        for start in range(0, len(df), RENDER_ROWS):
+            lines = copy_lines(df.iloc[start:start + RENDER_ROWS])
+            yield '\n'.join(lines) + '\n', len(lines)
+        return
+
+    head, tail = insert_statement(table, list(df.columns))
+    for start in range(0, len(df), rows_per_statement):
+        tuples = value_tuples(df.iloc[start:start + rows_per_statement])
+        yield head + ',\n'.join(tuples) + tail, len(tuples)
+
+
+class ArtifactWriter:
+    """Rolls gzip artifacts for one table over once they hold max_bytes of uncompressed text"""
+
+    def __init__(self, output_dir, table, fmt, max_bytes):
+        self.output_dir = output_dir
+        self.table = table
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.artifacts = []
+        self.first_row = 0
+        self._file = None
+
+    def _open(self):
+        self.name = f"{self.table}.{len(self.artifacts) + 1:04d}.{self.fmt}.gz"
+        self.path = os.path.join(self.output_dir, self.name)
+        self._raw = open(self.path + '.tmp', 'wb')
+        # mtime=0 and no embedded filename keep checksums reproducible
+        self._file = gzip.GzipFile(filename='', mode='wb', fileobj=self._raw, mtime=0)
+        self._content = hashlib.sha256()
+        self._bytes = 0
+        self._rows = 0
+
+    def write(self, text, rows):
+        if self._file is not None and self._bytes and self._bytes + len(text.encode('utf-8')) > self.max_bytes:
+            self.close()
+        if self._file is None:
+            self._open()
+        data = text.encode('utf-8')
+        self._file.write(data)
+        self._content.update(data)
+        self._bytes += len(data)
+        self._rows += rows
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._raw.close()
+        os.replace(self.path + '.tmp', self.path)
+        self.artifacts.append({
+            'file': self.name,
+            'table': self.table,
+            'first_row': self.first_row,
+            'rows': self._rows,
+            'bytes': self._bytes,
+            'compressed_bytes': os.path.getsize(self.path),
+            'sha256': file_sha256(self.path),
+            'content_sha256': self._content.hexdigest(),
+        })
+        self.first_row += self._rows
+        self._file = None
+
+
+def export_tables(tables, output_dir, fmt='copy', max_bytes=16 << 20, rows_per_statement=500):
+    """Write every table in LOAD_ORDER as artifacts; returns the manifest entries"""
+    os.makedirs(output_dir, exist_ok=True)
+    artifacts = []
+    for table in LOAD_ORDER:
+        df = tables[table]
+        writer = ArtifactWriter(output_dir, table, fmt, max_bytes)
+        for text, rows in render_blocks(table, df, fmt, rows_per_statement):
+            writer.write(text, rows)
+        writer.close()
+        artifacts.extend(writer.artifacts)
+        print(f"  {table}: {len(df)} rows in {len(writer.artifacts)} artifacts")
+    return artifacts
+
+
+def write_manifest(output_dir, tables, artifacts, fmt, source):
+    manifest = {
+        'format': fmt,
+        'created_at': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'source': source,
+        'source_sha256': file_sha256(source) if os.path.isfile(source) else None,
+        'tables': {
+            table: {
+                'columns': list(tables[table].columns),
+                'rows': len(tables[table]),
+                'copy_sql': (f"COPY {table} ({', '.join(tables[table].columns)}) FROM STDIN"
+                             if fmt == 'copy' else None),
+            }
+            for table in LOAD_ORDER
+        },
+        'artifacts': artifacts,
+    }
+    path = os.path.join(output_dir, 'manifest.json')
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the workbook as gzip COPY/INSERT artifacts with a manifest')
+    parser.add_argument('--excel', default=EXCEL_FILE, help='workbook (.xlsx or a directory of sheet CSVs)')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    parser.add_argument('--format', choices=('copy', 'insert'), default='copy')
+    parser.add_argument('--chunk-mb', type=float, default=16, help='uncompressed size bound per artifact')
+    parser.add_argument('--rows-per-statement', type=int, default=500, help='rows per INSERT (insert format)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.excel):
+        print(f"Excel file not found: {args.excel}")
+        return
+
+    # Stale artifacts from an earlier export would not match the new manifest
+    if os.path.isdir(args.output_dir):
+        for name in os.listdir(args.output_dir):
+            if name.endswith('.gz') or name == 'manifest.json':
+                os.remove(os.path.join(args.output_dir, name))
+
+    print(f"Reading {args.excel}...")
+    tables = normalize_workbook(read_workbook(args.excel))
+    print(f"Writing {args.format} artifacts to {args.output_dir}")
+    artifacts = export_tables(tables, args.output_dir, args.format, int(args.chunk_mb * (1 << 20)),
+                              args.rows_per_statement)
+    path = write_manifest(args.output_dir, tables, artifacts, args.format, args.excel)
+    total = sum(artifact['compressed_bytes'] for artifact in artifacts)
+    print(f"{len(artifacts)} artifacts ({total / 1024:.0f} KB compressed); manifest at {path}")
+
+
+if __name__ == "__main__":
+    main()
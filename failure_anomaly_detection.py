@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from psycopg2.extras import execute_values
+
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from fleet_digest import refresh_digests
+
+CRANE_TOTAL = '*'  # by_device placeholder for the all-devices series of a crane
+EPOCH = np.datetime64('1970-01-05', 'D')  # a Monday, so weekly periods run Monday-Sunday
+
+STATE_DDL = """
+    CREATE TABLE IF NOT EXISTS failure_anomaly_state (
+        series_key TEXT NOT NULL,
+        crane_id TEXT NOT NULL,
+        by_device TEXT NOT NULL,
+        freq TEXT NOT NULL,
+        last_period DATE NOT NULL,
+        ewma_mean DOUBLE PRECISION NOT NULL,
+        ewma_var DOUBLE PRECISION NOT NULL,
+        observations INTEGER NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (series_key, freq)
+    )
+"""
+
+# alerts.dedupe_key names what an alert is about (here series|freq|period start); the server's own
+# alerts leave it NULL, which never conflicts
+ALERT_KEY_DDL = """
+    ALTER TABLE alerts ADD COLUMN IF NOT EXISTS dedupe_key TEXT;
+    CREATE UNIQUE INDEX IF NOT EXISTS alerts_dedupe_key_idx ON alerts (crane_id, type, dedupe_key);
+"""
+
+# Spikes already alerted on are skipped
+INSERT_ALERTS_SQL = """
+    INSERT INTO alerts (crane_id, type, message, severity, is_active, created_at, dedupe_key)
+    VALUES %s
+    ON CONFLICT (crane_id, type, dedupe_key) DO NOTHING
+    RETURNING crane_id
+"""
+
+
+def ensure_alert_key(cursor):
+    cursor.execute("""
+        SELECT 1 FROM pg_indexes WHERE schemaname = current_schema() AND indexname = 'alerts_dedupe_key_idx'
+    """)
+    # Checked first: ALTER TABLE takes an exclusive lock even when there is nothing to add
+    if cursor.fetchone() is None:
+        cursor.execute(ALERT_KEY_DDL)
+
+
+def alert_key(series_key, freq, start):
+    return f"{series_key}|{freq}|{start}"
+
+
+def period_length(freq):
+    return 7 if freq == 'W' else 1
+
+
+def to_period(dates, freq):
+    """Map datetime64 values to integer period numbers (days or Monday-based weeks)"""
+    days = (np.asarray(dates, dtype='datetime64[D]') - EPOCH).astype(np.int64)
+    return days // period_length(freq)
+
+
+def period_start(period, freq):
+    return (EPOCH + np.timedelta64(int(period) * period_length(freq), 'D')).astype(date)
+
+
+def series_keys(crane_ids, devices):
+    return [f"{crane_id}|{device}" for crane_id, device in zip(crane_ids, devices)]
+
+
+def build_count_matrix(records, freq, first_period, last_period):
+    """Resample failure records into a (series x period) count matrix.
+
+    Every failure counts towards its crane's total series and, when byDevice is
+    known, towards the (crane, byDevice) series as well.
+    """
+    periods = to_period(records['date'].to_numpy(), freq)
+    in_window = (periods >= first_period) & (periods <= last_period)
+    records = records[in_window]
+    periods = periods[in_window]
+
+    devices = records['by_device'].fillna('').astype(str).str.strip()
+    has_device = (devices != '').to_numpy()
+
+    crane_ids = np.concatenate([records['crane_id'].to_numpy(), records['crane_id'].to_numpy()[has_device]])
+    series_devices = np.concatenate([np.full(len(records), CRANE_TOTAL, dtype=object), devices.to_numpy()[has_device]])
+    series_periods = np.concatenate([periods, periods[has_device]])
+
+    keys = pd.Series(series_keys(crane_ids, series_devices))
+    codes, uniques = pd.factorize(keys, sort=True)
+
+    n_series = len(uniques)
+    n_periods = int(last_period - first_period + 1)
+    flat = codes * n_periods + (series_periods - first_period)
+    counts = np.bincount(flat, minlength=n_series * n_periods).reshape(n_series, n_periods)
+    return list(uniques), counts.astype(np.float64)
+
+
+def ewma_zscores(counts, mean, var, alpha, min_std):
+    """Score every period against the EWMA mean/variance of the periods before it.
+
+    The recursion runs over time; each step updates all series at once.
+    Returns the z-score matrix and the final mean/variance for the next run.
+    """
+    mean = mean.copy()
+    var = var.copy()
+    z = np.empty_like(counts)
+    for t in range(counts.shape[1]):
+        x = counts[:, t]
+        diff = x - mean
+        z[:, t] = diff / np.maximum(np.sqrt(var), min_std)
+        increment = alpha * diff
+        mean += increment
+        var = (1 - alpha) * (var + diff * increment)
+    return z, mean, var
+
+
+def load_state(conn, freq):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(STATE_DDL)
+        cursor.execute("""
+            SELECT series_key, last_period, ewma_mean, ewma_var, observations
+            FROM failure_anomaly_state WHERE freq = %s
+        """, (freq,))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    return pd.DataFrame(rows, columns=['series_key', 'last_period', 'ewma_mean', 'ewma_var', 'observations'])
+
+
+def load_failures(conn, since=None):
+    """Load failure records dated after `since` (all of them when since is None)"""
+    cursor = conn.cursor()
+    try:
+        if since is None:
+            cursor.execute("SELECT crane_id, by_device, date FROM failure_records")
+        else:
+            cursor.execute("SELECT crane_id, by_device, date FROM failure_records WHERE date > %s",
+                           (since.isoformat(),))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    records = pd.DataFrame(rows, columns=['crane_id', 'by_device', 'date'])
+    records['date'] = pd.to_datetime(records['date'], errors='coerce', format='mixed')
+    return records.dropna(subset=['date', 'crane_id'])
+
+
+def detect_anomalies(conn, freq='D', as_of=None, alpha=0.1, z_threshold=3.0, min_count=3,
+                     warmup=8, min_std=0.5, alert_lookback=30, full=False):
+    """Process every complete period since the last run and raise failure_spike alerts"""
+    as_of = as_of or date.today()
+    last_period = int(to_period([np.datetime64(as_of, 'D')], freq)[0]) - 1  # only complete periods
+
+    if full:
+        cursor = conn.cursor()
+        cursor.execute(STATE_DDL)
+        cursor.execute("DELETE FROM failure_anomaly_state WHERE freq = %s", (freq,))
+        cursor.close()
+
+    state = load_state(conn, freq)
+    processed_through = None
+    if len(state) > 0:
+        processed_through = pd.to_datetime(state['last_period']).max().date()
+
+    if processed_through is None:
+        records = load_failures(conn)
+        if len(records) == 0:
+            print("No failure records to analyse")
+            return 0
+        first_period = int(to_period([records['date'].min().to_datetime64()], freq)[0])
+    else:
+        # Re-read from the start of the next period so late rows in it are counted
+        first_period = int(to_period([np.datetime64(processed_through, 'D')], freq)[0]) + 1
+        records = load_failures(conn, since=period_start(first_period, freq) - timedelta(days=1))
+
+    if first_period > last_period:
+        print("No new complete periods to process")
+        return 0
+
+    keys, counts = build_count_matrix(records, freq, first_period, last_period)
+
+    # Series seen before resume from their state; new series have been all-zero so far
+    previous = state.set_index('series_key')
+    known = previous.reindex(keys)
+    baseline_obs = int(previous['observations'].max()) if len(previous) > 0 else 0
+    mean = known['ewma_mean'].fillna(0.0).to_numpy(dtype=np.float64)
+    var = known['ewma_var'].fillna(0.0).to_numpy(dtype=np.float64)
+    observations = known['observations'].fillna(baseline_obs).to_numpy(dtype=np.int64)
+
+    # Carry forward state-only series (no failures in the new window) with zero counts
+    missing = previous.index.difference(keys)
+    if len(missing) > 0:
+        keys = keys + list(missing)
+        counts = np.vstack([counts, np.zeros((len(missing), counts.shape[1]))])
+        mean = np.concatenate([mean, previous.loc[missing, 'ewma_mean'].to_numpy(dtype=np.float64)])
+        var = np.concatenate([var, previous.loc[missing, 'ewma_var'].to_numpy(dtype=np.float64)])
+        observations = np.concatenate([observations, previous.loc[missing, 'observations'].to_numpy(dtype=np.int64)])
+
+    z, mean, var = ewma_zscores(counts, mean, var, alpha, min_std)
+
+    n_periods = counts.shape[1]
+    seen = observations[:, None] + np.arange(n_periods)[None, :]
+    alert_from = max(0, n_periods - int(np.ceil(alert_lookback / period_length(freq))))
+    flagged = (z >= z_threshold) & (counts >= min_count) & (seen >= warmup)
+    flagged[:, :alert_from] = False
+
+    series_idx, period_idx = np.nonzero(flagged)
+    now = datetime.now().isoformat()
+    unit = '주간' if freq == 'W' else '일간'
+    alert_rows = []
+    for s, p in zip(series_idx, period_idx):
+        crane_id, device = keys[s].split('|', 1)
+        start = period_start(first_period + p, freq)
+        scope = '' if device == CRANE_TOTAL else f" ({device})"
+        alert_rows.append((
+            crane_id,
+            'failure_spike',
+            f"Crane {crane_id}{scope}, {unit} period starting {start}: {int(counts[s, p])} failures "
+            f"(z={z[s, p]:.1f})",
+            'high' if z[s, p] >= 2 * z_threshold else 'medium',
+            True,
+            now,
+            alert_key(keys[s], freq, start),
+        ))
+
+    state_rows = [
+        (key, *key.split('|', 1), freq, period_start(last_period, freq),
+         float(mean[i]), float(var[i]), int(observations[i] + n_periods), now)
+        for i, key in enumerate(keys)
+    ]
+
+    cursor = conn.cursor()
+    try:
+        # A --full run or an overlapping window finds the same spikes again
+        inserted = []
+        if alert_rows:
+            ensure_alert_key(cursor)
+            inserted = execute_values(cursor, INSERT_ALERTS_SQL, alert_rows, page_size=1000, fetch=True,
+                                      template="(%s, %s, %s, %s, %s, %s::timestamptz, %s)")
+        execute_values(cursor, """
+            INSERT INTO failure_anomaly_state
+                (series_key, crane_id, by_device, freq, last_period, ewma_mean, ewma_var, observations, updated_at)
+            VALUES %s
+            ON CONFLICT (series_key, freq) DO UPDATE SET
+                last_period = EXCLUDED.last_period,
+                ewma_mean = EXCLUDED.ewma_mean,
+                ewma_var = EXCLUDED.ewma_var,
+                observations = EXCLUDED.observations,
+                updated_at = EXCLUDED.updated_at
+        """, state_rows, page_size=1000)
+        if inserted:
+            notify_change(conn, 'alerts', crane_ids=[row[0] for row in inserted], job='failure_anomaly_detection')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    print(f"Processed {n_periods} periods x {len(keys)} series "
+          f"({period_start(first_period, freq)} ~ {period_start(last_period, freq)}), "
+          f"{len(alert_rows)} anomalies flagged, {len(inserted)} new alerts")
+    return len(inserted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Detect failure-rate spikes per crane and byDevice')
+    parser.add_argument('--freq', choices=['D', 'W'], default='D', help='daily or weekly buckets')
+    parser.add_argument('--as-of', type=date.fromisoformat, default=None)
+    parser.add_argument('--alpha', type=float, default=0.1, help='EWMA smoothing factor')
+    parser.add_argument('--z-threshold', type=float, default=3.0)
+    parser.add_argument('--min-count', type=int, default=3, help='minimum failures in a flagged period')
+    parser.add_argument('--alert-lookback', type=int, default=30,
+                        help='only raise alerts for anomalies within this many days')
+    parser.add_argument('--full', action='store_true', help='discard saved state and reprocess history')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+
+    try:
+        raised = detect_anomalies(conn, freq=args.freq, as_of=args.as_of, alpha=args.alpha,
+                                  z_threshold=args.z_threshold, min_count=args.min_count,
+                                  alert_lookback=args.alert_lookback, full=args.full)
+        # The digests list the recent anomaly alerts
+        if raised:
+            refresh_digests(conn)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from psycopg2.extras import execute_values
+
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+
+HORIZONS = (30, 90)  # days, one expected_<n>d column each
+
+# Sparse cranes are refit once the fleet prior has moved this much (relative) from the one they were fit with
+PRIOR_TOLERANCE = 0.05
+
+FORECAST_DDL = """
+    CREATE TABLE IF NOT EXISTS failure_forecasts (
+        crane_id TEXT PRIMARY KEY,
+        history_hash TEXT NOT NULL,
+        model TEXT NOT NULL,
+        params TEXT NOT NULL,
+        event_count INTEGER NOT NULL,
+        window_start DATE NOT NULL,
+        window_end DATE NOT NULL,
+        expected_30d DOUBLE PRECISION NOT NULL,
+        expected_90d DOUBLE PRECISION NOT NULL,
+        fitted_at TEXT NOT NULL
+    )
+"""
+
+
+def load_histories(conn):
+    """Failure dates per crane, plus what each crane's observation starts from.
+
+    Returns (cranes, failures, repairs): cranes has crane_id and
+    installation_date for every crane, including ones that never failed;
+    repairs has the maintenance record dates.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT crane_id, installation_date FROM cranes")
+        cranes = pd.DataFrame(cursor.fetchall(), columns=['crane_id', 'installation_date'])
+        cursor.execute("SELECT crane_id, date FROM failure_records")
+        failures = pd.DataFrame(cursor.fetchall(), columns=['crane_id', 'date'])
+        cursor.execute("SELECT crane_id, date FROM maintenance_records")
+        repairs = pd.DataFrame(cursor.fetchall(), columns=['crane_id', 'date'])
+    finally:
+        cursor.close()
+
+    cranes['installation_date'] = pd.to_datetime(cranes['installation_date'], errors='coerce', format='mixed')
+    for frame in (failures, repairs):
+        frame['date'] = pd.to_datetime(frame['date'], errors='coerce', format='mixed').dt.normalize()
+    return cranes, failures.dropna(), repairs.dropna()
+
+
+def crane_starts(cranes, failures, repairs, window_end):
+    """crane_id -> first day of its own observation window.
+
+    That is the crane's first failure or repair record, so cranes added to the
+    records later are not charged exposure from before they were tracked.
+    Cranes without records start at installation, or at window_end when that
+    is unknown too (their forecast is then the fleet prior).
+    """
+    records = pd.concat([failures, repairs], ignore_index=True)
+    first_record = records.groupby('crane_id')['date'].min()
+    installed = cranes.dropna(subset=['installation_date']).set_index('crane_id')['installation_date']
+    starts = {}
+    for crane_id in set(cranes['crane_id']) | set(first_record.index):
+        start = first_record.get(crane_id, installed.get(crane_id))
+        starts[crane_id] = min(start.date(), window_end) if start is not None and pd.notna(start) else window_end
+    return starts
+
+
+def fit_gamma_prior(event_counts, exposure_days):
+    """Method-of-moments Gamma(alpha, beta) prior on the daily failure rate across the fleet.
+
+    exposure_days is one value per crane (or one for all).
+    """
+    counts = np.asarray(event_counts, dtype=np.float64)
+    exposure = np.broadcast_to(np.asarray(exposure_days, dtype=np.float64), counts.shape)
+    rates = counts / exposure if len(counts) > 0 else counts
+    mean_rate = rates.mean() if len(rates) > 0 else 0.0
+    if mean_rate <= 0:
+        return {'alpha': 0.5, 'beta': 0.5 * (float(exposure.mean()) if len(exposure) > 0 else 1.0)}
+
+    # Between-crane variance, net of the Poisson noise each crane's rate carries
+    between_var = rates.var() - (mean_rate / exposure).mean()
+    between_var = max(between_var, (mean_rate ** 2) * 0.01)
+    return {'alpha': float(mean_rate ** 2 / between_var), 'beta': float(mean_rate / between_var)}
+
+
+def default_as_of(today=None):
+    """The last Sunday before today; the window moves once a week, in between only changed cranes refit"""
+    today = today or date.today()
+    return today - timedelta(days=today.weekday() + 1)
+
+
+def history_hash(event_days, window_start, window_end):
+    """Identifies one crane's own failures in its own window; nothing fleet-wide goes in"""
+    digest = hashlib.sha1()
+    digest.update(f"{window_start}|{window_end}".encode())
+    digest.update(np.sort(np.asarray(event_days, dtype=np.int64)).tobytes())
+    return digest.hexdigest()
+
+
+def prior_moved(params, prior):
+    """Whether a poisson_gamma fit was made with a prior that has since drifted past PRIOR_TOLERANCE"""
+    fitted = json.loads(params)
+    return any(abs(prior[k] - fitted.get(k, 0.0)) > PRIOR_TOLERANCE * abs(prior[k]) for k in ('alpha', 'beta'))
+
+
+def fit_poisson_gamma(event_days, exposure_days, prior, horizons):
+    """Posterior-mean Poisson rate, shrunk towards the fleet prior"""
+    rate = (prior['alpha'] + len(event_days)) / (prior['beta'] + exposure_days)
+    params = {'rate_per_day': rate, 'alpha': prior['alpha'], 'beta': prior['beta']}
+    return 'poisson_gamma', params, [rate * h for h in horizons]
+
+
+def fit_weibull_process(event_days, exposure_days, horizons):
+    """Power-law NHPP (Crow-AMSAA / Weibull process) fitted by time-truncated MLE.
+
+    Cumulative intensity is lambda * t**shape; shape > 1 means failures are
+    getting more frequent, shape < 1 means the crane is settling down.
+    """
+    t = np.asarray(event_days, dtype=np.float64) + 1.0
+    end = exposure_days + 1.0
+    log_ratio = np.log(end / t).sum()
+    shape = len(t) / log_ratio if log_ratio > 0 else 1.0
+    shape = float(np.clip(shape, 0.2, 5.0))
+    scale = len(t) / end ** shape
+    params = {'shape': shape, 'lambda': scale}
+    return 'weibull_process', params, [scale * ((end + h) ** shape - end ** shape) for h in horizons]
+
+
+def fit_crane_batch(batch, prior, horizons, min_events):
+    """Fit every crane in a batch; runs inside a worker process"""
+    results = []
+    for crane_id, event_days, exposure_days, window_start, digest in batch:
+        if len(event_days) >= min_events:
+            model, params, expected = fit_weibull_process(event_days, exposure_days, horizons)
+        else:
+            model, params, expected = fit_poisson_gamma(event_days, exposure_days, prior, horizons)
+        results.append((crane_id, digest, model, params, len(event_days), window_start, expected))
+    return results
+
+
+def load_cached_fits(conn):
+    """crane_id -> (history_hash, model, params) of the stored forecasts"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(FORECAST_DDL)
+        cursor.execute("SELECT crane_id, history_hash, model, params FROM failure_forecasts")
+        return {row[0]: row[1:] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def forecast_failures(conn, as_of=None, min_events=8, workers=None, batch_size=64, force=False):
+    cranes, failures, repairs = load_histories(conn)
+    if len(failures) == 0:
+        print("No failure records to fit")
+        return 0
+
+    window_end = as_of or default_as_of()
+    failures = failures[failures['date'].dt.date <= window_end]
+    repairs = repairs[repairs['date'].dt.date <= window_end]
+    if len(failures) == 0:
+        print(f"No failure records up to {window_end}")
+        return 0
+
+    # Offsets and exposure count from each crane's own start
+    starts = crane_starts(cranes, failures, repairs, window_end)
+    start_of = pd.to_datetime(failures['crane_id'].map(starts))
+    offsets = (failures['date'] - start_of).dt.days.to_numpy()
+    grouped = pd.Series(offsets).groupby(failures['crane_id'].to_numpy()).apply(lambda s: s.to_numpy())
+    histories = {crane_id: (grouped.get(crane_id, np.array([], dtype=np.int64)), start,
+                            (window_end - start).days + 1)
+                 for crane_id, start in starts.items()}
+
+    prior = fit_gamma_prior([len(days) for days, _, _ in histories.values()],
+                            [exposure for _, _, exposure in histories.values()])
+    cached = {} if force else load_cached_fits(conn)
+
+    pending = []
+    for crane_id, (days, start, exposure_days) in histories.items():
+        digest = history_hash(days, start, window_end)
+        cached_hash, model, params = cached.get(crane_id, (None, None, None))
+        # The prior changes with every failure in the fleet; sparse cranes follow it only once it has drifted
+        if cached_hash != digest or (model == 'poisson_gamma' and prior_moved(params, prior)):
+            pending.append((crane_id, days, exposure_days, start, digest))
+
+    print(f"{len(histories)} cranes, {len(histories) - len(pending)} unchanged, refitting {len(pending)}")
+    if not pending:
+        return 0
+
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(fit_crane_batch, batch, prior, HORIZONS, min_events)
+                   for batch in batches]
+        for future in futures:
+            results.extend(future.result())
+
+    fitted_at = datetime.now().isoformat()
+    rows = [
+        (crane_id, digest, model, json.dumps(params), event_count, window_start, window_end,
+         float(expected[0]), float(expected[1]), fitted_at)
+        for crane_id, digest, model, params, event_count, window_start, expected in results
+    ]
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(FORECAST_DDL)
+        execute_values(cursor, """
+            INSERT INTO failure_forecasts
+                (crane_id, history_hash, model, params, event_count, window_start, window_end,
+                 expected_30d, expected_90d, fitted_at)
+            VALUES %s
+            ON CONFLICT (crane_id) DO UPDATE SET
+                history_hash = EXCLUDED.history_hash,
+                model = EXCLUDED.model,
+                params = EXCLUDED.params,
+                event_count = EXCLUDED.event_count,
+                window_start = EXCLUDED.window_start,
+                window_end = EXCLUDED.window_end,
+                expected_30d = EXCLUDED.expected_30d,
+                expected_90d = EXCLUDED.expected_90d,
+                fitted_at = EXCLUDED.fitted_at
+        """, rows, page_size=1000)
+        notify_change(conn, 'failure_forecasts', crane_ids=[row[0] for row in rows], job='failure_forecast')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    models = pd.Series([row[2] for row in rows]).value_counts().to_dict()
+    print(f"Wrote {len(rows)} forecasts (through {window_end}): {models}")
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fit per-crane failure forecasts for the next 30/90 days')
+    parser.add_argument('--as-of', type=date.fromisoformat, default=None,
+                        help='end of the observation window (default: last Sunday)')
+    parser.add_argument('--min-events', type=int, default=8,
+                        help='cranes with fewer failures use the shared fleet prior')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help='refit every crane, ignoring cached hashes')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+
+    try:
+        forecast_failures(conn, as_of=args.as_of, min_events=args.min_events,
+                          workers=args.workers, force=args.force)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
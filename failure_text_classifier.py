@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+import argparse
+import math
+import os
+import re
+import sys
+from collections import Counter, defaultdict, deque
+
+import pandas as pd
+
+EXCEL_FILE = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
+TEXT_COLUMNS = ['symptom', 'failureDetails', 'actionTaken']
+TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣']+")
+HANGUL = re.compile(r'[가-힣]')
+# Shorter latin/digit keywords ('ac', 'on', '12') hide inside unrelated words, so they only match whole tokens
+MIN_SUBSTRING_LATIN = 3
+# Hold-out accuracy stays poor below this; inferred labels are kept apart from real ones even above it
+MIN_CONFIDENCE = 0.9
+
+
+class AhoCorasick:
+    """Keyword automaton that reports every keyword occurrence in one pass over the text"""
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].append(index)
+
+        # Breadth-first failure links; each state inherits the outputs of its fallback
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def find(self, text):
+        """Indices of every keyword occurring in text (with repeats)"""
+        state = 0
+        found = []
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                found.extend(self.output[state])
+        return found
+
+
+class KeywordMatcher:
+    """Finds keywords in text: Hangul and longer keywords anywhere, short latin/digit ones as whole tokens"""
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        substring = [index for index, keyword in enumerate(self.keywords) if not whole_token_only(keyword)]
+        self.substring_index = substring
+        self.automaton = AhoCorasick(self.keywords[index] for index in substring)
+        self.tokens = {keyword: index for index, keyword in enumerate(self.keywords) if whole_token_only(keyword)}
+
+    def find(self, text):
+        """Indices of every keyword occurring in text (with repeats)"""
+        found = [self.substring_index[index] for index in self.automaton.find(text)]
+        if self.tokens:
+            found.extend(self.tokens[token] for token in TOKEN_PATTERN.findall(text) if token in self.tokens)
+        return found
+
+
+def whole_token_only(keyword):
+    return len(keyword) < MIN_SUBSTRING_LATIN and not HANGUL.search(keyword)
+
+
+def normalize_text(*parts):
+    return '\n'.join(str(part).strip().lower() for part in parts if isinstance(part, str) and part.strip())
+
+
+def row_texts(df, columns=TEXT_COLUMNS):
+    present = [column for column in columns if column in df.columns]
+    return [normalize_text(*values) for values in df[present].itertuples(index=False, name=None)]
+
+
+class KeywordClassifier:
+    """Maps free text to a label using keywords mined from labelled rows.
+
+    Candidate keywords are the tokens of the labelled text plus the label names
+    themselves. A keyword is kept when it appears in at least `min_support` rows
+    and at least `min_purity` of those rows share one label; it then votes for
+    that label with weight purity * log(1 + support). Latin/digit keywords
+    shorter than MIN_SUBSTRING_LATIN only match whole tokens.
+    """
+
+    def __init__(self, min_support=3, min_purity=0.6):
+        self.min_support = min_support
+        self.min_purity = min_purity
+        self.matcher = None
+        self.votes = []
+
+    def fit(self, texts, labels):
+        pairs = [(text, str(label).strip()) for text, label in zip(texts, labels)
+                 if text and isinstance(label, str) and label.strip()]
+
+        candidates = {label.lower() for _, label in pairs if len(label) >= 2}
+        for text, _ in pairs:
+            candidates.update(token for token in TOKEN_PATTERN.findall(text) if len(token) >= 2)
+        candidate_matcher = KeywordMatcher(sorted(candidates))
+
+        support = Counter()
+        by_label = defaultdict(Counter)
+        for text, label in pairs:
+            for index in set(candidate_matcher.find(text)):
+                support[index] += 1
+                by_label[index][label] += 1
+
+        keywords = []
+        self.votes = []
+        for index, count in support.items():
+            if count < self.min_support:
+                continue
+            label, label_count = by_label[index].most_common(1)[0]
+            purity = label_count / count
+            if purity >= self.min_purity:
+                keywords.append(candidate_matcher.keywords[index])
+                self.votes.append((label, purity * math.log1p(count)))
+
+        self.matcher = KeywordMatcher(keywords)
+        return self
+
+    def predict(self, text):
+        """(label, confidence) where confidence is the winning share of all keyword votes"""
+        if not text or self.matcher is None:
+            return None, 0.0
+        scores = Counter()
+        for index in set(self.matcher.find(text)):
+            label, weight = self.votes[index]
+            scores[label] += weight
+        if not scores:
+            return None, 0.0
+        label, score = scores.most_common(1)[0]
+        return label, score / sum(scores.values())
+
+    def predict_many(self, texts):
+        return [self.predict(text) for text in texts]
+
+
+def train_classifiers(failure_df, min_support=3, min_purity=0.6):
+    """Train byDevice and type classifiers on the labelled FailureReport rows"""
+    texts = row_texts(failure_df)
+    return {
+        column: KeywordClassifier(min_support, min_purity).fit(texts, failure_df[column].tolist())
+        for column in ('byDevice', 'type')
+    }
+
+
+def fill_missing_labels(failure_df, classifiers, min_confidence=MIN_CONFIDENCE):
+    """Fill empty byDevice/type cells with inferred labels and record the confidence"""
+    result = failure_df.copy()
+    texts = row_texts(result)
+    for column, classifier in classifiers.items():
+        missing = result[column].isna() | (result[column].astype(str).str.strip() == '')
+        predictions = [classifier.predict(text) if is_missing else (None, 0.0)
+                       for text, is_missing in zip(texts, missing)]
+        inferred = pd.Series([label for label, _ in predictions], index=result.index)
+        confidence = pd.Series([conf for _, conf in predictions], index=result.index)
+        accept = missing & inferred.notna() & (confidence >= min_confidence)
+
+        result[f'{column}_confidence'] = confidence.where(missing, 1.0)
+        result[f'{column}_inferred'] = accept
+        result.loc[accept, column] = inferred[accept]
+    return result
+
+
+def evaluate(failure_df, holdout_every=5, min_support=3, min_purity=0.6):
+    """Hold out every n-th labelled row and report accuracy against its real label"""
+    holdout = pd.Series(range(len(failure_df)), index=failure_df.index) % holdout_every == 0
+    classifiers = train_classifiers(failure_df[~holdout], min_support, min_purity)
+    texts = row_texts(failure_df[holdout])
+    for column, classifier in classifiers.items():
+        predictions = classifier.predict_many(texts)
+        actual = failure_df.loc[holdout, column].astype(str).str.strip().tolist()
+        answered = [(pred, conf, real) for (pred, conf), real in zip(predictions, actual) if pred is not None]
+        correct = sum(pred == real for pred, _, real in answered)
+        print(f"{column}: {len(classifier.votes)} keywords, answered {len(answered)}/{len(actual)}, "
+              f"accuracy {correct / max(len(answered), 1):.1%}")
+        for threshold in (0.5, 0.7, 0.9):
+            confident = [(pred, real) for pred, conf, real in answered if conf >= threshold]
+            hits = sum(pred == real for pred, real in confident)
+            print(f"  confidence >= {threshold}: {len(confident)} rows, accuracy {hits / max(len(confident), 1):.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Infer byDevice and failure type from failure text')
+    parser.add_argument('--excel', default=EXCEL_FILE)
+    parser.add_argument('--min-confidence', type=float, default=MIN_CONFIDENCE)
+    parser.add_argument('--output', help='write the FailureReport sheet with inferred labels to this CSV')
+    parser.add_argument('--evaluate', action='store_true', help='report hold-out accuracy and exit')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.excel):
+        print(f"Excel file not found: {args.excel}")
+        sys.exit(1)
+
+    failure_df = pd.read_excel(args.excel, sheet_name='FailureReport')
+    print(f"Loaded {len(failure_df)} rows from FailureReport sheet")
+
+    if args.evaluate:
+        evaluate(failure_df)
+        return
+
+    classifiers = train_classifiers(failure_df)
+    result = fill_missing_labels(failure_df, classifiers, args.min_confidence)
+    for column in classifiers:
+        missing = failure_df[column].isna() | (failure_df[column].astype(str).str.strip() == '')
+        inferred = result[f'{column}_inferred'].sum()
+        print(f"{column}: {missing.sum()} empty, inferred {inferred}, left empty {missing.sum() - inferred}")
+
+    if args.output:
+        result.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,18 @@
 #!/usr/bin/env python3
 import pandas as pd
-import psycopg2
-import os
+
+from db_access import fetch_column
+from db_connection import connect_db, release_db
 
 def find_missing_factory():
     excel_file = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
     
-    conn = psycopg2.connect(
-        host=os.getenv('PGHOST'),
-        database=os.getenv('PGDATABASE'),
-        user=os.getenv('PGUSER'),
-        password=os.getenv('PGPASSWORD'),
-        port=os.getenv('PGPORT')
-    )
-    cursor = conn.cursor()
+    conn = connect_db()
+    if not conn:
+        return
     
     # Get existing factories in DB
-    cursor.execute("SELECT DISTINCT plant_section FROM cranes WHERE plant_section IS NOT NULL ORDER BY plant_section")
-    db_factories = set(row[0] for row in cursor.fetchall())
+    db_factories = fetch_column(conn, "SELECT DISTINCT plant_section FROM cranes WHERE plant_section IS NOT NULL")
     print(f"DB에 있는 공장 ({len(db_factories)}개):")
     for factory in sorted(db_factories):
         print(f"  - {factory}")
@@ -51,8 +46,7 @@ def find_missing_factory():
         
         print(f"    해당 공장의 크레인: {missing_cranes}")
     
-    cursor.close()
-    conn.close()
+    release_db(conn)
 
 if __name__ == "__main__":
     find_missing_factory()
\ No newline at end of file
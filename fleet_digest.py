@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Precompute compact fleet, factory and crane digests for the AI reports.
+
+    python fleet_digest.py refresh                  # every scope, as of today
+    python fleet_digest.py refresh --as-of 2025-06-13
+    python fleet_digest.py show crane 4P1001201     # print one digest and its size
+
+/api/ai/analyze-dashboard and /api/ai/crane-summary put one ai_digests row
+into their prompt instead of assembling raw records per request. A digest
+covers the twelve months up to --as-of: failure and repair totals, the top
+failure devices, a monthly MTBF trend, recent anomaly alerts and overdue
+inspections (crane digests add the crane's own details and latest failures).
+
+Every digest is capped at MAX_DIGEST_BYTES of JSON; the longest lists are
+cut in half until it fits. version goes up only when a digest's content changes.
+
+Each row also records the data_versions of its source tables as they were
+when it was built. The server uses a digest only while none of those has
+moved on and its asOf is recent; otherwise it falls back to the records.
+The import scripts refresh the digests at the end of every load.
+"""
+import argparse
+import json
+import sys
+from datetime import date, timedelta
+
+import pandas as pd
+from psycopg2.extras import execute_values
+
+from db_connection import connect_db, release_db
+from etl_events import VERSIONS_DDL, notify_change
+from etl_locks import etl_locks
+
+MAX_DIGEST_BYTES = 3000
+HISTORY_DAYS = 365
+MTBF_MONTHS = 6
+ANOMALY_DAYS = 30
+TOP_N = 5
+
+# Tables the digests are built from; their data_versions are stored with each digest
+SOURCE_TABLES = ('cranes', 'failure_records', 'maintenance_records', 'alerts')
+
+DIGEST_DDL = """
+    CREATE TABLE IF NOT EXISTS ai_digests (
+        scope TEXT NOT NULL,
+        scope_key TEXT NOT NULL,
+        version INTEGER NOT NULL DEFAULT 1,
+        digest JSONB NOT NULL,
+        bytes INTEGER NOT NULL,
+        generated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        source_versions JSONB NOT NULL DEFAULT '{}',
+        refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (scope, scope_key)
+    );
+    ALTER TABLE ai_digests ADD COLUMN IF NOT EXISTS source_versions JSONB NOT NULL DEFAULT '{}';
+    ALTER TABLE ai_digests ADD COLUMN IF NOT EXISTS refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now();
+"""
+
+# List fields in the order they are shortened when a digest is over the size cap
+TRIM_ORDER = ('recentFailures', 'anomalies', 'overdue.cranes', 'topRepairs', 'topDevices')
+
+
+def source_versions(conn):
+    """data_versions of SOURCE_TABLES; read before the inputs, so a change in between makes the digest look stale"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(VERSIONS_DDL)
+        cursor.execute("SELECT table_name, version FROM data_versions WHERE table_name = ANY(%s)",
+                       (list(SOURCE_TABLES),))
+        versions = dict(cursor.fetchall())
+    finally:
+        cursor.close()
+    return {table: versions.get(table, 0) for table in SOURCE_TABLES}
+
+
+def load_inputs(conn, as_of):
+    since = as_of - timedelta(days=HISTORY_DAYS)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT crane_id, crane_name, plant_section, grade, drive_type, unmanned_operation,
+                   electrical_manager, mechanical_manager, installation_date, inspection_cycle,
+                   lead_time, next_maintenance_date
+            FROM cranes
+        """)
+        cranes = pd.DataFrame(cursor.fetchall(), columns=[
+            'crane_id', 'crane_name', 'plant_section', 'grade', 'drive_type', 'unmanned_operation',
+            'electrical_manager', 'mechanical_manager', 'installation_date', 'inspection_cycle',
+            'lead_time', 'next_maintenance_date'])
+        cursor.execute("""
+            SELECT crane_id, date, by_device, failure_type, downtime, description
+            FROM failure_records WHERE date > %s AND date <= %s
+        """, (since, as_of))
+        failures = pd.DataFrame(cursor.fetchall(), columns=[
+            'crane_id', 'date', 'by_device', 'failure_type', 'downtime', 'description'])
+        cursor.execute("""
+            SELECT crane_id, date, type, task_name, duration
+            FROM maintenance_records WHERE date > %s AND date <= %s
+        """, (since, as_of))
+        repairs = pd.DataFrame(cursor.fetchall(), columns=['crane_id', 'date', 'type', 'task_name', 'duration'])
+        cursor.execute("""
+            SELECT crane_id, created_at::date, type, severity, message
+            FROM alerts WHERE is_active AND created_at::date > %s AND created_at::date <= %s
+            ORDER BY created_at DESC
+        """, (as_of - timedelta(days=ANOMALY_DAYS), as_of))
+        alerts = pd.DataFrame(cursor.fetchall(), columns=['crane_id', 'date', 'type', 'severity', 'message'])
+    finally:
+        cursor.close()
+
+    for frame in (failures, repairs, alerts):
+        frame['date'] = pd.to_datetime(frame['date'])
+    return cranes, failures, repairs, alerts
+
+
+def text(value):
+    """None for a missing value; pandas 3 reads NULL text as NaN, which is truthy and not valid JSON"""
+    return None if pd.isna(value) else value
+
+
+def top_counts(values, n=TOP_N):
+    counts = values.fillna('기타').replace('', '기타').value_counts().head(n)
+    return [[str(name), int(count)] for name, count in counts.items()]
+
+
+def mtbf_trend(failures, crane_count, as_of):
+    """[['YYYY-MM', days of operation per failure or None], ...] for the last MTBF_MONTHS months"""
+    months = pd.period_range(end=pd.Period(as_of, 'M'), periods=MTBF_MONTHS, freq='M')
+    counts = failures['date'].dt.to_period('M').value_counts()
+    trend = []
+    for month in months:
+        failed = int(counts.get(month, 0))
+        exposure = month.days_in_month * crane_count
+        trend.append([str(month), round(exposure / failed, 1) if failed else None])
+    return trend
+
+
+def overdue_inspections(cranes, as_of):
+    due = pd.to_datetime(cranes['next_maintenance_date'])
+    overdue = cranes[due.notna() & (due.dt.date < as_of)].assign(due=due).sort_values('due')
+    return {
+        'count': len(overdue),
+        'cranes': [[text(row.crane_name) or row.crane_id, f"{row.due:%Y-%m-%d}", (as_of - row.due.date()).days]
+                   for row in overdue.itertuples()],
+    }
+
+
+def build_digest(scope, key, cranes, failures, repairs, alerts, as_of):
+    """The digest for one scope; every frame is already limited to the scope's cranes"""
+    names = {crane_id: text(name) for crane_id, name in zip(cranes['crane_id'], cranes['crane_name'])}
+    digest = {
+        'scope': scope,
+        'key': key,
+        'asOf': as_of.isoformat(),
+        'days': HISTORY_DAYS,
+        'failures': {'count': len(failures), 'downtimeHours': int(failures['downtime'].fillna(0).sum())},
+        'repairs': {'count': len(repairs), 'hours': int(repairs['duration'].fillna(0).sum())},
+        'topDevices': top_counts(failures['by_device']),
+        'mtbf': mtbf_trend(failures, max(len(cranes), 1), as_of),
+        'anomalies': [[f"{row.date:%Y-%m-%d}", names.get(row.crane_id) or row.crane_id, text(row.severity),
+                       (text(row.message) or '')[:80]]
+                      for row in alerts.itertuples()],
+    }
+    if scope == 'crane':
+        crane = cranes.iloc[0]
+        next_due = crane['next_maintenance_date']
+        digest['crane'] = {
+            'name': text(crane['crane_name']), 'code': crane['crane_id'], 'factory': text(crane['plant_section']),
+            'grade': text(crane['grade']), 'drive': text(crane['drive_type']),
+            'unmanned': text(crane['unmanned_operation']),
+            'electrical': text(crane['electrical_manager']), 'mechanical': text(crane['mechanical_manager']),
+            'installed': crane['installation_date'].isoformat() if pd.notna(crane['installation_date']) else None,
+            'cycleDays': None if pd.isna(crane['inspection_cycle']) else int(crane['inspection_cycle']),
+            'leadDays': None if pd.isna(crane['lead_time']) else int(crane['lead_time']),
+        }
+        digest['nextInspection'] = (
+            {'date': next_due.isoformat(), 'daysLeft': (next_due - as_of).days} if pd.notna(next_due) else None)
+        digest['topRepairs'] = top_counts(repairs['task_name'])
+        latest = failures.sort_values('date', ascending=False).head(TOP_N)
+        digest['recentFailures'] = [
+            [f"{row.date:%Y-%m-%d}", text(row.by_device), text(row.failure_type), (text(row.description) or '')[:60]]
+            for row in latest.itertuples()]
+    else:
+        digest['cranes'] = len(cranes)
+        if scope == 'fleet':
+            digest['factories'] = int(cranes['plant_section'].nunique())
+        digest['overdue'] = overdue_inspections(cranes, as_of)
+    return bound_digest(digest)
+
+
+def encoded(digest):
+    return json.dumps(digest, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def bound_digest(digest):
+    """Halve the TRIM_ORDER lists, one field at a time, until the JSON fits MAX_DIGEST_BYTES"""
+    for path in TRIM_ORDER:
+        while len(encoded(digest).encode('utf-8')) > MAX_DIGEST_BYTES:
+            parent, _, field = path.rpartition('.')
+            holder = digest.get(parent) if parent else digest
+            items = holder.get(field) if isinstance(holder, dict) else None
+            if not items:
+                break
+            holder[field] = items[:len(items) // 2]
+    return digest
+
+
+def build_digests(cranes, failures, repairs, alerts, as_of):
+    """(scope, key, digest) for the fleet, each factory and each crane"""
+    digests = [('fleet', 'all', build_digest('fleet', 'all', cranes, failures, repairs, alerts, as_of))]
+    section_of = cranes.set_index('crane_id')['plant_section']
+    for section, members in cranes.groupby(cranes['plant_section'].fillna('')):
+        if not section:
+            continue
+        ids = set(members['crane_id'])
+        digests.append(('factory', section, build_digest(
+            'factory', section, members, failures[failures['crane_id'].isin(ids)],
+            repairs[repairs['crane_id'].isin(ids)], alerts[alerts['crane_id'].isin(ids)], as_of)))
+
+    failures_by_crane = dict(tuple(failures.groupby('crane_id')))
+    repairs_by_crane = dict(tuple(repairs.groupby('crane_id')))
+    alerts_by_crane = dict(tuple(alerts.groupby('crane_id')))
+    for crane_id in section_of.index:
+        digests.append(('crane', crane_id, build_digest(
+            'crane', crane_id, cranes[cranes['crane_id'] == crane_id],
+            failures_by_crane.get(crane_id, failures.iloc[0:0]),
+            repairs_by_crane.get(crane_id, repairs.iloc[0:0]),
+            alerts_by_crane.get(crane_id, alerts.iloc[0:0]), as_of)))
+    return digests
+
+
+def refresh_digests(conn, as_of=None):
+    as_of = as_of or date.today()
+    with etl_locks(conn, 'ai_digests', job='fleet_digest'):
+        versions = json.dumps(source_versions(conn))
+        cranes, failures, repairs, alerts = load_inputs(conn, as_of)
+        digests = build_digests(cranes, failures, repairs, alerts, as_of)
+        rows = [(scope, key, encoded(digest), len(encoded(digest).encode('utf-8')), versions)
+                for scope, key, digest in digests]
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(DIGEST_DDL)
+            # Every digest is stamped with the versions it reflects; unchanged ones keep their version and generated_at
+            changed = sum(written for written, in execute_values(cursor, """
+                INSERT INTO ai_digests (scope, scope_key, digest, bytes, source_versions)
+                VALUES %s
+                ON CONFLICT (scope, scope_key) DO UPDATE SET
+                    version = ai_digests.version + (ai_digests.digest IS DISTINCT FROM EXCLUDED.digest)::int,
+                    generated_at = CASE WHEN ai_digests.digest IS DISTINCT FROM EXCLUDED.digest
+                                        THEN now() ELSE ai_digests.generated_at END,
+                    digest = EXCLUDED.digest,
+                    bytes = EXCLUDED.bytes,
+                    source_versions = EXCLUDED.source_versions,
+                    refreshed_at = now()
+                RETURNING generated_at = now()
+            """, rows, template="(%s, %s, %s::jsonb, %s, %s::jsonb)", page_size=1000, fetch=True))
+            # Cranes and factories that are gone
+            for scope in ('factory', 'crane'):
+                keys = [key for digest_scope, key, _ in digests if digest_scope == scope]
+                cursor.execute("DELETE FROM ai_digests WHERE scope = %s AND scope_key <> ALL(%s)", (scope, keys))
+            notify_change(conn, 'ai_digests', job='fleet_digest')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    sizes = pd.Series([row[3] for row in rows])
+    print(f"Digests as of {as_of}: {len(rows)} built, {changed} changed, "
+          f"{sizes.mean():.0f} bytes on average (max {sizes.max()})")
+    return changed
+
+
+def show_digest(conn, scope, key):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT version, bytes, generated_at, digest FROM ai_digests WHERE scope = %s AND scope_key = %s",
+                       (scope, key))
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+    if not row:
+        print(f"No {scope} digest for {key}; run `fleet_digest.py refresh`")
+        return
+    version, size, generated_at, digest = row
+    print(f"{scope}/{key} v{version}, {size} bytes, generated {generated_at:%Y-%m-%d %H:%M}")
+    print(json.dumps(digest, ensure_ascii=False, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute the digests the AI report endpoints send to the model')
+    commands = parser.add_subparsers(dest='command', required=True)
+    refresh = commands.add_parser('refresh', help='rebuild every digest')
+    refresh.add_argument('--as-of', type=date.fromisoformat, default=None)
+    show = commands.add_parser('show', help='print one digest')
+    show.add_argument('scope', choices=['fleet', 'factory', 'crane'])
+    show.add_argument('key', nargs='?', default='all', help="plant section or crane id ('all' for the fleet)")
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+    try:
+        if args.command == 'refresh':
+            refresh_digests(conn, args.as_of)
+        else:
+            show_digest(conn, args.scope, args.key)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
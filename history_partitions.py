@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""Monthly range partitions for failure_records and maintenance_records.
+
+The parents stay in the public schema under their usual names; the monthly
+partitions (<table>_YYYY_MM) and a <table>_default catch-all live in the
+history_partitions schema, out of drizzle-kit's view.
+
+    python history_partitions.py convert              # one-time: rebuild both tables as partitioned
+    python history_partitions.py ensure --ahead 3     # partitions through three months from now
+    python history_partitions.py reload --months 2024-03 2024-04
+    python history_partitions.py archive --before 2020-01 [--export-dir archive]
+    python history_partitions.py list
+
+reload rebuilds a month from the workbook in a staging table and swaps it in
+for the old partition, so the old rows go away with DETACH + DROP instead of a
+mass DELETE. Reloaded rows get new ids, so the repairs of the reloaded
+months (and of the week after them) are linked to their failures again.
+"""
+import argparse
+import gzip
+import io
+import os
+import re
+import sys
+from datetime import date, datetime, timedelta
+
+from crane_timeline import refresh_timelines
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from fleet_digest import refresh_digests
+from history_search_index import refresh_search_index
+from link_repairs_to_failures import apply_links, link_repairs, load_records
+from workbook_normalize import normalize_workbook, parse_datetimes, read_workbook
+from workbook_provenance import ensure_provenance, workbook_provenance
+
+EXCEL_FILE = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
+PARTITION_SCHEMA = 'history_partitions'
+ARCHIVE_SCHEMA = 'history_archive'
+PARTITIONED_TABLES = ('failure_records', 'maintenance_records')
+PARTITION_SUFFIX = re.compile(r'_(\d{4})_(\d{2})$')
+
+
+def next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def partition_name(table, month):
+    return f"{table}_{month:%Y_%m}"
+
+
+def partition_month(name):
+    """Month covered by a partition, from its _YYYY_MM suffix (None for the default partition)"""
+    match = PARTITION_SUFFIX.search(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def months_of(dates):
+    """Distinct first-of-month dates for any mix of date values"""
+    parsed = parse_datetimes(dates).dropna()
+    return sorted({date(ts.year, ts.month, 1) for ts in parsed})
+
+
+def is_partitioned(cursor, table):
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+    row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def attached_partitions(cursor, table):
+    cursor.execute("""
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = %s::regclass
+        ORDER BY c.relname
+    """, (table,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def copy_frame(cursor, target, df):
+    """COPY a normalized frame straight into one table (a partition or a staging table)"""
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {target} ({', '.join(df.columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+
+
+def create_partition(cursor, table, month):
+    """Create the month's partition, first moving any of its rows out of the default partition"""
+    name = f"{PARTITION_SCHEMA}.{partition_name(table, month)}"
+    default = f"{PARTITION_SCHEMA}.{table}_default"
+    bounds = (month, next_month(month))
+
+    cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE date >= %s AND date < %s)", bounds)
+    if not cursor.fetchone()[0]:
+        cursor.execute(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)", bounds)
+        return
+
+    # ATTACH refuses a range the default partition still holds rows for
+    cursor.execute(f"CREATE TABLE {name} (LIKE {table} INCLUDING ALL)")
+    cursor.execute(f"""
+        WITH moved AS (DELETE FROM {default} WHERE date >= %s AND date < %s RETURNING *)
+        INSERT INTO {name} SELECT * FROM moved
+    """, bounds)
+    cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)", bounds)
+
+
+def ensure_partitions(conn, table, dates):
+    """Create any missing monthly partitions for the given dates; no-op while the table is unpartitioned"""
+    cursor = conn.cursor()
+    try:
+        if not is_partitioned(cursor, table):
+            return []
+        existing = set(attached_partitions(cursor, table))
+        created = []
+        for month in months_of(dates):
+            if partition_name(table, month) not in existing:
+                create_partition(cursor, table, month)
+                created.append(partition_name(table, month))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    if created:
+        print(f"Created {len(created)} {table} partitions: {created[0]} .. {created[-1]}")
+    return created
+
+
+def ensure_upcoming_partitions(conn, months_ahead=3):
+    """Partitions from this month through months_ahead, so live inserts skip the default partition"""
+    month = date.today().replace(day=1)
+    months = [month]
+    for _ in range(months_ahead):
+        month = next_month(month)
+        months.append(month)
+    for table in PARTITIONED_TABLES:
+        ensure_partitions(conn, table, months)
+
+
+def convert_table(conn, table):
+    """Rebuild a plain history table as a monthly partitioned one, keeping ids, the sequence and indexes"""
+    old = f"{table}_unpartitioned"
+    cursor = conn.cursor()
+    try:
+        if is_partitioned(cursor, table):
+            print(f"{table} is already partitioned")
+            return
+        cursor.execute("""
+            SELECT data_type FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s AND column_name = 'date'
+        """, (table,))
+        if cursor.fetchone() != ('date',):
+            raise RuntimeError(f"{table}.date is not a date column; run migrate_date_columns.py --finalize first")
+
+        cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute("""
+            SELECT indexdef FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = %s AND indexname <> %s
+        """, (table, f"{table}_pkey"))
+        index_defs = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", (table,))
+        sequence = cursor.fetchone()[0]
+
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {old}")
+        cursor.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+        cursor.execute(f"""
+            CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE)
+            PARTITION BY RANGE (date)
+        """)
+        cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {PARTITION_SCHEMA}")
+        cursor.execute(f"CREATE TABLE {PARTITION_SCHEMA}.{table}_default PARTITION OF {table} DEFAULT")
+
+        cursor.execute(f"SELECT DISTINCT date_trunc('month', date)::date FROM {old} ORDER BY 1")
+        months = [row[0] for row in cursor.fetchall()]
+        for month in months:
+            name = f"{PARTITION_SCHEMA}.{partition_name(table, month)}"
+            bounds = (month, next_month(month))
+            cursor.execute(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)", bounds)
+            # Straight into the partition, skipping tuple routing
+            cursor.execute(f"INSERT INTO {name} SELECT * FROM {old} WHERE date >= %s AND date < %s", bounds)
+
+        cursor.execute(f"DROP TABLE {old}")
+        # Indexes are built after the copy; on the parent they cascade to every partition
+        cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, date)")
+        for index_def in index_defs:
+            cursor.execute(index_def)
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {table}_date_idx ON {table} (date)")
+        conn.commit()
+        print(f"{table}: {len(months)} monthly partitions")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    cursor = conn.cursor()
+    cursor.execute(f"ANALYZE {table}")
+    conn.commit()
+    cursor.close()
+
+
+def swap_month(conn, table, month, df):
+    """Replace one month of history with df by swapping in a freshly loaded partition"""
+    name = partition_name(table, month)
+    staging = f"{PARTITION_SCHEMA}.{name}_load"
+    bounds = (month, next_month(month))
+    cursor = conn.cursor()
+    try:
+        # Load and index the staging table before taking any lock on the parent
+        cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+        cursor.execute(f"CREATE TABLE {staging} (LIKE {table} INCLUDING ALL)")
+        copy_frame(cursor, staging, df)
+        # A CHECK matching the bounds lets ATTACH skip its validation scan
+        cursor.execute(f"ALTER TABLE {staging} ADD CONSTRAINT {name}_bounds CHECK (date >= %s AND date < %s)",
+                       bounds)
+        conn.commit()
+
+        if name in attached_partitions(cursor, table):
+            cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {PARTITION_SCHEMA}.{name}")
+            cursor.execute(f"DROP TABLE {PARTITION_SCHEMA}.{name}")
+        else:
+            cursor.execute(f"DELETE FROM {PARTITION_SCHEMA}.{table}_default WHERE date >= %s AND date < %s", bounds)
+        cursor.execute(f"ALTER TABLE {staging} RENAME TO {name}")
+        cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {PARTITION_SCHEMA}.{name} FOR VALUES FROM (%s) TO (%s)",
+                       bounds)
+        cursor.execute(f"ALTER TABLE {PARTITION_SCHEMA}.{name} DROP CONSTRAINT {name}_bounds")
+        # The whole month was replaced, including cranes that no longer appear in it
+        notify_change(conn, table, months=[month], job='history_partitions reload')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def reload_months(conn, tables, months=None):
+    """Swap in each month of the normalized workbook tables (all months present, or just `months`).
+
+    Returns the months swapped in, of either table.
+    """
+    cursor = conn.cursor()
+    unpartitioned = [table for table in PARTITIONED_TABLES if not is_partitioned(cursor, table)]
+    cursor.close()
+    if unpartitioned:
+        raise RuntimeError(f"{', '.join(unpartitioned)} not partitioned; run `history_partitions.py convert` first")
+
+    swapped = set()
+    for table in PARTITIONED_TABLES:
+        df = tables[table]
+        month_keys = parse_datetimes(df['date']).dt.to_period('M')
+        for period, frame in df.groupby(month_keys):
+            month = date(period.year, period.month, 1)
+            if months and month not in months:
+                continue
+            # Loads of other months, and of the other table, carry on meanwhile
+            with etl_locks(conn, f"{table}/{month:%Y-%m}", job='history_partitions reload'):
+                swap_month(conn, table, month, frame)
+            swapped.add(month)
+            print(f"  {partition_name(table, month)}: {len(frame)} rows swapped in")
+    return sorted(swapped)
+
+
+def relink_months(conn, months, tolerance_days=7):
+    """Link the repairs of reloaded months to their failures again; returns the records updated.
+
+    A swap gives failure records new ids and loads repairs unlinked, so any
+    related_failure_id in or just after those months points at a dropped row
+    or is missing. Repairs from the first reloaded month through tolerance_days
+    past the last are re-linked against the failures that can precede them.
+    """
+    tolerance = timedelta(days=tolerance_days)
+    start, end = min(months), next_month(max(months)) + tolerance
+    with etl_locks(conn, 'maintenance_records', shared=('failure_records',), job='history_partitions reload'):
+        failures, repairs = load_records(conn, (start, end), (start - tolerance, end))
+        return apply_links(conn, link_repairs(failures, repairs, tolerance_days))
+
+
+def archive_partitions(conn, table, before, export_dir=None):
+    """Detach partitions that end on or before `before`; export them to gzip CSV or move them to history_archive"""
+    cursor = conn.cursor()
+    try:
+        archived = []
+        for name in attached_partitions(cursor, table):
+            month = partition_month(name)
+            if month is None or next_month(month) > before:
+                continue
+            cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {PARTITION_SCHEMA}.{name}")
+            if export_dir:
+                os.makedirs(export_dir, exist_ok=True)
+                path = os.path.join(export_dir, f"{name}.csv.gz")
+                with gzip.open(path, 'wt', encoding='utf-8', newline='') as f:
+                    cursor.copy_expert(f"COPY {PARTITION_SCHEMA}.{name} TO STDOUT WITH (FORMAT csv, HEADER)", f)
+                cursor.execute(f"DROP TABLE {PARTITION_SCHEMA}.{name}")
+            else:
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}")
+                cursor.execute(f"ALTER TABLE {PARTITION_SCHEMA}.{name} SET SCHEMA {ARCHIVE_SCHEMA}")
+            notify_change(conn, table, months=[month], job='history_partitions archive')
+            # One partition per transaction; a failed export leaves the rest attached
+            conn.commit()
+            archived.append(name)
+        return archived
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def list_partitions(conn):
+    cursor = conn.cursor()
+    try:
+        for table in PARTITIONED_TABLES:
+            if not is_partitioned(cursor, table):
+                print(f"{table}: not partitioned")
+                continue
+            cursor.execute("""
+                SELECT c.relname, c.reltuples::bigint, pg_total_relation_size(c.oid)
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = %s::regclass
+                ORDER BY c.relname
+            """, (table,))
+            print(f"{table}:")
+            for name, rows, size in cursor.fetchall():
+                print(f"  {name:<36} ~{max(rows, 0):>8} rows  {size / 1024:>8.0f} KB")
+    finally:
+        cursor.close()
+
+
+def parse_month(value):
+    return datetime.strptime(value, '%Y-%m').date()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monthly partitions for the failure/repair history tables')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('convert', help='rebuild both history tables as monthly partitioned tables')
+
+    ensure = commands.add_parser('ensure', help='create partitions from this month forward')
+    ensure.add_argument('--ahead', type=int, default=3, help='months past the current one')
+
+    reload = commands.add_parser('reload', help='swap in months of history from the workbook')
+    reload.add_argument('--excel', default=EXCEL_FILE)
+    reload.add_argument('--months', type=parse_month, nargs='+', help='YYYY-MM months (default: all in the workbook)')
+
+    archive = commands.add_parser('archive', help='detach partitions older than a month')
+    archive.add_argument('--before', type=parse_month, required=True, help='YYYY-MM; earlier months are archived')
+    archive.add_argument('--export-dir', help='write gzip CSVs here and drop the partitions')
+
+    commands.add_parser('list', help='show partitions with estimated row counts')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+
+    try:
+        if args.command == 'convert':
+            with etl_locks(conn, *PARTITIONED_TABLES, job='history_partitions convert'):
+                for table in PARTITIONED_TABLES:
+                    convert_table(conn, table)
+            ensure_upcoming_partitions(conn)
+        elif args.command == 'ensure':
+            ensure_upcoming_partitions(conn, args.ahead)
+        elif args.command == 'reload':
+            if not os.path.exists(args.excel):
+                print(f"Excel file not found: {args.excel}")
+                sys.exit(1)
+            # Tagged rows, so workbook_reimport.py can later update them in place
+            ensure_provenance(conn)
+            tables = normalize_workbook(read_workbook(args.excel), workbook_provenance(args.excel))
+            swapped = reload_months(conn, tables, set(args.months) if args.months else None)
+            if swapped:
+                print(f"Re-linked {relink_months(conn, swapped)} repairs to their failures")
+            refresh_search_index(conn)
+            refresh_timelines(conn)
+            refresh_digests(conn)
+        elif args.command == 'archive':
+            for table in PARTITIONED_TABLES:
+                with etl_locks(conn, table, job='history_partitions archive'):
+                    archived = archive_partitions(conn, table, args.before, args.export_dir)
+                print(f"{table}: archived {len(archived)} partitions")
+        else:
+            list_partitions(conn)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
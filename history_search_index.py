@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+
+import pandas as pd
+from psycopg2.extras import execute_values
+
+from db_connection import connect_db, release_db
+from etl_locks import etl_locks
+
+EXCEL_FILE = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
+SQLITE_FILE = 'history_search.db'
+
+TOKEN_RUN = re.compile(r'[가-힣]+|[0-9a-z]+')
+NGRAM = 2  # Hangul runs are indexed as overlapping bigrams; words/numbers as-is
+SUBSTRING_MIN = 3  # shortest query the trigram index can serve as an ILIKE fallback
+
+# Searchable text per history table, concatenated in SQL so changed rows can be detected
+SOURCES = {
+    'failure': ("failure_records",
+                "concat_ws(E'\\n', t.description, t.cause, t.failure_type, t.by_device)"),
+    'repair': ("maintenance_records",
+               "concat_ws(E'\\n', t.task_name, t.notes, t.equipment_name, t.work_order)"),
+}
+
+SEARCH_DDL = """
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE TABLE IF NOT EXISTS history_search (
+        source TEXT NOT NULL,
+        record_id INTEGER NOT NULL,
+        crane_id TEXT NOT NULL,
+        date DATE,
+        body TEXT NOT NULL,
+        search_vector TSVECTOR NOT NULL,
+        indexed_at TEXT NOT NULL,
+        PRIMARY KEY (source, record_id)
+    );
+    CREATE INDEX IF NOT EXISTS history_search_vector_idx ON history_search USING gin (search_vector);
+    CREATE INDEX IF NOT EXISTS history_search_body_trgm_idx ON history_search USING gin (body gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS history_search_crane_id_idx ON history_search (crane_id);
+"""
+
+
+def ngram_tokens(text):
+    """Split text into index tokens: Hangul bigrams plus lowercase words and numbers.
+
+    Korean compounds are rarely space-separated ('브레이크라이닝교체'), so bigrams
+    let '라이닝' match inside them without a morphological analyser.
+    """
+    tokens = []
+    for run in TOKEN_RUN.findall(str(text).lower()):
+        if '가' <= run[0] <= '힣' and len(run) > NGRAM:
+            tokens.extend(run[i:i + NGRAM] for i in range(len(run) - NGRAM + 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def query_terms(query):
+    """Distinct query tokens with a prefix flag (words and lone Hangul syllables match as prefixes)"""
+    terms = []
+    for token in dict.fromkeys(ngram_tokens(query)):
+        prefix = not ('가' <= token[0] <= '힣') or len(token) < NGRAM
+        terms.append((token, prefix))
+    return terms
+
+
+def to_tsquery(query):
+    return ' & '.join(f"{token}:*" if prefix else token for token, prefix in query_terms(query))
+
+
+def like_pattern(query):
+    """ILIKE pattern matching query anywhere in the body, with LIKE wildcards escaped"""
+    escaped = query.strip().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def to_fts5_query(query):
+    return ' AND '.join(f'"{token}"*' if prefix else f'"{token}"' for token, prefix in query_terms(query))
+
+
+def refresh_search_index(conn, crane_ids=None, rebuild=False, batch_size=5000):
+    """Bring history_search in line with failure_records / maintenance_records.
+
+    Only rows that are new or whose searchable text changed are re-tokenized, and
+    rows deleted from the source tables are dropped from the index. Imports pass
+    the crane_ids they wrote (as they do to notify_change) so only those cranes'
+    records are compared; without them the whole history is, as a full reload needs.
+    """
+    scope = {'all_cranes': crane_ids is None, 'crane_ids': sorted(crane_ids or [])}
+    if crane_ids is not None and not scope['crane_ids']:
+        return {}
+    # Concurrent refreshes would race on the same (source, record_id) rows
+    with etl_locks(conn, 'history_search'):
+        now = datetime.now().isoformat()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SEARCH_DDL)
+            if rebuild and crane_ids is None:
+                cursor.execute("TRUNCATE history_search")
+            elif rebuild:
+                cursor.execute("DELETE FROM history_search WHERE crane_id = ANY(%(crane_ids)s)", scope)
+
+            totals = {}
+            for source, (table, body_sql) in SOURCES.items():
+                cursor.execute(f"""
+                    DELETE FROM history_search h
+                    WHERE h.source = %(source)s
+                      AND (%(all_cranes)s OR h.crane_id = ANY(%(crane_ids)s))
+                      AND NOT EXISTS (SELECT 1 FROM {table} t WHERE t.id = h.record_id)
+                """, {'source': source, **scope})
+                removed = cursor.rowcount
+
+                cursor.execute(f"""
+                    SELECT t.id, t.crane_id, t.date, {body_sql} AS body
+                    FROM {table} t
+                    LEFT JOIN history_search h ON h.source = %(source)s AND h.record_id = t.id
+                    WHERE (%(all_cranes)s OR t.crane_id = ANY(%(crane_ids)s))
+                      AND (h.record_id IS NULL OR h.body IS DISTINCT FROM {body_sql}
+                           OR h.crane_id IS DISTINCT FROM t.crane_id OR h.date IS DISTINCT FROM t.date)
+                """, {'source': source, **scope})
+
+                indexed = 0
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    values = [
+                        (source, record_id, crane_id, record_date, body, ' '.join(ngram_tokens(body)), now)
+                        for record_id, crane_id, record_date, body in rows
+                    ]
+                    write_cursor = conn.cursor()
+                    try:
+                        execute_values(write_cursor, """
+                            INSERT INTO history_search
+                                (source, record_id, crane_id, date, body, search_vector, indexed_at)
+                            VALUES %s
+                            ON CONFLICT (source, record_id) DO UPDATE SET
+                                crane_id = EXCLUDED.crane_id,
+                                date = EXCLUDED.date,
+                                body = EXCLUDED.body,
+                                search_vector = EXCLUDED.search_vector,
+                                indexed_at = EXCLUDED.indexed_at
+                        """, values, template="(%s, %s, %s, %s, %s, to_tsvector('simple', %s), %s)", page_size=1000)
+                    finally:
+                        write_cursor.close()
+                    indexed += len(values)
+                totals[source] = (indexed, removed)
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        for source, (indexed, removed) in totals.items():
+            print(f"Search index [{source}]: {indexed} indexed, {removed} removed")
+        return totals
+
+
+def search_postgres(conn, query, limit=50, crane_id=None):
+    """Ranked keyword search over the GIN-indexed history_search table.
+
+    When the tokens find nothing (punctuation such as part numbers 'M-12/B',
+    or text split differently than the index split it) the query is matched
+    as a substring of the body through the pg_trgm index instead.
+    """
+    tsquery = to_tsquery(query)
+    params = {'q': tsquery, 'text': query.strip(), 'pattern': like_pattern(query),
+              'crane_id': crane_id, 'limit': limit}
+    cursor = conn.cursor()
+    try:
+        rows = []
+        if tsquery:
+            cursor.execute("""
+                SELECT source, record_id, crane_id, date, body,
+                       ts_rank(search_vector, to_tsquery('simple', %(q)s)) AS rank
+                FROM history_search
+                WHERE search_vector @@ to_tsquery('simple', %(q)s)
+                  AND (%(crane_id)s::text IS NULL OR crane_id = %(crane_id)s)
+                ORDER BY rank DESC, date DESC NULLS LAST
+                LIMIT %(limit)s
+            """, params)
+            rows = cursor.fetchall()
+        if not rows and len(params['text']) >= SUBSTRING_MIN:
+            cursor.execute("""
+                SELECT source, record_id, crane_id, date, body, word_similarity(%(text)s, body) AS rank
+                FROM history_search
+                WHERE body ILIKE %(pattern)s
+                  AND (%(crane_id)s::text IS NULL OR crane_id = %(crane_id)s)
+                ORDER BY rank DESC, date DESC NULLS LAST
+                LIMIT %(limit)s
+            """, params)
+            rows = cursor.fetchall()
+        return rows
+    finally:
+        cursor.close()
+
+
+def load_documents_from_db(conn):
+    cursor = conn.cursor()
+    try:
+        documents = []
+        for source, (table, body_sql) in SOURCES.items():
+            cursor.execute(f"SELECT t.id, t.crane_id, t.date::text, {body_sql} FROM {table} t")
+            documents.extend((source, *row) for row in cursor.fetchall())
+        return documents
+    finally:
+        cursor.close()
+
+
+def load_documents_from_excel(excel_file=EXCEL_FILE):
+    """Same documents straight from the workbook, for building the index with no database at all"""
+    def join_columns(df, columns):
+        present = [column for column in columns if column in df.columns]
+        text = df[present].astype('string').fillna('')
+        return text.apply(lambda row: '\n'.join(value.strip() for value in row if value.strip()), axis=1)
+
+    failures = pd.read_excel(excel_file, sheet_name='FailureReport')
+    repairs = pd.read_excel(excel_file, sheet_name='RepairReport')
+
+    failure_body = join_columns(failures, ['symptom', 'failureDetails', 'actionTaken', 'type', 'byDevice'])
+    repair_body = join_columns(repairs, ['taskName', 'EquipmentName', 'workOrder'])
+    failure_dates = pd.to_datetime(failures['date'], errors='coerce').dt.strftime('%Y-%m-%d')
+    repair_dates = pd.to_datetime(repairs['actualStartDateTime'], errors='coerce').dt.strftime('%Y-%m-%d')
+
+    documents = [
+        ('failure', i + 1, str(crane_id).strip(), day if isinstance(day, str) else None, body)
+        for i, (crane_id, day, body) in enumerate(zip(failures['EquipmentCode'], failure_dates, failure_body))
+    ]
+    documents.extend(
+        ('repair', i + 1, str(crane_id).strip(), day if isinstance(day, str) else None, body)
+        for i, (crane_id, day, body) in enumerate(zip(repairs['EquipmentCode'], repair_dates, repair_body))
+    )
+    return documents
+
+
+def build_sqlite_index(documents, path=SQLITE_FILE):
+    """Write an FTS5 index with the same n-gram tokens, for offline search without PostgreSQL"""
+    if os.path.exists(path):
+        os.remove(path)
+    lite = sqlite3.connect(path)
+    try:
+        lite.execute("""
+            CREATE VIRTUAL TABLE history_search USING fts5(
+                tokens, source UNINDEXED, record_id UNINDEXED, crane_id UNINDEXED,
+                date UNINDEXED, body UNINDEXED, tokenize = 'unicode61'
+            )
+        """)
+        lite.executemany(
+            "INSERT INTO history_search (tokens, source, record_id, crane_id, date, body) VALUES (?, ?, ?, ?, ?, ?)",
+            ((' '.join(ngram_tokens(body)), source, record_id, crane_id, record_date, body)
+             for source, record_id, crane_id, record_date, body in documents if body),
+        )
+        lite.execute("INSERT INTO history_search (history_search) VALUES ('optimize')")
+        lite.commit()
+    finally:
+        lite.close()
+    print(f"Wrote {len(documents)} documents to {path}")
+
+
+def search_sqlite(path, query, limit=50, crane_id=None):
+    fts_query = to_fts5_query(query)
+    if not fts_query:
+        return []
+    lite = sqlite3.connect(path)
+    try:
+        return lite.execute("""
+            SELECT source, record_id, crane_id, date, body, -bm25(history_search) AS rank
+            FROM history_search
+            WHERE history_search MATCH ? AND (? IS NULL OR crane_id = ?)
+            ORDER BY bm25(history_search), date DESC
+            LIMIT ?
+        """, (fts_query, crane_id, crane_id, limit)).fetchall()
+    finally:
+        lite.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query the failure/repair history search index')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    refresh = commands.add_parser('refresh', help='update the PostgreSQL history_search table')
+    refresh.add_argument('--rebuild', action='store_true', help='re-tokenize every record')
+
+    export = commands.add_parser('export-sqlite', help='write an offline SQLite FTS5 index')
+    export.add_argument('--output', default=SQLITE_FILE)
+    export.add_argument('--excel', nargs='?', const=EXCEL_FILE, default=None,
+                        help='index the workbook instead of the database')
+
+    search = commands.add_parser('search', help='keyword search across failure and repair history')
+    search.add_argument('query')
+    search.add_argument('--crane-id')
+    search.add_argument('--limit', type=int, default=20)
+    search.add_argument('--sqlite', nargs='?', const=SQLITE_FILE, default=None,
+                        help='search the offline SQLite index instead of PostgreSQL')
+    args = parser.parse_args()
+
+    if args.command == 'export-sqlite' and args.excel:
+        if not os.path.exists(args.excel):
+            print(f"Excel file not found: {args.excel}")
+            sys.exit(1)
+        build_sqlite_index(load_documents_from_excel(args.excel), args.output)
+        return
+
+    if args.command == 'search' and args.sqlite:
+        rows = search_sqlite(args.sqlite, args.query, args.limit, args.crane_id)
+    else:
+        conn = connect_db()
+        if not conn:
+            sys.exit(1)
+        try:
+            if args.command == 'refresh':
+                refresh_search_index(conn, rebuild=args.rebuild)
+                return
+            if args.command == 'export-sqlite':
+                build_sqlite_index(load_documents_from_db(conn), args.output)
+                return
+            rows = search_postgres(conn, args.query, args.limit, args.crane_id)
+        finally:
+            release_db(conn)
+
+    print(f"'{args.query}' 검색 결과: {len(rows)}건")
+    for source, record_id, crane_id, record_date, body, rank in rows:
+        summary = ' / '.join(line for line in body.splitlines() if line)[:80]
+        print(f"  [{source} #{record_id}] {record_date or '-'}  {crane_id}  {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,105 +1,146 @@
 #!/usr/bin/env python3
 
 import pandas as pd
-import psycopg2
 import os
-from datetime import datetime
+from datetime import date, datetime
 import sys
 
+from crane_timeline import refresh_timelines
+from db_connection import bulk_session, connect_db, execute_prepared, prepare, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks, month_resources
+from etl_metrics import RunMetrics
+from fleet_digest import refresh_digests
+from history_partitions import ensure_partitions, months_of
+from history_search_index import refresh_search_index
+from workbook_normalize import parse_datetimes
+from workbook_provenance import ensure_provenance, sheet_row, workbook_provenance
+
 def import_all_repair_records():
     """Import all RepairReport records with correct EquipmentCode mapping"""
     
+    metrics = RunMetrics('import_all_repair_records')
     try:
         # Connect to database
-        conn = psycopg2.connect(os.environ['DATABASE_URL'])
+        conn = connect_db()
+        if not conn:
+            return False
         cursor = conn.cursor()
         
         # Read RepairReport data
         file_path = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
         print(f"Reading RepairReport data from {file_path}...")
-        repair_df = pd.read_excel(file_path, sheet_name='RepairReport')
+        with metrics.span('read') as span:
+            repair_df = pd.read_excel(file_path, sheet_name='RepairReport')
+            span.add_rows(len(repair_df))
+        provenance = workbook_provenance(file_path)
+        ensure_provenance(conn)
         
         print(f"Found {len(repair_df)} total RepairReport records")
         
         # Filter out records without EquipmentCode
-        valid_records = repair_df[repair_df['EquipmentCode'].notna() & (repair_df['EquipmentCode'] != '')]
+        with metrics.span('normalize') as span:
+            valid_records = repair_df[repair_df['EquipmentCode'].notna() & (repair_df['EquipmentCode'] != '')]
+            span.add_rows(len(valid_records))
         print(f"Valid records with EquipmentCode: {len(valid_records)}")
         
         # Group by EquipmentCode to show distribution
         equipment_counts = valid_records['EquipmentCode'].value_counts()
         print(f"Records per equipment: {equipment_counts.head(10).to_dict()}")
         
-        # Import all records
-        imported_count = 0
-        for i, (_, repair) in enumerate(valid_records.iterrows()):
-            try:
-                equipment_code = str(repair['EquipmentCode']).strip()
+        # Only the months being loaded are locked; rows without a usable start date land in 2024-01
+        months = months_of(valid_records['actualStartDateTime'])
+        if parse_datetimes(valid_records['actualStartDateTime']).isna().any():
+            months.append(date(2024, 1, 1))
+        
+        with etl_locks(conn, *month_resources('maintenance_records', months), job='import_all_repair_records') as waited:
+            metrics.record('lock_wait', waited)
+            # Monthly partitions for the incoming rows
+            with metrics.span('partition'):
+                ensure_partitions(conn, 'maintenance_records', valid_records['actualStartDateTime'])
+        
+            # Import all records, 100 per prepared batch and commit
+            imported_count = 0
+            batch = []
+            prepare(conn, 'insert_maintenance')
+        
+            def flush(batch):
+                with metrics.span('load') as span, bulk_session(conn):
+                    span.add_rows(execute_prepared(cursor, 'insert_maintenance', batch))
+                notify_change(conn, 'maintenance_records', crane_ids=[r[0] for r in batch],
+                              months=[r[1] for r in batch], job='import_all_repair_records')
+                with metrics.span('commit'):
+                    conn.commit()
+                return len(batch)
+        
+            for i, (index, repair) in enumerate(valid_records.iterrows()):
+                try:
+                    equipment_code = str(repair['EquipmentCode']).strip()
                 
-                # Get date values
-                date_val = repair.get('actualStartDateTime')
-                if pd.notna(date_val):
-                    if isinstance(date_val, str):
-                        date_str = date_val[:10] if len(date_val) >= 10 else '2024-01-15'
+                    # Get date values
+                    date_val = repair.get('actualStartDateTime')
+                    if pd.notna(date_val):
+                        if isinstance(date_val, str):
+                            date_str = date_val[:10] if len(date_val) >= 10 else '2024-01-15'
+                        else:
+                            date_str = date_val.strftime('%Y-%m-%d')
                     else:
-                        date_str = date_val.strftime('%Y-%m-%d')
-                else:
-                    date_str = '2024-01-15'
+                        date_str = '2024-01-15'
                 
-                # Get work order
-                work_order = str(repair.get('workOrder', '')) if pd.notna(repair.get('workOrder')) else ''
+                    # Get work order
+                    work_order = str(repair.get('workOrder', '')) if pd.notna(repair.get('workOrder')) else ''
                 
-                # Get task name
-                task_name = str(repair.get('taskName', '')) if pd.notna(repair.get('taskName')) else ''
+                    # Get task name
+                    task_name = str(repair.get('taskName', '')) if pd.notna(repair.get('taskName')) else ''
                 
-                # Get area name
-                area_name = str(repair.get('areaName', '')) if pd.notna(repair.get('areaName')) else ''
+                    # Get area name
+                    area_name = str(repair.get('areaName', '')) if pd.notna(repair.get('areaName')) else ''
                 
-                # Get equipment name
-                equipment_name = str(repair.get('EquipmentName', '')) if pd.notna(repair.get('EquipmentName')) else ''
+                    # Get equipment name
+                    equipment_name = str(repair.get('EquipmentName', '')) if pd.notna(repair.get('EquipmentName')) else ''
                 
-                # Get total workers
-                total_workers = 1
-                if pd.notna(repair.get('totalWorkers')):
-                    try:
-                        total_workers = int(float(repair.get('totalWorkers')))
-                    except:
-                        total_workers = 1
+                    # Get total workers
+                    total_workers = 1
+                    if pd.notna(repair.get('totalWorkers')):
+                        try:
+                            total_workers = int(float(repair.get('totalWorkers')))
+                        except:
+                            total_workers = 1
                 
-                cursor.execute('''
-                    INSERT INTO maintenance_records (
-                        crane_id, type, date, work_order, task_name,
-                        actual_start_date_time, actual_end_date_time,
-                        total_workers, total_work_time, area_name, equipment_name,
-                        status, technician
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ''', (
-                    equipment_code,
-                    'repair',
-                    date_str,
-                    work_order,
-                    task_name,
-                    date_str + ' 08:00:00',
-                    date_str + ' 16:00:00',
-                    total_workers,
-                    8,
-                    area_name,
-                    equipment_name,
-                    'completed',
-                    'maintenance_team'
-                ))
-                
-                imported_count += 1
-                
-                if imported_count % 100 == 0:
-                    conn.commit()
-                    print(f"Imported {imported_count} records...")
+                    batch.append((
+                        equipment_code,
+                        date_str,
+                        'repair',
+                        'maintenance_team',
+                        'completed',
+                        None,
+                        work_order,
+                        task_name,
+                        date_str + ' 08:00:00',
+                        date_str + ' 16:00:00',
+                        total_workers,
+                        8,
+                        area_name,
+                        equipment_name,
+                        provenance['source_file'],
+                        'RepairReport',
+                        sheet_row(index),
+                        provenance['import_batch']
+                    ))
                     
-            except Exception as e:
-                print(f"Error importing record {i}: {e}")
-                continue
+                except Exception as e:
+                    print(f"Error importing record {i}: {e}")
+                    continue
+            
+                # Database errors end the import rather than being skipped per record
+                if len(batch) == 100:
+                    imported_count += flush(batch)
+                    batch = []
+                    print(f"Imported {imported_count} records...")
         
-        conn.commit()
-        print(f"Successfully imported {imported_count} maintenance records")
+            if batch:
+                imported_count += flush(batch)
+            print(f"Successfully imported {imported_count} maintenance records")
         
         # Verify specific crane records
         cursor.execute('SELECT COUNT(*) FROM maintenance_records WHERE crane_id = %s', ('4P1001201',))
@@ -111,11 +152,20 @@ def import_all_repair_records():
         print(f"Total maintenance records in database: {total_count}")
         
         cursor.close()
-        conn.close()
+
+        # Keep the keyword search index, the loaded cranes' timelines and the AI digests in step with the new records
+        with metrics.span('index'):
+            loaded = set(valid_records['EquipmentCode'].astype(str).str.strip())
+            refresh_search_index(conn, loaded)
+            refresh_timelines(conn, loaded)
+            refresh_digests(conn)
+        release_db(conn)
+        metrics.finish('success')
         return True
         
     except Exception as e:
         print(f"Error during import: {e}")
+        metrics.finish('failed')
         return False
 
 if __name__ == "__main__":
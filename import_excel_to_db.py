@@ -1,30 +1,22 @@
 #!/usr/bin/env python3
 import pandas as pd
-import psycopg2
 import os
 from datetime import datetime
 import sys
 
-def connect_to_db():
-    """Connect to PostgreSQL database using environment variables"""
-    try:
-        conn = psycopg2.connect(
-            host=os.getenv('PGHOST'),
-            database=os.getenv('PGDATABASE'),
-            user=os.getenv('PGUSER'),
-            password=os.getenv('PGPASSWORD'),
-            port=os.getenv('PGPORT')
-        )
-        return conn
-    except Exception as e:
-        print(f"Database connection error: {e}")
-        return None
+from crane_timeline import refresh_timelines
+from db_connection import bulk_session, connect_db, execute_prepared, prepare, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from etl_metrics import RunMetrics
+from fleet_digest import refresh_digests
+from workbook_provenance import ensure_provenance, sheet_row, workbook_provenance
 
 def process_crane_data(df):
     """Process crane data from Excel file"""
     processed_data = []
     
-    for _, row in df.iterrows():
+    for index, row in df.iterrows():
         try:
             # Extract and clean data using actual column names
             crane_data = {
@@ -37,6 +29,8 @@ def process_crane_data(df):
                 'grade': str(row.get('Grade', '')).strip() if pd.notna(row.get('Grade')) else None,
                 'driveType': str(row.get('DriveType', '')).strip() if pd.notna(row.get('DriveType')) else None,
                 'unmannedOperation': str(row.get('UnmannedOperation', '')).strip() if pd.notna(row.get('UnmannedOperation')) else None,
+                'electricalManager': str(row.get('electricalManager', '')).strip() if pd.notna(row.get('electricalManager')) else None,
+                'mechanicalManager': str(row.get('mechanicalManager', '')).strip() if pd.notna(row.get('mechanicalManager')) else None,
                 'capacity': None,  # Will extract from MainLoad
                 'span': None,
                 'height': None,
@@ -44,7 +38,8 @@ def process_crane_data(df):
                 'installationDate': None,
                 'lastMaintenanceDate': None,
                 'nextMaintenanceDate': None,
-                'isUrgent': False
+                'isUrgent': False,
+                'sourceRow': sheet_row(index)
             }
             
             # Handle capacity from MainLoad
@@ -74,7 +69,6 @@ def process_crane_data(df):
             # Skip empty crane IDs
             if crane_data['craneId'] and crane_data['craneId'] != 'nan' and crane_data['craneId'] != '':
                 processed_data.append(crane_data)
-                print(f"Processed crane: {crane_data['craneId']} - {crane_data['craneName']}")
                 
         except Exception as e:
             print(f"Error processing row: {e}")
@@ -82,55 +76,53 @@ def process_crane_data(df):
     
     return processed_data
 
-def insert_crane_data(conn, crane_data_list):
+def insert_crane_data(conn, crane_data_list, provenance, sheet_name):
     """Insert crane data into database"""
     cursor = conn.cursor()
     
     try:
-        # Clear existing crane data
-        print("Clearing existing crane data...")
-        cursor.execute("DELETE FROM cranes")
-        conn.commit()
-        
-        insert_query = """
-            INSERT INTO cranes (
-                crane_id, crane_name, plant_section, status, location, model, 
-                grade, drive_type, unmanned_operation, installation_date, 
-                last_maintenance_date, next_maintenance_date, is_urgent
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-        """
-        
-        inserted_count = 0
+        ensure_provenance(conn)
+        # The first row wins when the sheet lists a crane twice
+        rows = {}
         for crane_data in crane_data_list:
-            try:
-                cursor.execute(insert_query, (
-                    crane_data['craneId'],
-                    crane_data['craneName'],
-                    crane_data['plantSection'],
-                    crane_data['status'],
-                    crane_data['location'],
-                    crane_data['model'],
-                    crane_data['grade'],
-                    crane_data['driveType'],
-                    crane_data['unmannedOperation'],
-                    crane_data['installationDate'],
-                    crane_data['lastMaintenanceDate'],
-                    crane_data['nextMaintenanceDate'],
-                    crane_data['isUrgent']
-                ))
-                inserted_count += 1
-                
-                # Commit each insert to avoid transaction issues
-                conn.commit()
-                
-            except Exception as e:
-                print(f"Error inserting crane {crane_data['craneId']}: {e}")
-                conn.rollback()
-                continue
+            rows.setdefault(crane_data['craneId'], (
+                crane_data['craneId'],
+                crane_data['craneName'],
+                crane_data['plantSection'],
+                crane_data['status'],
+                crane_data['location'],
+                crane_data['model'],
+                crane_data['grade'],
+                crane_data['driveType'],
+                crane_data['unmannedOperation'],
+                crane_data['electricalManager'],
+                crane_data['mechanicalManager'],
+                crane_data['installationDate'],
+                None,
+                crane_data['lastMaintenanceDate'],
+                crane_data['nextMaintenanceDate'],
+                crane_data['isUrgent'],
+                provenance['source_file'],
+                sheet_name,
+                crane_data['sourceRow'],
+                provenance['import_batch']
+            ))
+        
+        # Clear and reload in one transaction, with the prepared crane upsert
+        with etl_locks(conn, 'cranes', job='import_excel_to_db'), bulk_session(conn):
+            print("Clearing existing crane data...")
+            cursor.execute("DELETE FROM cranes")
+            prepare(conn, 'upsert_crane')
+            inserted_count = execute_prepared(cursor, 'upsert_crane', rows.values())
+            # Every crane was replaced, so the event covers the whole table
+            notify_change(conn, 'cranes', job='import_excel_to_db')
+            conn.commit()
         
         print(f"Successfully inserted {inserted_count} crane records")
+        # Names, sections and inspection cycles feed the crane detail timelines and the AI digests
+        refresh_timelines(conn)
+        refresh_digests(conn)
+        return inserted_count
         
     except Exception as e:
         print(f"Database error: {e}")
@@ -148,52 +140,60 @@ def main():
     
     print(f"Reading Excel file: {excel_file}")
     
-    try:
-        # Read Excel file - try different sheet names
-        xl_file = pd.ExcelFile(excel_file)
-        print(f"Available sheets: {xl_file.sheet_names}")
-        
-        # Try to find the crane data sheet
-        df = None
-        for sheet_name in xl_file.sheet_names:
-            try:
-                temp_df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                if len(temp_df) > 0:
-                    print(f"Using sheet: {sheet_name}")
-                    df = temp_df
-                    break
-            except:
-                continue
-        
-        if df is None:
-            print("No valid data found in Excel file")
-            sys.exit(1)
-        
-        print(f"Read {len(df)} rows from Excel")
-        print("Columns found:", list(df.columns))
-        
-        # Process crane data
-        print("Processing crane data...")
-        crane_data_list = process_crane_data(df)
-        print(f"Processed {len(crane_data_list)} crane records")
-        
-        # Connect to database
-        print("Connecting to database...")
-        conn = connect_to_db()
-        if not conn:
-            print("Failed to connect to database")
+    with RunMetrics('import_excel_to_db') as metrics:
+        try:
+            with metrics.span('read') as span:
+                # Read Excel file - try different sheet names
+                xl_file = pd.ExcelFile(excel_file)
+                print(f"Available sheets: {xl_file.sheet_names}")
+                
+                # Try to find the crane data sheet
+                df = None
+                for sheet_name in xl_file.sheet_names:
+                    try:
+                        temp_df = pd.read_excel(excel_file, sheet_name=sheet_name)
+                        if len(temp_df) > 0:
+                            print(f"Using sheet: {sheet_name}")
+                            df = temp_df
+                            crane_sheet = sheet_name
+                            break
+                    except:
+                        continue
+                
+                if df is None:
+                    print("No valid data found in Excel file")
+                    sys.exit(1)
+                span.add_rows(len(df))
+            
+            print(f"Read {len(df)} rows from Excel")
+            print("Columns found:", list(df.columns))
+            
+            # Process crane data
+            print("Processing crane data...")
+            with metrics.span('normalize') as span:
+                crane_data_list = process_crane_data(df)
+                span.add_rows(len(crane_data_list))
+            print(f"Processed {len(crane_data_list)} crane records")
+            
+            # Connect to database
+            print("Connecting to database...")
+            conn = connect_db()
+            if not conn:
+                print("Failed to connect to database")
+                sys.exit(1)
+            
+            # Insert data (one transaction; nothing changes if it fails)
+            print("Inserting data into database...")
+            with metrics.span('load') as span:
+                provenance = workbook_provenance(excel_file)
+                span.add_rows(insert_crane_data(conn, crane_data_list, provenance, crane_sheet) or 0)
+            
+            release_db(conn)
+            print("Data import completed successfully!")
+            
+        except Exception as e:
+            print(f"Error reading Excel file: {e}")
             sys.exit(1)
-        
-        # Insert data
-        print("Inserting data into database...")
-        insert_crane_data(conn, crane_data_list)
-        
-        conn.close()
-        print("Data import completed successfully!")
-        
-    except Exception as e:
-        print(f"Error reading Excel file: {e}")
-        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
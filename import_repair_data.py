@@ -1,18 +1,19 @@
 #!/usr/bin/env python3
 import pandas as pd
-import psycopg2
 import os
-from datetime import datetime
+from datetime import date, datetime
 import sys
 
-def connect_db():
-    """Connect to PostgreSQL database"""
-    try:
-        conn = psycopg2.connect(os.environ['DATABASE_URL'])
-        return conn
-    except Exception as e:
-        print(f"Database connection error: {e}")
-        sys.exit(1)
+from crane_timeline import refresh_timelines
+from db_connection import bulk_session, connect_db, execute_prepared, prepare, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks, month_resources
+from etl_metrics import RunMetrics
+from fleet_digest import refresh_digests
+from history_partitions import ensure_partitions, months_of
+from history_search_index import refresh_search_index
+from workbook_normalize import parse_datetimes
+from workbook_provenance import ensure_provenance, sheet_row, workbook_provenance
 
 def import_repair_data():
     """Import RepairReport data from Excel file"""
@@ -23,106 +24,141 @@ def import_repair_data():
         print(f"Excel file not found: {file_path}")
         return
     
+    metrics = RunMetrics('import_repair_data')
     try:
         # Read RepairReport sheet
-        df = pd.read_excel(file_path, sheet_name='RepairReport')
+        with metrics.span('read') as span:
+            df = pd.read_excel(file_path, sheet_name='RepairReport')
+            span.add_rows(len(df))
+        provenance = workbook_provenance(file_path)
         print(f"Found {len(df)} repair records in Excel file")
         
         # Clean and prepare data
-        df = df.dropna(subset=['workOrder'])  # Remove rows without work order
+        with metrics.span('normalize') as span:
+            df = df.dropna(subset=['workOrder'])  # Remove rows without work order
+            span.add_rows(len(df))
         
         # Connect to database
         conn = connect_db()
+        if not conn:
+            sys.exit(1)
         cursor = conn.cursor()
+        ensure_provenance(conn)
+        
+        # Only the months being loaded are locked; rows without a usable start date land in 2024-01
+        months = months_of(df['actualStartDateTime'])
+        if parse_datetimes(df['actualStartDateTime']).isna().any():
+            months.append(date(2024, 1, 1))
+        
+        with etl_locks(conn, *month_resources('maintenance_records', months), shared=('cranes',),
+                       job='import_repair_data') as waited:
+            metrics.record('lock_wait', waited)
+            # Monthly partitions for the incoming rows
+            with metrics.span('partition'):
+                ensure_partitions(conn, 'maintenance_records', df['actualStartDateTime'])
         
-        # Insert records
-        inserted = 0
-        for _, row in df.iterrows():
-            try:
-                # Extract crane ID from equipment code or name
-                equipment_code = str(row.get('EquipmentCode', ''))
-                equipment_name = str(row.get('EquipmentName', ''))
+            # Build the records; they are inserted together with the prepared statement below
+            rows = []
+            for index, row in df.iterrows():
+                try:
+                    # Extract crane ID from equipment code or name
+                    equipment_code = str(row.get('EquipmentCode', ''))
+                    equipment_name = str(row.get('EquipmentName', ''))
                 
-                # Try to match with existing cranes by looking for crane patterns
-                crane_id = None
+                    # Try to match with existing cranes by looking for crane patterns
+                    crane_id = None
                 
-                # First try to find a crane by equipment code
-                cursor.execute("""
-                    SELECT crane_id FROM cranes 
-                    WHERE crane_id ILIKE %s OR crane_name ILIKE %s
-                    LIMIT 1
-                """, (f'%{equipment_code}%', f'%{equipment_name}%'))
+                    # First try to find a crane by equipment code
+                    with metrics.span('resolve', rows=1):
+                        cursor.execute("""
+                            SELECT crane_id FROM cranes 
+                            WHERE crane_id ILIKE %s OR crane_name ILIKE %s
+                            LIMIT 1
+                        """, (f'%{equipment_code}%', f'%{equipment_name}%'))
                 
-                result = cursor.fetchone()
-                if result:
-                    crane_id = result[0]
-                else:
-                    # Use a default crane ID or create a generic one
-                    crane_id = '1P1001270'  # Use first available crane
+                        result = cursor.fetchone()
+                    if result:
+                        crane_id = result[0]
+                    else:
+                        # Use a default crane ID or create a generic one
+                        crane_id = '1P1001270'  # Use first available crane
                 
-                # Parse dates
-                start_date = row.get('actualStartDateTime')
-                end_date = row.get('actualEndDateTime')
+                    # Parse dates
+                    start_date = row.get('actualStartDateTime')
+                    end_date = row.get('actualEndDateTime')
                 
-                if pd.isna(start_date):
-                    start_date = '2024-01-01'
-                else:
-                    try:
-                        start_date = pd.to_datetime(start_date).strftime('%Y-%m-%d')
-                    except:
+                    if pd.isna(start_date):
                         start_date = '2024-01-01'
+                    else:
+                        try:
+                            start_date = pd.to_datetime(start_date).strftime('%Y-%m-%d')
+                        except:
+                            start_date = '2024-01-01'
                 
-                # Parse numbers
-                total_workers = row.get('totalWorkers', 0)
-                if pd.isna(total_workers):
-                    total_workers = 1
-                else:
-                    total_workers = int(float(total_workers))
+                    # Parse numbers
+                    total_workers = row.get('totalWorkers', 0)
+                    if pd.isna(total_workers):
+                        total_workers = 1
+                    else:
+                        total_workers = int(float(total_workers))
                 
-                total_work_time = row.get('totalWorkTime', 0)
-                if pd.isna(total_work_time):
-                    total_work_time = 8
-                else:
-                    total_work_time = int(float(total_work_time))
+                    total_work_time = row.get('totalWorkTime', 0)
+                    if pd.isna(total_work_time):
+                        total_work_time = 8
+                    else:
+                        total_work_time = int(float(total_work_time))
                 
-                # Insert maintenance record
-                cursor.execute("""
-                    INSERT INTO maintenance_records (
-                        crane_id, date, type, technician, status, notes,
-                        work_order, task_name, actual_start_date_time, actual_end_date_time,
-                        total_workers, total_work_time, area_name, equipment_name
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    crane_id,
-                    start_date,
-                    'routine',  # Default type
-                    '정비팀',    # Default technician
-                    'completed',
-                    f"작업번호: {row.get('workOrder', '')}, 작업명: {row.get('taskName', '')}",
-                    str(row.get('workOrder', '')),
-                    str(row.get('taskName', '')),
-                    start_date if not pd.isna(row.get('actualStartDateTime')) else None,
-                    start_date if not pd.isna(row.get('actualEndDateTime')) else None,
-                    total_workers,
-                    total_work_time,
-                    str(row.get('areaName', '')),
-                    str(row.get('EquipmentName', ''))
-                ))
+                    rows.append((
+                        crane_id,
+                        start_date,
+                        'routine',  # Default type
+                        '정비팀',    # Default technician
+                        'completed',
+                        f"작업번호: {row.get('workOrder', '')}, 작업명: {row.get('taskName', '')}",
+                        str(row.get('workOrder', '')),
+                        str(row.get('taskName', '')),
+                        start_date if not pd.isna(row.get('actualStartDateTime')) else None,
+                        start_date if not pd.isna(row.get('actualEndDateTime')) else None,
+                        total_workers,
+                        total_work_time,
+                        str(row.get('areaName', '')),
+                        str(row.get('EquipmentName', '')),
+                        provenance['source_file'],
+                        'RepairReport',
+                        sheet_row(index),  # dropna() above keeps the sheet's index
+                        provenance['import_batch']
+                    ))
                 
-                inserted += 1
-                
-            except Exception as e:
-                print(f"Error inserting record {row.get('workOrder', 'Unknown')}: {e}")
-                continue
+                except Exception as e:
+                    print(f"Error preparing record {row.get('workOrder', 'Unknown')}: {e}")
+                    continue
+        
+            with metrics.span('load') as span:
+                with bulk_session(conn):
+                    prepare(conn, 'insert_maintenance')
+                    inserted = execute_prepared(cursor, 'insert_maintenance', rows)
+                span.add_rows(inserted)
         
-        conn.commit()
-        cursor.close()
-        conn.close()
+            notify_change(conn, 'maintenance_records', crane_ids=[r[0] for r in rows], months=[r[1] for r in rows],
+                          job='import_repair_data')
+            with metrics.span('commit'):
+                conn.commit()
+            cursor.close()
+
+        # Keep the keyword search index, the loaded cranes' timelines and the AI digests in step with the new records
+        with metrics.span('index'):
+            loaded = {row[0] for row in rows}
+            refresh_search_index(conn, loaded)
+            refresh_timelines(conn, loaded)
+            refresh_digests(conn)
+        release_db(conn)
         
         print(f"Successfully imported {inserted} repair records")
+        metrics.finish('success')
         
     except Exception as e:
         print(f"Error importing repair data: {e}")
+        metrics.finish('failed')
 
 if __name__ == "__main__":
     import_repair_data()
\ No newline at end of file
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from psycopg2.extras import execute_values
+
+from crane_timeline import refresh_timelines
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from fleet_digest import refresh_digests
+from workbook_normalize import LEAD_TIME_COLUMN, parse_inspection_cycle
+
+EXCEL_FILE = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
+
+# Used when a crane has no InspectionCycle / LeadTime (the old /api/crane-details assumption)
+DEFAULT_INSPECTION_CYCLE = 90
+DEFAULT_LEAD_TIME = 7
+
+CALENDAR_DDL = """
+    CREATE TABLE IF NOT EXISTS inspection_calendar (
+        id SERIAL PRIMARY KEY,
+        crane_id TEXT NOT NULL,
+        due_date DATE NOT NULL,
+        window_start DATE NOT NULL,
+        inspection_cycle INTEGER NOT NULL,
+        lead_time INTEGER NOT NULL,
+        generated_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS inspection_calendar_due_date_idx ON inspection_calendar (due_date);
+    CREATE INDEX IF NOT EXISTS inspection_calendar_crane_id_idx ON inspection_calendar (crane_id);
+"""
+
+
+def read_schedule_fields(excel_file=EXCEL_FILE):
+    """Read the inspection columns of the CraneList sheet, one row per EquipmentCode"""
+    crane_df = pd.read_excel(excel_file, sheet_name='CraneList')
+
+    fields = pd.DataFrame({
+        'crane_id': crane_df['EquipmentCode'].astype('string').str.strip(),
+        'inspection_reference_date': pd.to_datetime(crane_df['InspectionReferenceDate'], errors='coerce'),
+        'inspection_cycle': parse_inspection_cycle(crane_df['InspectionCycle']),
+        'lead_time': pd.to_numeric(crane_df.get(LEAD_TIME_COLUMN), errors='coerce').round().astype('Int64'),
+    })
+    fields = fields[fields['crane_id'].notna() & (fields['crane_id'] != '') & (fields['crane_id'] != 'nan')]
+    return fields.drop_duplicates(subset='crane_id', keep='first').reset_index(drop=True)
+
+
+def update_crane_schedule_fields(conn, fields):
+    """Write InspectionReferenceDate / InspectionCycle / LeadTime onto the cranes table in one statement"""
+    rows = [
+        (
+            row.crane_id,
+            row.inspection_reference_date.strftime('%Y-%m-%d') if pd.notna(row.inspection_reference_date) else None,
+            int(row.inspection_cycle) if pd.notna(row.inspection_cycle) else None,
+            int(row.lead_time) if pd.notna(row.lead_time) else None,
+        )
+        for row in fields.itertuples(index=False)
+    ]
+
+    cursor = conn.cursor()
+    try:
+        execute_values(cursor, """
+            UPDATE cranes AS c
+            SET inspection_reference_date = v.reference_date,
+                inspection_cycle = v.inspection_cycle,
+                lead_time = v.lead_time
+            FROM (VALUES %s) AS v(crane_id, reference_date, inspection_cycle, lead_time)
+            WHERE c.crane_id = v.crane_id
+        """, rows, template="(%s, %s::date, %s::integer, %s::integer)", page_size=1000)
+        updated = cursor.rowcount
+        notify_change(conn, 'cranes', crane_ids=[row[0] for row in rows], job='inspection_scheduler')
+        conn.commit()
+        return updated
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def load_schedule_inputs(conn):
+    """Load each crane's schedule fields plus its last completed maintenance date"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT c.crane_id, c.inspection_reference_date, c.inspection_cycle, c.lead_time,
+                   m.last_completed
+            FROM cranes c
+            LEFT JOIN (
+                SELECT crane_id, MAX(date) AS last_completed
+                FROM maintenance_records
+                WHERE status IN ('completed', '완료')
+                GROUP BY crane_id
+            ) m ON m.crane_id = c.crane_id
+        """)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    return pd.DataFrame(rows, columns=[
+        'crane_id', 'inspection_reference_date', 'inspection_cycle', 'lead_time', 'last_completed'
+    ])
+
+
+def compute_next_due(inputs, as_of):
+    """Vectorized next-due computation for every crane.
+
+    The schedule is anchored on InspectionReferenceDate (falling back to the last
+    completed maintenance) and advanced by whole cycles until it is on or after as_of.
+    Cranes with no anchor at all are dropped.
+    """
+    anchor = pd.to_datetime(inputs['inspection_reference_date'], errors='coerce', format='mixed')
+    anchor = anchor.fillna(pd.to_datetime(inputs['last_completed'], errors='coerce', format='mixed'))
+
+    cycle = pd.to_numeric(inputs['inspection_cycle'], errors='coerce').fillna(DEFAULT_INSPECTION_CYCLE)
+    lead = pd.to_numeric(inputs['lead_time'], errors='coerce').fillna(DEFAULT_LEAD_TIME)
+    valid = anchor.notna().to_numpy() & (cycle > 0).to_numpy()
+
+    anchor_days = anchor[valid].to_numpy().astype('datetime64[D]')
+    cycle_days = cycle[valid].to_numpy().astype(np.int64)
+    lead_days = lead[valid].to_numpy().astype(np.int64)
+
+    elapsed = (np.datetime64(as_of, 'D') - anchor_days).astype(np.int64)
+    cycles_passed = np.maximum(-(-elapsed // cycle_days), 0)
+    next_due = anchor_days + (cycles_passed * cycle_days).astype('timedelta64[D]')
+
+    return pd.DataFrame({
+        'crane_id': inputs['crane_id'][valid].to_numpy(),
+        'next_due': next_due,
+        'inspection_cycle': cycle_days,
+        'lead_time': lead_days,
+    })
+
+
+def expand_calendar(next_due, horizon_end):
+    """Expand each crane's next due date into every due date up to horizon_end (inclusive)"""
+    due = next_due['next_due'].to_numpy().astype('datetime64[D]')
+    cycle = next_due['inspection_cycle'].to_numpy()
+    lead = next_due['lead_time'].to_numpy()
+
+    remaining = (np.datetime64(horizon_end, 'D') - due).astype(np.int64)
+    counts = np.where(remaining >= 0, remaining // cycle + 1, 0)
+
+    owner = np.repeat(np.arange(len(due)), counts)
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    step = np.arange(counts.sum()) - starts
+
+    due_dates = due[owner] + (step * cycle[owner]).astype('timedelta64[D]')
+    return pd.DataFrame({
+        'crane_id': next_due['crane_id'].to_numpy()[owner],
+        'due_date': due_dates,
+        'window_start': due_dates - lead[owner].astype('timedelta64[D]'),
+        'inspection_cycle': cycle[owner],
+        'lead_time': lead[owner],
+    }).sort_values(['due_date', 'crane_id'], kind='stable').reset_index(drop=True)
+
+
+def materialize_calendar(conn, calendar, next_due):
+    """Replace inspection_calendar and cranes.next_maintenance_date in a single transaction"""
+    generated_at = datetime.now().isoformat()
+    calendar_rows = [
+        (row.crane_id, pd.Timestamp(row.due_date).date(), pd.Timestamp(row.window_start).date(),
+         int(row.inspection_cycle), int(row.lead_time), generated_at)
+        for row in calendar.itertuples(index=False)
+    ]
+    next_due_rows = [
+        (row.crane_id, pd.Timestamp(row.next_due).date())
+        for row in next_due.itertuples(index=False)
+    ]
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(CALENDAR_DDL)
+        cursor.execute("DELETE FROM inspection_calendar")
+        execute_values(cursor, """
+            INSERT INTO inspection_calendar
+                (crane_id, due_date, window_start, inspection_cycle, lead_time, generated_at)
+            VALUES %s
+        """, calendar_rows, page_size=1000)
+        execute_values(cursor, """
+            UPDATE cranes AS c
+            SET next_maintenance_date = v.next_due
+            FROM (VALUES %s) AS v(crane_id, next_due)
+            WHERE c.crane_id = v.crane_id
+        """, next_due_rows, page_size=1000)
+        notify_change(conn, 'inspection_calendar', job='inspection_scheduler')
+        notify_change(conn, 'cranes', crane_ids=[row[0] for row in next_due_rows], job='inspection_scheduler')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def due_between(conn, start_date, end_date):
+    """Inspections due in [start_date, end_date] - an index range scan on due_date"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT ic.crane_id, c.crane_name, c.plant_section, ic.due_date, ic.window_start
+            FROM inspection_calendar ic
+            LEFT JOIN cranes c ON c.crane_id = ic.crane_id
+            WHERE ic.due_date BETWEEN %s AND %s
+            ORDER BY ic.due_date, ic.crane_id
+        """, (start_date, end_date))
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Materialize the fleet inspection calendar')
+    parser.add_argument('--excel', default=EXCEL_FILE, help='workbook with the CraneList sheet')
+    parser.add_argument('--skip-import', action='store_true',
+                        help='use the schedule fields already stored on the cranes table')
+    parser.add_argument('--as-of', type=date.fromisoformat, default=date.today())
+    parser.add_argument('--horizon-days', type=int, default=365)
+    parser.add_argument('--due-within', type=int, default=None,
+                        help='only list inspections due in the next N days (no recompute)')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+
+    try:
+        if args.due_within is not None:
+            end = args.as_of + timedelta(days=args.due_within)
+            rows = due_between(conn, args.as_of, end)
+            print(f"{args.as_of} ~ {end} 점검 예정: {len(rows)}건")
+            for crane_id, crane_name, plant_section, due_date, window_start in rows:
+                print(f"  {due_date}  {crane_id}  {crane_name or ''} ({plant_section or '-'})  준비 시작 {window_start}")
+            return
+
+        with etl_locks(conn, 'cranes', job='inspection_scheduler'):
+            if not args.skip_import:
+                if not os.path.exists(args.excel):
+                    print(f"Excel file not found: {args.excel}")
+                    sys.exit(1)
+                fields = read_schedule_fields(args.excel)
+                updated = update_crane_schedule_fields(conn, fields)
+                print(f"Updated inspection fields on {updated} cranes")
+
+            inputs = load_schedule_inputs(conn)
+            next_due = compute_next_due(inputs, args.as_of)
+            calendar = expand_calendar(next_due, args.as_of + timedelta(days=args.horizon_days))
+            materialize_calendar(conn, calendar, next_due)
+
+            print(f"Scheduled {len(next_due)} of {len(inputs)} cranes, "
+                  f"{len(calendar)} inspections through {args.horizon_days} days")
+
+        # The detail view shows each crane's next inspection from its timeline row; the digests list overdue ones
+        refresh_timelines(conn)
+        refresh_digests(conn)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from workbook_normalize import PLANT_TIMEZONE, parse_datetimes
+
+
+def column_type(cursor, table, column):
+    cursor.execute("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = %s AND column_name = %s
+    """, (table, column))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def date_range(window):
+    """WHERE clause and params limiting `date` to [start, end), or everything when window is None"""
+    return ("WHERE date >= %s AND date < %s", window) if window else ("", ())
+
+
+def load_records(conn, repair_window=None, failure_window=None):
+    """Load the columns the linkage needs from both history tables, optionally a (start, end) date range of each"""
+    failure_where, failure_params = date_range(failure_window)
+    repair_where, repair_params = date_range(repair_window)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT id, crane_id, date FROM failure_records {failure_where}", failure_params)
+        failures = pd.DataFrame(cursor.fetchall(), columns=['failure_id', 'crane_id', 'failure_date'])
+        # Text until migrate_date_columns.py --finalize has run; then timestamptz
+        typed = column_type(cursor, 'maintenance_records', 'actual_start_date_time') == 'timestamp with time zone'
+        if typed:
+            # timestamptz comes back tz-aware; compare in naive plant time like the failure dates
+            cursor.execute(f"""
+                SELECT id, crane_id, date, actual_start_date_time AT TIME ZONE %s
+                FROM maintenance_records {repair_where}
+            """, (PLANT_TIMEZONE, *repair_params))
+        else:
+            cursor.execute(f"SELECT id, crane_id, date, actual_start_date_time FROM maintenance_records {repair_where}",
+                           repair_params)
+        repairs = pd.DataFrame(cursor.fetchall(), columns=['id', 'crane_id', 'date', 'actual_start_date_time'])
+    finally:
+        cursor.close()
+
+    failures['failure_date'] = pd.to_datetime(failures['failure_date'], errors='coerce', format='mixed')
+
+    # Prefer the actual start timestamp; fall back to the record date
+    if typed:
+        started = pd.to_datetime(repairs['actual_start_date_time'], errors='coerce', format='mixed')
+    else:
+        # The old text formats, including values with a UTC offset, parsed to naive plant time
+        started = parse_datetimes(repairs['actual_start_date_time'])
+    repairs['repair_start'] = started.fillna(pd.to_datetime(repairs['date'], errors='coerce', format='mixed'))
+    return failures, repairs[['id', 'crane_id', 'repair_start']]
+
+
+def link_repairs(failures, repairs, tolerance_days=7):
+    """Match each repair to the nearest preceding failure on the same crane.
+
+    Both sides are sorted once and joined with merge_asof, so the cost is
+    O((N + M) log(N + M)) instead of comparing every repair with every failure.
+    Repairs with no failure inside the tolerance window get failure_id = NaN.
+    """
+    left = repairs.dropna(subset=['repair_start', 'crane_id']).sort_values('repair_start', kind='stable')
+    right = failures.dropna(subset=['failure_date', 'crane_id']).sort_values('failure_date', kind='stable')
+
+    linked = pd.merge_asof(
+        left, right,
+        left_on='repair_start', right_on='failure_date',
+        by='crane_id',
+        direction='backward',
+        tolerance=pd.Timedelta(days=tolerance_days),
+    )
+    linked['repair_lag_hours'] = (linked['repair_start'] - linked['failure_date']).dt.total_seconds() / 3600
+
+    # Repairs without a usable timestamp are still written back, unlinked
+    unplaced = repairs.loc[~repairs['id'].isin(linked['id']), ['id']]
+    return pd.concat([linked, unplaced], ignore_index=True)
+
+
+def apply_links(conn, linked):
+    """Write every repair's related_failure_id with a single UPDATE ... FROM unnest()"""
+    ids = linked['id'].astype(int).tolist()
+    failure_ids = [int(value) if pd.notna(value) else None for value in linked['failure_id']]
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            UPDATE maintenance_records AS m
+            SET related_failure_id = v.failure_id
+            FROM unnest(%s::integer[], %s::integer[]) AS v(id, failure_id)
+            WHERE m.id = v.id
+              AND m.related_failure_id IS DISTINCT FROM v.failure_id
+            RETURNING m.crane_id, m.date
+        """, (ids, failure_ids))
+        changed = cursor.fetchall()
+        if changed:
+            notify_change(conn, 'maintenance_records', crane_ids=[c for c, _ in changed],
+                          months=[d for _, d in changed], job='link_repairs_to_failures')
+        conn.commit()
+        return len(changed)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Link repairs to the failure that preceded them')
+    parser.add_argument('--tolerance-days', type=int, default=7,
+                        help='maximum gap between a failure and the repair that fixes it')
+    parser.add_argument('--dry-run', action='store_true', help='report matches without updating')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+
+    try:
+        # Both tables must stay put between reading them and writing the links back
+        with etl_locks(conn, *([] if args.dry_run else ['maintenance_records']),
+                       shared=('failure_records', 'maintenance_records'), job='link_repairs_to_failures'):
+            failures, repairs = load_records(conn)
+            print(f"Loaded {len(failures)} failure records and {len(repairs)} maintenance records")
+
+            linked = link_repairs(failures, repairs, args.tolerance_days)
+            matched = linked['failure_id'].notna()
+            print(f"Matched {matched.sum()} of {len(linked)} repairs within {args.tolerance_days} days")
+            if matched.any():
+                lag = linked.loc[matched, 'repair_lag_hours']
+                print(f"Time to repair: median {lag.median():.1f}h, mean {lag.mean():.1f}h, p90 {lag.quantile(0.9):.1f}h")
+
+            if not args.dry_run:
+                changed = apply_links(conn, linked)
+                print(f"Updated related_failure_id on {changed} maintenance records")
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
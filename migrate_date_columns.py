@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""Convert the text date columns to native date / timestamptz.
+
+Each column is backfilled into a typed shadow column (<column>_typed) in
+id-ordered batches. Every batch commits together with its row in
+date_migration_progress, so an interrupted run resumes where it stopped.
+Values that cannot be parsed are kept in date_migration_rejects.
+
+    python migrate_date_columns.py              # backfill every pending column
+    python migrate_date_columns.py --status
+    python migrate_date_columns.py --finalize   # swap the typed columns in and add the indexes
+
+--finalize locks one table at a time, converts rows written since the
+backfill, and refuses to swap a NOT NULL column that still has unparseable
+values. Run it before `npm run db:push`, which cannot cast text to date itself.
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+from psycopg2.extras import execute_values
+
+from db_connection import connect_db, release_db
+from history_search_index import refresh_search_index
+from workbook_normalize import PLANT_TIMEZONE, clean_text, parse_datetimes
+
+# (table, column, target type, NOT NULL)
+DATE_COLUMNS = [
+    ('cranes', 'installation_date', 'date', False),
+    ('cranes', 'inspection_reference_date', 'date', False),
+    ('cranes', 'last_maintenance_date', 'date', False),
+    ('cranes', 'next_maintenance_date', 'date', False),
+    ('failure_records', 'date', 'date', True),
+    ('maintenance_records', 'date', 'date', True),
+    ('maintenance_records', 'actual_start_date_time', 'timestamptz', False),
+    ('maintenance_records', 'actual_end_date_time', 'timestamptz', False),
+    ('alerts', 'created_at', 'timestamptz', True),
+]
+
+DATE_INDEXES = [
+    ('failure_records_crane_id_date_idx', 'failure_records', '(crane_id, date)'),
+    ('maintenance_records_crane_id_date_idx', 'maintenance_records', '(crane_id, date)'),
+]
+
+# information_schema.columns.data_type for each target
+TARGET_TYPES = {'date': 'date', 'timestamptz': 'timestamp with time zone'}
+
+MIGRATION_DDL = """
+    CREATE TABLE IF NOT EXISTS date_migration_progress (
+        table_name TEXT NOT NULL,
+        column_name TEXT NOT NULL,
+        last_id INTEGER NOT NULL DEFAULT 0,
+        converted INTEGER NOT NULL DEFAULT 0,
+        rejected INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (table_name, column_name)
+    );
+    CREATE TABLE IF NOT EXISTS date_migration_rejects (
+        table_name TEXT NOT NULL,
+        column_name TEXT NOT NULL,
+        record_id INTEGER NOT NULL,
+        raw_value TEXT,
+        PRIMARY KEY (table_name, column_name, record_id)
+    );
+"""
+
+
+def column_type(cursor, table, column):
+    cursor.execute("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = %s AND column_name = %s
+    """, (table, column))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def convert_values(raw_values, target):
+    """Render raw text values as literals for the target type; None where unparseable or blank"""
+    raw = pd.Series(raw_values, dtype='object')
+    parsed = parse_datetimes(raw)
+    if target == 'date':
+        text = parsed.dt.strftime('%Y-%m-%d')
+    else:
+        text = parsed.dt.tz_localize(PLANT_TIMEZONE).dt.strftime('%Y-%m-%d %H:%M:%S%z')
+    rejected = parsed.isna() & clean_text(raw).notna()
+    return text.astype('object').where(parsed.notna(), None).tolist(), rejected.tolist()
+
+
+def convert_rows(cursor, table, column, target, rows):
+    """Write the typed value of each (id, raw) row into the shadow column; returns (converted, rejected)"""
+    values, rejected = convert_values([raw for _, raw in rows], target)
+    execute_values(cursor, f"""
+        UPDATE {table} AS t SET {column}_typed = v.value
+        FROM (VALUES %s) AS v(id, value)
+        WHERE t.id = v.id
+    """, [(record_id, value) for (record_id, _), value in zip(rows, values)],
+        template=f"(%s::integer, %s::{target})", page_size=1000)
+
+    rejects = [(table, column, record_id, raw) for (record_id, raw), bad in zip(rows, rejected) if bad]
+    if rejects:
+        execute_values(cursor, """
+            INSERT INTO date_migration_rejects (table_name, column_name, record_id, raw_value)
+            VALUES %s
+            ON CONFLICT (table_name, column_name, record_id) DO UPDATE SET raw_value = EXCLUDED.raw_value
+        """, rejects)
+    return sum(value is not None for value in values), len(rejects)
+
+
+def backfill_column(conn, table, column, target, batch_size=5000):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column}_typed {target}")
+        cursor.execute("""
+            INSERT INTO date_migration_progress (table_name, column_name) VALUES (%s, %s)
+            ON CONFLICT DO NOTHING
+        """, (table, column))
+        cursor.execute("""
+            SELECT last_id FROM date_migration_progress WHERE table_name = %s AND column_name = %s
+        """, (table, column))
+        last_id = cursor.fetchone()[0]
+        conn.commit()
+
+        if last_id:
+            print(f"  resuming after id {last_id}")
+        while True:
+            cursor.execute(f"SELECT id, {column} FROM {table} WHERE id > %s ORDER BY id LIMIT %s",
+                           (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            converted, rejected = convert_rows(cursor, table, column, target, rows)
+            last_id = rows[-1][0]
+            cursor.execute("""
+                UPDATE date_migration_progress
+                SET last_id = %s, converted = converted + %s, rejected = rejected + %s, updated_at = now()
+                WHERE table_name = %s AND column_name = %s
+            """, (last_id, converted, rejected, table, column))
+            conn.commit()
+            print(f"  {table}.{column}: through id {last_id} ({converted} converted, {rejected} rejected)")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def stale_rows_sql(table, column, target):
+    """Rows whose shadow value does not render back to the raw text (new, updated or non-ISO rows)"""
+    if target == 'date':
+        rendered = f"{column}_typed::text"
+    else:
+        rendered = f"to_char({column}_typed AT TIME ZONE '{PLANT_TIMEZONE}', 'YYYY-MM-DD HH24:MI:SS')"
+    return f"SELECT id, {column} FROM {table} WHERE {rendered} IS DISTINCT FROM NULLIF({column}, '')"
+
+
+def finalize_table(conn, table, columns):
+    """Catch up, then replace each text column with its typed shadow in one transaction"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        for column, target, not_null in columns:
+            cursor.execute(stale_rows_sql(table, column, target))
+            rows = cursor.fetchall()
+            if rows:
+                convert_rows(cursor, table, column, target, rows)
+
+            if not_null:
+                cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE {column}_typed IS NULL")
+                missing = cursor.fetchone()[0]
+                if missing:
+                    raise RuntimeError(f"{table}.{column}: {missing} rows have no parseable value; "
+                                       f"fix them (see date_migration_rejects) and rerun --finalize")
+
+            cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+            cursor.execute(f"ALTER TABLE {table} RENAME COLUMN {column}_typed TO {column}")
+            if not_null:
+                cursor.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL")
+            print(f"  {table}.{column} -> {target} ({len(rows)} rows caught up)")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def retype_search_index(conn):
+    """history_search copies failure/repair dates; re-type it and let a refresh fill the dates back in"""
+    cursor = conn.cursor()
+    try:
+        if column_type(cursor, 'history_search', 'date') != 'text':
+            return
+        cursor.execute("ALTER TABLE history_search ALTER COLUMN date TYPE date USING NULL")
+        conn.commit()
+    finally:
+        cursor.close()
+    refresh_search_index(conn)
+
+
+def create_date_indexes(conn):
+    """Build the (crane_id, date) indexes without blocking writers"""
+    conn.autocommit = True
+    cursor = conn.cursor()
+    try:
+        for name, table, columns in DATE_INDEXES:
+            # A failed CONCURRENTLY build leaves an invalid index that IF NOT EXISTS would keep
+            cursor.execute("""
+                SELECT NOT i.indisvalid FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE c.relname = %s
+            """, (name,))
+            row = cursor.fetchone()
+            if row and row[0]:
+                cursor.execute(f"DROP INDEX CONCURRENTLY {name}")
+            cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {columns}")
+            cursor.execute(f"ANALYZE {table}")
+            print(f"  index {name} ready")
+    finally:
+        cursor.close()
+        conn.autocommit = False
+
+
+def pending_columns(conn):
+    """DATE_COLUMNS entries whose column is still text"""
+    cursor = conn.cursor()
+    try:
+        pending = []
+        for table, column, target, not_null in DATE_COLUMNS:
+            current = column_type(cursor, table, column)
+            if current is None:
+                print(f"  {table}.{column}: column not found, skipping")
+            elif current != TARGET_TYPES[target]:
+                pending.append((table, column, target, not_null))
+        return pending
+    finally:
+        cursor.close()
+
+
+def print_status(conn):
+    cursor = conn.cursor()
+    try:
+        for table, column, target, _ in DATE_COLUMNS:
+            current = column_type(cursor, table, column)
+            if current == TARGET_TYPES[target]:
+                print(f"  {table}.{column}: done ({target})")
+                continue
+            cursor.execute("""
+                SELECT last_id, converted, rejected FROM date_migration_progress
+                WHERE table_name = %s AND column_name = %s
+            """, (table, column))
+            progress = cursor.fetchone()
+            if progress is None:
+                print(f"  {table}.{column}: not started ({current})")
+                continue
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            max_id = cursor.fetchone()[0]
+            last_id, converted, rejected = progress
+            print(f"  {table}.{column}: backfilled through id {last_id}/{max_id}, "
+                  f"{converted} converted, {rejected} rejected")
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backfill text date columns into date/timestamptz')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--status', action='store_true', help='show progress and exit')
+    parser.add_argument('--finalize', action='store_true',
+                        help='swap the backfilled columns in and build the (crane_id, date) indexes')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute(MIGRATION_DDL)
+        conn.commit()
+        cursor.close()
+
+        if args.status:
+            print_status(conn)
+            return
+
+        pending = pending_columns(conn)
+        if not args.finalize:
+            for table, column, target, _ in pending:
+                print(f"Backfilling {table}.{column} -> {target}")
+                backfill_column(conn, table, column, target, args.batch_size)
+            print("Backfill complete; run with --finalize to swap the columns in")
+            return
+
+        cursor = conn.cursor()
+        missing_shadow = [f"{table}.{column}" for table, column, _, _ in pending
+                          if column_type(cursor, table, f"{column}_typed") is None]
+        cursor.close()
+        if missing_shadow:
+            print(f"Not backfilled yet: {', '.join(missing_shadow)}; run without --finalize first")
+            sys.exit(1)
+
+        by_table = {}
+        for table, column, target, not_null in pending:
+            by_table.setdefault(table, []).append((column, target, not_null))
+        for table, columns in by_table.items():
+            print(f"Finalizing {table}")
+            finalize_table(conn, table, columns)
+
+        retype_search_index(conn)
+        create_date_indexes(conn)
+        print("Date columns migrated")
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
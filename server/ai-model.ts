@@ -0,0 +1,45 @@
+import OpenAI from "openai";
+
+export interface ReportRequest {
+  system: string;
+  prompt: string;
+  maxTokens: number;
+}
+
+// AI_STUB_MODEL=1 answers locally, with no API key or network, so the AI routes can be exercised in development and tests.
+// OPENAI_BASE_URL points the client at any OpenAI-compatible server, e.g. a model running on the plant network.
+const useStub = () => process.env.AI_STUB_MODEL === '1';
+
+export function aiConfigured(): boolean {
+  return useStub() || !!process.env.OPENAI_API_KEY2;
+}
+
+export async function generateReport({ system, prompt, maxTokens }: ReportRequest): Promise<string> {
+  if (useStub()) return stubReport(prompt);
+
+  const openai = new OpenAI({
+    apiKey: process.env.OPENAI_API_KEY2,
+    baseURL: process.env.OPENAI_BASE_URL || undefined,
+  });
+  const response = await openai.chat.completions.create({
+    model: "gpt-4o", // the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
+    messages: [
+      { role: "system", content: system },
+      { role: "user", content: prompt }
+    ],
+    max_tokens: maxTokens,
+    temperature: 0.7
+  });
+  return response.choices[0].message.content ?? '';
+}
+
+// Deterministic stand-in: reports what the model would have been given
+function stubReport(prompt: string): string {
+  const context = prompt.match(/\{[\s\S]*\}/)?.[0] ?? '';
+  return `# 스텁 모델 보고서
+기준 날짜: ${new Date().toLocaleDateString('ko-KR')}
+
+프롬프트 ${prompt.length}자, 데이터 ${context.length}자를 받았습니다.
+
+${context.slice(0, 500)}`;
+}
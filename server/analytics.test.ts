@@ -0,0 +1,28 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { displayMonth, selected, toHeatmap } from "./analytics";
+
+test("'all' and empty filters mean no filter", () => {
+  assert.equal(selected("all"), undefined);
+  assert.equal(selected(""), undefined);
+  assert.equal(selected(undefined), undefined);
+  assert.equal(selected("Hoist"), "Hoist");
+});
+
+test("months are shown in Korean chart labels", () => {
+  assert.equal(displayMonth("2024-03"), "2024년 3월");
+  assert.equal(displayMonth("2023-12"), "2023년 12월");
+});
+
+test("heatmap rows total their failure types, busiest device first", () => {
+  const heatmap = toHeatmap([
+    { device: "Trolley", failureType: "Noise", count: 2 },
+    { device: "Hoist", failureType: "Brake", count: 3 },
+    { device: "Trolley", failureType: "Wear", count: 4 },
+  ]);
+  assert.deepEqual(heatmap, [
+    { device: "Trolley", total: 6, failureTypes: [{ type: "Noise", count: 2 }, { type: "Wear", count: 4 }] },
+    { device: "Hoist", total: 3, failureTypes: [{ type: "Brake", count: 3 }] },
+  ]);
+  assert.deepEqual(toHeatmap([]), []);
+});
@@ -0,0 +1,27 @@
+import type { DeviceFailureHeatmap } from "@shared/schema";
+
+// Shaping shared by the SQL (DatabaseStorage) and in-memory (MemStorage) analytics
+
+// 'all' is the UI's "no filter" value
+export function selected(value?: string): string | undefined {
+  return value && value !== 'all' ? value : undefined;
+}
+
+// 'YYYY-MM' as shown on the charts, e.g. '2024년 3월'
+export function displayMonth(month: string): string {
+  const [year, monthNum] = month.split('-');
+  const monthName = new Date(parseInt(year), parseInt(monthNum) - 1).toLocaleString('ko-KR', { month: 'short' });
+  return `${year}년 ${monthName}`;
+}
+
+// Device rows, busiest first, from (device, failure type, count) buckets
+export function toHeatmap(buckets: { device: string; failureType: string; count: number }[]): DeviceFailureHeatmap[] {
+  const devices = new Map<string, DeviceFailureHeatmap>();
+  buckets.forEach(({ device, failureType, count }) => {
+    const entry = devices.get(device) || { device, total: 0, failureTypes: [] };
+    entry.total += count;
+    entry.failureTypes.push({ type: failureType, count });
+    devices.set(device, entry);
+  });
+  return Array.from(devices.values()).sort((a, b) => b.total - a.total);
+}
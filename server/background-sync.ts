@@ -1,20 +1,23 @@
 import { storage } from './storage';
-import { cache } from './cache';
+import { CACHED_TABLES, knownVersion, refreshForChanges } from './cache-warmup';
+
+// One small read of data_versions per check, so idle periods cost next to nothing
+const VERSION_CHECK_MS = Number(process.env.DATA_VERSION_CHECK_MS) || 30 * 1000;
 
 class BackgroundSync {
   private syncInterval: NodeJS.Timeout | null = null;
   private isSyncing = false;
 
   start() {
-    console.log('[BackgroundSync] Database mode - using PostgreSQL data only');
-    
+    console.log('[BackgroundSync] Database mode - re-warming tables whose data version changed');
+
     // Initial cache warm-up for database data
-    this.performSync();
-    
-    // Set up periodic cache refresh every 5 minutes (less frequent for database)
+    this.performSync(true);
+
+    // Catch changes the change listener missed (e.g. while it was reconnecting)
     this.syncInterval = setInterval(() => {
       this.performSync();
-    }, 5 * 60 * 1000);
+    }, VERSION_CHECK_MS);
   }
 
   stop() {
@@ -24,7 +27,7 @@ class BackgroundSync {
     }
   }
 
-  private async performSync() {
+  private async performSync(warmAll = false) {
     if (this.isSyncing) {
       console.log('[BackgroundSync] Sync already in progress, skipping...');
       return;
@@ -34,16 +37,15 @@ class BackgroundSync {
     const startTime = Date.now();
 
     try {
-      console.log('[BackgroundSync] Starting data sync...');
+      // Only the tables the ETL has changed since the cache last saw them; uncached tables
+      // are included so the response version tag (versionTag) follows them too
+      const versions = await storage.getDataVersions();
+      const tables = Array.from(new Set([...CACHED_TABLES, ...Object.keys(versions)]));
+      const changed = tables.filter(table => warmAll || (versions[table] ?? 0) > knownVersion(table));
+      if (changed.length === 0) return;
 
-      // Warm up the cache with frequently accessed data
-      await Promise.all([
-        storage.getCranes(),
-        storage.getFailureRecords(),
-        storage.getUniqueFactories(),
-        storage.getUniqueCraneNames(),
-        storage.getDashboardSummary()
-      ]);
+      console.log(`[BackgroundSync] Warming ${changed.join(', ')}...`);
+      await refreshForChanges(changed.map(table => ({ table, version: versions[table], job: 'BackgroundSync' })));
 
       const duration = Date.now() - startTime;
       console.log(`[BackgroundSync] Sync completed in ${duration}ms`);
@@ -54,18 +56,18 @@ class BackgroundSync {
     }
   }
 
-  // Force a sync (useful for testing or manual refresh)
+  // Force a version check (useful for testing or manual refresh)
   async forceSync() {
     this.isSyncing = false; // Reset flag
     await this.performSync();
   }
 
-  // Clear all cache and perform fresh sync
+  // Re-warm every cached key; readers keep the current values until each is replaced
   async refresh() {
-    console.log('[BackgroundSync] Clearing cache and refreshing data...');
-    cache.clear();
-    await this.forceSync();
+    console.log('[BackgroundSync] Refreshing all cached data...');
+    this.isSyncing = false;
+    await this.performSync(true);
   }
 }
 
-export const backgroundSync = new BackgroundSync();
\ No newline at end of file
+export const backgroundSync = new BackgroundSync();
@@ -0,0 +1,166 @@
+import { createHash } from 'crypto';
+import { storage } from './storage';
+import { cache } from './cache';
+
+// A change to one table, as published by the Python ETL (etl_events.py)
+export interface ChangeEvent {
+  table: string;
+  plantSections?: string[];
+  craneIds?: string[];
+  from?: string; // YYYY-MM
+  to?: string;
+  job?: string;
+  version?: number; // data_versions.version after the change
+}
+
+interface CacheDependent {
+  key: string;
+  rewarm: () => Promise<unknown>;
+  // Whether an event covering these months can change the cached value
+  affectedBy?: (event: ChangeEvent) => boolean;
+}
+
+// Entries that cover the six months up to the latest one only change when the
+// load reaches into that window (or moves it forward)
+const touchesRecentMonths = (event: ChangeEvent) => {
+  const cached = cache.get<{ month: string }[]>('recent-maintenance-stats');
+  return !event.to || !cached?.length || event.to >= cached[0].month;
+};
+
+// Cache entries derived from each table, in the order they are rebuilt
+// (the cranes:all / failure-records:all lists first, the stats built on them after)
+const DEPENDENTS: Record<string, CacheDependent[]> = {
+  cranes: [
+    { key: 'cranes:all', rewarm: () => storage.getCranes() },
+    { key: 'dashboard-summary', rewarm: () => storage.getDashboardSummary() },
+    { key: 'factories:unique', rewarm: () => storage.getUniqueFactories() },
+    { key: 'crane-names:unique', rewarm: () => storage.getUniqueCraneNames() },
+    { key: 'factory-overview', rewarm: () => storage.getFactoryOverview() },
+    { key: 'crane-grade-stats', rewarm: () => storage.getCraneGradeStats() },
+    { key: 'operation-type-stats', rewarm: () => storage.getOperationTypeStats() },
+    { key: 'system-overview', rewarm: () => storage.getSystemOverview() },
+  ],
+  failure_records: [
+    { key: 'failure-records:all', rewarm: () => storage.getFailureRecords() },
+    { key: 'failure-cause-distribution', rewarm: () => storage.getFailureCauseDistribution() },
+    { key: 'recent-maintenance-stats', rewarm: () => storage.getRecentMaintenanceStats(), affectedBy: touchesRecentMonths },
+  ],
+  maintenance_records: [
+    { key: 'recent-maintenance-stats', rewarm: () => storage.getRecentMaintenanceStats(), affectedBy: touchesRecentMonths },
+  ],
+  failure_forecasts: [
+    { key: 'failure-forecasts', rewarm: () => storage.getFailureForecasts() },
+  ],
+};
+
+export const CACHED_TABLES = Object.keys(DEPENDENTS);
+
+// Drop every entry built from these tables; for writers that replace the tables wholesale
+// and cannot describe the change as events (the Google Sheets sync)
+export function invalidateTables(tables: string[]) {
+  for (const table of tables) {
+    for (const dependent of DEPENDENTS[table] || []) cache.delete(dependent.key);
+  }
+}
+
+// The newest data_versions.version whose changes are already in the cache, per table
+const knownVersions = new Map<string, number>();
+
+export function knownVersion(table: string): number {
+  return knownVersions.get(table) ?? 0;
+}
+
+function noteVersion(table: string, version?: number) {
+  if (version !== undefined && version > knownVersion(table)) {
+    knownVersions.set(table, version);
+    tag = null;
+  }
+}
+
+// Changes made through the server itself (Google Sheets syncs) bump no data version
+const bootId = Date.now().toString(36);
+let localChanges = 0;
+let lastLocalChangeAt = 0;
+let tag: string | null = null;
+let tagDay = '';
+
+// Local calendar day; the analytics windows (e.g. the last six months) are built from new Date()
+function today(): string {
+  const now = new Date();
+  return `${now.getFullYear()}-${String(now.getMonth() + 1).padStart(2, '0')}-${String(now.getDate()).padStart(2, '0')}`;
+}
+
+export function noteLocalChange() {
+  localChanges++;
+  lastLocalChangeAt = Date.now();
+  tag = null;
+}
+
+// When the server last changed the data itself (0 if it has not since startup); ETL-built tables older than this are stale
+export function lastLocalChange(): number {
+  return lastLocalChangeAt;
+}
+
+/**
+ * Identifies the data the server is answering from: the data versions
+ * already refreshed into the cache, plus any local changes since startup.
+ * It only moves once a refresh has finished, so a response never carries
+ * a tag newer than its data.
+ *
+ * The day and the server start are part of it too: date-relative responses
+ * roll over at midnight, and writers that bump no data version (the older
+ * import scripts, migrate_date_columns.py, MemStorage) show up within a
+ * day or on the next restart.
+ */
+export function versionTag(): string {
+  const day = today();
+  if (tag === null || day !== tagDay) {
+    const versions = Array.from(knownVersions.entries()).sort(([a], [b]) => a.localeCompare(b));
+    tag = createHash('sha1').update(JSON.stringify([versions, bootId, localChanges, day])).digest('hex').slice(0, 16);
+    tagDay = day;
+  }
+  return tag;
+}
+
+// Refreshes run one after another, so a NOTIFY and a version check never rebuild the same keys at once
+let queue: Promise<void> = Promise.resolve();
+
+/**
+ * Refresh the cache entries that the given changes can affect. Readers keep
+ * getting the old values until each is replaced; entries are rebuilt one at
+ * a time in dependency order, so the stats are built on the refreshed lists.
+ */
+export function refreshForChanges(events: ChangeEvent[]): Promise<void> {
+  const run = queue.then(() => refresh(events));
+  queue = run.catch(() => undefined);
+  return run;
+}
+
+async function refresh(events: ChangeEvent[]) {
+  const stale = new Map<string, CacheDependent>();
+  for (const event of events) {
+    for (const dependent of DEPENDENTS[event.table] || []) {
+      if (!dependent.affectedBy || dependent.affectedBy(event)) stale.set(dependent.key, dependent);
+    }
+  }
+  if (stale.size === 0) {
+    // Nothing cached depends on these tables, but uncached responses do
+    events.forEach(event => noteVersion(event.table, event.version));
+    return;
+  }
+
+  const jobs = Array.from(new Set(events.map(event => event.job).filter(Boolean)));
+  console.log(`[CacheWarmup] ${jobs.join(', ') || 'ETL'} changed ${Array.from(new Set(events.map(e => e.table))).join(', ')}; ` +
+    `refreshing ${Array.from(stale.keys()).join(', ')}`);
+
+  stale.forEach((_, key) => cache.markStale(key));
+  for (const dependent of Array.from(stale.values())) {
+    try {
+      await dependent.rewarm();
+      await cache.settled(dependent.key);
+    } catch (error) {
+      console.error(`[CacheWarmup] Failed to rewarm ${dependent.key}:`, error);
+    }
+  }
+  events.forEach(event => noteVersion(event.table, event.version));
+}
@@ -0,0 +1,115 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { MemoryCache, approximateSize } from './cache';
+
+// The limits are read from the environment when a cache is created
+function cacheWith(env: Record<string, string>): MemoryCache {
+  Object.assign(process.env, env);
+  try {
+    return new MemoryCache();
+  } finally {
+    for (const name of Object.keys(env)) delete process.env[name];
+  }
+}
+
+function deferred<T>() {
+  let resolve!: (value: T) => void;
+  const promise = new Promise<T>(r => (resolve = r));
+  return { promise, resolve };
+}
+
+test('the least recently used entry is evicted first', () => {
+  const cache = cacheWith({ CACHE_MAX_ENTRIES: '2' });
+  cache.set('a', 1);
+  cache.set('b', 2);
+  cache.get('a'); // a is now more recent than b
+  cache.set('c', 3);
+
+  assert.equal(cache.get('b'), null);
+  assert.equal(cache.get('a'), 1);
+  assert.equal(cache.get('c'), 3);
+  assert.equal(cache.stats().evictions, 1);
+});
+
+test('the byte budget evicts old entries but keeps the newest', () => {
+  const cache = cacheWith({ CACHE_MAX_BYTES: '100' });
+  cache.set('small', 'x'.repeat(40));
+  cache.set('large', 'y'.repeat(500));
+
+  assert.equal(cache.get('small'), null);
+  assert.equal(cache.get('large'), 'y'.repeat(500));
+  assert.equal(cache.stats().bytes, approximateSize('y'.repeat(500)));
+});
+
+test('replacing and deleting entries keeps the byte count right', () => {
+  const cache = cacheWith({});
+  cache.set('k', 'x'.repeat(10));
+  cache.set('k', 'x'.repeat(20));
+  assert.equal(cache.stats().bytes, approximateSize('x'.repeat(20)));
+  cache.delete('k');
+  assert.deepEqual([cache.stats().bytes, cache.stats().entries], [0, 0]);
+});
+
+test('concurrent misses share one load', async () => {
+  const cache = cacheWith({});
+  const load = deferred<string[]>();
+  let loads = 0;
+  const loader = () => {
+    loads++;
+    return load.promise;
+  };
+
+  const first = cache.getOrLoad('rows', loader);
+  const second = cache.getOrLoad('rows', loader);
+  load.resolve(['row']);
+
+  assert.deepEqual(await Promise.all([first, second]), [['row'], ['row']]);
+  assert.equal(loads, 1);
+  assert.equal(cache.stats().coalesced, 1);
+  assert.deepEqual(await cache.getOrLoad('rows', loader), ['row']);
+  assert.equal(cache.stats().hits, 1);
+});
+
+test('a stale entry is served while one background load replaces it', async () => {
+  const cache = cacheWith({});
+  cache.set('rows', 'old');
+  cache.markStale('rows');
+  const refresh = deferred<string>();
+
+  assert.equal(await cache.getOrLoad('rows', () => refresh.promise), 'old');
+  assert.equal(cache.get('rows'), null);
+  refresh.resolve('new');
+  await cache.settled('rows');
+
+  assert.equal(cache.get('rows'), 'new');
+  assert.equal(cache.stats().staleHits, 1);
+});
+
+test('a load started before a change does not store its outdated result', async () => {
+  const cache = cacheWith({});
+  const load = deferred<string>();
+  const pending = cache.getOrLoad('rows', () => load.promise);
+  cache.delete('rows');
+  load.resolve('outdated');
+
+  assert.equal(await pending, 'outdated');
+  assert.equal(cache.get('rows'), null);
+});
+
+test('failed loads are counted and not cached', async () => {
+  const cache = cacheWith({});
+  await assert.rejects(cache.getOrLoad('rows', () => Promise.reject(new Error('down'))), /down/);
+  assert.equal(cache.stats().loadErrors, 1);
+  assert.equal(await cache.getOrLoad('rows', async () => 'up'), 'up');
+});
+
+test('approximateSize stays close to the JSON size', () => {
+  const rows = Array.from({ length: 5000 }, (_, i) => ({
+    id: i, craneId: `CR-${i}`, date: '2024-01-15', description: 'x'.repeat(i % 120), worktime: i / 7, note: null,
+  }));
+  const actual = Buffer.byteLength(JSON.stringify(rows));
+  const estimate = approximateSize(rows);
+  assert.ok(Math.abs(estimate - actual) / actual < 0.2, `estimate ${estimate} vs ${actual}`);
+  assert.equal(approximateSize([]), 2);
+  assert.equal(approximateSize('abc'), 5);
+});
@@ -2,18 +2,81 @@ interface CacheItem<T> {
   data: T;
   timestamp: number;
   ttl: number; // time to live in milliseconds
+  size: number; // approximate bytes, for the memory budget
 }
 
-class MemoryCache {
+export interface CacheStats {
+  hits: number;
+  staleHits: number; // served an expired entry while it refreshed in the background
+  misses: number;
+  coalesced: number; // misses that joined a load already in flight instead of starting their own
+  loads: number;
+  loadErrors: number;
+  evictions: number;
+  entries: number;
+  bytes: number;
+}
+
+// Elements of an array that are measured; the rest are assumed to be the same size on average
+const SIZE_SAMPLE = 8;
+
+/**
+ * Rough in-memory size, in about the bytes JSON.stringify would produce.
+ * The cached values are arrays of plain rows, so long arrays are measured
+ * from a few evenly spaced elements instead of serialized whole.
+ */
+export function approximateSize(data: unknown, depth = 0): number {
+  if (data === null || data === undefined) return 4;
+  switch (typeof data) {
+    case 'string':
+      return data.length + 2;
+    case 'number':
+    case 'bigint':
+      return 8;
+    case 'boolean':
+      return 5;
+    case 'object':
+      break;
+    default:
+      return 0;
+  }
+  if (depth > 8) return 0;
+  if (data instanceof Date) return 26;
+  if (Array.isArray(data)) {
+    if (data.length === 0) return 2;
+    const step = Math.max(1, Math.floor(data.length / SIZE_SAMPLE));
+    let sampled = 0;
+    let measured = 0;
+    for (let i = 0; i < data.length && sampled < SIZE_SAMPLE; i += step, sampled++) {
+      measured += approximateSize(data[i], depth + 1) + 1;
+    }
+    return Math.round((measured / sampled) * data.length) + 2;
+  }
+  let size = 2;
+  for (const [key, value] of Object.entries(data as Record<string, unknown>)) {
+    size += key.length + 4 + approximateSize(value, depth + 1);
+  }
+  return size;
+}
+
+export class MemoryCache {
+  // Map iteration order is insertion order, so the first key is the least recently used
   private cache = new Map<string, CacheItem<any>>();
+  private inflight = new Map<string, Promise<any>>();
   private readonly defaultTtl = 5 * 60 * 1000; // 5 minutes
+  // How long past its ttl an entry is still served while one refresh runs
+  private readonly staleTtl = Number(process.env.CACHE_STALE_MS) || 10 * 60 * 1000;
+  private readonly maxEntries = Number(process.env.CACHE_MAX_ENTRIES) || 1000;
+  private readonly maxBytes = Number(process.env.CACHE_MAX_BYTES) || 256 * 1024 * 1024;
+  private bytes = 0;
+  private counters = { hits: 0, staleHits: 0, misses: 0, coalesced: 0, loads: 0, loadErrors: 0, evictions: 0 };
 
   set<T>(key: string, data: T, ttl?: number): void {
-    this.cache.set(key, {
-      data,
-      timestamp: Date.now(),
-      ttl: ttl || this.defaultTtl
-    });
+    this.remove(key);
+    const item = { data, timestamp: Date.now(), ttl: ttl || this.defaultTtl, size: approximateSize(data) };
+    this.cache.set(key, item);
+    this.bytes += item.size;
+    this.evict();
   }
 
   get<T>(key: string): T | null {
@@ -22,37 +85,118 @@ class MemoryCache {
 
     const now = Date.now();
     if (now - item.timestamp > item.ttl) {
-      this.cache.delete(key);
+      // Kept for stale-while-revalidate readers until it is too old even for them
+      if (now - item.timestamp > item.ttl + this.staleTtl) this.remove(key);
       return null;
     }
 
+    this.touch(key, item);
     return item.data;
   }
 
+  /**
+   * The cached value, loading it on a miss. Concurrent misses share one load,
+   * and an expired entry is returned as is while a single background load
+   * replaces it, so the database sees one query per key per refresh.
+   */
+  async getOrLoad<T>(key: string, load: () => Promise<T>, ttl?: number): Promise<T> {
+    const item = this.cache.get(key);
+    const now = Date.now();
+    if (item && now - item.timestamp <= item.ttl) {
+      this.counters.hits++;
+      this.touch(key, item);
+      return item.data;
+    }
+    if (item && now - item.timestamp <= item.ttl + this.staleTtl) {
+      this.counters.staleHits++;
+      this.touch(key, item);
+      this.load(key, load, ttl).catch(error => console.error(`[Cache] Background refresh of ${key} failed:`, error));
+      return item.data;
+    }
+
+    this.counters.misses++;
+    if (this.inflight.has(key)) this.counters.coalesced++;
+    return this.load(key, load, ttl);
+  }
+
+  // Resolves once the load in flight for key (if any) has finished
+  async settled(key: string): Promise<void> {
+    await this.inflight.get(key)?.catch(() => undefined);
+  }
+
+  // Let readers keep the current value only until one refresh replaces it
+  markStale(key: string): void {
+    const item = this.cache.get(key);
+    if (item) item.timestamp = Date.now() - item.ttl - 1;
+    // A load started before the change would store outdated data
+    this.inflight.delete(key);
+  }
+
   delete(key: string): void {
-    this.cache.delete(key);
+    this.remove(key);
+    this.inflight.delete(key);
   }
 
   clear(): void {
     this.cache.clear();
+    this.inflight.clear();
+    this.bytes = 0;
   }
 
   clearKey(key: string): void {
-    this.cache.delete(key);
+    this.delete(key);
   }
 
   has(key: string): boolean {
+    return this.get(key) !== null;
+  }
+
+  stats(): CacheStats {
+    return { ...this.counters, entries: this.cache.size, bytes: this.bytes };
+  }
+
+  private load<T>(key: string, load: () => Promise<T>, ttl?: number): Promise<T> {
+    const running = this.inflight.get(key);
+    if (running) return running;
+
+    this.counters.loads++;
+    const loading: Promise<T> = load().then(
+      data => {
+        // Only the current load may store; a delete or markStale meanwhile means the data is outdated
+        if (this.inflight.get(key) === loading) this.set(key, data, ttl);
+        return data;
+      },
+      error => {
+        this.counters.loadErrors++;
+        throw error;
+      },
+    ).finally(() => {
+      if (this.inflight.get(key) === loading) this.inflight.delete(key);
+    });
+    this.inflight.set(key, loading);
+    return loading;
+  }
+
+  private touch(key: string, item: CacheItem<any>): void {
+    this.cache.delete(key);
+    this.cache.set(key, item);
+  }
+
+  private remove(key: string): void {
     const item = this.cache.get(key);
-    if (!item) return false;
+    if (!item) return;
+    this.bytes -= item.size;
+    this.cache.delete(key);
+  }
 
-    const now = Date.now();
-    if (now - item.timestamp > item.ttl) {
-      this.cache.delete(key);
-      return false;
+  // Evict least recently used entries until both budgets are met; the newest entry always stays
+  private evict(): void {
+    while (this.cache.size > 1 && (this.cache.size > this.maxEntries || this.bytes > this.maxBytes)) {
+      const oldest = this.cache.keys().next().value as string;
+      this.remove(oldest);
+      this.counters.evictions++;
     }
-
-    return true;
   }
 }
 
-export const cache = new MemoryCache();
\ No newline at end of file
+export const cache = new MemoryCache();
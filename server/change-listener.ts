@@ -0,0 +1,100 @@
+import { Client } from '@neondatabase/serverless';
+import { refreshForChanges, type ChangeEvent } from './cache-warmup';
+
+// Published by the Python ETL (etl_events.py) when a load commits
+const CHANNEL = 'etl_changes';
+
+// Events arriving this close together (one import commits in batches) are handled as one
+const DEBOUNCE_MS = 250;
+const RECONNECT_MIN_MS = 1000;
+const RECONNECT_MAX_MS = 60 * 1000;
+
+class ChangeListener {
+  private client: Client | null = null;
+  private pending: ChangeEvent[] = [];
+  private flushTimer: NodeJS.Timeout | null = null;
+  private reconnectTimer: NodeJS.Timeout | null = null;
+  private reconnectDelay = RECONNECT_MIN_MS;
+  private stopped = false;
+
+  start() {
+    this.stopped = false;
+    this.connect();
+  }
+
+  async stop() {
+    this.stopped = true;
+    if (this.reconnectTimer) clearTimeout(this.reconnectTimer);
+    if (this.flushTimer) clearTimeout(this.flushTimer);
+    this.reconnectTimer = this.flushTimer = null;
+    const client = this.client;
+    this.client = null;
+    await client?.end().catch(() => undefined);
+  }
+
+  private async connect() {
+    // LISTEN needs a session of its own; a transaction-pooling endpoint can set DATABASE_LISTEN_URL to a direct one
+    const client = new Client({ connectionString: process.env.DATABASE_LISTEN_URL || process.env.DATABASE_URL });
+    client.on('notification', (message) => {
+      if (message.channel === CHANNEL && message.payload) this.receive(message.payload);
+    });
+    client.on('error', (error) => this.reconnect(client, error));
+    client.on('end', () => this.reconnect(client));
+
+    try {
+      await client.connect();
+      await client.query(`LISTEN ${CHANNEL}`);
+    } catch (error) {
+      this.reconnect(client, error);
+      return;
+    }
+
+    this.client = client;
+    this.reconnectDelay = RECONNECT_MIN_MS;
+    // Changes committed while disconnected are caught by BackgroundSync's data version check
+    console.log(`[ChangeListener] Listening for ETL changes on ${CHANNEL}`);
+  }
+
+  private reconnect(client: Client, error?: unknown) {
+    if (this.client && this.client !== client) return;
+    this.client = null;
+    client.removeAllListeners();
+    client.end().catch(() => undefined);
+    if (this.stopped || this.reconnectTimer) return;
+
+    if (error) console.error('[ChangeListener] Connection lost:', error);
+    const delay = this.reconnectDelay;
+    this.reconnectDelay = Math.min(this.reconnectDelay * 2, RECONNECT_MAX_MS);
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
+      this.connect();
+    }, delay);
+  }
+
+  private receive(payload: string) {
+    try {
+      const event = JSON.parse(payload) as ChangeEvent;
+      if (!event.table) return;
+      this.pending.push(event);
+      this.scheduleFlush();
+    } catch (error) {
+      console.error('[ChangeListener] Ignoring malformed event:', payload);
+    }
+  }
+
+  private scheduleFlush() {
+    if (this.flushTimer) return;
+    this.flushTimer = setTimeout(() => {
+      this.flushTimer = null;
+      this.flush();
+    }, DEBOUNCE_MS);
+  }
+
+  private async flush() {
+    const events = this.pending;
+    this.pending = [];
+    await refreshForChanges(events);
+  }
+}
+
+export const changeListener = new ChangeListener();
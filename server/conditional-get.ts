@@ -0,0 +1,93 @@
+import { brotliCompressSync, gzipSync, constants as zlibConstants } from 'zlib';
+import type { Request, Response, NextFunction } from 'express';
+import { versionTag } from './cache-warmup';
+
+// Bodies smaller than this go out as plain JSON; compressing them saves less than the headers cost
+const COMPRESS_MIN_BYTES = Number(process.env.COMPRESS_MIN_BYTES) || 8 * 1024;
+const MAX_COMPRESSED_ENTRIES = 500;
+
+// Compressed bodies for the current version tag, keyed by encoding and URL
+const compressed = new Map<string, Buffer>();
+let compressedTag = '';
+
+function preferredEncoding(req: Request): 'br' | 'gzip' | null {
+  const accepted = String(req.headers['accept-encoding'] || '');
+  if (/\bbr\b/.test(accepted)) return 'br';
+  if (/\bgzip\b/.test(accepted)) return 'gzip';
+  return null;
+}
+
+function compress(encoding: 'br' | 'gzip', body: string): Buffer {
+  return encoding === 'br'
+    ? brotliCompressSync(body, { params: { [zlibConstants.BROTLI_PARAM_QUALITY]: 9 } })
+    : gzipSync(body, { level: 9 });
+}
+
+// A body is compressed once per data version and URL, then reused for every client
+function compressedBody(tag: string, encoding: 'br' | 'gzip', url: string, body: string): Buffer {
+  // The version moved on while this request ran; don't let it evict the newer bodies
+  if (tag !== versionTag()) return compress(encoding, body);
+  if (tag !== compressedTag) {
+    compressed.clear();
+    compressedTag = tag;
+  }
+  const key = `${encoding} ${url}`;
+  let buffer = compressed.get(key);
+  if (!buffer) {
+    buffer = compress(encoding, body);
+    if (compressed.size >= MAX_COMPRESSED_ENTRIES) compressed.delete(compressed.keys().next().value!);
+    compressed.set(key, buffer);
+  }
+  return buffer;
+}
+
+// If-None-Match against our ETag: weak comparison, any entry of a list, or '*'
+export function etagMatches(ifNoneMatch: string | undefined, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch.split(',').some(value => {
+    const candidate = value.trim();
+    return candidate === '*' || candidate.replace(/^W\//, '') === etag.replace(/^W\//, '');
+  });
+}
+
+/**
+ * Conditional GETs for responses that change only when the data does.
+ *
+ * The ETag is the data version tag, so a client that already has the
+ * current version gets a 304 before the route (and storage) runs. Large
+ * bodies are compressed once per version and URL and served from memory.
+ */
+export function versionedResponses() {
+  return (req: Request, res: Response, next: NextFunction) => {
+    if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+
+    const tag = versionTag();
+    const etag = `W/"${tag}"`;
+    res.setHeader('ETag', etag);
+    // Revalidate on every poll; the 304 makes that cheap
+    res.setHeader('Cache-Control', 'no-cache');
+    res.setHeader('Vary', 'Accept-Encoding');
+
+    if (etagMatches(req.headers['if-none-match'], etag)) {
+      return res.status(304).end();
+    }
+
+    const json = res.json.bind(res);
+    res.json = (data: unknown) => {
+      if (res.statusCode !== 200) {
+        // Errors are not versioned data
+        res.removeHeader('ETag');
+        res.setHeader('Cache-Control', 'no-store');
+        return json(data);
+      }
+      const encoding = preferredEncoding(req);
+      const body = JSON.stringify(data);
+      if (!encoding || body === undefined || Buffer.byteLength(body) < COMPRESS_MIN_BYTES) return json(data);
+
+      res.setHeader('Content-Type', 'application/json; charset=utf-8');
+      res.setHeader('Content-Encoding', encoding);
+      return res.send(compressedBody(tag, encoding, req.originalUrl, body));
+    };
+    next();
+  };
+}
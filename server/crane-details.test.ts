@@ -0,0 +1,65 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import type { Crane, CraneTimeline } from "@shared/schema";
+import { daysUntil, timelineDetails } from "./crane-details";
+
+const crane = { craneId: "4P1001201", craneName: "CT73_PCM" } as Crane;
+
+const row = {
+  craneId: "4P1001201",
+  craneName: "CT73_PCM",
+  plantSection: "냉연",
+  dailyRepairCount: 2,
+  emergencyRepairCount: 2,
+  dailyRepairHours: 5,
+  emergencyRepairHours: 7,
+  dailyRepairBreakdown: { routine: 1, preventive: 1, inspection: 0 },
+  emergencyRepairBreakdown: { hydraulic: 1, electrical: 1, mechanical: 0, structural: 0 },
+  failureHeatmap: { Wear: 1, Unknown: 1 },
+  lastMaintenanceDate: "2024-03-10",
+  nextInspectionDate: null,
+  timeline: [
+    { kind: "failure", id: 9, date: "2024-04-02", type: "hydraulic", cause: "Wear", hours: 4 },
+    { kind: "repair", id: 5, date: "2024-03-10", type: "routine", status: "completed", hours: 2 },
+    { kind: "repair", id: 4, date: "2024-03-01", type: "overhaul", hours: 10 },
+    { kind: "failure", id: 8, date: "2024-02-20", type: "electrical", hours: 3 },
+    { kind: "repair", id: 3, date: "2024-02-01", type: "preventive", hours: 3 },
+  ],
+  refreshedAt: "2024-04-03 00:00:00+09:00",
+} as CraneTimeline;
+
+test("without a full date range the materialized counts are returned as is", () => {
+  const details = timelineDetails(crane, row, "2024-03-01");
+  assert.equal(details.crane, crane);
+  assert.equal(details.dailyRepairCount, 2);
+  assert.equal(details.emergencyRepairHours, 7);
+  assert.equal(details.failureHeatmap, row.failureHeatmap);
+  assert.equal(details.timeline, row.timeline);
+  assert.equal(details.daysUntilInspection, 0);
+});
+
+test("a date range recounts only the events inside it, both ends inclusive", () => {
+  const details = timelineDetails(crane, row, "2024-03-01", "2024-04-02");
+  assert.deepEqual(details.timeline.map(event => event.id), [9, 5, 4]);
+  // overhaul is neither a daily repair nor a failure
+  assert.equal(details.dailyRepairCount, 1);
+  assert.equal(details.dailyRepairHours, 2);
+  assert.equal(details.emergencyRepairCount, 1);
+  assert.equal(details.emergencyRepairHours, 4);
+  assert.deepEqual(details.dailyRepairBreakdown, { routine: 1, preventive: 0, inspection: 0 });
+  assert.deepEqual(details.emergencyRepairBreakdown, { hydraulic: 1, electrical: 0, mechanical: 0, structural: 0 });
+  assert.deepEqual(details.failureHeatmap, { Wear: 1 });
+  // The last maintenance and next inspection stay the crane's, not the range's
+  assert.equal(details.lastMaintenanceDate, "2024-03-10");
+});
+
+test("failures without a cause count as Unknown", () => {
+  assert.deepEqual(timelineDetails(crane, row, "2024-01-01", "2024-02-28").failureHeatmap, { Unknown: 1 });
+});
+
+test("days until an inspection round up and never go negative", () => {
+  assert.equal(daysUntil(null), 0);
+  assert.equal(daysUntil("2000-01-01"), 0);
+  const inTenDays = new Date(Date.now() + 9.5 * 24 * 60 * 60 * 1000).toISOString();
+  assert.equal(daysUntil(inTenDays), 10);
+});
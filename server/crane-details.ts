@@ -0,0 +1,58 @@
+import type { Crane, CraneTimeline } from "@shared/schema";
+
+// Same type lists as crane_timeline.py (DAILY_REPAIR_TYPES, FAILURE_TYPES)
+const DAILY_REPAIR_TYPES = ['routine', 'preventive', 'inspection'];
+const FAILURE_TYPES = ['hydraulic', 'electrical', 'mechanical', 'structural'];
+
+// Whole days from now until an ISO date, never negative
+export function daysUntil(date: string | null): number {
+  if (!date) return 0;
+  return Math.max(0, Math.ceil((new Date(date).getTime() - Date.now()) / (1000 * 60 * 60 * 24)));
+}
+
+function countBy<T>(items: T[], key: (item: T) => string): Record<string, number> {
+  return items.reduce((acc, item) => {
+    acc[key(item)] = (acc[key(item)] || 0) + 1;
+    return acc;
+  }, {} as Record<string, number>);
+}
+
+// The crane detail response from its materialized timeline; a date range recounts just the events inside it
+export function timelineDetails(crane: Crane, row: CraneTimeline, startDate?: string, endDate?: string) {
+  const details = {
+    crane,
+    lastMaintenanceDate: row.lastMaintenanceDate,
+    nextInspectionDate: row.nextInspectionDate,
+    daysUntilInspection: daysUntil(row.nextInspectionDate),
+  };
+  if (!startDate || !endDate) {
+    return {
+      ...details,
+      dailyRepairCount: row.dailyRepairCount,
+      emergencyRepairCount: row.emergencyRepairCount,
+      dailyRepairHours: row.dailyRepairHours,
+      emergencyRepairHours: row.emergencyRepairHours,
+      dailyRepairBreakdown: row.dailyRepairBreakdown,
+      emergencyRepairBreakdown: row.emergencyRepairBreakdown,
+      failureHeatmap: row.failureHeatmap,
+      timeline: row.timeline,
+    };
+  }
+
+  const timeline = row.timeline.filter(event => event.date >= startDate && event.date <= endDate);
+  const dailyRepairs = timeline.filter(event => event.kind === 'repair' && DAILY_REPAIR_TYPES.includes(event.type ?? ''));
+  const emergencyRepairs = timeline.filter(event => event.kind === 'failure');
+  const dailyTypes = countBy(dailyRepairs, event => event.type ?? '');
+  const failureTypes = countBy(emergencyRepairs, event => event.type ?? '');
+  return {
+    ...details,
+    dailyRepairCount: dailyRepairs.length,
+    emergencyRepairCount: emergencyRepairs.length,
+    dailyRepairHours: dailyRepairs.reduce((sum, event) => sum + (event.hours || 0), 0),
+    emergencyRepairHours: emergencyRepairs.reduce((sum, event) => sum + (event.hours || 0), 0),
+    dailyRepairBreakdown: Object.fromEntries(DAILY_REPAIR_TYPES.map(type => [type, dailyTypes[type] || 0])),
+    emergencyRepairBreakdown: Object.fromEntries(FAILURE_TYPES.map(type => [type, failureTypes[type] || 0])),
+    failureHeatmap: countBy(emergencyRepairs, event => event.cause || 'Unknown'),
+    timeline,
+  };
+}
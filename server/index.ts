@@ -2,6 +2,7 @@ import express, { type Request, Response, NextFunction } from "express";
 import { registerRoutes } from "./routes";
 import { setupVite, serveStatic, log } from "./vite";
 import { backgroundSync } from "./background-sync";
+import { changeListener } from "./change-listener";
 
 const app = express();
 app.use(express.json());
@@ -43,6 +44,9 @@ app.use((req, res, next) => {
   // Start background sync for performance optimization
   backgroundSync.start();
 
+  // Refresh just the cache entries an ETL run changed, as soon as it commits
+  changeListener.start();
+
   app.use((err: any, _req: Request, res: Response, _next: NextFunction) => {
     const status = err.status || err.statusCode || 500;
     const message = err.message || "Internal Server Error";
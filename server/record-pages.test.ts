@@ -0,0 +1,52 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { decodeCursor, encodeCursor, pageOf, toPage } from "./record-pages";
+
+const records = [
+  { id: 1, date: "2024-03-01" },
+  { id: 4, date: "2024-03-02" },
+  { id: 2, date: "2024-03-02" },
+  { id: 3, date: "2024-02-28" },
+  { id: 5, date: "2024-03-01" },
+];
+
+test("cursors round-trip and are opaque base64url", () => {
+  const token = encodeCursor({ date: "2024-03-02", id: 42 });
+  assert.ok(token && /^[A-Za-z0-9_-]+$/.test(token));
+  assert.deepEqual(decodeCursor(token!), { date: "2024-03-02", id: 42 });
+  assert.equal(encodeCursor(null), null);
+});
+
+test("tampered or malformed cursors are rejected", () => {
+  const encode = (text: string) => Buffer.from(text).toString("base64url");
+  assert.equal(decodeCursor(encode("2024-3-2|42")), undefined);
+  assert.equal(decodeCursor(encode("2024-03-02|-1")), undefined);
+  assert.equal(decodeCursor(encode("2024-03-02")), undefined);
+  assert.equal(decodeCursor("not a cursor"), undefined);
+});
+
+test("a page past the limit points at its last row", () => {
+  assert.deepEqual(toPage(records.slice(0, 3), 2), {
+    items: records.slice(0, 2),
+    next: { date: "2024-03-02", id: 4 },
+  });
+  assert.deepEqual(toPage(records.slice(0, 2), 2).next, null);
+  assert.deepEqual(toPage([], 2), { items: [], next: null });
+});
+
+test("in-memory pages walk (date, id) newest first without gaps or repeats", () => {
+  const seen: number[] = [];
+  let page = pageOf(records, { limit: 2 });
+  seen.push(...page.items.map(record => record.id));
+  while (page.next) {
+    page = pageOf(records, { limit: 2, after: page.next });
+    seen.push(...page.items.map(record => record.id));
+  }
+  assert.deepEqual(seen, [4, 2, 5, 1, 3]);
+});
+
+test("rows on the cursor's date with a smaller id come after it", () => {
+  const page = pageOf(records, { limit: 10, after: { date: "2024-03-01", id: 5 } });
+  assert.deepEqual(page.items.map(record => record.id), [1, 3]);
+  assert.equal(page.next, null);
+});
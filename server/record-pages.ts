@@ -0,0 +1,30 @@
+import type { RecordCursor, RecordPage, RecordPageQuery } from "@shared/schema";
+
+// Keyset pagination over history records, newest first in (date, id) order
+
+// Cursors are opaque to clients: base64url of 'YYYY-MM-DD|id'
+export function encodeCursor(cursor: RecordCursor | null): string | null {
+  return cursor ? Buffer.from(`${cursor.date}|${cursor.id}`).toString('base64url') : null;
+}
+
+export function decodeCursor(value: string): RecordCursor | undefined {
+  const [date, id] = Buffer.from(value, 'base64url').toString().split('|');
+  return /^\d{4}-\d{2}-\d{2}$/.test(date) && /^\d+$/.test(id ?? '') ? { date, id: Number(id) } : undefined;
+}
+
+// Pages fetch one row past the limit to tell whether another page follows
+export function toPage<T extends { date: string; id: number }>(rows: T[], limit: number): RecordPage<T> {
+  const items = rows.slice(0, limit);
+  const last = items[items.length - 1];
+  return { items, next: rows.length > limit && last ? { date: last.date, id: last.id } : null };
+}
+
+// The in-memory equivalent of a keyset page query
+export function pageOf<T extends { date: string; id: number }>(records: T[], query: RecordPageQuery): RecordPage<T> {
+  const after = query.after;
+  const rows = records
+    .filter(record => !after || record.date < after.date || (record.date === after.date && record.id < after.id))
+    .sort((a, b) => b.date.localeCompare(a.date) || b.id - a.id)
+    .slice(0, query.limit + 1);
+  return toPage(rows, query.limit);
+}
@@ -1,8 +1,133 @@
-import type { Express } from "express";
+import type { Express, Response } from "express";
 import { createServer, type Server } from "http";
 import { storage } from "./storage";
+import { cache } from "./cache";
+import { lastLocalChange, noteLocalChange } from "./cache-warmup";
+import { versionedResponses } from "./conditional-get";
 import Papa from "papaparse";
-import OpenAI from "openai";
+import { aiConfigured, generateReport } from "./ai-model";
+import { timelineDetails } from "./crane-details";
+import { decodeCursor, encodeCursor } from "./record-pages";
+import type { AiDigest, HistoryFilters, RecordPage, RecordPageQuery } from "@shared/schema";
+
+// History filters from the query string; the date range applies only when both ends are given
+function historyFilters(query: Record<string, unknown>): HistoryFilters {
+  const { craneName, factory, startDate, endDate } = query as Record<string, string | undefined>;
+  return startDate && endDate ? { craneName, factory, startDate, endDate } : { craneName, factory };
+}
+
+const DEFAULT_PAGE_SIZE = 100;
+const MAX_PAGE_SIZE = 1000;
+
+// Filters, cursor and page size for the record list endpoints; a string is the reason the query was rejected
+function recordPageQuery(query: Record<string, unknown>): RecordPageQuery | string {
+  const { craneId, byDevice, type, cursor, limit } = query as Record<string, string | undefined>;
+  const pageSize = limit === undefined ? DEFAULT_PAGE_SIZE : Number(limit);
+  if (!Number.isInteger(pageSize) || pageSize < 1 || pageSize > MAX_PAGE_SIZE) {
+    return `limit must be an integer from 1 to ${MAX_PAGE_SIZE}`;
+  }
+  const after = cursor ? decodeCursor(cursor) : undefined;
+  if (cursor && !after) return 'invalid cursor';
+  return { ...historyFilters(query), craneId, byDevice, type, after, limit: pageSize };
+}
+
+// format=columnar sends the column names once and each record as an array of values
+function sendPage<T extends object>(res: Response, page: RecordPage<T>, format: unknown) {
+  const nextCursor = encodeCursor(page.next);
+  if (format !== 'columnar') return res.json({ items: page.items, nextCursor });
+  const columns = page.items.length > 0 ? Object.keys(page.items[0]) : [];
+  res.json({
+    columns,
+    rows: page.items.map(item => columns.map(column => (item as Record<string, unknown>)[column])),
+    nextCursor,
+  });
+}
+
+// Prepended to fleet_digest.py digests so the model can read their short keys
+const DIGEST_LEGEND = `데이터 키: failures/repairs=최근 days일 건수·시간, topDevices=고장 장치 상위 [장치, 건수], \
+mtbf=월별 평균 고장 간격(일, 크레인당), anomalies=최근 이상 알림 [날짜, 크레인, 심각도, 내용], \
+overdue=점검 지연 [크레인, 예정일, 지연일], nextInspection=다음 점검(daysLeft=D-day), \
+topRepairs=주요 수리 작업 [작업명, 건수], recentFailures=최근 고장 [날짜, 장치, 유형, 설명]`;
+
+// Tables fleet_digest.py builds the digests from (its SOURCE_TABLES)
+const DIGEST_SOURCES = ['cranes', 'failure_records', 'maintenance_records', 'alerts'];
+// Digests cover windows ending at their asOf; older ones no longer match "the last 30 days" etc.
+const DIGEST_MAX_AGE_DAYS = 1;
+
+// The scope's digest while it still reflects the data; undefined sends the route to the records instead
+async function currentDigest(scope: 'fleet' | 'factory' | 'crane', key: string): Promise<AiDigest | undefined> {
+  const digest = await storage.getAiDigest(scope, key);
+  if (!digest) return undefined;
+
+  const versions = await storage.getDataVersions();
+  const built = digest.sourceVersions ?? {};
+  if (DIGEST_SOURCES.some(table => (versions[table] ?? 0) > (built[table] ?? 0))) return undefined;
+  // asOf is a calendar date; a missing one counts as too old
+  const ageDays = Math.floor((Date.now() - new Date(digest.digest.asOf).getTime()) / (1000 * 60 * 60 * 24));
+  if (!(ageDays <= DIGEST_MAX_AGE_DAYS)) return undefined;
+  // Sheet syncs through the server bump no data version
+  if (lastLocalChange() > new Date(digest.refreshedAt).getTime()) return undefined;
+  return digest;
+}
+
+// Where an AI prompt's data came from and what it cost, returned alongside the report
+function contextInfo(digest: AiDigest | undefined, prompt: string, startedAt: number) {
+  return {
+    source: digest ? 'digest' : 'records',
+    version: digest?.version ?? null,
+    generatedAt: digest?.generatedAt ?? null,
+    promptChars: prompt.length,
+    assemblyMs: Date.now() - startedAt,
+  };
+}
+
+// The crane-summary context built from raw records, for cranes without a digest; undefined if the crane is unknown
+async function assembleCraneContext(craneId: string): Promise<{ plantSection: string | null; context: string } | undefined> {
+  const crane = await storage.getCraneByCraneId(craneId);
+  if (!crane) return undefined;
+
+  const failureRecords = await storage.getFailureRecordsByCraneId(craneId);
+  const maintenanceRecords = await storage.getMaintenanceRecordsByCraneId(craneId);
+
+  const craneData = {
+    기본정보: {
+      크레인명: crane.craneName,
+      설비코드: crane.craneId,
+      공장: crane.plantSection,
+      위치: crane.location,
+      모델: crane.model,
+      등급: crane.grade,
+      운전방식: crane.driveType,
+      유무인운전: crane.unmannedOperation,
+      전기담당자: crane.electricalManager,
+      기계담당자: crane.mechanicalManager,
+      상태: crane.status
+    },
+    고장이력: failureRecords.map(f => ({
+      날짜: f.date,
+      고장유형: f.failureType,
+      설명: f.description,
+      심각도: f.severity,
+      중단시간: f.downtime,
+      원인: f.cause,
+      부위: f.byDevice,
+      작업시간: f.worktime
+    })),
+    수리이력: maintenanceRecords.map(m => ({
+      날짜: m.actualStartDateTime || m.date,
+      작업종류: m.type,
+      작업명: m.taskName,
+      상태: m.status,
+      작업자수: m.totalWorkers,
+      작업시간: m.totalWorkTime,
+      작업지시서: m.workOrder,
+      설비명: m.equipmentName,
+      지역명: m.areaName
+    }))
+  };
+
+  return { plantSection: crane.plantSection, context: JSON.stringify(craneData, null, 2) };
+}
 
 // Helper function to clean spreadsheet ID from URL fragments
 function cleanSpreadsheetId(id: string): string {
@@ -79,6 +204,8 @@ ${sheetName ? `5. 시트명 '${sheetName}'이 존재하는지 확인하세요` :
 }
 
 export async function registerRoutes(app: Express): Promise<Server> {
+  // Analytics only change when the data version does: ETags, 304s and precompressed bodies
+  app.use(["/api/analytics", "/api/dashboard"], versionedResponses());
   
   // Get dashboard summary
   app.get("/api/dashboard/summary", async (req, res) => {
@@ -160,11 +287,14 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
-  // Get maintenance records
+  // Page through maintenance records, newest first (?craneId, craneName, factory, type, startDate/endDate, cursor, limit, format)
   app.get("/api/maintenance-records", async (req, res) => {
     try {
-      const records = await storage.getMaintenanceRecords();
-      res.json(records);
+      const query = recordPageQuery(req.query);
+      if (typeof query === 'string') {
+        return res.status(400).json({ message: query });
+      }
+      sendPage(res, await storage.getMaintenanceRecordPage(query), req.query.format);
     } catch (error) {
       console.error("Error fetching maintenance records:", error);
       res.status(500).json({ message: "Failed to fetch maintenance records" });
@@ -228,37 +358,14 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
-  // Get failure records with filtering
+  // Page through failure records, newest first (?craneId, craneName, factory, byDevice, type, startDate/endDate, cursor, limit, format)
   app.get("/api/failure-records", async (req, res) => {
     try {
-      const { craneName, startDate, endDate } = req.query;
-      let records = await storage.getFailureRecords();
-      
-      // Filter by crane name if provided
-      if (craneName && craneName !== 'all') {
-        const cranes = await storage.getCranes();
-        const targetCrane = cranes.find(c => c.craneName === craneName);
-        if (targetCrane) {
-          console.log(`Filtering failure records for crane: ${craneName} with craneId: ${targetCrane.craneId}`);
-          records = records.filter(r => r.craneId === targetCrane.craneId);
-          console.log(`Found ${records.length} failure records for this crane`);
-        } else {
-          console.log(`No crane found with name: ${craneName}`);
-        }
+      const query = recordPageQuery(req.query);
+      if (typeof query === 'string') {
+        return res.status(400).json({ message: query });
       }
-      
-      // Filter by date range if provided
-      if (startDate && endDate) {
-        records = records.filter(r => {
-          if (!r.date) return false;
-          const recordDate = new Date(r.date);
-          const start = new Date(startDate as string);
-          const end = new Date(endDate as string);
-          return recordDate >= start && recordDate <= end;
-        });
-      }
-      
-      res.json(records);
+      sendPage(res, await storage.getFailureRecordPage(query), req.query.format);
     } catch (error) {
       console.error("Error fetching failure records:", error);
       res.status(500).json({ message: "Failed to fetch failure records" });
@@ -289,23 +396,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // Get cranes with failure data
   app.get("/api/cranes-with-failure-data", async (req, res) => {
     try {
-      const cranes = await storage.getCranes();
-      const failureRecords = await storage.getFailureRecords();
-      
-      const cranesWithData = cranes
-        .map(crane => {
-          const failureCount = failureRecords.filter(record => record.craneId === crane.craneId).length;
-          return {
-            craneId: crane.craneId,
-            craneName: crane.craneName,
-            plantSection: crane.plantSection,
-            failureCount,
-            hasData: failureCount > 0
-          };
-        })
-        .filter(crane => crane.hasData)
-        .sort((a, b) => b.failureCount - a.failureCount);
-      
+      const cranesWithData = await storage.getCraneFailureCounts();
       res.json(cranesWithData);
     } catch (error) {
       console.error("Error fetching cranes with failure data:", error);
@@ -316,67 +407,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // Get device failure heatmap data
   app.get("/api/device-failure-heatmap", async (req, res) => {
     try {
-      const { craneName, factory, startDate, endDate } = req.query;
-      let records = await storage.getFailureRecords();
-      
-      // Filter by crane name if specified
-      if (craneName && craneName !== 'all') {
-        const cranes = await storage.getCranes();
-        const targetCranes = cranes.filter(c => c.craneName === craneName);
-        const craneIds = targetCranes.map(c => c.craneId);
-        records = records.filter(r => craneIds.includes(r.craneId));
-      }
-      
-      // Filter by factory if specified
-      if (factory && factory !== 'all') {
-        const cranes = await storage.getCranes();
-        const factoryCranes = cranes.filter(c => c.plantSection === factory);
-        const craneIds = factoryCranes.map(c => c.craneId);
-        records = records.filter(r => craneIds.includes(r.craneId));
-      }
-      
-      // Filter by date range if specified
-      if (startDate && endDate) {
-        records = records.filter(r => {
-          if (!r.date) return false;
-          const recordDate = new Date(r.date);
-          const start = new Date(startDate as string);
-          const end = new Date(endDate as string);
-          return recordDate >= start && recordDate <= end;
-        });
-      }
-      
-      // Group by device type and failure type
-      const heatmapData: { [device: string]: { [failureType: string]: number } } = {};
-      const deviceTotals: { [device: string]: number } = {};
-      
-      records.forEach(record => {
-        const device = record.byDevice || '기타';
-        const failureType = record.failureType || '기타';
-        
-        if (!heatmapData[device]) {
-          heatmapData[device] = {};
-          deviceTotals[device] = 0;
-        }
-        
-        if (!heatmapData[device][failureType]) {
-          heatmapData[device][failureType] = 0;
-        }
-        
-        heatmapData[device][failureType]++;
-        deviceTotals[device]++;
-      });
-      
-      // Convert to array format for visualization
-      const result = Object.entries(heatmapData).map(([device, failureTypes]) => ({
-        device,
-        total: deviceTotals[device],
-        failureTypes: Object.entries(failureTypes).map(([type, count]) => ({
-          type,
-          count
-        }))
-      })).sort((a, b) => b.total - a.total);
-      
+      // Grouped by device type and failure type in SQL
+      const result = await storage.getFailureHeatmap(historyFilters(req.query));
       res.json(result);
     } catch (error) {
       console.error("Error fetching device failure heatmap:", error);
@@ -387,53 +419,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // Get failure type classification data
   app.get("/api/failure-type-classification", async (req, res) => {
     try {
-      const { craneName, factory, startDate, endDate } = req.query;
-      let records = await storage.getFailureRecords();
-      
-      // Filter by crane name if specified
-      if (craneName && craneName !== 'all') {
-        const cranes = await storage.getCranes();
-        const targetCranes = cranes.filter(c => c.craneName === craneName);
-        const craneIds = targetCranes.map(c => c.craneId);
-        records = records.filter(r => craneIds.includes(r.craneId));
-      }
-      
-      // Filter by factory if specified
-      if (factory && factory !== 'all') {
-        const cranes = await storage.getCranes();
-        const factoryCranes = cranes.filter(c => c.plantSection === factory);
-        const craneIds = factoryCranes.map(c => c.craneId);
-        records = records.filter(r => craneIds.includes(r.craneId));
-      }
-      
-      // Filter by date range if specified
-      if (startDate && endDate) {
-        records = records.filter(r => {
-          if (!r.date) return false;
-          const recordDate = new Date(r.date);
-          const start = new Date(startDate as string);
-          const end = new Date(endDate as string);
-          return recordDate >= start && recordDate <= end;
-        });
-      }
-      
-      // Group by failure type (from "type" column)
-      const typeGroups: { [type: string]: number } = {};
-      
-      records.forEach(record => {
-        // Use the failureType field which maps to the "type" column from FailureReport
-        const type = record.failureType || '기타';
-        typeGroups[type] = (typeGroups[type] || 0) + 1;
-      });
-      
-      // Convert to array format for bar chart visualization
-      const result = Object.entries(typeGroups)
-        .map(([type, count]) => ({
-          type,
-          count
-        }))
-        .sort((a, b) => b.count - a.count);
-      
+      // Grouped by failure type (from "type" column) in SQL
+      const result = await storage.getFailureTypeCounts(historyFilters(req.query));
       res.json(result);
     } catch (error) {
       console.error("Error fetching failure type classification:", error);
@@ -590,6 +577,51 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  // Get expected failure counts per crane for the next 30/90 days
+  app.get("/api/analytics/failure-forecasts", async (req, res) => {
+    try {
+      const forecasts = await storage.getFailureForecasts();
+      res.json(forecasts);
+    } catch (error) {
+      console.error("Error fetching failure forecasts:", error);
+      res.status(500).json({ message: "Failed to fetch failure forecasts" });
+    }
+  });
+
+  // Keyword search across failure and repair history
+  app.get("/api/search", async (req, res) => {
+    try {
+      const query = ((req.query.q as string) || "").trim();
+      if (!query) {
+        return res.status(400).json({ message: "Search query (q) is required" });
+      }
+      const limit = Math.min(parseInt(req.query.limit as string) || 50, 200);
+      const craneId = req.query.craneId as string | undefined;
+
+      const results = await storage.searchHistory(query, limit, craneId);
+      res.json(results);
+    } catch (error) {
+      console.error("Error searching history:", error);
+      res.status(500).json({ message: "Failed to search history" });
+    }
+  });
+
+  // Get inspections due in a date range (defaults to the next 7 days)
+  app.get("/api/inspections/upcoming", async (req, res) => {
+    try {
+      const today = new Date();
+      const weekLater = new Date(today.getTime() + 7 * 24 * 60 * 60 * 1000);
+      const startDate = (req.query.startDate as string) || today.toISOString().split('T')[0];
+      const endDate = (req.query.endDate as string) || weekLater.toISOString().split('T')[0];
+      
+      const inspections = await storage.getInspectionCalendar(startDate, endDate);
+      res.json(inspections);
+    } catch (error) {
+      console.error("Error fetching upcoming inspections:", error);
+      res.status(500).json({ message: "Failed to fetch upcoming inspections" });
+    }
+  });
+
   // Get recent 6 months maintenance stats
   app.get("/api/analytics/recent-maintenance-stats", async (req, res) => {
     try {
@@ -616,28 +648,12 @@ export async function registerRoutes(app: Express): Promise<Server> {
   app.get("/api/failure-records/factory/:factoryName", async (req, res) => {
     try {
       const { factoryName } = req.params;
-      const allCranes = await storage.getCranes();
-      const allFailureRecords = await storage.getFailureRecords();
-      
-      // Filter cranes by factory (plantSection)
-      const factoryCranes = allCranes.filter(crane => 
-        crane.plantSection === decodeURIComponent(factoryName)
-      );
-      
-      // Get all crane IDs for this factory
-      const factoryCraneIds = factoryCranes.map(crane => crane.craneId);
-      
-      // Filter failure records to only include those from factory cranes
-      const factoryFailureRecords = allFailureRecords.filter(record => 
-        factoryCraneIds.includes(record.craneId)
-      );
-      
-      // Sort by date descending (most recent first)
-      const sortedRecords = factoryFailureRecords.sort((a, b) => 
-        new Date(b.date).getTime() - new Date(a.date).getTime()
-      );
-      
-      res.json(sortedRecords);
+      const query = recordPageQuery(req.query);
+      if (typeof query === 'string') {
+        return res.status(400).json({ message: query });
+      }
+      // Same pages as /api/failure-records?factory=..., most recent first
+      sendPage(res, await storage.getFailureRecordPage({ ...query, factory: decodeURIComponent(factoryName) }), req.query.format);
     } catch (error) {
       console.error("Error fetching factory failure records:", error);
       res.status(500).json({ message: "Failed to fetch factory failure records" });
@@ -660,6 +676,16 @@ export async function registerRoutes(app: Express): Promise<Server> {
         });
       }
 
+      // Date range is applied in SQL (index range scan on crane_id, date) when both ends are given
+      const rangeStart = startDate && endDate ? String(startDate) : undefined;
+      const rangeEnd = startDate && endDate ? String(endDate) : undefined;
+
+      // One indexed lookup when crane_timeline.py has materialized the crane's row
+      const materialized = await storage.getCraneTimeline(String(craneName), factory ? String(factory) : undefined);
+      if (materialized) {
+        return res.json(timelineDetails(materialized.crane, materialized.timeline, rangeStart, rangeEnd));
+      }
+
       // Get crane details
       const cranes = await storage.getCranes();
       const crane = cranes.find(c => c.craneName === craneName && 
@@ -670,41 +696,37 @@ export async function registerRoutes(app: Express): Promise<Server> {
       }
 
       // Get maintenance records (daily repair)
-      const maintenanceRecords = await storage.getMaintenanceRecords();
-      let dailyRepairs = maintenanceRecords.filter(r => 
-        r.craneId === crane.craneId && 
-        (r.type === 'routine' || r.type === 'preventive' || r.type === 'inspection')
+      const maintenanceRecords = await storage.getMaintenanceRecordsByCraneId(crane.craneId);
+      const rangedMaintenance = rangeStart
+        ? await storage.getMaintenanceRecordsByCraneId(crane.craneId, rangeStart, rangeEnd)
+        : maintenanceRecords;
+      const dailyRepairs = rangedMaintenance.filter(r =>
+        r.type === 'routine' || r.type === 'preventive' || r.type === 'inspection'
       );
 
       // Get failure records (emergency repair)
-      const failureRecords = await storage.getFailureRecords();
-      let emergencyRepairs = failureRecords.filter(r => r.craneId === crane.craneId);
+      const emergencyRepairs = await storage.getFailureRecordsByCraneId(crane.craneId, rangeStart, rangeEnd);
 
-      // Apply date filtering if provided
-      if (startDate && endDate) {
-        dailyRepairs = dailyRepairs.filter(r => r.date >= startDate && r.date <= endDate);
-        emergencyRepairs = emergencyRepairs.filter(r => r.date >= startDate && r.date <= endDate);
-      }
-
-      // Calculate last maintenance date and next inspection
+      // Calculate last maintenance date and next inspection; dates are ISO 'YYYY-MM-DD' strings
       const sortedMaintenance = maintenanceRecords
-        .filter(r => r.craneId === crane.craneId && r.status === 'completed')
-        .sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime());
+        .filter(r => r.status === 'completed')
+        .sort((a, b) => b.date.localeCompare(a.date));
 
       const lastMaintenanceDate = sortedMaintenance.length > 0 ? sortedMaintenance[0].date : null;
       
-      // Calculate next inspection (assuming 90-day cycle)
-      let nextInspectionDate = null;
+      // Next inspection comes from the materialized schedule (inspection_scheduler.py);
+      // without it, fall back to the crane's own InspectionCycle (90 days if unknown)
+      let nextInspectionDate: string | null = crane.nextMaintenanceDate || null;
       let daysUntilInspection = 0;
       
-      if (lastMaintenanceDate) {
-        const lastDate = new Date(lastMaintenanceDate);
-        const nextDate = new Date(lastDate);
-        nextDate.setDate(nextDate.getDate() + 90);
+      if (!nextInspectionDate && lastMaintenanceDate) {
+        const nextDate = new Date(lastMaintenanceDate);
+        nextDate.setDate(nextDate.getDate() + (crane.inspectionCycle || 90));
         nextInspectionDate = nextDate.toISOString().split('T')[0];
-        
-        const today = new Date();
-        const diffTime = nextDate.getTime() - today.getTime();
+      }
+      
+      if (nextInspectionDate) {
+        const diffTime = new Date(nextInspectionDate).getTime() - new Date().getTime();
         daysUntilInspection = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
       }
 
@@ -836,6 +858,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
         }
       }
 
+      if (updatedCount > 0) noteLocalChange();
+
       res.json({
         message: `${updatedCount}개 크레인의 사양 정보가 업데이트되었습니다.`,
         updatedCount,
@@ -897,6 +921,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       
       // Sync to storage
       await storage.syncDataFromSheets(cranesData, failureData, maintenanceData);
+      noteLocalChange();
       
       res.json({ message: "Data synced successfully" });
     } catch (error) {
@@ -932,6 +957,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       ]);
       
       await storage.syncDataFromSheets(refreshCranesData, refreshFailureData, refreshMaintenanceData);
+      noteLocalChange();
       
       res.json({ 
         message: "데이터가 성공적으로 새로고침되었습니다",
@@ -1002,6 +1028,10 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  app.get('/api/cache/stats', (req, res) => {
+    res.json(cache.stats());
+  });
+
   app.get('/api/cache/force-sync', async (req, res) => {
     try {
       const { backgroundSync } = await import('./background-sync');
@@ -1016,30 +1046,32 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // AI Dashboard Analysis endpoint
   app.post("/api/ai/analyze-dashboard", async (req, res) => {
     try {
-      const { dashboardSummary, systemOverview, maintenanceStats, failureCauses } = req.body;
+      const { dashboardSummary, systemOverview, maintenanceStats, failureCauses, factory } = req.body;
       
-      const apiKey = process.env.OPENAI_API_KEY2;
-      if (!apiKey) {
+      if (!aiConfigured()) {
         return res.status(500).json({ 
           message: "OpenAI API 키가 설정되지 않았습니다." 
         });
       }
 
-      const openai = new OpenAI({ apiKey });
-
-      // Prepare data for analysis
-      const analysisData = {
-        대시보드_요약: dashboardSummary,
-        시스템_현황: systemOverview,
-        정비_통계: maintenanceStats,
-        고장_원인_분포: failureCauses
-      };
+      // The precomputed digest while it is current; the dashboard data sent by the client is the fallback
+      const startedAt = Date.now();
+      const plantSection = factory && factory !== 'all' ? String(factory) : undefined;
+      const digest = await currentDigest(plantSection ? 'factory' : 'fleet', plantSection || 'all');
+      const analysisData = digest
+        ? `${DIGEST_LEGEND}\n${JSON.stringify(digest.digest)}`
+        : JSON.stringify({
+            대시보드_요약: dashboardSummary,
+            시스템_현황: systemOverview,
+            정비_통계: maintenanceStats,
+            고장_원인_분포: failureCauses
+          }, null, 2);
 
       const prompt = `당신은 산업 현장의 스마트 유지보수 시스템 'PoCrane'에서 특정 크레인의 데이터를 분석하는 AI입니다.
 
 다음과 같은 한 개 크레인(예: ML04 크레인)의 대시보드 데이터를 기반으로 유지보수 요약 보고서를 작성해주세요.
 
-${JSON.stringify(analysisData, null, 2)}
+${analysisData}
 
 📌 포함할 항목:
 
@@ -1070,25 +1102,16 @@ ${JSON.stringify(analysisData, null, 2)}
 📌 고장 요약  
 최근 한 달간 ML04 크레인에서는 총 3건의 고장이 발생했으며, 평균 조치 소요 시간은 5.2시간으로 확인됩니다. 고장 중 2건은 전기모터 과열로 인한 것이었습니다.`;
 
-      const response = await openai.chat.completions.create({
-        model: "gpt-4o", // the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
-        messages: [
-          {
-            role: "system",
-            content: "당신은 산업 현장의 스마트 유지보수 시스템 'PoCrane'의 데이터 분석 AI입니다. 실시간 데이터를 분석하여 관리자 회의에서 바로 활용 가능한 전문적인 보고서를 작성합니다."
-          },
-          {
-            role: "user",
-            content: prompt
-          }
-        ],
-        max_tokens: 2000,
-        temperature: 0.7
-      });
+      const context = contextInfo(digest, prompt, startedAt);
+      console.log(`[AI] analyze-dashboard: ${context.source} context, ${context.promptChars} chars in ${context.assemblyMs}ms`);
 
-      const summary = response.choices[0].message.content;
+      const summary = await generateReport({
+        system: "당신은 산업 현장의 스마트 유지보수 시스템 'PoCrane'의 데이터 분석 AI입니다. 실시간 데이터를 분석하여 관리자 회의에서 바로 활용 가능한 전문적인 보고서를 작성합니다.",
+        prompt,
+        maxTokens: 2000
+      });
 
-      res.json({ summary });
+      res.json({ summary, context });
     } catch (error) {
       console.error("Error generating AI analysis:", error);
       
@@ -1143,66 +1166,25 @@ ${JSON.stringify(analysisData, null, 2)}
         });
       }
 
-      const apiKey = process.env.OPENAI_API_KEY2;
-      if (!apiKey) {
+      if (!aiConfigured()) {
         return res.status(500).json({ 
           message: "OpenAI API 키가 설정되지 않았습니다." 
         });
       }
 
-      const openai = new OpenAI({ apiKey });
-
-      // Get crane data
-      const crane = await storage.getCraneByCraneId(craneId);
-      if (!crane) {
+      // The crane's precomputed digest while it is current, otherwise its records
+      const startedAt = Date.now();
+      const digest = await currentDigest('crane', craneId);
+      const assembled = digest ? undefined : await assembleCraneContext(craneId);
+      if (!digest && !assembled) {
         return res.status(404).json({ 
           message: "크레인을 찾을 수 없습니다." 
         });
       }
+      const plantSection = digest ? digest.digest.crane?.factory ?? null : assembled!.plantSection;
+      const craneContext = digest ? `${DIGEST_LEGEND}\n${JSON.stringify(digest.digest)}` : assembled!.context;
 
-      // Get failure and maintenance records for this crane
-      const failureRecords = await storage.getFailureRecordsByCraneId(craneId);
-      const maintenanceRecords = await storage.getMaintenanceRecordsByCraneId(craneId);
-
-      // Prepare crane data for analysis
-      const craneData = {
-        기본정보: {
-          크레인명: crane.craneName,
-          설비코드: crane.craneId,
-          공장: crane.plantSection,
-          위치: crane.location,
-          모델: crane.model,
-          등급: crane.grade,
-          운전방식: crane.driveType,
-          유무인운전: crane.unmannedOperation,
-          전기담당자: crane.electricalManager,
-          기계담당자: crane.mechanicalManager,
-          상태: crane.status
-        },
-        고장이력: failureRecords.map(f => ({
-          날짜: f.date,
-          고장유형: f.failureType,
-          설명: f.description,
-          심각도: f.severity,
-          중단시간: f.downtime,
-          원인: f.cause,
-          부위: f.byDevice,
-          작업시간: f.worktime
-        })),
-        수리이력: maintenanceRecords.map(m => ({
-          날짜: m.actualStartDateTime || m.date,
-          작업종류: m.type,
-          작업명: m.taskName,
-          상태: m.status,
-          작업자수: m.totalWorkers,
-          작업시간: m.totalWorkTime,
-          작업지시서: m.workOrder,
-          설비명: m.equipmentName,
-          지역명: m.areaName
-        }))
-      };
-
-      const prompt = `당신은 산업 장비 유지보수 전문가입니다. 아래는 [${crane.plantSection}] 공장의 [${craneId}] 크레인에 대한 상세 이력 데이터입니다. 이 데이터를 바탕으로 다음 항목을 포함한 요약 보고서를 작성하세요:
+      const prompt = `당신은 산업 장비 유지보수 전문가입니다. 아래는 [${plantSection}] 공장의 [${craneId}] 크레인에 대한 상세 이력 데이터입니다. 이 데이터를 바탕으로 다음 항목을 포함한 요약 보고서를 작성하세요:
 
 **크레인의 기본 정보**
 - 크레인 명칭
@@ -1226,27 +1208,18 @@ ${JSON.stringify(analysisData, null, 2)}
 
 해당 크레인의 데이터는 다음과 같습니다:
 
-${JSON.stringify(craneData, null, 2)}`;
-
-      const response = await openai.chat.completions.create({
-        model: "gpt-4o", // the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
-        messages: [
-          {
-            role: "system",
-            content: "당신은 산업 장비 유지보수 전문가입니다. 크레인 데이터를 분석하여 실용적이고 통찰력 있는 보고서를 작성합니다."
-          },
-          {
-            role: "user",
-            content: prompt
-          }
-        ],
-        max_tokens: 2500,
-        temperature: 0.7
-      });
+${craneContext}`;
+
+      const context = contextInfo(digest, prompt, startedAt);
+      console.log(`[AI] crane-summary ${craneId}: ${context.source} context, ${context.promptChars} chars in ${context.assemblyMs}ms`);
 
-      const summary = response.choices[0].message.content;
+      const summary = await generateReport({
+        system: "당신은 산업 장비 유지보수 전문가입니다. 크레인 데이터를 분석하여 실용적이고 통찰력 있는 보고서를 작성합니다.",
+        prompt,
+        maxTokens: 2500
+      });
 
-      res.json({ summary });
+      res.json({ summary, context });
     } catch (error) {
       console.error("Error generating crane summary:", error);
       res.status(500).json({ 
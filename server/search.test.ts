@@ -0,0 +1,21 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { likePattern, toTsQuery } from "./search";
+
+// Same cases as tests/test_history_search_index.py, so the two tokenizers cannot drift apart
+test("Hangul runs become exact bigrams and words become prefixes", () => {
+  assert.equal(toTsQuery("라이닝 mot"), "라이 & 이닝 & mot:*");
+  assert.equal(toTsQuery("브레이크라이닝"), "브레 & 레이 & 이크 & 크라 & 라이 & 이닝");
+});
+
+test("lone syllables match as prefixes and repeated tokens appear once", () => {
+  assert.equal(toTsQuery("과 Motor motor 12"), "과:* & motor:* & 12:*");
+});
+
+test("punctuation-only queries produce no tsquery", () => {
+  assert.equal(toTsQuery("!!"), "");
+});
+
+test("LIKE wildcards and backslashes are escaped", () => {
+  assert.equal(likePattern(" 50%_a\\b "), "%50\\%\\_a\\\\b%");
+});
@@ -0,0 +1,33 @@
+// Query-side twin of ngram_tokens()/to_tsquery() in history_search_index.py;
+// the two must tokenize identically or indexed bigrams will not match.
+const TOKEN_RUN = /[가-힣]+|[0-9a-z]+/g;
+const NGRAM = 2;
+// Shortest query the trigram index can serve as an ILIKE fallback (SUBSTRING_MIN there)
+export const SUBSTRING_MIN = 3;
+
+function isHangul(ch: string): boolean {
+  return ch >= "가" && ch <= "힣";
+}
+
+export function toTsQuery(query: string): string {
+  const tokens = new Set<string>();
+  for (const run of query.toLowerCase().match(TOKEN_RUN) ?? []) {
+    if (isHangul(run[0]) && run.length > NGRAM) {
+      for (let i = 0; i + NGRAM <= run.length; i++) {
+        tokens.add(run.slice(i, i + NGRAM));
+      }
+    } else {
+      tokens.add(run);
+    }
+  }
+
+  // Words and lone syllables match as prefixes; Hangul bigrams match exactly
+  return Array.from(tokens)
+    .map((token) => (!isHangul(token[0]) || token.length < NGRAM ? `${token}:*` : token))
+    .join(" & ");
+}
+
+// ILIKE pattern matching the query anywhere in the body, with LIKE wildcards escaped
+export function likePattern(query: string): string {
+  return `%${query.trim().replace(/[\\%_]/g, (ch) => `\\${ch}`)}%`;
+}
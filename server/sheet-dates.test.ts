@@ -0,0 +1,35 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { sheetDate, sheetTimestamp } from "./sheet-dates";
+
+// Same cases as test_parse_datetimes_formats in tests/test_workbook_normalize.py
+const CASES: [unknown, string | null][] = [
+  ["2024-01-31", "2024-01-31 00:00:00"],
+  ["2024-01-31 08:15:00", "2024-01-31 08:15:00"],
+  ["2024.01.31", "2024-01-31 00:00:00"],
+  ["2024. 1. 5", "2024-01-05 00:00:00"],
+  ["2024. 01. 31. 08:30", "2024-01-31 08:30:00"],
+  ["2024/1/5", "2024-01-05 00:00:00"],
+  ["20240131", "2024-01-31 00:00:00"],
+  ["2024년 1월 31일", "2024-01-31 00:00:00"],
+  ["45322", "2024-01-31 00:00:00"],
+  ["45322.5", "2024-01-31 12:00:00"],
+  ["2024-01-31T00:00:00Z", "2024-01-31 09:00:00"],
+  ["2024-01-31 23:30:00-05:00", "2024-02-01 13:30:00"],
+  ["2024-02-30", null],
+  ["nan", null],
+  ["", null],
+  [null, null],
+];
+
+for (const [value, expected] of CASES) {
+  test(`sheet value ${JSON.stringify(value)}`, () => {
+    assert.equal(sheetTimestamp(value), expected === null ? null : `${expected}+09:00`);
+    assert.equal(sheetDate(value), expected === null ? null : expected.slice(0, 10));
+  });
+}
+
+test("Date objects are read in plant time", () => {
+  assert.equal(sheetTimestamp(new Date("2024-01-31T15:00:00Z")), "2024-02-01 00:00:00+09:00");
+  assert.equal(sheetDate(new Date("invalid")), null);
+});
@@ -0,0 +1,82 @@
+// Server twin of parse_datetimes() in workbook_normalize.py; both must accept the same
+// sheet date formats or a sync through the server loses rows a Python load keeps.
+// Besides ISO strings: '2024.01.31', '2024. 1. 31.', '2024/01/31', '20240131', '2024년 1월 31일',
+// Excel serial day numbers, and timestamps with a UTC offset (converted to plant time).
+// Naive timestamps in the sheets and the database are plant-local time.
+const PLANT_OFFSET_MINUTES = 9 * 60; // Asia/Seoul, no daylight saving
+const PLANT_OFFSET = "+09:00";
+const EXCEL_EPOCH = Date.UTC(1899, 11, 30);
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+const KOREAN_DATE = /^(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일?/;
+const DOTTED_DATE = /^(\d{4})\s*[./]\s*(\d{1,2})\s*[./]\s*(\d{1,2})\.?/;
+const COMPACT_DATE = /^(\d{4})(\d{2})(\d{2})$/;
+const EXCEL_SERIAL = /^\d{5}(?:\.\d+)?$/;
+const ISO_DATE_TIME =
+  /^(\d{4})-(\d{1,2})-(\d{1,2})(?:[T\s]+(\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?\s*(Z|[+-]\d{2}(?::?\d{2})?)?$/i;
+const MISSING = new Set(["", "nan", "NaN", "None"]);
+
+export interface SheetDateTime {
+  date: string; // plant-local 'YYYY-MM-DD'
+  time: string; // plant-local 'HH:MM:SS'
+}
+
+const pad = (value: number, width = 2) => String(value).padStart(width, "0");
+
+// Wall-clock parts of a UTC-based millisecond value
+function fromWallClock(ms: number): SheetDateTime {
+  const d = new Date(ms);
+  return {
+    date: `${pad(d.getUTCFullYear(), 4)}-${pad(d.getUTCMonth() + 1)}-${pad(d.getUTCDate())}`,
+    time: `${pad(d.getUTCHours())}:${pad(d.getUTCMinutes())}:${pad(d.getUTCSeconds())}`,
+  };
+}
+
+function offsetMinutes(offset: string): number {
+  if (offset.toUpperCase() === "Z") return 0;
+  const sign = offset[0] === "-" ? -1 : 1;
+  const digits = offset.slice(1).replace(":", "");
+  return sign * (parseInt(digits.slice(0, 2), 10) * 60 + parseInt(digits.slice(2) || "0", 10));
+}
+
+// Plant-local date and time of a sheet value; null where it cannot be parsed
+export function parseSheetDateTime(value: unknown): SheetDateTime | null {
+  if (value === null || value === undefined) return null;
+  if (value instanceof Date) {
+    return isNaN(value.getTime()) ? null : fromWallClock(value.getTime() + PLANT_OFFSET_MINUTES * 60000);
+  }
+
+  let text = String(value).trim();
+  if (MISSING.has(text)) return null;
+  text = text
+    .replace(KOREAN_DATE, "$1-$2-$3")
+    .replace(DOTTED_DATE, "$1-$2-$3")
+    .replace(COMPACT_DATE, "$1-$2-$3");
+
+  if (EXCEL_SERIAL.test(text)) {
+    return fromWallClock(Math.round(EXCEL_EPOCH + parseFloat(text) * DAY_MS));
+  }
+
+  const match = ISO_DATE_TIME.exec(text);
+  if (!match) return null;
+  const [, year, month, day, hour = "0", minute = "0", second = "0", offset] = match;
+  const parts = [year, month, day, hour, minute, second].map((part) => parseInt(part, 10));
+  const wallClock = Date.UTC(parts[0], parts[1] - 1, parts[2], parts[3], parts[4], parts[5]);
+  // Date.UTC rolls 2024-02-30 over into March; the sheet value was simply wrong
+  const check = new Date(wallClock);
+  if (check.getUTCMonth() !== parts[1] - 1 || check.getUTCDate() !== parts[2] || parts[3] > 23 || parts[4] > 59 || parts[5] > 59) {
+    return null;
+  }
+  return fromWallClock(offset ? wallClock + (PLANT_OFFSET_MINUTES - offsetMinutes(offset)) * 60000 : wallClock);
+}
+
+// Value for a date column, or null
+export function sheetDate(value: unknown): string | null {
+  return parseSheetDateTime(value)?.date ?? null;
+}
+
+// Value for a timestamptz column (plant time, offset spelled out), or null
+export function sheetTimestamp(value: unknown): string | null {
+  const parsed = parseSheetDateTime(value);
+  return parsed ? `${parsed.date} ${parsed.time}${PLANT_OFFSET}` : null;
+}
@@ -3,6 +3,12 @@ import {
   failureRecords,
   maintenanceRecords, 
   alerts,
+  inspectionCalendar,
+  failureForecasts,
+  historySearch,
+  dataVersions,
+  craneTimelines,
+  aiDigests,
   type Crane, 
   type InsertCrane,
   type FailureRecord,
@@ -17,11 +23,26 @@ import {
   type FactoryOverview,
   type SystemOverview,
   type CraneGradeStats,
-  type OperationTypeStats
+  type OperationTypeStats,
+  type InspectionCalendarEntry,
+  type FailureForecast,
+  type HistorySearchResult,
+  type HistoryFilters,
+  type DeviceFailureHeatmap,
+  type CraneFailureCount,
+  type CraneTimeline,
+  type RecordPageQuery,
+  type RecordPage,
+  type AiDigest
 } from "@shared/schema";
 import { db } from "./db";
-import { eq, and, isNotNull } from "drizzle-orm";
+import { eq, and, isNotNull, gt, gte, lte, asc, desc, inArray, ilike, sql, type SQL } from "drizzle-orm";
 import { cache } from "./cache";
+import { displayMonth, selected, toHeatmap } from "./analytics";
+import { pageOf, toPage } from "./record-pages";
+import { invalidateTables } from "./cache-warmup";
+import { SUBSTRING_MIN, likePattern, toTsQuery } from "./search";
+import { sheetDate, sheetTimestamp } from "./sheet-dates";
 
 export interface IStorage {
   // Crane operations
@@ -34,14 +55,16 @@ export interface IStorage {
   // Failure record operations
   getFailureRecords(): Promise<FailureRecord[]>;
   getFailureRecord(id: number): Promise<FailureRecord | undefined>;
-  getFailureRecordsByCraneId(craneId: string): Promise<FailureRecord[]>;
+  getFailureRecordsByCraneId(craneId: string, startDate?: string, endDate?: string): Promise<FailureRecord[]>;
   createFailureRecord(record: InsertFailureRecord): Promise<FailureRecord>;
+  getFailureRecordPage(query: RecordPageQuery): Promise<RecordPage<FailureRecord>>;
   
   // Maintenance record operations
   getMaintenanceRecords(): Promise<MaintenanceRecord[]>;
   getMaintenanceRecord(id: number): Promise<MaintenanceRecord | undefined>;
-  getMaintenanceRecordsByCraneId(craneId: string): Promise<MaintenanceRecord[]>;
+  getMaintenanceRecordsByCraneId(craneId: string, startDate?: string, endDate?: string): Promise<MaintenanceRecord[]>;
   createMaintenanceRecord(record: InsertMaintenanceRecord): Promise<MaintenanceRecord>;
+  getMaintenanceRecordPage(query: RecordPageQuery): Promise<RecordPage<MaintenanceRecord>>;
   
   // Alert operations
   getAlerts(): Promise<Alert[]>;
@@ -56,6 +79,9 @@ export interface IStorage {
   getMonthlyTrends(): Promise<MonthlyTrend[]>;
   getMonthlyFailureStats(craneId?: string, factory?: string): Promise<MonthlyTrend[]>;
   getMonthlyRepairTimeStats(craneId?: string, factory?: string): Promise<{ month: string; avgRepairTime: number }[]>;
+  getFailureHeatmap(filters: HistoryFilters): Promise<DeviceFailureHeatmap[]>;
+  getFailureTypeCounts(filters: HistoryFilters): Promise<MaintenanceStats[]>;
+  getCraneFailureCounts(): Promise<CraneFailureCount[]>;
   
   // Factory and crane filters
   getUniqueFactories(): Promise<string[]>;
@@ -76,6 +102,24 @@ export interface IStorage {
   
   // Failure cause distribution
   getFailureCauseDistribution(): Promise<{ cause: string; count: number; percentage: number }[]>;
+  
+  // Inspection calendar (materialized by inspection_scheduler.py)
+  getInspectionCalendar(startDate: string, endDate: string): Promise<InspectionCalendarEntry[]>;
+  
+  // Failure forecasts (written by failure_forecast.py)
+  getFailureForecasts(): Promise<FailureForecast[]>;
+  
+  // Per-crane detail rows (materialized by crane_timeline.py); factory narrows duplicate crane names
+  getCraneTimeline(craneName: string, factory?: string): Promise<{ crane: Crane; timeline: CraneTimeline } | undefined>;
+  
+  // Prompt context for the AI reports (precomputed by fleet_digest.py)
+  getAiDigest(scope: 'fleet' | 'factory' | 'crane', key: string): Promise<AiDigest | undefined>;
+  
+  // Keyword search over failure/repair history (indexed by history_search_index.py)
+  searchHistory(query: string, limit: number, craneId?: string): Promise<HistorySearchResult[]>;
+  
+  // Per-table change counters bumped by the ETL (etl_events.py)
+  getDataVersions(): Promise<Record<string, number>>;
 }
 
 export class MemStorage implements IStorage {
@@ -369,9 +413,10 @@ export class MemStorage implements IStorage {
     return this.failureRecords.get(id);
   }
 
-  async getFailureRecordsByCraneId(craneId: string): Promise<FailureRecord[]> {
+  async getFailureRecordsByCraneId(craneId: string, startDate?: string, endDate?: string): Promise<FailureRecord[]> {
     return Array.from(this.failureRecords.values())
-      .filter(record => record.craneId === craneId);
+      .filter(record => record.craneId === craneId &&
+        (!startDate || record.date >= startDate) && (!endDate || record.date <= endDate));
   }
 
   async createFailureRecord(insertRecord: InsertFailureRecord): Promise<FailureRecord> {
@@ -384,7 +429,11 @@ export class MemStorage implements IStorage {
       downtime: insertRecord.downtime || null,
       cause: insertRecord.cause || null,
       reportedBy: insertRecord.reportedBy || null,
-      byDevice: insertRecord.byDevice || null
+      byDevice: insertRecord.byDevice || null,
+      byDeviceInferred: insertRecord.byDeviceInferred || null,
+      byDeviceConfidence: insertRecord.byDeviceConfidence ?? null,
+      failureTypeInferred: insertRecord.failureTypeInferred || null,
+      failureTypeConfidence: insertRecord.failureTypeConfidence ?? null,
     };
     this.failureRecords.set(id, record);
     return record;
@@ -398,9 +447,10 @@ export class MemStorage implements IStorage {
     return this.maintenanceRecords.get(id);
   }
 
-  async getMaintenanceRecordsByCraneId(craneId: string): Promise<MaintenanceRecord[]> {
+  async getMaintenanceRecordsByCraneId(craneId: string, startDate?: string, endDate?: string): Promise<MaintenanceRecord[]> {
     return Array.from(this.maintenanceRecords.values())
-      .filter(record => record.craneId === craneId);
+      .filter(record => record.craneId === craneId &&
+        (!startDate || record.date >= startDate) && (!endDate || record.date <= endDate));
   }
 
   async createMaintenanceRecord(insertRecord: InsertMaintenanceRecord): Promise<MaintenanceRecord> {
@@ -438,7 +488,8 @@ export class MemStorage implements IStorage {
     const alert: Alert = { 
       ...insertAlert, 
       id,
-      isActive: insertAlert.isActive !== undefined ? insertAlert.isActive : true
+      isActive: insertAlert.isActive !== undefined ? insertAlert.isActive : true,
+      dedupeKey: insertAlert.dedupeKey ?? null,
     };
     this.alerts.set(id, alert);
     return alert;
@@ -599,6 +650,80 @@ export class MemStorage implements IStorage {
       });
   }
 
+  async getFailureHeatmap(filters: HistoryFilters): Promise<DeviceFailureHeatmap[]> {
+    const heatmap = new Map<string, Map<string, number>>();
+    this.filterFailureRecords(filters).forEach(record => {
+      const device = record.byDevice || '기타';
+      const failureType = record.failureType || '기타';
+      const types = heatmap.get(device) || new Map<string, number>();
+      types.set(failureType, (types.get(failureType) || 0) + 1);
+      heatmap.set(device, types);
+    });
+    return toHeatmap(Array.from(heatmap.entries()).flatMap(([device, types]) =>
+      Array.from(types.entries()).map(([failureType, count]) => ({ device, failureType, count }))
+    ));
+  }
+
+  async getFailureTypeCounts(filters: HistoryFilters): Promise<MaintenanceStats[]> {
+    const counts = new Map<string, number>();
+    this.filterFailureRecords(filters).forEach(record => {
+      const type = record.failureType || '기타';
+      counts.set(type, (counts.get(type) || 0) + 1);
+    });
+    return Array.from(counts.entries())
+      .map(([type, count]) => ({ type, count }))
+      .sort((a, b) => b.count - a.count);
+  }
+
+  async getCraneFailureCounts(): Promise<CraneFailureCount[]> {
+    const records = Array.from(this.failureRecords.values());
+    return Array.from(this.cranes.values())
+      .map(crane => {
+        const failureCount = records.filter(record => record.craneId === crane.craneId).length;
+        return {
+          craneId: crane.craneId,
+          craneName: crane.craneName,
+          plantSection: crane.plantSection,
+          failureCount,
+          hasData: failureCount > 0
+        };
+      })
+      .filter(crane => crane.hasData)
+      .sort((a, b) => b.failureCount - a.failureCount);
+  }
+
+  async getFailureRecordPage(query: RecordPageQuery): Promise<RecordPage<FailureRecord>> {
+    const byDevice = selected(query.byDevice);
+    const type = selected(query.type);
+    return pageOf(this.filterFailureRecords(query).filter(record =>
+      (!byDevice || record.byDevice === byDevice) && (!type || record.failureType === type)
+    ), query);
+  }
+
+  async getMaintenanceRecordPage(query: RecordPageQuery): Promise<RecordPage<MaintenanceRecord>> {
+    const type = selected(query.type);
+    return pageOf(this.filterRecords(Array.from(this.maintenanceRecords.values()), query)
+      .filter(record => !type || record.type === type), query);
+  }
+
+  private filterFailureRecords(filters: HistoryFilters): FailureRecord[] {
+    return this.filterRecords(Array.from(this.failureRecords.values()), filters);
+  }
+
+  private filterRecords<T extends { craneId: string; date: string }>(records: T[], filters: HistoryFilters): T[] {
+    const craneName = selected(filters.craneName);
+    const factory = selected(filters.factory);
+    const craneId = selected(filters.craneId);
+    const cranesList = Array.from(this.cranes.values());
+    return records.filter(record =>
+      (!craneId || record.craneId === craneId) &&
+      (!craneName || cranesList.some(c => c.craneId === record.craneId && c.craneName === craneName)) &&
+      (!factory || cranesList.some(c => c.craneId === record.craneId && c.plantSection === factory)) &&
+      (!filters.startDate || record.date >= filters.startDate) &&
+      (!filters.endDate || record.date <= filters.endDate)
+    );
+  }
+
   async getCranesByFactoryAndName(factory?: string, craneName?: string): Promise<Crane[]> {
     let cranes = Array.from(this.cranes.values());
     
@@ -911,18 +1036,84 @@ export class MemStorage implements IStorage {
       }))
       .sort((a, b) => b.count - a.count);
   }
+
+  async getInspectionCalendar(startDate: string, endDate: string): Promise<InspectionCalendarEntry[]> {
+    // The calendar is only materialized in PostgreSQL
+    return [];
+  }
+
+  async getFailureForecasts(): Promise<FailureForecast[]> {
+    // Forecasts are only written to PostgreSQL
+    return [];
+  }
+
+  async getCraneTimeline(craneName: string, factory?: string): Promise<{ crane: Crane; timeline: CraneTimeline } | undefined> {
+    // Timelines are only materialized in PostgreSQL; the route computes the details itself
+    return undefined;
+  }
+
+  async getAiDigest(scope: 'fleet' | 'factory' | 'crane', key: string): Promise<AiDigest | undefined> {
+    // Digests are only precomputed in PostgreSQL; the AI routes assemble their context themselves
+    return undefined;
+  }
+
+  async searchHistory(query: string, limit: number, craneId?: string): Promise<HistorySearchResult[]> {
+    // The search index only exists in PostgreSQL
+    return [];
+  }
+
+  async getDataVersions(): Promise<Record<string, number>> {
+    // Nothing outside the server changes the in-memory data
+    return {};
+  }
+}
+
+// Empty a table the Python ETL materializes from the replaced data; it may not have been created yet
+async function clearMaterialized(table: typeof craneTimelines | typeof aiDigests) {
+  try {
+    await db.delete(table);
+  } catch (error: any) {
+    if (error?.code !== '42P01') throw error;
+  }
 }
 
+// WHERE conditions for the history filters; crane name and factory are matched through the cranes table
+function historyConditions(table: typeof failureRecords | typeof maintenanceRecords, filters: HistoryFilters): SQL[] {
+  const conditions: SQL[] = [];
+  const craneId = selected(filters.craneId);
+  const craneName = selected(filters.craneName);
+  const factory = selected(filters.factory);
+  if (craneId) conditions.push(eq(table.craneId, craneId));
+  if (craneName) {
+    conditions.push(inArray(table.craneId, db.select({ craneId: cranes.craneId }).from(cranes).where(eq(cranes.craneName, craneName))));
+  }
+  if (factory) {
+    conditions.push(inArray(table.craneId, db.select({ craneId: cranes.craneId }).from(cranes).where(eq(cranes.plantSection, factory))));
+  }
+  // Date ranges prune to the monthly partitions they cover
+  if (filters.startDate) conditions.push(gte(table.date, filters.startDate));
+  if (filters.endDate) conditions.push(lte(table.date, filters.endDate));
+  return conditions;
+}
+
+// History conditions plus the keyset position: rows strictly before the cursor in (date, id) order
+function pageConditions(table: typeof failureRecords | typeof maintenanceRecords, query: RecordPageQuery): SQL[] {
+  const conditions = historyConditions(table, query);
+  if (query.after) conditions.push(sql`(${table.date}, ${table.id}) < (${query.after.date}::date, ${query.after.id})`);
+  return conditions;
+}
+
+// 'YYYY-MM' bucket of a history date, for GROUP BY
+function monthOf(column: typeof failureRecords.date | typeof maintenanceRecords.date) {
+  return sql<string>`to_char(date_trunc('month', ${column}), 'YYYY-MM')`;
+}
+
+const unmannedCondition = sql`${cranes.unmannedOperation} in ('무인', 'Y')`;
+
 // DatabaseStorage implementation
 export class DatabaseStorage implements IStorage {
   async getCranes(): Promise<Crane[]> {
-    const cacheKey = 'cranes:all';
-    const cached = cache.get<Crane[]>(cacheKey);
-    if (cached) return cached;
-
-    const result = await db.select().from(cranes);
-    cache.set(cacheKey, result, 2 * 60 * 1000); // Cache for 2 minutes
-    return result;
+    return cache.getOrLoad('cranes:all', () => db.select().from(cranes), 2 * 60 * 1000); // Cache for 2 minutes
   }
 
   async getCrane(id: number): Promise<Crane | undefined> {
@@ -953,13 +1144,7 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getFailureRecords(): Promise<FailureRecord[]> {
-    const cacheKey = 'failure-records:all';
-    const cached = cache.get<FailureRecord[]>(cacheKey);
-    if (cached) return cached;
-
-    const result = await db.select().from(failureRecords);
-    cache.set(cacheKey, result, 3 * 60 * 1000); // Cache for 3 minutes
-    return result;
+    return cache.getOrLoad('failure-records:all', () => db.select().from(failureRecords), 3 * 60 * 1000); // Cache for 3 minutes
   }
 
   async getFailureRecord(id: number): Promise<FailureRecord | undefined> {
@@ -967,8 +1152,12 @@ export class DatabaseStorage implements IStorage {
     return record || undefined;
   }
 
-  async getFailureRecordsByCraneId(craneId: string): Promise<FailureRecord[]> {
-    return await db.select().from(failureRecords).where(eq(failureRecords.craneId, craneId));
+  async getFailureRecordsByCraneId(craneId: string, startDate?: string, endDate?: string): Promise<FailureRecord[]> {
+    // Range scan on failure_records_crane_id_date_idx
+    const conditions = [eq(failureRecords.craneId, craneId)];
+    if (startDate) conditions.push(gte(failureRecords.date, startDate));
+    if (endDate) conditions.push(lte(failureRecords.date, endDate));
+    return await db.select().from(failureRecords).where(and(...conditions));
   }
 
   async createFailureRecord(insertRecord: InsertFailureRecord): Promise<FailureRecord> {
@@ -988,8 +1177,41 @@ export class DatabaseStorage implements IStorage {
     return record || undefined;
   }
 
-  async getMaintenanceRecordsByCraneId(craneId: string): Promise<MaintenanceRecord[]> {
-    return await db.select().from(maintenanceRecords).where(eq(maintenanceRecords.craneId, craneId));
+  async getMaintenanceRecordsByCraneId(craneId: string, startDate?: string, endDate?: string): Promise<MaintenanceRecord[]> {
+    // Range scan on maintenance_records_crane_id_date_idx
+    const conditions = [eq(maintenanceRecords.craneId, craneId)];
+    if (startDate) conditions.push(gte(maintenanceRecords.date, startDate));
+    if (endDate) conditions.push(lte(maintenanceRecords.date, endDate));
+    return await db.select().from(maintenanceRecords).where(and(...conditions));
+  }
+
+  async getFailureRecordPage(query: RecordPageQuery): Promise<RecordPage<FailureRecord>> {
+    const conditions = pageConditions(failureRecords, query);
+    const byDevice = selected(query.byDevice);
+    const type = selected(query.type);
+    if (byDevice) conditions.push(eq(failureRecords.byDevice, byDevice));
+    if (type) conditions.push(eq(failureRecords.failureType, type));
+    // Backward scan of failure_records_date_id_idx (or the by_device one) that stops after one page
+    const rows = await db
+      .select()
+      .from(failureRecords)
+      .where(and(...conditions))
+      .orderBy(desc(failureRecords.date), desc(failureRecords.id))
+      .limit(query.limit + 1);
+    return toPage(rows, query.limit);
+  }
+
+  async getMaintenanceRecordPage(query: RecordPageQuery): Promise<RecordPage<MaintenanceRecord>> {
+    const conditions = pageConditions(maintenanceRecords, query);
+    const type = selected(query.type);
+    if (type) conditions.push(eq(maintenanceRecords.type, type));
+    const rows = await db
+      .select()
+      .from(maintenanceRecords)
+      .where(and(...conditions))
+      .orderBy(desc(maintenanceRecords.date), desc(maintenanceRecords.id))
+      .limit(query.limit + 1);
+    return toPage(rows, query.limit);
   }
 
   async createMaintenanceRecord(insertRecord: InsertMaintenanceRecord): Promise<MaintenanceRecord> {
@@ -1040,14 +1262,17 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getDashboardSummary(): Promise<DashboardSummary> {
-    const allCranes = await this.getCranes();
-    
-    return {
-      totalCranes: allCranes.length,
-      operatingCranes: allCranes.filter(c => c.status === 'operating').length,
-      maintenanceCranes: allCranes.filter(c => c.status === 'maintenance').length,
-      urgentCranes: allCranes.filter(c => c.status === 'urgent' || c.isUrgent).length,
-    };
+    // Rebuilt from cranes:all by the cache warmup whenever cranes change
+    return cache.getOrLoad('dashboard-summary', async () => {
+      const allCranes = await this.getCranes();
+
+      return {
+        totalCranes: allCranes.length,
+        operatingCranes: allCranes.filter(c => c.status === 'operating').length,
+        maintenanceCranes: allCranes.filter(c => c.status === 'maintenance').length,
+        urgentCranes: allCranes.filter(c => c.status === 'urgent' || c.isUrgent).length,
+      };
+    }, 2 * 60 * 1000);
   }
 
   async getMaintenanceStats(): Promise<MaintenanceStats[]> {
@@ -1118,104 +1343,89 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getMonthlyRepairTimeStats(craneId?: string, factory?: string): Promise<{ month: string; avgRepairTime: number }[]> {
-    let records = await this.getMaintenanceRecords();
-    
-    // Filter by crane if specified
-    if (craneId && craneId !== 'all') {
-      records = records.filter(record => record.craneId === craneId);
-    }
-    
-    // Filter by factory if specified
-    if (factory && factory !== 'all') {
-      const cranesList = await this.getCranes();
-      const factoryCranes = cranesList.filter(crane => crane.plantSection === factory);
-      const factoryCraneIds = factoryCranes.map(crane => crane.craneId);
-      records = records.filter(record => factoryCraneIds.includes(record.craneId));
-    }
-    
-    const monthlyData = new Map<string, { totalTime: number; count: number }>();
-    
-    records.forEach(record => {
-      // Only include records with valid totalWorkTime
-      if (record.totalWorkTime && record.totalWorkTime > 0) {
-        const date = new Date(record.date);
-        const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-        
-        const existing = monthlyData.get(monthKey) || { totalTime: 0, count: 0 };
-        existing.totalTime += record.totalWorkTime;
-        existing.count += 1;
-        monthlyData.set(monthKey, existing);
-      }
-    });
-    
-    // Calculate averages and format for display
-    return Array.from(monthlyData.entries())
-      .sort(([a], [b]) => a.localeCompare(b))
-      .map(([month, data]) => {
-        const [year, monthNum] = month.split('-');
-        const monthName = new Date(parseInt(year), parseInt(monthNum) - 1).toLocaleString('ko-KR', { month: 'short' });
-        return { 
-          month: `${year}년 ${monthName}`, 
-          avgRepairTime: Math.round((data.totalTime / data.count) * 10) / 10 
-        };
-      });
+    // One row per month; only records with a recorded work time count towards the average
+    const month = monthOf(maintenanceRecords.date);
+    const rows = await db
+      .select({ month, avgRepairTime: sql<number>`avg(${maintenanceRecords.totalWorkTime})`.mapWith(Number) })
+      .from(maintenanceRecords)
+      .where(and(...historyConditions(maintenanceRecords, { craneId, factory }), gt(maintenanceRecords.totalWorkTime, '0')))
+      .groupBy(month)
+      .orderBy(month);
+
+    return rows.map(row => ({
+      month: displayMonth(row.month),
+      avgRepairTime: Math.round(row.avgRepairTime * 10) / 10
+    }));
+  }
+
+  async getFailureHeatmap(filters: HistoryFilters): Promise<DeviceFailureHeatmap[]> {
+    const device = sql<string>`coalesce(nullif(${failureRecords.byDevice}, ''), '기타')`;
+    const failureType = sql<string>`coalesce(nullif(${failureRecords.failureType}, ''), '기타')`;
+    const buckets = await db
+      .select({ device, failureType, count: sql<number>`count(*)`.mapWith(Number) })
+      .from(failureRecords)
+      .where(and(...historyConditions(failureRecords, filters)))
+      .groupBy(device, failureType)
+      .orderBy(desc(sql`count(*)`));
+    return toHeatmap(buckets);
+  }
+
+  async getFailureTypeCounts(filters: HistoryFilters): Promise<MaintenanceStats[]> {
+    const type = sql<string>`coalesce(nullif(${failureRecords.failureType}, ''), '기타')`;
+    return await db
+      .select({ type, count: sql<number>`count(*)`.mapWith(Number) })
+      .from(failureRecords)
+      .where(and(...historyConditions(failureRecords, filters)))
+      .groupBy(type)
+      .orderBy(desc(sql`count(*)`));
+  }
+
+  async getCraneFailureCounts(): Promise<CraneFailureCount[]> {
+    // Counted per crane on the (crane_id, date) index, then joined to the crane list
+    const counts = db
+      .select({ craneId: failureRecords.craneId, failureCount: sql<number>`count(*)`.as('failure_count') })
+      .from(failureRecords)
+      .groupBy(failureRecords.craneId)
+      .as('counts');
+    const rows = await db
+      .select({
+        craneId: cranes.craneId,
+        craneName: cranes.craneName,
+        plantSection: cranes.plantSection,
+        failureCount: sql<number>`${counts.failureCount}`.mapWith(Number),
+      })
+      .from(cranes)
+      .innerJoin(counts, eq(counts.craneId, cranes.craneId))
+      .orderBy(desc(counts.failureCount));
+    return rows.map(row => ({ ...row, hasData: true }));
   }
 
   async getMonthlyFailureStats(craneId?: string, factory?: string): Promise<MonthlyTrend[]> {
-    let records = Array.from(this.failureRecords.values());
-    
-    // Filter by crane if specified
-    if (craneId && craneId !== 'all') {
-      records = records.filter(record => record.craneId === craneId);
-    }
-    
-    // Filter by factory if specified
-    if (factory && factory !== 'all') {
-      const cranesList = Array.from(this.cranes.values());
-      const factoryCranes = cranesList.filter(crane => crane.plantSection === factory);
-      const factoryCraneIds = factoryCranes.map(crane => crane.craneId);
-      records = records.filter(record => factoryCraneIds.includes(record.craneId));
-    }
-    
-    const trends = new Map<string, number>();
-    
-    records.forEach(record => {
-      const date = new Date(record.date);
-      const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-      const count = trends.get(monthKey) || 0;
-      trends.set(monthKey, count + 1);
-    });
-    
-    // Sort by month and format for display
-    return Array.from(trends.entries())
-      .sort(([a], [b]) => a.localeCompare(b))
-      .map(([month, count]) => {
-        const [year, monthNum] = month.split('-');
-        const monthName = new Date(parseInt(year), parseInt(monthNum) - 1).toLocaleString('ko-KR', { month: 'short' });
-        return { month: `${year}년 ${monthName}`, count };
-      });
+    const month = monthOf(failureRecords.date);
+    const rows = await db
+      .select({ month, count: sql<number>`count(*)`.mapWith(Number) })
+      .from(failureRecords)
+      .where(and(...historyConditions(failureRecords, { craneId, factory })))
+      .groupBy(month)
+      .orderBy(month);
+
+    return rows.map(row => ({ month: displayMonth(row.month), count: row.count }));
   }
 
   async getUniqueFactories(): Promise<string[]> {
-    const cacheKey = 'factories:unique';
-    const cached = cache.get<string[]>(cacheKey);
-    if (cached) return cached;
-
-    const result = await db.selectDistinct({ plantSection: cranes.plantSection }).from(cranes);
-    const factories = result.map(r => r.plantSection).filter((section): section is string => Boolean(section)).sort();
-    cache.set(cacheKey, factories, 5 * 60 * 1000); // Cache for 5 minutes
-    return factories;
+    return cache.getOrLoad('factories:unique', async () => {
+      const result = await db.selectDistinct({ plantSection: cranes.plantSection }).from(cranes);
+      const factories = result.map(r => r.plantSection).filter((section): section is string => Boolean(section)).sort();
+      return factories;
+    }, 5 * 60 * 1000); // Cache for 5 minutes
   }
 
   async getUniqueCraneNames(): Promise<string[]> {
-    const cacheKey = 'crane-names:unique';
-    const cached = cache.get<string[]>(cacheKey);
-    if (cached) return cached;
-
-    const result = await db.selectDistinct({ craneName: cranes.craneName }).from(cranes);
-    const craneNames = result.map(r => r.craneName).filter((name): name is string => Boolean(name)).sort();
-    cache.set(cacheKey, craneNames, 5 * 60 * 1000); // Cache for 5 minutes
-    return craneNames;
+    return cache.getOrLoad('crane-names:unique', async () => {
+      const result = await db.selectDistinct({ craneName: cranes.craneName }).from(cranes);
+      const craneNames = result.map(r => r.craneName).filter((name): name is string => Boolean(name)).sort();
+      return craneNames;
+    }, 5 * 60 * 1000); // Cache for 5 minutes
   }
 
   async getCranesByFactoryAndName(factory?: string, craneName?: string): Promise<Crane[]> {
@@ -1231,23 +1441,26 @@ export class DatabaseStorage implements IStorage {
   }
 
   async syncDataFromSheets(cranesData: any[], failureData: any[], maintenanceData: any[]): Promise<void> {
-    // Clear relevant cache entries before syncing
-    cache.delete('cranes:all');
-    cache.delete('failure-records:all');
-    cache.delete('maintenance-records:all');
-    cache.delete('factories:unique');
-    cache.delete('crane-names:unique');
+    // Clear every cache entry built from the three tables before syncing
+    invalidateTables(['cranes', 'failure_records', 'maintenance_records']);
     
     console.log('Syncing data from sheets...');
     console.log('Cranes data sample:', cranesData.slice(0, 2));
     console.log('Failure data sample:', failureData.slice(0, 2));
     console.log('Maintenance data sample:', maintenanceData.slice(0, 2));
     
+    // Rows dropped for a date the columns cannot take, or for an insert error; reported at the end
+    const rejected = { failureDates: 0, failureInserts: 0, maintenanceDates: 0, maintenanceInserts: 0 };
+
     // Clear existing data
     await db.delete(alerts);
     await db.delete(maintenanceRecords);
     await db.delete(failureRecords);
     await db.delete(cranes);
+    // The timelines describe the old rows; /api/crane-details computes from the records until crane_timeline.py runs
+    await clearMaterialized(craneTimelines);
+    // Likewise the AI digests; routes.ts only compares them with local changes made since this server started
+    await clearMaterialized(aiDigests);
     
     // Process cranes data - handle both EquipmentCode and crane_id field names
     for (const data of cranesData) {
@@ -1269,14 +1482,14 @@ export class DatabaseStorage implements IStorage {
           status: data.Status || data.status || 'operating',
           location: data.Location || data.location || '',
           model: data.Model || data.model || '',
-          lastMaintenanceDate: data.LastMaintenanceDate || data.last_maintenance_date || null,
-          nextMaintenanceDate: data.NextMaintenanceDate || data.next_maintenance_date || null,
+          lastMaintenanceDate: sheetDate(data.LastMaintenanceDate || data.last_maintenance_date),
+          nextMaintenanceDate: sheetDate(data.NextMaintenanceDate || data.next_maintenance_date),
           isUrgent: (data.IsUrgent || data.is_urgent) === 'true' || (data.IsUrgent || data.is_urgent) === true,
           grade: data.Grade || data.grade || null,
           driveType: data.DriveType || data.drive_type || data['운전방식'] || null,
           unmannedOperation: data.UnmannedOperation || data.unmanned_operation || data['유무인'] || null,
-          installationDate: data.InstallationDate || data.installation_date || null,
-          inspectionReferenceDate: data.InspectionReferenceDate || data.inspection_reference_date || null,
+          installationDate: sheetDate(data.InstallationDate || data.installation_date),
+          inspectionReferenceDate: sheetDate(data.InspectionReferenceDate || data.inspection_reference_date),
           inspectionCycle: data.InspectionCycle ? parseInt(data.InspectionCycle) : (data.inspection_cycle ? parseInt(data.inspection_cycle) : null),
           leadTime: data['LeadTime\n(Days)'] ? parseInt(data['LeadTime\n(Days)']) : (data.LeadTime ? parseInt(data.LeadTime) : (data.lead_time ? parseInt(data.lead_time) : null)),
         });
@@ -1301,10 +1514,17 @@ export class DatabaseStorage implements IStorage {
       
       if (equipmentCode && date) {
         console.log('Processing failure record:', equipmentCode, date);
+        // Same formats as the Python loaders accept (workbook_normalize.parse_datetimes)
+        const day = sheetDate(date);
+        if (!day) {
+          rejected.failureDates++;
+          console.warn(`Skipping failure record for ${equipmentCode}: unreadable date ${JSON.stringify(date)}`);
+          continue;
+        }
         try {
           await this.createFailureRecord({
             craneId: equipmentCode,
-            date: date,
+            date: day,
             failureType: type || mechanicalElectrical || 'mechanical',
             description: symptom || '',
             severity: 'medium',
@@ -1316,6 +1536,7 @@ export class DatabaseStorage implements IStorage {
             byDevice: byDevice || null,
           });
         } catch (error) {
+          rejected.failureInserts++;
           console.error(`Error creating failure record for ${equipmentCode}:`, error);
         }
       }
@@ -1342,10 +1563,16 @@ export class DatabaseStorage implements IStorage {
       
       if (equipmentCode && actualStartDateTime) {
         console.log('Processing maintenance record:', equipmentCode, actualStartDateTime);
+        const started = sheetTimestamp(actualStartDateTime);
+        if (!started) {
+          rejected.maintenanceDates++;
+          console.warn(`Skipping maintenance record for ${equipmentCode}: unreadable start ${JSON.stringify(actualStartDateTime)}`);
+          continue;
+        }
         try {
           await this.createMaintenanceRecord({
             craneId: equipmentCode,
-            date: actualStartDateTime,
+            date: started.slice(0, 10),
             type: 'repair',
             technician: '',
             status: 'completed',
@@ -1355,18 +1582,26 @@ export class DatabaseStorage implements IStorage {
             relatedFailureId: null,
             workOrder: workOrder || null,
             taskName: taskName || null,
-            actualStartDateTime: actualStartDateTime || null,
-            actualEndDateTime: actualEndDateTime || null,
+            actualStartDateTime: started,
+            actualEndDateTime: sheetTimestamp(actualEndDateTime) ?? undefined,
             totalWorkers: totalWorkers ? parseInt(totalWorkers) : null,
             totalWorkTime: totalWorkTime ? parseFloat(totalWorkTime) : null,
             areaName: areaName || null,
             equipmentName: equipmentName || null,
           });
         } catch (error) {
+          rejected.maintenanceInserts++;
           console.error(`Error creating maintenance record for ${equipmentCode}:`, error);
         }
       }
     }
+
+    if (Object.values(rejected).some(count => count > 0)) {
+      console.warn(`Sheet sync rejected ${rejected.failureDates + rejected.failureInserts} failure rows ` +
+        `(${rejected.failureDates} unreadable dates, ${rejected.failureInserts} insert errors) and ` +
+        `${rejected.maintenanceDates + rejected.maintenanceInserts} maintenance rows ` +
+        `(${rejected.maintenanceDates} unreadable dates, ${rejected.maintenanceInserts} insert errors)`);
+    }
     
     console.log('Data sync completed, generating alerts...');
     // Generate alerts based on data
@@ -1374,261 +1609,286 @@ export class DatabaseStorage implements IStorage {
   }
   
   async getFactoryOverview(): Promise<FactoryOverview[]> {
-    const cacheKey = 'factory-overview';
-    const cached = cache.get<FactoryOverview[]>(cacheKey);
-    if (cached) return cached;
-
-    const cranes = await this.getCranes();
-    const factoryMap = new Map<string, { total: number; manned: number; unmanned: number }>();
+    return cache.getOrLoad('factory-overview', async () => {
+      const cranes = await this.getCranes();
+      const factoryMap = new Map<string, { total: number; manned: number; unmanned: number }>();
     
-    cranes.forEach(crane => {
-      const factory = crane.plantSection || '미분류';
-      const existing = factoryMap.get(factory) || { total: 0, manned: 0, unmanned: 0 };
+      cranes.forEach(crane => {
+        const factory = crane.plantSection || '미분류';
+        const existing = factoryMap.get(factory) || { total: 0, manned: 0, unmanned: 0 };
       
-      existing.total += 1;
-      if (crane.unmannedOperation === '무인' || crane.unmannedOperation === 'Y') {
-        existing.unmanned += 1;
-      } else {
-        existing.manned += 1;
-      }
+        existing.total += 1;
+        if (crane.unmannedOperation === '무인' || crane.unmannedOperation === 'Y') {
+          existing.unmanned += 1;
+        } else {
+          existing.manned += 1;
+        }
       
-      factoryMap.set(factory, existing);
-    });
+        factoryMap.set(factory, existing);
+      });
     
-    const result = Array.from(factoryMap.entries()).map(([factoryName, data]) => ({
-      factoryName,
-      totalCranes: data.total,
-      mannedCranes: data.manned,
-      unmannedCranes: data.unmanned,
-      mannedPercentage: data.total > 0 ? Math.round((data.manned / data.total) * 100) : 0,
-      unmannedPercentage: data.total > 0 ? Math.round((data.unmanned / data.total) * 100) : 0
-    })).sort((a, b) => b.totalCranes - a.totalCranes);
+      const result = Array.from(factoryMap.entries()).map(([factoryName, data]) => ({
+        factoryName,
+        totalCranes: data.total,
+        mannedCranes: data.manned,
+        unmannedCranes: data.unmanned,
+        mannedPercentage: data.total > 0 ? Math.round((data.manned / data.total) * 100) : 0,
+        unmannedPercentage: data.total > 0 ? Math.round((data.unmanned / data.total) * 100) : 0
+      })).sort((a, b) => b.totalCranes - a.totalCranes);
 
-    cache.set(cacheKey, result);
-    return result;
+      return result;
+    });
   }
 
   async getSystemOverview(): Promise<SystemOverview> {
-    const cacheKey = 'system-overview';
-    // Clear cache to ensure fresh data after crane import
-    cache.clearKey(cacheKey);
-    const cached = cache.get<SystemOverview>(cacheKey);
-    if (cached) return cached;
-
-    const cranes = await this.getCranes();
-    // Count only factories with actual plant sections (exclude null/undefined)
-    const factories = new Set(cranes
-      .map(crane => crane.plantSection)
-      .filter(section => section !== null && section !== undefined)
-    );
-    
-    const totalCranes = cranes.length;
-    const mannedCranes = cranes.filter(crane => 
-      crane.unmannedOperation !== '무인' && crane.unmannedOperation !== 'Y'
-    ).length;
-    
-    const result = {
-      totalFactories: factories.size,
-      totalCranes,
-      totalMannedPercentage: totalCranes > 0 ? Math.round((mannedCranes / totalCranes) * 100) : 0
-    };
-
-    cache.set(cacheKey, result);
-    return result;
+    return cache.getOrLoad('system-overview', async () => {
+      const cranes = await this.getCranes();
+      // Count only factories with actual plant sections (exclude null/undefined)
+      const factories = new Set(cranes
+        .map(crane => crane.plantSection)
+        .filter(section => section !== null && section !== undefined)
+      );
+    
+      const totalCranes = cranes.length;
+      const mannedCranes = cranes.filter(crane => 
+        crane.unmannedOperation !== '무인' && crane.unmannedOperation !== 'Y'
+      ).length;
+    
+      const result = {
+        totalFactories: factories.size,
+        totalCranes,
+        totalMannedPercentage: totalCranes > 0 ? Math.round((mannedCranes / totalCranes) * 100) : 0
+      };
+
+      return result;
+    });
   }
 
   async getCraneGradeStats(): Promise<CraneGradeStats[]> {
-    const cacheKey = 'crane-grade-stats';
-    const cached = cache.get<CraneGradeStats[]>(cacheKey);
-    if (cached) return cached;
-
-    const cranes = await this.getCranes();
-    const gradeMap = new Map<string, number>();
-    
-    cranes.forEach(crane => {
-      const grade = crane.grade || '미분류';
-      gradeMap.set(grade, (gradeMap.get(grade) || 0) + 1);
+    return cache.getOrLoad('crane-grade-stats', async () => {
+      const grade = sql<string>`coalesce(nullif(${cranes.grade}, ''), '미분류')`;
+      const rows = await db
+        .select({ grade, count: sql<number>`count(*)`.mapWith(Number) })
+        .from(cranes)
+        .groupBy(grade)
+        .orderBy(desc(sql`count(*)`));
+      const totalCranes = rows.reduce((sum, row) => sum + row.count, 0);
+
+      return rows.map(row => ({
+        ...row,
+        percentage: totalCranes > 0 ? Math.round((row.count / totalCranes) * 100) : 0
+      }));
     });
-    
-    const totalCranes = cranes.length;
-    
-    const result = Array.from(gradeMap.entries()).map(([grade, count]) => ({
-      grade,
-      count,
-      percentage: totalCranes > 0 ? Math.round((count / totalCranes) * 100) : 0
-    })).sort((a, b) => b.count - a.count);
-
-    cache.set(cacheKey, result);
-    return result;
   }
 
   async getOperationTypeStats(): Promise<OperationTypeStats> {
-    const cacheKey = 'operation-type-stats';
-    const cached = cache.get<OperationTypeStats>(cacheKey);
-    if (cached) return cached;
-
-    const cranes = await this.getCranes();
-    const totalCranes = cranes.length;
-    
-    const unmannedCranes = cranes.filter(crane => 
-      crane.unmannedOperation === '무인' || crane.unmannedOperation === 'Y'
-    ).length;
-    const mannedCranes = totalCranes - unmannedCranes;
-    
-    const result = {
-      manned: mannedCranes,
-      unmanned: unmannedCranes,
-      mannedPercentage: totalCranes > 0 ? Math.round((mannedCranes / totalCranes) * 100) : 0,
-      unmannedPercentage: totalCranes > 0 ? Math.round((unmannedCranes / totalCranes) * 100) : 0
-    };
-
-    cache.set(cacheKey, result);
-    return result;
+    return cache.getOrLoad('operation-type-stats', async () => {
+      const [{ totalCranes, unmannedCranes }] = await db
+        .select({
+          totalCranes: sql<number>`count(*)`.mapWith(Number),
+          unmannedCranes: sql<number>`count(*) filter (where ${unmannedCondition})`.mapWith(Number),
+        })
+        .from(cranes);
+      const mannedCranes = totalCranes - unmannedCranes;
+
+      return {
+        manned: mannedCranes,
+        unmanned: unmannedCranes,
+        mannedPercentage: totalCranes > 0 ? Math.round((mannedCranes / totalCranes) * 100) : 0,
+        unmannedPercentage: totalCranes > 0 ? Math.round((unmannedCranes / totalCranes) * 100) : 0
+      };
+    });
   }
 
   async getRecentMaintenanceStats(): Promise<{ month: string; failureCount: number; maintenanceCount: number; total: number }[]> {
-    const cacheKey = 'recent-maintenance-stats';
-    const cached = cache.get<{ month: string; failureCount: number; maintenanceCount: number; total: number }[]>(cacheKey);
-    if (cached) return cached;
-
-    // Get failure and maintenance records
-    const failureRecords = await this.getFailureRecords();
-    const maintenanceRecords = await this.getMaintenanceRecords();
-
-    // Find the date range where we have actual data
-    const allDates = [
-      ...failureRecords.filter(r => r.date).map(r => new Date(r.date!)),
-      ...maintenanceRecords.filter(r => r.date).map(r => new Date(r.date!))
-    ].sort((a, b) => b.getTime() - a.getTime());
-
-    if (allDates.length === 0) {
-      return [];
-    }
-
-    // Use the latest date from data, going back 6 months
-    const latestDate = allDates[0];
-    const startDate = new Date(latestDate.getFullYear(), latestDate.getMonth() - 5, 1);
-
-    // Create map for monthly stats
-    const monthlyStats = new Map<string, { failureCount: number; maintenanceCount: number }>();
-
-    // Initialize the 6 months based on actual data range
-    for (let i = 0; i < 6; i++) {
-      const date = new Date(latestDate.getFullYear(), latestDate.getMonth() - i, 1);
-      const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-      monthlyStats.set(monthKey, { failureCount: 0, maintenanceCount: 0 });
-    }
-
-    // Count failure records by month
-    failureRecords.forEach(record => {
-      if (record.date) {
-        const recordDate = new Date(record.date);
-        if (recordDate >= startDate && recordDate <= latestDate) {
-          const monthKey = `${recordDate.getFullYear()}-${String(recordDate.getMonth() + 1).padStart(2, '0')}`;
-          const stats = monthlyStats.get(monthKey);
-          if (stats) {
-            stats.failureCount++;
-          }
-        }
+    return cache.getOrLoad('recent-maintenance-stats', async () => {
+      // Latest date with data; served from the newest partition's date index
+      const [[latestFailure], [latestMaintenance]] = await Promise.all([
+        db.select({ latest: sql<string | null>`to_char(max(${failureRecords.date}), 'YYYY-MM-DD')` }).from(failureRecords),
+        db.select({ latest: sql<string | null>`to_char(max(${maintenanceRecords.date}), 'YYYY-MM-DD')` }).from(maintenanceRecords),
+      ]);
+      const latestDate = [latestFailure?.latest, latestMaintenance?.latest]
+        .filter((d): d is string => !!d)
+        .sort()
+        .pop();
+
+      if (!latestDate) {
+        return [];
       }
-    });
 
-    // Count maintenance records by month
-    maintenanceRecords.forEach(record => {
-      if (record.date) {
-        const recordDate = new Date(record.date);
-        if (recordDate >= startDate && recordDate <= latestDate) {
-          const monthKey = `${recordDate.getFullYear()}-${String(recordDate.getMonth() + 1).padStart(2, '0')}`;
-          const stats = monthlyStats.get(monthKey);
-          if (stats) {
-            stats.maintenanceCount++;
-          }
-        }
+      // The 6 months ending with the latest month; the date range prunes to those 6 partitions
+      const [year, month] = latestDate.split('-').map(Number);
+      const monthKeys: string[] = [];
+      for (let i = 5; i >= 0; i--) {
+        const date = new Date(Date.UTC(year, month - 1 - i, 1));
+        monthKeys.push(`${date.getUTCFullYear()}-${String(date.getUTCMonth() + 1).padStart(2, '0')}`);
       }
-    });
-
-    // Convert to result format and sort by month (oldest first)
-    const result = Array.from(monthlyStats.entries())
-      .map(([monthKey, stats]) => ({
-        month: monthKey,
-        failureCount: stats.failureCount,
-        maintenanceCount: stats.maintenanceCount,
-        total: stats.failureCount + stats.maintenanceCount
-      }))
-      .sort((a, b) => a.month.localeCompare(b.month));
+      const startDate = `${monthKeys[0]}-01`;
+
+      const failureMonth = sql<string>`to_char(${failureRecords.date}, 'YYYY-MM')`;
+      const maintenanceMonth = sql<string>`to_char(${maintenanceRecords.date}, 'YYYY-MM')`;
+      const [failureCounts, maintenanceCounts] = await Promise.all([
+        db.select({ month: failureMonth, count: sql<number>`count(*)`.mapWith(Number) })
+          .from(failureRecords)
+          .where(and(gte(failureRecords.date, startDate), lte(failureRecords.date, latestDate)))
+          .groupBy(failureMonth),
+        db.select({ month: maintenanceMonth, count: sql<number>`count(*)`.mapWith(Number) })
+          .from(maintenanceRecords)
+          .where(and(gte(maintenanceRecords.date, startDate), lte(maintenanceRecords.date, latestDate)))
+          .groupBy(maintenanceMonth),
+      ]);
+
+      const failureByMonth = new Map(failureCounts.map(row => [row.month, row.count]));
+      const maintenanceByMonth = new Map(maintenanceCounts.map(row => [row.month, row.count]));
+      const result = monthKeys.map(monthKey => {
+        const failureCount = failureByMonth.get(monthKey) || 0;
+        const maintenanceCount = maintenanceByMonth.get(monthKey) || 0;
+        return { month: monthKey, failureCount, maintenanceCount, total: failureCount + maintenanceCount };
+      });
 
-    cache.set(cacheKey, result);
-    return result;
+      return result;
+    });
   }
 
   async getFailureCauseDistribution(): Promise<{ cause: string; count: number; percentage: number }[]> {
-    const cacheKey = 'failure-cause-distribution';
-    const cached = cache.get<{ cause: string; count: number; percentage: number }[]>(cacheKey);
-    if (cached) return cached;
+    return cache.getOrLoad('failure-cause-distribution', async () => {
+      // Count by device using actual byDevice categories from Excel FailureReport,
+      // falling back to failure_type and then '기타'
+      const cause = sql<string>`coalesce(nullif(trim(${failureRecords.byDevice}), ''), nullif(${failureRecords.failureType}, ''), '기타')`;
+      const sortedEntries = await db
+        .select({ cause, count: sql<number>`count(*)`.mapWith(Number) })
+        .from(failureRecords)
+        .groupBy(cause)
+        .orderBy(desc(sql`count(*)`), cause);
+      const totalCount = sortedEntries.reduce((sum, row) => sum + row.count, 0);
+
+      // Keep top 5 categories, group others as "기타"
+      const topCategories = sortedEntries.slice(0, 5);
+      const minorCategories = sortedEntries.slice(5);
+
+      const result = topCategories.map(({ cause, count }) => ({
+        cause,
+        count,
+        percentage: totalCount > 0 ? Math.round((count / totalCount) * 100) : 0
+      }));
 
-    const failureRecords = await this.getFailureRecords();
-    
-    // Count by device using actual byDevice categories from Excel FailureReport
-    const causeCount = new Map<string, number>();
-    let totalCount = 0;
+      // Add consolidated "기타" category if there are minor categories
+      if (minorCategories.length > 0) {
+        const otherCount = minorCategories.reduce((sum, row) => sum + row.count, 0);
+        const existingOther = result.find(item => item.cause === '기타');
 
-    failureRecords.forEach(record => {
-      let device = '';
-      
-      // Use byDevice column if available
-      if (record.byDevice && record.byDevice.trim() !== '') {
-        device = record.byDevice.trim();
-      } 
-      // Otherwise use failure_type as fallback
-      else if (record.failureType) {
-        device = record.failureType;
-      }
-      // If still empty, use a default category
-      else {
-        device = '기타';
+        if (existingOther) {
+          // If "기타" already exists in top 5, combine counts
+          existingOther.count += otherCount;
+          existingOther.percentage = totalCount > 0 ? Math.round((existingOther.count / totalCount) * 100) : 0;
+        } else {
+          result.push({
+            cause: '기타',
+            count: otherCount,
+            percentage: totalCount > 0 ? Math.round((otherCount / totalCount) * 100) : 0
+          });
+        }
       }
 
-      if (device !== '') {
-        causeCount.set(device, (causeCount.get(device) || 0) + 1);
-        totalCount++;
-      }
+      return result;
     });
+  }
 
-    // Convert to result format with percentages, consolidate minor categories
-    const sortedEntries = Array.from(causeCount.entries())
-      .sort((a, b) => b[1] - a[1]);
-    
-    // Keep top 5 categories, group others as "기타"
-    const topCategories = sortedEntries.slice(0, 5);
-    const minorCategories = sortedEntries.slice(5);
-    
-    const result = topCategories.map(([cause, count]) => ({
-      cause,
-      count,
-      percentage: totalCount > 0 ? Math.round((count / totalCount) * 100) : 0
-    }));
-    
-    // Add consolidated "기타" category if there are minor categories
-    if (minorCategories.length > 0) {
-      const otherCount = minorCategories.reduce((sum, [_, count]) => sum + count, 0);
-      const existingOtherIndex = result.findIndex(item => item.cause === '기타');
-      
-      if (existingOtherIndex !== -1) {
-        // If "기타" already exists in top 5, combine counts
-        result[existingOtherIndex].count += otherCount;
-        result[existingOtherIndex].percentage = totalCount > 0 ? Math.round((result[existingOtherIndex].count / totalCount) * 100) : 0;
-      } else {
-        // Add new "기타" category
-        result.push({
-          cause: '기타',
-          count: otherCount,
-          percentage: totalCount > 0 ? Math.round((otherCount / totalCount) * 100) : 0
-        });
-      }
+  async getInspectionCalendar(startDate: string, endDate: string): Promise<InspectionCalendarEntry[]> {
+    // Range scan on inspection_calendar_due_date_idx
+    return await db
+      .select()
+      .from(inspectionCalendar)
+      .where(and(gte(inspectionCalendar.dueDate, startDate), lte(inspectionCalendar.dueDate, endDate)))
+      .orderBy(asc(inspectionCalendar.dueDate), asc(inspectionCalendar.craneId));
+  }
+
+  async getFailureForecasts(): Promise<FailureForecast[]> {
+    return cache.getOrLoad('failure-forecasts', () => db
+      .select()
+      .from(failureForecasts)
+      .orderBy(desc(failureForecasts.expected30d)));
+  }
+
+  async getCraneTimeline(craneName: string, factory?: string): Promise<{ crane: Crane; timeline: CraneTimeline } | undefined> {
+    const conditions = [eq(craneTimelines.craneName, craneName)];
+    const plantSection = selected(factory);
+    if (plantSection) conditions.push(eq(craneTimelines.plantSection, plantSection));
+    try {
+      // Index scan on crane_timelines_crane_name_idx, then the cranes row by its unique crane_id
+      const [row] = await db
+        .select({ crane: cranes, timeline: craneTimelines })
+        .from(craneTimelines)
+        .innerJoin(cranes, eq(cranes.craneId, craneTimelines.craneId))
+        .where(and(...conditions))
+        .orderBy(asc(craneTimelines.craneId))
+        .limit(1);
+      return row;
+    } catch (error: any) {
+      // The table is created by the first crane_timeline.py run
+      if (error?.code === '42P01') return undefined;
+      throw error;
+    }
+  }
+
+  async getAiDigest(scope: 'fleet' | 'factory' | 'crane', key: string): Promise<AiDigest | undefined> {
+    try {
+      const [digest] = await db
+        .select()
+        .from(aiDigests)
+        .where(and(eq(aiDigests.scope, scope), eq(aiDigests.scopeKey, key)));
+      return digest;
+    } catch (error: any) {
+      // The table is created by the first fleet_digest.py run; one from before source_versions is treated as stale
+      if (error?.code === '42P01' || error?.code === '42703') return undefined;
+      throw error;
     }
+  }
 
-    cache.set(cacheKey, result);
-    return result;
+  async getDataVersions(): Promise<Record<string, number>> {
+    try {
+      const rows = await db.select({ tableName: dataVersions.tableName, version: dataVersions.version }).from(dataVersions);
+      return Object.fromEntries(rows.map(row => [row.tableName, row.version]));
+    } catch (error: any) {
+      // The table is created by the first ETL run that publishes a change
+      if (error?.code === '42P01') return {};
+      throw error;
+    }
+  }
+
+  async searchHistory(query: string, limit: number, craneId?: string): Promise<HistorySearchResult[]> {
+    const tsQuery = toTsQuery(query);
+    const text = query.trim();
+    const search = (match: SQL, rank: SQL<number>) => db
+      .select({
+        source: historySearch.source,
+        recordId: historySearch.recordId,
+        craneId: historySearch.craneId,
+        date: historySearch.date,
+        body: historySearch.body,
+        rank,
+      })
+      .from(historySearch)
+      .where(craneId ? and(match, eq(historySearch.craneId, craneId)) : match)
+      .orderBy(desc(rank), desc(historySearch.date))
+      .limit(limit);
+
+    // GIN index scan on search_vector; no ILIKE over the history tables
+    if (tsQuery) {
+      const matchQuery = sql`to_tsquery('simple', ${tsQuery})`;
+      const results = await search(
+        sql`${historySearch.searchVector} @@ ${matchQuery}`,
+        sql<number>`ts_rank(${historySearch.searchVector}, ${matchQuery})`.mapWith(Number),
+      );
+      if (results.length > 0) return results;
+    }
+
+    // Part numbers and other punctuated text the tokens miss: substring match on the trigram index
+    if (text.length < SUBSTRING_MIN) return [];
+    return await search(
+      ilike(historySearch.body, likePattern(text)),
+      sql<number>`word_similarity(${text}, ${historySearch.body})`.mapWith(Number),
+    );
   }
 
   private async generateAlerts(): Promise<void> {
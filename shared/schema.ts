@@ -1,7 +1,13 @@
-import { pgTable, text, serial, integer, boolean, timestamp, numeric } from "drizzle-orm/pg-core";
+import { pgTable, text, serial, integer, boolean, timestamp, numeric, date, index, uniqueIndex, doublePrecision, primaryKey, customType, jsonb } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
 
+const tsvector = customType<{ data: string }>({
+  dataType() {
+    return "tsvector";
+  },
+});
+
 export const cranes = pgTable("cranes", {
   id: serial("id").primaryKey(),
   craneId: text("crane_id").notNull().unique(),
@@ -15,19 +21,28 @@ export const cranes = pgTable("cranes", {
   unmannedOperation: text("unmanned_operation"), // UnmannedOperation field
   electricalManager: text("electrical_manager"), // ElectricalManager from CraneList sheet
   mechanicalManager: text("mechanical_manager"), // MechanicalManager from CraneList sheet
-  installationDate: text("installation_date"), // InstallationDate from CraneList
-  inspectionReferenceDate: text("inspection_reference_date"), // InspectionReferenceDate from CraneList
+  installationDate: date("installation_date"), // InstallationDate from CraneList
+  inspectionReferenceDate: date("inspection_reference_date"), // InspectionReferenceDate from CraneList
   inspectionCycle: integer("inspection_cycle"), // InspectionCycle from CraneList (days)
   leadTime: integer("lead_time"), // LeadTime from CraneList (days)
-  lastMaintenanceDate: text("last_maintenance_date"),
-  nextMaintenanceDate: text("next_maintenance_date"),
+  lastMaintenanceDate: date("last_maintenance_date"),
+  nextMaintenanceDate: date("next_maintenance_date"),
   isUrgent: boolean("is_urgent").default(false),
-});
+  // Provenance, set by the workbook loaders (workbook_reimport.py): workbook content hash, sheet, row, load
+  sourceFile: text("source_file"),
+  sourceSheet: text("source_sheet"),
+  sourceRow: integer("source_row"),
+  importBatch: text("import_batch"),
+}, (table) => [
+  index("cranes_plant_section_idx").on(table.plantSection), // factory filters on the history analytics
+]);
 
+// failure_records and maintenance_records are range-partitioned by month on date
+// (history_partitions.py); the partitions live in the history_partitions schema
 export const failureRecords = pgTable("failure_records", {
-  id: serial("id").primaryKey(),
+  id: serial("id").notNull(),
   craneId: text("crane_id").notNull(),
-  date: text("date").notNull(),
+  date: date("date").notNull(),
   failureType: text("failure_type").notNull(), // 'hydraulic', 'electrical', 'mechanical', 'structural'
   description: text("description").notNull(),
   severity: text("severity").notNull(), // 'low', 'medium', 'high', 'critical'
@@ -37,12 +52,30 @@ export const failureRecords = pgTable("failure_records", {
   data: numeric("data"), // failure interval in days
   worktime: numeric("worktime"), // work time in hours
   byDevice: text("by_device"), // device/equipment type causing the failure
-});
+  // Guesses from assign_real_bydevice.py where byDevice / failureType are empty; never copied into them
+  byDeviceInferred: text("by_device_inferred"),
+  byDeviceConfidence: doublePrecision("by_device_confidence"),
+  failureTypeInferred: text("failure_type_inferred"),
+  failureTypeConfidence: doublePrecision("failure_type_confidence"),
+  sourceFile: text("source_file"),
+  sourceSheet: text("source_sheet"),
+  sourceRow: integer("source_row"),
+  importBatch: text("import_batch"),
+}, (table) => [
+  primaryKey({ columns: [table.id, table.date] }), // partition key must be part of the primary key
+  index("failure_records_crane_id_date_idx").on(table.craneId, table.date),
+  index("failure_records_date_idx").on(table.date),
+  // Keyset pages walk (date, id) newest first, optionally within one device
+  index("failure_records_date_id_idx").on(table.date, table.id),
+  index("failure_records_by_device_date_id_idx").on(table.byDevice, table.date, table.id),
+  // Partial re-imports match workbook rows to records by sheet and row
+  index("failure_records_source_idx").on(table.sourceSheet, table.sourceRow),
+]);
 
 export const maintenanceRecords = pgTable("maintenance_records", {
-  id: serial("id").primaryKey(),
+  id: serial("id").notNull(),
   craneId: text("crane_id").notNull(),
-  date: text("date").notNull(),
+  date: date("date").notNull(),
   type: text("type").notNull(), // 'routine', 'emergency', 'preventive', 'repair', 'inspection'
   technician: text("technician").notNull(),
   status: text("status").notNull(), // 'completed', 'in_progress', 'scheduled'
@@ -52,24 +85,173 @@ export const maintenanceRecords = pgTable("maintenance_records", {
   relatedFailureId: integer("related_failure_id"), // reference to failure record if applicable
   workOrder: text("work_order"),
   taskName: text("task_name"),
-  actualStartDateTime: text("actual_start_date_time"),
-  actualEndDateTime: text("actual_end_date_time"),
+  actualStartDateTime: timestamp("actual_start_date_time", { withTimezone: true, mode: "string" }),
+  actualEndDateTime: timestamp("actual_end_date_time", { withTimezone: true, mode: "string" }),
   totalWorkers: integer("total_workers"),
   totalWorkTime: numeric("total_work_time"),
   areaName: text("area_name"),
   equipmentName: text("equipment_name"),
-});
+  sourceFile: text("source_file"),
+  sourceSheet: text("source_sheet"),
+  sourceRow: integer("source_row"),
+  importBatch: text("import_batch"),
+}, (table) => [
+  primaryKey({ columns: [table.id, table.date] }),
+  index("maintenance_records_crane_id_date_idx").on(table.craneId, table.date),
+  index("maintenance_records_date_idx").on(table.date),
+  index("maintenance_records_date_id_idx").on(table.date, table.id),
+  index("maintenance_records_type_date_id_idx").on(table.type, table.date, table.id),
+  index("maintenance_records_source_idx").on(table.sourceSheet, table.sourceRow),
+]);
 
 export const alerts = pgTable("alerts", {
   id: serial("id").primaryKey(),
   craneId: text("crane_id").notNull(),
-  type: text("type").notNull(), // 'overdue', 'due_soon', 'high_frequency'
+  type: text("type").notNull(), // 'overdue', 'due_soon', 'high_frequency', 'failure_spike'
   message: text("message").notNull(),
   severity: text("severity").notNull(), // 'low', 'medium', 'high', 'critical'
   isActive: boolean("is_active").default(true),
-  createdAt: text("created_at").notNull(),
+  createdAt: timestamp("created_at", { withTimezone: true, mode: "string" }).notNull(),
+  // What a generated alert is about, e.g. failure_spike: '<crane>|<device>|<freq>|<period start>';
+  // failure_anomaly_detection.py skips alerts whose key already exists. NULL for the server's own alerts
+  dedupeKey: text("dedupe_key"),
+}, (table) => [
+  uniqueIndex("alerts_dedupe_key_idx").on(table.craneId, table.type, table.dedupeKey),
+]);
+
+// Materialized by inspection_scheduler.py from InspectionReferenceDate / InspectionCycle / LeadTime
+export const inspectionCalendar = pgTable("inspection_calendar", {
+  id: serial("id").primaryKey(),
+  craneId: text("crane_id").notNull(),
+  dueDate: date("due_date").notNull(), // scheduled inspection date
+  windowStart: date("window_start").notNull(), // due date minus lead time
+  inspectionCycle: integer("inspection_cycle").notNull(), // days
+  leadTime: integer("lead_time").notNull(), // days
+  generatedAt: text("generated_at").notNull(),
+}, (table) => [
+  index("inspection_calendar_due_date_idx").on(table.dueDate),
+  index("inspection_calendar_crane_id_idx").on(table.craneId),
+]);
+
+// EWMA state per failure-count series, maintained by failure_anomaly_detection.py
+export const failureAnomalyState = pgTable("failure_anomaly_state", {
+  seriesKey: text("series_key").notNull(), // '<crane_id>|<by_device>', '*' for all devices
+  craneId: text("crane_id").notNull(),
+  byDevice: text("by_device").notNull(),
+  freq: text("freq").notNull(), // 'D' daily, 'W' weekly
+  lastPeriod: date("last_period").notNull(), // start of the last processed period
+  ewmaMean: doublePrecision("ewma_mean").notNull(),
+  ewmaVar: doublePrecision("ewma_var").notNull(),
+  observations: integer("observations").notNull(),
+  updatedAt: text("updated_at").notNull(),
+}, (table) => [
+  primaryKey({ columns: [table.seriesKey, table.freq] }), // daily and weekly state are kept apart
+]);
+
+// Expected failure counts per crane, written by failure_forecast.py
+export const failureForecasts = pgTable("failure_forecasts", {
+  craneId: text("crane_id").primaryKey(),
+  historyHash: text("history_hash").notNull(), // fitted parameters are reused while this is unchanged
+  model: text("model").notNull(), // 'weibull_process', 'poisson_gamma'
+  params: text("params").notNull(), // JSON
+  eventCount: integer("event_count").notNull(),
+  windowStart: date("window_start").notNull(),
+  windowEnd: date("window_end").notNull(), // forecasts cover the days after this date
+  expected30d: doublePrecision("expected_30d").notNull(),
+  expected90d: doublePrecision("expected_90d").notNull(),
+  fittedAt: text("fitted_at").notNull(),
 });
 
+// Maintained by history_search_index.py; needs the pg_trgm extension (created by that script)
+export const historySearch = pgTable("history_search", {
+  source: text("source").notNull(), // 'failure' (failure_records) or 'repair' (maintenance_records)
+  recordId: integer("record_id").notNull(),
+  craneId: text("crane_id").notNull(),
+  date: date("date"),
+  body: text("body").notNull(), // searchable text of the source row
+  searchVector: tsvector("search_vector").notNull(), // Hangul bigrams + words, 'simple' config
+  indexedAt: text("indexed_at").notNull(),
+}, (table) => [
+  primaryKey({ columns: [table.source, table.recordId] }),
+  index("history_search_vector_idx").using("gin", table.searchVector),
+  index("history_search_body_trgm_idx").using("gin", table.body.op("gin_trgm_ops")),
+  index("history_search_crane_id_idx").on(table.craneId),
+]);
+
+// Bookkeeping for migrate_date_columns.py, which converted the text date columns to date/timestamptz
+export const dateMigrationProgress = pgTable("date_migration_progress", {
+  tableName: text("table_name").notNull(),
+  columnName: text("column_name").notNull(),
+  lastId: integer("last_id").notNull().default(0), // backfilled through this id
+  converted: integer("converted").notNull().default(0),
+  rejected: integer("rejected").notNull().default(0),
+  updatedAt: timestamp("updated_at", { withTimezone: true, mode: "string" }).notNull().defaultNow(),
+}, (table) => [
+  primaryKey({ columns: [table.tableName, table.columnName] }),
+]);
+
+export const dateMigrationRejects = pgTable("date_migration_rejects", {
+  tableName: text("table_name").notNull(),
+  columnName: text("column_name").notNull(),
+  recordId: integer("record_id").notNull(),
+  rawValue: text("raw_value"), // original text that could not be parsed
+}, (table) => [
+  primaryKey({ columns: [table.tableName, table.columnName, table.recordId] }),
+]);
+
+// Progress of apply_artifacts.py: one row per applied artifact (or .sql statement batch)
+export const artifactLoads = pgTable("artifact_loads", {
+  sourceSha256: text("source_sha256").notNull(), // manifest.json or .sql file checksum
+  file: text("file").notNull(),
+  chunk: integer("chunk").notNull(),
+  rows: integer("rows").notNull(),
+  appliedAt: timestamp("applied_at", { withTimezone: true, mode: "string" }).notNull().defaultNow(),
+}, (table) => [
+  primaryKey({ columns: [table.sourceSha256, table.file, table.chunk] }),
+]);
+
+// Bumped by etl_events.notify_change() in the same transaction as each ETL change;
+// the server compares versions to re-warm only the tables that changed
+export const dataVersions = pgTable("data_versions", {
+  tableName: text("table_name").primaryKey(),
+  version: integer("version").notNull(),
+  changedAt: timestamp("changed_at", { withTimezone: true, mode: "string" }).notNull().defaultNow(),
+});
+
+// One row per crane for the detail view, maintained by crane_timeline.py
+export const craneTimelines = pgTable("crane_timelines", {
+  craneId: text("crane_id").primaryKey(),
+  craneName: text("crane_name"),
+  plantSection: text("plant_section"),
+  dailyRepairCount: integer("daily_repair_count").notNull(), // routine/preventive/inspection repairs
+  emergencyRepairCount: integer("emergency_repair_count").notNull(), // failures
+  dailyRepairHours: integer("daily_repair_hours").notNull(),
+  emergencyRepairHours: integer("emergency_repair_hours").notNull(),
+  dailyRepairBreakdown: jsonb("daily_repair_breakdown").$type<Record<string, number>>().notNull(),
+  emergencyRepairBreakdown: jsonb("emergency_repair_breakdown").$type<Record<string, number>>().notNull(),
+  failureHeatmap: jsonb("failure_heatmap").$type<Record<string, number>>().notNull(), // cause -> count
+  lastMaintenanceDate: date("last_maintenance_date"),
+  nextInspectionDate: date("next_inspection_date"),
+  timeline: jsonb("timeline").$type<CraneTimelineEvent[]>().notNull(), // newest first
+  refreshedAt: timestamp("refreshed_at", { withTimezone: true, mode: "string" }).notNull().defaultNow(),
+}, (table) => [
+  index("crane_timelines_crane_name_idx").on(table.craneName, table.plantSection),
+]);
+
+// Compact fleet/factory/crane digests for the AI reports, precomputed by fleet_digest.py
+export const aiDigests = pgTable("ai_digests", {
+  scope: text("scope").notNull(), // 'fleet', 'factory' or 'crane'
+  scopeKey: text("scope_key").notNull(), // 'all', plant section or crane id
+  version: integer("version").notNull().default(1), // bumped when the digest content changes
+  digest: jsonb("digest").$type<Record<string, any>>().notNull(), // at most fleet_digest.MAX_DIGEST_BYTES of JSON
+  bytes: integer("bytes").notNull(),
+  generatedAt: timestamp("generated_at", { withTimezone: true, mode: "string" }).notNull().defaultNow(),
+  sourceVersions: jsonb("source_versions").$type<Record<string, number>>().notNull().default({}), // data_versions it was built from
+  refreshedAt: timestamp("refreshed_at", { withTimezone: true, mode: "string" }).notNull().defaultNow(),
+}, (table) => [
+  primaryKey({ columns: [table.scope, table.scopeKey] }),
+]);
+
 export const insertCraneSchema = createInsertSchema(cranes).omit({
   id: true,
 });
@@ -103,6 +285,13 @@ export type MaintenanceRecord = typeof maintenanceRecords.$inferSelect;
 export type InsertMaintenanceRecord = z.infer<typeof insertMaintenanceRecordSchema>;
 export type Alert = typeof alerts.$inferSelect;
 export type InsertAlert = z.infer<typeof insertAlertSchema>;
+export type InspectionCalendarEntry = typeof inspectionCalendar.$inferSelect;
+export type FailureForecast = typeof failureForecasts.$inferSelect;
+export type CraneTimeline = typeof craneTimelines.$inferSelect;
+export type AiDigest = typeof aiDigests.$inferSelect;
+export type HistorySearchResult = Omit<typeof historySearch.$inferSelect, "searchVector" | "indexedAt"> & {
+  rank: number;
+};
 
 // Dashboard summary types
 export type DashboardSummary = {
@@ -149,3 +338,58 @@ export type OperationTypeStats = {
   mannedPercentage: number;
   unmannedPercentage: number;
 };
+
+// Filters shared by the failure/repair history analytics; 'all' or omitted means no filter
+export type HistoryFilters = {
+  craneId?: string;
+  craneName?: string;
+  factory?: string;
+  startDate?: string;
+  endDate?: string;
+};
+
+// Position of a record in (date, id) order; a page continues after the last record of the previous one
+export type RecordCursor = {
+  date: string;
+  id: number;
+};
+
+// A page of failure or maintenance records, newest first
+export type RecordPageQuery = HistoryFilters & {
+  byDevice?: string; // failure records only
+  type?: string; // failure type or maintenance type
+  after?: RecordCursor;
+  limit: number;
+};
+
+export type RecordPage<T> = {
+  items: T[];
+  next: RecordCursor | null; // null on the last page
+};
+
+export type DeviceFailureHeatmap = {
+  device: string;
+  total: number;
+  failureTypes: { type: string; count: number }[];
+};
+
+// A failure or repair in a crane's timeline; fields the source row left empty are omitted
+export type CraneTimelineEvent = {
+  kind: 'failure' | 'repair';
+  id: number;
+  date: string;
+  type?: string; // failure type or repair type
+  status?: string; // repairs only
+  severity?: string; // failures only
+  cause?: string;
+  summary?: string;
+  hours?: number; // repair duration or failure downtime
+};
+
+export type CraneFailureCount = {
+  craneId: string;
+  craneName: string | null;
+  plantSection: string | null;
+  failureCount: number;
+  hasData: boolean;
+};
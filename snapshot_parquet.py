@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Dump the dashboard tables to a Parquet snapshot for offline analysis.
+
+    python snapshot_parquet.py [--output-dir snapshots/latest] [--batch-rows 50000]
+
+Needs pyarrow (uv sync --extra snapshots). Every table is read through a
+server-side cursor in one REPEATABLE READ transaction, so the snapshot is
+consistent and memory stays bounded by --batch-rows. failure_records and
+maintenance_records are written Hive-style as <table>/month=YYYY-MM/part-0.parquet.
+The snapshot is built in a temporary directory and swapped in when
+complete. snapshot_queries.py runs the dashboard analytics over it with DuckDB.
+"""
+import argparse
+import itertools
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+
+from db_connection import connect_db, release_db
+
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+SNAPSHOT_DIR = os.path.join('snapshots', 'latest')
+
+# Column name -> Arrow type, in shared/schema.ts order; numeric columns are read as float8
+SNAPSHOT_TABLES = {
+    'cranes': {
+        'columns': {
+            'id': 'int32', 'crane_id': 'string', 'crane_name': 'string', 'plant_section': 'string',
+            'status': 'string', 'location': 'string', 'model': 'string', 'grade': 'string',
+            'drive_type': 'string', 'unmanned_operation': 'string', 'electrical_manager': 'string',
+            'mechanical_manager': 'string', 'installation_date': 'date32', 'inspection_reference_date': 'date32',
+            'inspection_cycle': 'int32', 'lead_time': 'int32', 'last_maintenance_date': 'date32',
+            'next_maintenance_date': 'date32', 'is_urgent': 'bool',
+        },
+        'monthly': False,
+    },
+    'failure_records': {
+        'columns': {
+            'id': 'int32', 'crane_id': 'string', 'date': 'date32', 'failure_type': 'string',
+            'description': 'string', 'severity': 'string', 'downtime': 'int32', 'cause': 'string',
+            'reported_by': 'string', 'data': 'float64', 'worktime': 'float64', 'by_device': 'string',
+        },
+        'monthly': True,
+    },
+    'maintenance_records': {
+        'columns': {
+            'id': 'int32', 'crane_id': 'string', 'date': 'date32', 'type': 'string', 'technician': 'string',
+            'status': 'string', 'notes': 'string', 'duration': 'int32', 'cost': 'int32',
+            'related_failure_id': 'int32', 'work_order': 'string', 'task_name': 'string',
+            'actual_start_date_time': 'timestamp', 'actual_end_date_time': 'timestamp', 'total_workers': 'int32',
+            'total_work_time': 'float64', 'area_name': 'string', 'equipment_name': 'string',
+        },
+        'monthly': True,
+    },
+    'alerts': {
+        'columns': {
+            'id': 'int32', 'crane_id': 'string', 'type': 'string', 'message': 'string', 'severity': 'string',
+            'is_active': 'bool', 'created_at': 'timestamp',
+        },
+        'monthly': False,
+    },
+}
+
+
+def arrow_schema(table):
+    types = {
+        'int32': pa.int32(), 'float64': pa.float64(), 'string': pa.string(), 'bool': pa.bool_(),
+        'date32': pa.date32(), 'timestamp': pa.timestamp('us', tz='UTC'),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in SNAPSHOT_TABLES[table]['columns'].items()])
+
+
+def select_sql(table):
+    columns = SNAPSHOT_TABLES[table]['columns']
+    select = ', '.join(f"{name}::float8 AS {name}" if kind == 'float64' else name for name, kind in columns.items())
+    order = 'date, id' if SNAPSHOT_TABLES[table]['monthly'] else 'id'
+    return f"SELECT {select} FROM {table} ORDER BY {order}"
+
+
+def record_batch(rows, schema):
+    columns = list(zip(*rows))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema)
+
+
+def export_table(conn, table, output_dir, batch_rows):
+    """Stream one table to Parquet; monthly tables get one file per month (rows arrive date-ordered)"""
+    schema = arrow_schema(table)
+    monthly = SNAPSHOT_TABLES[table]['monthly']
+    date_index = list(SNAPSHOT_TABLES[table]['columns']).index('date') if monthly else None
+
+    writers = {}
+    files = []
+
+    def writer_for(month):
+        if month not in writers:
+            # Months arrive in order, so the previous month's file is complete
+            for done in writers.values():
+                done.close()
+            writers.clear()
+            directory = os.path.join(output_dir, table, f"month={month}" if month else '')
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, 'part-0.parquet')
+            writers[month] = pq.ParquetWriter(path, schema, compression='zstd')
+            files.append(os.path.relpath(path, output_dir))
+        return writers[month]
+
+    cursor = conn.cursor(name=f"snapshot_{table}")
+    cursor.itersize = batch_rows
+    total = 0
+    try:
+        cursor.execute(select_sql(table))
+        while True:
+            rows = cursor.fetchmany(batch_rows)
+            if not rows:
+                break
+            total += len(rows)
+            if monthly:
+                for month, group in itertools.groupby(rows, key=lambda row: f"{row[date_index]:%Y-%m}"):
+                    writer_for(month).write_batch(record_batch(list(group), schema))
+            else:
+                writer_for(None).write_batch(record_batch(rows, schema))
+        if not files:
+            # Keep empty tables queryable
+            writer_for(None)
+    finally:
+        cursor.close()
+        for writer in writers.values():
+            writer.close()
+    return total, files
+
+
+def export_snapshot(conn, output_dir, batch_rows=50000):
+    staging = f"{output_dir.rstrip(os.sep)}.tmp-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+    tables = {}
+    try:
+        for table in SNAPSHOT_TABLES:
+            rows, files = export_table(conn, table, staging, batch_rows)
+            tables[table] = {'rows': rows, 'files': files}
+            print(f"  {table}: {rows} rows in {len(files)} files")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    with open(os.path.join(staging, 'snapshot.json'), 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(), 'tables': tables}, f, ensure_ascii=False, indent=2)
+
+    # Swap the finished snapshot in; readers never see a half-written one
+    previous = f"{output_dir.rstrip(os.sep)}.old-{os.getpid()}"
+    if os.path.exists(output_dir):
+        os.replace(output_dir, previous)
+    os.replace(staging, output_dir)
+    shutil.rmtree(previous, ignore_errors=True)
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the dashboard tables to a Parquet snapshot')
+    parser.add_argument('--output-dir', default=SNAPSHOT_DIR)
+    parser.add_argument('--batch-rows', type=int, default=50000, help='rows fetched and written per batch')
+    args = parser.parse_args()
+
+    if pa is None:
+        print("pyarrow is required: uv sync --extra snapshots")
+        sys.exit(1)
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+
+    try:
+        print(f"Writing snapshot to {args.output_dir}")
+        tables = export_snapshot(conn, args.output_dir, args.batch_rows)
+        print(f"Snapshot complete: {sum(t['rows'] for t in tables.values())} rows")
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Dashboard analytics over a snapshot_parquet.py snapshot, using DuckDB.
+
+    python snapshot_queries.py factory-overview
+    python snapshot_queries.py bydevice-trends --snapshot snapshots/latest --json
+
+Needs duckdb (uv sync --extra snapshots). The queries reproduce the storage.ts
+analytics (same grouping, rounding and result keys), so numbers can be checked
+against the dashboard without touching the production database. Filters on
+`month` only read the matching partition directories.
+"""
+import argparse
+import json
+import os
+import sys
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+from snapshot_parquet import SNAPSHOT_DIR, SNAPSHOT_TABLES
+
+# Mirrors the 무인/'Y' test in storage.ts
+UNMANNED = "unmanned_operation IN ('무인', 'Y')"
+
+QUERIES = {
+    # getMonthlyTrends: maintenance records per month ("Jan 2024")
+    'monthly-trends': """
+        SELECT strftime(date, '%b %Y') AS month, count(*) AS count
+        FROM maintenance_records
+        GROUP BY date_trunc('month', date), month
+        ORDER BY date_trunc('month', date)
+    """,
+    # getFactoryOverview
+    'factory-overview': f"""
+        SELECT coalesce(plant_section, '미분류') AS factoryName,
+               count(*) AS totalCranes,
+               count(*) FILTER (WHERE NOT coalesce({UNMANNED}, false)) AS mannedCranes,
+               count(*) FILTER (WHERE {UNMANNED}) AS unmannedCranes,
+               round(100.0 * mannedCranes / totalCranes)::INTEGER AS mannedPercentage,
+               round(100.0 * unmannedCranes / totalCranes)::INTEGER AS unmannedPercentage
+        FROM cranes
+        GROUP BY factoryName
+        ORDER BY totalCranes DESC
+    """,
+    # getCraneGradeStats
+    'grade-stats': """
+        SELECT coalesce(nullif(grade, ''), '미분류') AS grade,
+               count(*) AS count,
+               round(100.0 * count(*) / sum(count(*)) OVER ())::INTEGER AS percentage
+        FROM cranes
+        GROUP BY 1
+        ORDER BY count DESC
+    """,
+    # getFailureCauseDistribution: byDevice, else failure_type, else 기타; top 5 with the rest folded into 기타
+    'failure-causes': """
+        WITH causes AS (
+            SELECT CASE WHEN trim(by_device) <> '' THEN trim(by_device)
+                        WHEN failure_type <> '' THEN failure_type
+                        ELSE '기타' END AS cause,
+                   count(*) AS count
+            FROM failure_records
+            GROUP BY 1
+        ), ranked AS (
+            SELECT cause, count, row_number() OVER (ORDER BY count DESC) AS rank FROM causes
+        )
+        SELECT CASE WHEN rank <= 5 THEN cause ELSE '기타' END AS cause,
+               sum(count)::BIGINT AS count,
+               round(100.0 * sum(count) / (SELECT sum(count) FROM causes))::INTEGER AS percentage
+        FROM ranked
+        GROUP BY 1
+        ORDER BY min(rank)
+    """,
+    # Monthly failures per byDevice category
+    'bydevice-trends': """
+        SELECT month, coalesce(nullif(trim(by_device), ''), '미분류') AS byDevice, count(*) AS count
+        FROM failure_records
+        GROUP BY month, byDevice
+        ORDER BY month, count DESC
+    """,
+    # Failures, repair hours and failures per crane by factory
+    'factory-failures': """
+        WITH failures AS (
+            SELECT crane_id, count(*) AS failures, sum(coalesce(worktime, 0)) AS repair_hours
+            FROM failure_records
+            GROUP BY crane_id
+        )
+        SELECT coalesce(c.plant_section, '미분류') AS factoryName,
+               count(*) AS totalCranes,
+               coalesce(sum(f.failures), 0)::BIGINT AS failureCount,
+               round(coalesce(sum(f.repair_hours), 0), 1) AS repairHours,
+               round(coalesce(sum(f.failures), 0) / count(*), 2) AS failuresPerCrane
+        FROM cranes c
+        LEFT JOIN failures f ON f.crane_id = c.crane_id
+        GROUP BY factoryName
+        ORDER BY failuresPerCrane DESC
+    """,
+}
+
+
+def connect(snapshot_dir=SNAPSHOT_DIR):
+    """In-memory DuckDB with one view per snapshot table"""
+    if duckdb is None:
+        raise RuntimeError("duckdb is required: uv sync --extra snapshots")
+    if not os.path.exists(os.path.join(snapshot_dir, 'snapshot.json')):
+        raise FileNotFoundError(f"No snapshot at {snapshot_dir}; run snapshot_parquet.py first")
+
+    con = duckdb.connect()
+    for table, spec in SNAPSHOT_TABLES.items():
+        pattern = os.path.join(snapshot_dir, table, '**', '*.parquet').replace("'", "''")
+        hive = 'true' if spec['monthly'] else 'false'
+        con.execute(f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{pattern}', hive_partitioning = {hive})")
+    return con
+
+
+def run_query(con, name):
+    """Run one of QUERIES; returns a list of dicts keyed like the storage.ts results"""
+    result = con.execute(QUERIES[name])
+    columns = [column[0] for column in result.description]
+    return [dict(zip(columns, row)) for row in result.fetchall()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dashboard analytics over the Parquet snapshot')
+    parser.add_argument('query', choices=sorted(QUERIES))
+    parser.add_argument('--snapshot', default=SNAPSHOT_DIR)
+    parser.add_argument('--json', action='store_true', help='print JSON instead of a table')
+    args = parser.parse_args()
+
+    try:
+        con = connect(args.snapshot)
+    except (RuntimeError, FileNotFoundError) as e:
+        print(e)
+        sys.exit(1)
+
+    rows = run_query(con, args.query)
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2, default=str))
+        return
+    if not rows:
+        print("(no rows)")
+        return
+    columns = list(rows[0])
+    widths = [max(len(str(column)), *(len(str(row[column])) for row in rows)) for column in columns]
+    print('  '.join(str(column).ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print('  '.join(str(row[column]).ljust(width) for column, width in zip(columns, widths)))
+
+
+if __name__ == "__main__":
+    main()
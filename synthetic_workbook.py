@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Generate a synthetic crane workbook shaped like the real DB용 크레인 데이터 export.
+
+The category frequencies, per-crane failure skew, time-of-day and work-time
+distributions below were taken from the real workbook; names, free text and
+equipment codes are made up, so the output can be shared and committed to
+benchmarks. scale=1 matches the real row counts (233 cranes, ~4.1k failures,
+~4.1k repairs); every sheet grows linearly with the scale.
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from workbook_normalize import LEAD_TIME_COLUMN, SHEETS
+
+BASE_CRANES = 233
+BASE_FAILURES = 4108
+BASE_REPAIRS = 4056
+ORPHAN_CODE_FRACTION = 0.2  # history rows whose EquipmentCode is missing from CraneList, as in the real data
+XLSX_MAX_ROWS = 1_048_575  # excluding the header row
+
+FAILURE_PERIOD = (date(2023, 6, 1), date(2025, 5, 22))
+REPAIR_PERIOD = (date(2024, 1, 31), date(2025, 3, 31))
+
+PLANTS = {
+    '제품출하섹션': 46, '후판제품공장': 21, '1열연공장': 19, '1선재공장': 19, '1냉연공장': 19, '2열연공장': 18,
+    '2냉연공장': 14, '2선재공장': 13, '3연주공장': 10, 'STS소둔산세공장': 9, '2후판공장': 8, '3후판공장': 8,
+    '3선재공장': 7, '1연주공장': 6, '2연주공장': 5, '1제강공장': 4, '2제강공장': 3, 'STS압연공장': 2,
+    '도금공장': 1, '1후판공장': 1,
+}
+YARDS = {  # CraneCode prefix -> yard name
+    'CT': 'Coil Yard', 'TS': 'Slab Yard', 'BT': 'Billet Yard', 'ML': 'Mill Line', 'RS': 'Roll Shop',
+    'SL': 'Shear Line', 'JA': 'Warehouse', 'PC': 'Product Yard',
+}
+INSPECTION_CYCLES = {  # label -> (cranes, lead time in days)
+    '2주(14일)': (129, 7), '4주(28일)': (75, 14), '12주(84일)': (18, 20), '24주(168일)': (5, 30),
+    '8주(56일)': (4, 15), '1주(7일)': (2, 6),
+}
+MAIN_LOADS = {40: 49, 30: 43, 25: 34, 10: 20, 35: 16, 20: 15, 50: 12, 15: 10, 5: 8, 60: 6, 80: 4}
+AUXILIARY_LOADS = {0: 169, 5: 21, 10: 15, 20: 7, 40: 6, 25: 3}
+GRADES = {'B': 205, 'A': 28}
+DRIVE_TYPES = {
+    '운전실': 100, '운전실/리모트/자동운전': 50, '리모트/운전실': 48, '리모트/펜던트': 18,
+    '리모트/팬던트/자동운전': 8, '운전실/자동운전': 6, '펜던트': 3,
+}
+HOISTING_DEVICES = {
+    'Coil Lifter': 79, 'Magnet': 45, 'Single Hook': 43, 'Tong': 34, 'Magnet+Magnet': 18, 'C-Hook': 10, 'Double Hook': 4,
+}
+UNMANNED = {'유인': 167, '무인': 66}
+
+SYMPTOMS = {
+    '주권': 1046, 'Coiliifter': 758, '주행': 739, '횡행': 340, 'Magnet': 302, '전원': 265, 'Tong': 164,
+    '기타': 108, '거리계': 67, '보권': 66, 'C-Hook': 66, 'PC': 42,
+}
+SHIFT_TYPES = {'일과 내': 2093, '일과 외': 987, '주': 631, '야': 396}
+MECHANICAL_ELECTRICAL = {'전기': 3745, '기계': 189, '제어': 174}
+DEVICE_TYPES = {  # (byDevice, type) -> failures
+    ('전장품', 'Magnet Contactor'): 280, ('전장품', 'Cable'): 272, ('전장품', '기타'): 262, ('전장품', 'Relay'): 187,
+    ('기타', '기타'): 156, ('Coil Lifter', 'Cable'): 127, ('안전장치', 'Cam Limit'): 125, ('Coil Lifter', '기타'): 96,
+    ('Coil Lifter', 'Sensor'): 90, ('Magnet', 'Cable'): 86, ('전원', 'Pantograph'): 84, ('전장품', 'Controller'): 81,
+    ('안전장치', '충돌방지기'): 78, ('Brake', 'Lining 이상(조정, 교체)'): 74, ('전장품', 'Sensor'): 65,
+    ('안전장치', '중추 Limit'): 60, ('전장품', 'Thyristor'): 57, ('Brake', 'Coil'): 54, ('Brake', 'Controller'): 50,
+    ('Brake', '기타'): 48, ('Magnet', '기타'): 44, ('Coil Lifter', 'Motor'): 42, ('Motor', '소손'): 42,
+    ('Inverter', '교환'): 41, ('Coil Lifter', 'Limit'): 40, ('전장품', 'T.G Coup'): 40, ('전장품', '점검'): 38,
+    ('Inverter', 'Parameter 수정'): 38, ('Wheel', "Brg' 파손"): 37, ('전원', 'Panto-Shoe'): 34,
+}
+START_HOURS = [70, 61, 39, 63, 76, 86, 43, 77, 185, 646, 276, 104, 23, 408, 451, 269, 368, 150, 119, 135, 151, 75, 146, 87]
+FAILURE_DETAILS = ['작동이상 점검 및 정비', '동작불능', '동작이상', '작동이상 정비', '소음발생', '고장']
+ACTIONS = ['교환', '교체', '점검', '조정', '수리', 'Reset']
+
+WORKERS = {2: 1299, 3: 1014, 4: 548, 5: 306, 6: 218, 7: 133, 8: 118, 9: 101, 16: 68, 10: 64}
+AREAS = {
+    '(포)지원-생산기술부-제품출하섹션': 981, '(포)강편선재-1선재 강편-강편공장공통': 252, '(포)냉연-1냉연-PCM': 192,
+    '(포)후판-2후판-공장공통': 166, '(포)강편선재-2선재-공장공통': 139, '(포)강편선재-3선재-공장공통': 139,
+    '(포)STS-압연_소둔산세-공장공통': 109, '(포)냉연-2냉연-PCM': 92, '(포)열연-1열연-공장공통': 80, '(포)열연-2열연-공장공통': 75,
+}
+REPAIR_PARTS = ['주행 감속기', '주권 Wire Rope', '횡행 Brake', 'Magnet Cable', 'Coil Lifter Sensor', 'Inverter', '주행 Wheel']
+STANDBY_TASKS = ['[대기평일]크레인 책임정비 대기근무', '[대기휴일]크레인 책임정비 대기근무']
+STANDBY_FRACTION = 0.08
+
+SURNAMES = list('김이박최정강조윤장임한오서')
+GIVEN_SYLLABLES = list('민성현영준희태호재식수진우상철')
+WEEKDAYS = np.array(list('월화수목금토일'))
+
+
+def choose(rng, weights, size):
+    """Sample keys of a {value: weight} mapping"""
+    keys = list(weights)
+    p = np.asarray([weights[k] for k in keys], dtype=np.float64)
+    picks = rng.choice(len(keys), size=size, p=p / p.sum())
+    values = np.empty(len(keys), dtype=object)
+    values[:] = keys
+    return values[picks]
+
+
+def make_names(rng, count):
+    names = set()
+    while len(names) < count:
+        names.add(rng.choice(SURNAMES) + ''.join(rng.choice(GIVEN_SYLLABLES, 2)))
+    return sorted(names)
+
+
+def sample_days(rng, period, size, weekend_weight=0.6):
+    """Days in [start, end] with weekends less likely, as in the failure log"""
+    days = pd.date_range(*period, freq='D')
+    weights = np.where(days.dayofweek >= 5, weekend_weight, 1.0)
+    return days.to_numpy()[rng.choice(len(days), size=size, p=weights / weights.sum())]
+
+
+def generate_crane_list(rng, n_cranes):
+    codes = 900 + np.cumsum(rng.integers(1, 3, size=n_cranes))
+    prefixes = rng.choice(list(YARDS), size=n_cranes)
+    crane_codes = np.char.add(prefixes.astype(str), np.char.zfill(rng.integers(1, 100, size=n_cranes).astype(str), 2))
+    yards = np.array([YARDS[p] for p in prefixes], dtype=object)
+    plants = choose(rng, PLANTS, n_cranes)
+    main_load = choose(rng, MAIN_LOADS, n_cranes).astype(np.int64)
+    cycles = choose(rng, {label: n for label, (n, _) in INSPECTION_CYCLES.items()}, n_cranes)
+    lead_times = np.array([INSPECTION_CYCLES[c][1] for c in cycles], dtype=np.int64)
+
+    crane_names = pd.Series(yards).str.cat([pd.Series(rng.integers(1, 5, n_cranes)).astype(str)], sep=' #') \
+        + '(' + crane_codes + ')'
+    equipment_names = 'OHC ' + pd.Series(plants) + ' FOR ' + pd.Series(yards).str.upper() + ' ' + crane_codes \
+        + '(' + main_load.astype(str) + 'TON)'
+
+    installed = pd.to_datetime('1975-01-01') + pd.to_timedelta(rng.integers(0, 48 * 365, n_cranes), unit='D')
+    reference = pd.to_datetime('2025-05-12') + pd.to_timedelta(rng.integers(0, 19, n_cranes), unit='D')
+
+    return pd.DataFrame({
+        'EquipmentCode': np.char.add('4P1', np.char.zfill(codes.astype(str), 6)),
+        'Plant/Secsion': plants,
+        'EquipmentName': equipment_names,
+        'CraneName': crane_names,
+        'CraneCode': crane_codes,
+        'InspectionReferenceDate': reference.strftime('%Y-%m-%d 00:00:00.000'),
+        'InspectionCycle': cycles,
+        LEAD_TIME_COLUMN: lead_times,
+        'electricalManager': rng.choice(make_names(rng, 13), n_cranes),
+        'mechanicalManager': rng.choice(make_names(rng, 13), n_cranes),
+        'InstallationLocation': crane_names,
+        'InstallationDate': installed.strftime('%Y-%m-%d 00:00:00.000'),
+        'MainLoad\n(Ton)': main_load,
+        'AuxiliaryLoad\n(Ton)': choose(rng, AUXILIARY_LOADS, n_cranes).astype(np.int64),
+        'Grade': choose(rng, GRADES, n_cranes),
+        'DriveType': choose(rng, DRIVE_TYPES, n_cranes),
+        'HoistingDevice': choose(rng, HOISTING_DEVICES, n_cranes),
+        'UnmannedOperation': choose(rng, UNMANNED, n_cranes),
+    })
+
+
+def equipment_pool(rng, crane_df):
+    """CraneList rows plus orphan codes, each with a heavy-tailed failure/repair propensity"""
+    n_orphans = int(round(len(crane_df) * ORPHAN_CODE_FRACTION / (1 - ORPHAN_CODE_FRACTION)))
+    last_code = int(crane_df['EquipmentCode'].str[3:].astype(int).max())
+    orphans = crane_df.sample(n=n_orphans, replace=True, random_state=rng).reset_index(drop=True)
+    orphans['EquipmentCode'] = ['4P1' + str(last_code + i + 1).zfill(6) for i in range(n_orphans)]
+    pool = pd.concat([crane_df, orphans], ignore_index=True)
+    weights = rng.gamma(0.8, size=len(pool))
+    return pool, weights / weights.sum()
+
+
+def generate_failure_report(rng, pool, weights, n_failures):
+    owner = pool.iloc[rng.choice(len(pool), size=n_failures, p=weights)].reset_index(drop=True)
+    days = pd.DatetimeIndex(sample_days(rng, FAILURE_PERIOD, n_failures))
+    hours = np.asarray(START_HOURS, dtype=np.float64)
+    start_minutes = rng.choice(24, size=n_failures, p=hours / hours.sum()) * 60 + rng.choice([0, 30], size=n_failures)
+    worktime = np.clip(np.round(rng.lognormal(0.405, 0.94, size=n_failures) * 6) / 6, 1 / 6, 48)
+    end_minutes = (start_minutes + np.round(worktime * 60).astype(np.int64)) % (24 * 60)
+
+    device_type = choose(rng, DEVICE_TYPES, n_failures)
+    by_device = np.array([d for d, _ in device_type], dtype=object)
+    failure_type = np.array([t for _, t in device_type], dtype=object)
+    symptoms = choose(rng, SYMPTOMS, n_failures)
+
+    def clock(minutes):
+        return pd.Series(minutes // 60).astype(str).str.zfill(2) + ':' + pd.Series(minutes % 60).astype(str).str.zfill(2) + ':00'
+
+    return pd.DataFrame({
+        'date': days,
+        'dayOfweek': WEEKDAYS[days.dayofweek],
+        'plant': owner['Plant/Secsion'],
+        'crane': owner['CraneCode'],
+        'grade': owner['Grade'],
+        'UnmannedOperation': owner['UnmannedOperation'],
+        'symptom': symptoms,
+        'starttime': clock(start_minutes),
+        'endtime': clock(end_minutes),
+        'worktime': worktime,
+        'shiftType': choose(rng, SHIFT_TYPES, n_failures),
+        'Mechanical/Electrical': choose(rng, MECHANICAL_ELECTRICAL, n_failures),
+        'byDevice': by_device,
+        'type': failure_type,
+        'EquipmentCode': owner['EquipmentCode'],
+        'failureDetails': pd.Series(symptoms) + ' ' + rng.choice(FAILURE_DETAILS, n_failures),
+        'actionTaken': pd.Series(failure_type) + ' ' + rng.choice(ACTIONS, n_failures),
+    }).sort_values('date', kind='stable').reset_index(drop=True)
+
+
+def generate_repair_report(rng, pool, weights, n_repairs):
+    owner = pool.iloc[rng.choice(len(pool), size=n_repairs, p=weights)].reset_index(drop=True)
+    start = pd.DatetimeIndex(sample_days(rng, REPAIR_PERIOD, n_repairs, weekend_weight=0.3)) \
+        + pd.to_timedelta(rng.integers(7 * 60, 22 * 60, n_repairs), unit='m')
+    end = start + pd.to_timedelta(np.round(rng.lognormal(1.5, 1.0, n_repairs) * 60), unit='m')
+    workers = choose(rng, WORKERS, n_repairs).astype(np.int64)
+    work_minutes = workers * rng.choice([480, 480, 480, 240, 120, 90], n_repairs)
+
+    task_names = ('[' + owner['mechanicalManager'] + '] ' + owner['Plant/Secsion'] + ' ' + owner['CraneCode'] + ' '
+                  + rng.choice(REPAIR_PARTS, n_repairs) + ' ' + rng.choice(ACTIONS, n_repairs))
+    standby = rng.random(n_repairs) < STANDBY_FRACTION
+    task_names[standby] = rng.choice(STANDBY_TASKS, standby.sum())
+
+    order_numbers = np.char.zfill(rng.permutation(n_repairs * 10)[:n_repairs].astype(str), 7)
+    return pd.DataFrame({
+        'workOrder': 'P' + start.strftime('%y%m') + order_numbers,
+        'taskName': task_names,
+        'actualStartDateTime': start,
+        'actualEndDateTime': end.strftime('%Y-%m-%d %H:%M'),
+        'totalWorkers': workers,
+        'totalWorkTime': pd.Series(work_minutes // 60).astype(str) + ':' + pd.Series(work_minutes % 60).astype(str).str.zfill(2),
+        'areaName': choose(rng, AREAS, n_repairs),
+        'EquipmentCode': owner['EquipmentCode'],
+        'EquipmentName': owner['EquipmentName'],
+    })
+
+
+def generate_workbook(scale=1.0, seed=0):
+    """Return {sheet name: DataFrame} for a synthetic workbook at the given scale"""
+    rng = np.random.default_rng(seed)
+    crane_df = generate_crane_list(rng, max(1, int(round(BASE_CRANES * scale))))
+    pool, weights = equipment_pool(rng, crane_df)
+    return {
+        'CraneList': crane_df,
+        'FailureReport': generate_failure_report(rng, pool, weights, int(round(BASE_FAILURES * scale))),
+        'RepairReport': generate_repair_report(rng, pool, weights, int(round(BASE_REPAIRS * scale))),
+    }
+
+
+def write_workbook(sheets, path):
+    """Write .xlsx (streaming, write-only) or, for a path without .xlsx, one CSV per sheet.
+
+    Falls back to CSV when a sheet exceeds the Excel row limit; returns the path written.
+    """
+    if path.endswith('.xlsx') and max(len(df) for df in sheets.values()) > XLSX_MAX_ROWS:
+        path = path[:-len('.xlsx')]
+        print(f"Sheet exceeds {XLSX_MAX_ROWS} rows, writing CSV files to {path}/ instead")
+
+    if not path.endswith('.xlsx'):
+        os.makedirs(path, exist_ok=True)
+        for sheet in SHEETS:
+            sheets[sheet].to_csv(os.path.join(path, f'{sheet}.csv'), index=False)
+        return path
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    workbook = Workbook(write_only=True)
+    for sheet in SHEETS:
+        df = sheets[sheet]
+        worksheet = workbook.create_sheet(sheet)
+        worksheet.append(list(df.columns))
+        columns = [df[c].dt.to_pydatetime() if pd.api.types.is_datetime64_any_dtype(df[c]) else df[c].tolist()
+                   for c in df.columns]
+        for row in zip(*columns):
+            worksheet.append([value.item() if isinstance(value, np.generic) else value for value in row])
+    workbook.save(path)
+    return path
+
+
+def default_path(scale):
+    return os.path.join('benchmarks', 'data', f'synthetic_{scale:g}x.xlsx')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic crane workbook')
+    parser.add_argument('--scale', type=float, default=1.0, help='1 = real workbook size (233 cranes)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='.xlsx file, or a directory for CSV sheets '
+                                         '(default: benchmarks/data/synthetic_<scale>x.xlsx)')
+    args = parser.parse_args()
+
+    if args.scale <= 0:
+        print("Scale must be positive")
+        sys.exit(1)
+
+    sheets = generate_workbook(args.scale, args.seed)
+    path = write_workbook(sheets, args.output or default_path(args.scale))
+    counts = ', '.join(f"{sheet} {len(df)}" for sheet, df in sheets.items())
+    print(f"Wrote {path}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import gzip
+import hashlib
+import io
+import os
+
+import pandas as pd
+
+from apply_artifacts import HashingReader, iter_statements, statement_batches, verify_artifacts
+from export_artifacts import export_tables
+
+
+def test_statements_split_on_semicolons_outside_literals():
+    lines = [
+        '-- header comment\n',
+        '\n',
+        "INSERT INTO t VALUES ('a;\n",
+        "still the literal;', 'it''s');\n",
+        'UPDATE t SET x = 1;\n',
+        'SELECT 1',
+    ]
+    assert list(iter_statements(lines)) == [
+        "INSERT INTO t VALUES ('a;\nstill the literal;', 'it''s');\n",
+        'UPDATE t SET x = 1;\n',
+        'SELECT 1',
+    ]
+
+
+def test_statement_batches_read_gzip_files(tmp_path):
+    path = tmp_path / 'script.sql.gz'
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(''.join(f'SELECT {i};\n' for i in range(5)))
+    assert [len(batch) for batch in statement_batches(str(path), 2)] == [2, 2, 1]
+
+
+def test_hashing_reader_hashes_what_was_read():
+    reader = HashingReader(io.BytesIO(b'line one\nrest'))
+    assert reader.readline() + reader.read() == b'line one\nrest'
+    assert reader.digest.hexdigest() == hashlib.sha256(b'line one\nrest').hexdigest()
+
+
+def test_verify_artifacts_catches_missing_and_altered_files(tmp_path):
+    tables = {
+        'cranes': pd.DataFrame({'crane_id': ['A', 'B']}),
+        'failure_records': pd.DataFrame({'crane_id': ['A']}),
+        'maintenance_records': pd.DataFrame({'crane_id': ['B']}),
+    }
+    artifacts = export_tables(tables, str(tmp_path))
+    manifest = {'artifacts': artifacts}
+    assert verify_artifacts(str(tmp_path), manifest) == []
+
+    os.remove(tmp_path / 'failure_records.0001.copy.gz')
+    with gzip.GzipFile(tmp_path / 'maintenance_records.0001.copy.gz', 'wb', mtime=0) as f:
+        f.write(b'C\n')
+    assert verify_artifacts(str(tmp_path), manifest) == [
+        'failure_records.0001.copy.gz: missing',
+        'maintenance_records.0001.copy.gz: checksum mismatch',
+    ]
@@ -0,0 +1,92 @@
+import psycopg2.extensions
+import pytest
+
+from crane_timeline import DAILY_REPAIR_TYPES, DEFAULT_INSPECTION_CYCLE, FAILURE_TYPES, MATERIALIZE_SQL, refresh_timelines
+
+
+class FakeInfo:
+    transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, sql, params=None):
+        if sql is MATERIALIZE_SQL and self.conn.fail:
+            raise RuntimeError('materialize failed')
+        self.conn.log.append((sql, params))
+        self.rowcount = self.conn.rows
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    closed = False
+    info = FakeInfo()
+
+    def __init__(self, rows=0, fail=False):
+        self.log = []
+        self.rows = rows
+        self.fail = fail
+        self.rolled_back = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.log.append(('COMMIT', None))
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def statements(conn, prefix):
+    return [params for sql, params in conn.log if sql.strip().startswith(prefix)]
+
+
+# etl_locks commits its session setup; only commits after the DELETE belong to the refresh
+def committed_after_delete(conn):
+    deleted = next(i for i, (sql, _) in enumerate(conn.log) if sql.startswith('DELETE'))
+    return ('COMMIT', None) in conn.log[deleted:]
+
+
+def test_named_cranes_are_replaced_once_each():
+    conn = FakeConnection(rows=2)
+    assert refresh_timelines(conn, ['B', 'A', 'B']) == 2
+    assert statements(conn, 'DELETE FROM crane_timelines') == [(['A', 'B'],)]
+    params = next(params for sql, params in conn.log if sql is MATERIALIZE_SQL)
+    assert params == {
+        'all': False,
+        'crane_ids': ['A', 'B'],
+        'daily_types': list(DAILY_REPAIR_TYPES),
+        'failure_types': list(FAILURE_TYPES),
+        'default_cycle': DEFAULT_INSPECTION_CYCLE,
+    }
+    assert committed_after_delete(conn)
+
+
+def test_no_crane_ids_rebuilds_every_crane():
+    conn = FakeConnection(rows=5)
+    assert refresh_timelines(conn) == 5
+    assert statements(conn, 'DELETE FROM crane_timelines') == [None]
+    params = next(params for sql, params in conn.log if sql is MATERIALIZE_SQL)
+    assert params['all'] is True and params['crane_ids'] == []
+
+
+def test_a_failed_refresh_rolls_back():
+    conn = FakeConnection(fail=True)
+    with pytest.raises(RuntimeError):
+        refresh_timelines(conn, ['A'])
+    assert conn.rolled_back and not committed_after_delete(conn)
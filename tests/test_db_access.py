@@ -0,0 +1,94 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from db_access import fetch_column, iter_arrays, iter_chunks, iter_rows
+from update_actual_bydevice import excel_rows_by_date
+
+
+class FakeNamedCursor:
+    def __init__(self, rows, columns, name, withhold):
+        self.rows = list(rows)
+        self.columns = columns
+        self.name = name
+        self.withhold = withhold
+        self.description = None
+        self.fetch_sizes = []
+        self.closed = False
+
+    def execute(self, sql, params=None):
+        self.sql, self.params = sql, params
+
+    def fetchmany(self, size):
+        # Like psycopg2's named cursors, the description only appears once rows are fetched
+        self.description = [(column,) for column in self.columns]
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, rows, columns=('id',)):
+        self.rows = rows
+        self.columns = columns
+        self.cursors = []
+
+    def cursor(self, name=None, withhold=False):
+        assert name, 'large reads must use a server-side cursor'
+        self.cursors.append(FakeNamedCursor(self.rows, self.columns, name, withhold))
+        return self.cursors[-1]
+
+
+def test_chunks_are_bounded_and_the_cursor_is_closed():
+    conn = FakeConnection([(i,) for i in range(5)])
+    chunks = list(iter_chunks(conn, 'SELECT id FROM t WHERE x = %s', (1,), chunk_rows=2, hold=True))
+
+    assert chunks == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+    cursor = conn.cursors[0]
+    assert (cursor.params, cursor.withhold, cursor.closed) == ((1,), True, True)
+
+
+def test_each_stream_gets_its_own_cursor_name():
+    conn = FakeConnection([(1,)])
+    list(iter_rows(conn, 'SELECT 1'))
+    list(iter_rows(conn, 'SELECT 1'))
+    assert conn.cursors[0].name != conn.cursors[1].name
+
+
+def test_stopping_early_still_closes_the_cursor():
+    conn = FakeConnection([(i,) for i in range(10)])
+    rows = iter_rows(conn, 'SELECT id FROM t', chunk_rows=3)
+    assert next(rows) == (0,)
+    rows.close()
+    assert conn.cursors[0].closed
+
+
+def test_arrays_use_the_requested_dtypes():
+    conn = FakeConnection([(1, 2.5, 'a'), (2, None, 'b'), (3, 4.0, None)], columns=('id', 'worktime', 'crane_id'))
+    batches = list(iter_arrays(conn, 'SELECT ...', chunk_rows=2, dtypes={'id': 'int64', 'worktime': 'float64'}))
+
+    assert [batch['id'].tolist() for batch in batches] == [[1, 2], [3]]
+    assert batches[0]['id'].dtype == np.int64
+    assert np.isnan(batches[0]['worktime'][1])
+    assert batches[1]['crane_id'].dtype == object
+
+
+def test_fetch_column_collects_distinct_values():
+    assert fetch_column(FakeConnection([('A',), ('B',), ('A',)]), 'SELECT crane_id FROM cranes') == {'A', 'B'}
+
+
+def test_excel_rows_group_by_failure_date():
+    df = pd.DataFrame({
+        'date': ['2024-01-31', '2024.01.31', 'not a date', '2024-02-01'],
+        'crane': ['C1', 1234, 'C3', float('nan')],
+        'byDevice': ['Brake', None, 'Motor', 'Wheel'],
+    })
+    rows = excel_rows_by_date(df)
+    # Unparseable dates and missing cranes are dropped; numeric crane codes are matched as text
+    assert list(rows) == [datetime.date(2024, 1, 31)]
+    assert [crane for crane, _ in rows[datetime.date(2024, 1, 31)]] == ['C1', '1234']
+    assert pd.isna(rows[datetime.date(2024, 1, 31)][1][1])
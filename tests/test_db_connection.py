@@ -0,0 +1,117 @@
+import re
+
+import psycopg2
+import pytest
+from psycopg2 import errorcodes
+
+import db_connection
+from db_connection import (
+    PREPARED_STATEMENTS, RETRY_MAX_DELAY, backoff_delay, connection_settings, is_transient, run_with_retry,
+)
+
+
+def pg_error(base, code):
+    # pgcode is normally filled in by the driver from the server's reply
+    return type('ServerError', (base,), {'pgcode': code})()
+
+
+def test_settings_prefer_database_url(monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', 'postgresql://u@h/db')
+    assert connection_settings() == {'dsn': 'postgresql://u@h/db'}
+    monkeypatch.delenv('DATABASE_URL')
+    monkeypatch.setenv('PGHOST', 'db.local')
+    assert connection_settings()['host'] == 'db.local'
+
+
+def test_transient_errors():
+    assert is_transient(psycopg2.OperationalError('server closed the connection unexpectedly'))
+    assert is_transient(pg_error(psycopg2.extensions.TransactionRollbackError, errorcodes.DEADLOCK_DETECTED))
+    assert is_transient(pg_error(psycopg2.OperationalError, errorcodes.ADMIN_SHUTDOWN))
+    assert not is_transient(pg_error(psycopg2.ProgrammingError, errorcodes.UNDEFINED_TABLE))
+    assert not is_transient(ValueError('not a database error'))
+
+
+def test_backoff_grows_and_is_capped():
+    for attempt in range(10):
+        delay = backoff_delay(attempt)
+        assert 0 < delay <= RETRY_MAX_DELAY
+        assert delay <= db_connection.RETRY_BASE_DELAY * 2 ** attempt
+
+
+@pytest.mark.parametrize('name', sorted(PREPARED_STATEMENTS))
+def test_prepared_statements_bind_one_parameter_per_column(name):
+    sql = PREPARED_STATEMENTS[name]
+    parameters = sorted({int(n) for n in re.findall(r'\$(\d+)', sql)})
+    assert parameters == list(range(1, len(parameters) + 1))
+    columns = re.search(r'\(([^)]*)\)\s*VALUES', sql)
+    if columns:
+        assert len(columns.group(1).split(',')) == len(parameters)
+
+
+class FakeConn:
+    closed = False
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def pooled(monkeypatch):
+    """connect_db/release_db without a database; records what was borrowed and returned"""
+    events = []
+    monkeypatch.setattr(db_connection, 'connect_db', lambda: events.append('connect') or FakeConn())
+    monkeypatch.setattr(db_connection, 'release_db', lambda conn: events.append('release'))
+    monkeypatch.setattr(db_connection.time, 'sleep', lambda seconds: None)
+    return events
+
+
+def test_run_with_retry_repeats_transient_failures(pooled):
+    calls = []
+
+    def work(conn, value):
+        calls.append(value)
+        if len(calls) < 3:
+            raise pg_error(psycopg2.extensions.TransactionRollbackError, errorcodes.SERIALIZATION_FAILURE)
+        return value * 2
+
+    assert run_with_retry(work, 21) == 42
+    assert len(calls) == 3
+    # Every attempt borrows its own connection and gives it back
+    assert pooled == ['connect', 'release'] * 3
+
+
+def test_run_with_retry_does_not_repeat_real_errors(pooled):
+    def work(conn):
+        raise pg_error(psycopg2.ProgrammingError, errorcodes.UNDEFINED_TABLE)
+
+    with pytest.raises(psycopg2.ProgrammingError):
+        run_with_retry(work)
+    assert pooled == ['connect', 'release']
+
+
+def test_run_with_retry_gives_up(pooled):
+    def work(conn):
+        raise psycopg2.OperationalError('connection reset')
+
+    with pytest.raises(psycopg2.OperationalError):
+        run_with_retry(work, attempts=2)
+    assert pooled.count('connect') == 2
+
+
+class FakePool:
+    closed = False
+
+
+def test_pool_opens_the_requested_size_up_front(monkeypatch):
+    created = []
+    monkeypatch.setattr(db_connection, '_pool', None)
+    monkeypatch.setattr(db_connection, 'ThreadedConnectionPool',
+                        lambda minconn, maxconn, **settings: created.append((minconn, maxconn)) or FakePool())
+    monkeypatch.setattr(db_connection, 'POOL_SIZE', 4)
+
+    db_connection.get_pool(8)
+    assert created == [(8, 8)]
+    monkeypatch.setattr(db_connection, '_pool', None)
+    db_connection.get_pool()
+    assert created[-1] == (1, 4)
+
@@ -0,0 +1,36 @@
+import json
+from datetime import date, datetime
+
+import pandas as pd
+
+import etl_events
+from etl_events import change_payload, month_range
+
+
+def test_month_range_accepts_any_date_like_value():
+    assert month_range([date(2024, 3, 5), '2024-01-31', datetime(2024, 2, 1), None, float('nan'), pd.NaT]) == (
+        '2024-01', '2024-03')
+    assert month_range([]) is None
+
+
+def test_payload_carries_only_the_known_detail():
+    payload = json.loads(change_payload('cranes', plant_sections=['P2', 'P1', None, 'P1'], job='import', version=7))
+    assert payload == {'table': 'cranes', 'version': 7, 'job': 'import', 'plantSections': ['P1', 'P2']}
+
+
+def test_payload_with_months_and_cranes():
+    payload = json.loads(change_payload('failure_records', crane_ids=['B', 'A'], months=['2024-02-10', '2024-01-01']))
+    assert payload == {'table': 'failure_records', 'from': '2024-01', 'to': '2024-02', 'craneIds': ['A', 'B']}
+
+
+def test_oversized_payloads_drop_cranes_before_plant_sections(monkeypatch):
+    monkeypatch.setattr(etl_events, 'MAX_PAYLOAD_BYTES', 200)
+    cranes = [f'CRANE-{i:04d}' for i in range(50)]
+
+    payload = json.loads(change_payload('cranes', plant_sections=['1열연공장'], crane_ids=cranes, version=3))
+    assert payload == {'table': 'cranes', 'version': 3, 'plantSections': ['1열연공장']}
+
+    sections = [f'공장{i}' for i in range(50)]
+    payload = json.loads(change_payload('cranes', plant_sections=sections, crane_ids=cranes, months=['2024-01'],
+                                        version=3))
+    assert payload == {'table': 'cranes', 'version': 3, 'from': '2024-01', 'to': '2024-01'}
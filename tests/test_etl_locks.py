@@ -0,0 +1,92 @@
+from datetime import date
+
+import psycopg2.extensions
+
+from etl_locks import describe, etl_locks, key_pair, lock_key, lock_plan, month_resources, signed
+
+
+def test_whole_table_lock_covers_its_partitions():
+    assert lock_plan(['failure_records', 'failure_records/2024-03']) == [('failure_records', None, True)]
+
+
+def test_partitions_hold_their_table_shared_and_come_in_a_global_order():
+    plan = lock_plan(['maintenance_records/2024-04', 'cranes', 'maintenance_records/2024-03'], shared=['alerts'])
+    assert plan == [
+        ('alerts', None, False),
+        ('cranes', None, True),
+        ('maintenance_records', None, False),
+        ('maintenance_records', '2024-03', True),
+        ('maintenance_records', '2024-04', True),
+    ]
+    # Order does not depend on how the job listed them
+    assert plan == lock_plan(['maintenance_records/2024-03', 'maintenance_records/2024-04', 'cranes'],
+                             shared=['alerts'])
+
+
+def test_shared_does_not_weaken_an_exclusive_lock():
+    assert lock_plan(['cranes'], shared=['cranes']) == [('cranes', None, True)]
+
+
+def test_keys_fit_postgres_int4():
+    for name in ('failure_records', '2024-03', 'plant=1열연공장'):
+        assert 0 < lock_key(name) < 1 << 32
+        assert -(1 << 31) <= signed(lock_key(name)) < 1 << 31
+    assert key_pair('cranes', None) == (lock_key('cranes'), 0)
+
+
+def test_month_resources_and_names():
+    assert month_resources('failure_records', [date(2024, 3, 1)]) == ['failure_records/2024-03']
+    assert describe('cranes', None, False) == 'cranes (shared)'
+    assert describe('failure_records', '2024-03', True) == 'failure_records/2024-03'
+
+
+class FakeInfo:
+    transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+class FakeCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def execute(self, sql, params=None):
+        self.log.append((sql.split('(')[0].replace('SELECT ', ''), params))
+
+    def fetchone(self):
+        return (True,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    closed = False
+    info = FakeInfo()
+
+    def __init__(self):
+        self.log = []
+
+    def cursor(self):
+        return FakeCursor(self.log)
+
+    def commit(self):
+        self.log.append(('COMMIT', None))
+
+
+def test_locks_are_released_in_reverse_order_even_on_error():
+    conn = FakeConnection()
+    try:
+        with etl_locks(conn, 'failure_records/2024-03', job='test') as waited:
+            assert waited == 0.0
+            raise RuntimeError('job failed')
+    except RuntimeError:
+        pass
+
+    table, month = (signed(lock_key(n)) for n in ('failure_records', '2024-03'))
+    assert conn.log == [
+        ('SET application_name = %s', ('etl:test',)),
+        ('COMMIT', None),
+        ('pg_try_advisory_lock_shared', (table, 0)),
+        ('pg_try_advisory_lock', (table, month)),
+        ('pg_advisory_unlock', (table, month)),
+        ('pg_advisory_unlock_shared', (table, 0)),
+    ]
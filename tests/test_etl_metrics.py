@@ -0,0 +1,53 @@
+import json
+import sys
+
+import pytest
+
+from etl_metrics import RunMetrics, label_value
+
+
+def test_spans_accumulate_across_calls(tmp_path):
+    metrics = RunMetrics('job', output_dir=str(tmp_path), profile=False)
+    for _ in range(3):
+        with metrics.span('load', rows=2) as span:
+            span.add_rows(1)
+    metrics.record('lock_wait', 0.5)
+    metrics.record('lock_wait', 0.25, rows=4)
+
+    stages = metrics.summary()['stages']
+    assert (stages['load']['calls'], stages['load']['rows']) == (3, 9)
+    lock_wait = stages['lock_wait']
+    assert (lock_wait['seconds'], lock_wait['rows'], lock_wait['calls'], lock_wait['rows_per_sec']) == (0.75, 4, 2, 5.3)
+
+
+def test_run_writes_json_and_prometheus_files(tmp_path):
+    with RunMetrics('import_test', output_dir=str(tmp_path), profile=False) as metrics:
+        with metrics.span('read', rows=10):
+            pass
+
+    summary = json.loads((tmp_path / 'import_test.json').read_text(encoding='utf-8'))
+    assert summary['status'] == 'success'
+    assert summary['stages']['read']['rows'] == 10
+
+    prom = (tmp_path / 'import_test.prom').read_text(encoding='utf-8')
+    assert 'crane_etl_stage_rows{job="import_test",stage="read"} 10' in prom
+    assert 'crane_etl_run_success{job="import_test"} 1' in prom
+    assert not (tmp_path / 'import_test.prom.tmp').exists()
+
+
+def test_a_failed_run_is_reported_as_failed(tmp_path):
+    with pytest.raises(ValueError):
+        with RunMetrics('broken', output_dir=str(tmp_path), profile=False):
+            raise ValueError('boom')
+    assert json.loads((tmp_path / 'broken.json').read_text())['status'] == 'failed'
+
+
+def test_sys_exit_zero_is_a_success(tmp_path):
+    with pytest.raises(SystemExit):
+        with RunMetrics('done', output_dir=str(tmp_path), profile=False):
+            sys.exit(0)
+    assert json.loads((tmp_path / 'done.json').read_text())['status'] == 'success'
+
+
+def test_label_values_are_escaped():
+    assert label_value('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
@@ -0,0 +1,59 @@
+import gzip
+
+import pandas as pd
+
+from export_artifacts import ArtifactWriter, copy_lines, export_tables, insert_statement, render_blocks, sql_literals
+
+
+def test_copy_lines_escape_specials_and_mark_nulls():
+    df = pd.DataFrame({'a': ['x\ty', 'back\\slash', None], 'b': pd.array([1, None, 3], dtype='Int64')})
+    assert copy_lines(df).tolist() == ['x\\ty\t1', 'back\\\\slash\t\\N', '\\N\t3']
+
+
+def test_copy_lines_escape_newlines():
+    assert copy_lines(pd.DataFrame({'a': ['two\nlines\r']})).tolist() == ['two\\nlines\\r']
+
+
+def test_sql_literals_quote_text_but_not_numbers():
+    assert sql_literals(pd.Series(["it's", None])).tolist() == ["'it''s'", 'NULL']
+    assert sql_literals(pd.Series([1.5, None])).tolist() == ['1.5', 'NULL']
+    assert sql_literals(pd.Series([True, False])).tolist() == ["'True'", "'False'"]
+
+
+def test_insert_statements_upsert_cranes_and_skip_history_conflicts():
+    head, tail = insert_statement('cranes', ['crane_id', 'crane_name'])
+    assert head == 'INSERT INTO cranes (crane_id, crane_name) VALUES\n'
+    assert tail == '\nON CONFLICT (crane_id) DO UPDATE SET crane_name = EXCLUDED.crane_name;\n'
+    assert insert_statement('failure_records', ['crane_id'])[1] == '\nON CONFLICT DO NOTHING;\n'
+
+
+def test_render_blocks_split_inserts_by_statement_size():
+    df = pd.DataFrame({'crane_id': [f'C{i}' for i in range(5)]})
+    blocks = list(render_blocks('failure_records', df, 'insert', rows_per_statement=2))
+    assert [rows for _, rows in blocks] == [2, 2, 1]
+    assert blocks[-1][0] == "INSERT INTO failure_records (crane_id) VALUES\n('C4')\nON CONFLICT DO NOTHING;\n"
+
+
+def test_writer_rolls_over_without_splitting_a_block(tmp_path):
+    writer = ArtifactWriter(str(tmp_path), 'cranes', 'copy', max_bytes=10)
+    for text in ('aaaa\n', 'bbbb\n', 'cccc\n'):
+        writer.write(text, 1)
+    writer.close()
+
+    assert [(a['file'], a['first_row'], a['rows'], a['bytes']) for a in writer.artifacts] == [
+        ('cranes.0001.copy.gz', 0, 2, 10), ('cranes.0002.copy.gz', 2, 1, 5),
+    ]
+    assert gzip.open(tmp_path / 'cranes.0002.copy.gz').read() == b'cccc\n'
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_exports_are_reproducible(tmp_path):
+    tables = {
+        'cranes': pd.DataFrame({'crane_id': ['A', 'B']}),
+        'failure_records': pd.DataFrame({'crane_id': ['A'], 'date': ['2024-01-01']}),
+        'maintenance_records': pd.DataFrame({'crane_id': pd.Series([], dtype='string')}),
+    }
+    first = export_tables(tables, str(tmp_path / 'one'))
+    second = export_tables(tables, str(tmp_path / 'two'))
+    assert [a['sha256'] for a in first] == [a['sha256'] for a in second]
+    assert [(a['table'], a['rows']) for a in first] == [('cranes', 2), ('failure_records', 1)]
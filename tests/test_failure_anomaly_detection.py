@@ -0,0 +1,59 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from failure_anomaly_detection import (
+    CRANE_TOTAL, alert_key, build_count_matrix, ewma_zscores, period_start, to_period,
+)
+
+
+def test_weekly_periods_start_on_monday():
+    monday, sunday, next_monday = to_period(np.array(['2024-01-01', '2024-01-07', '2024-01-08'], 'datetime64[D]'), 'W')
+    assert monday == sunday
+    assert next_monday == monday + 1
+    assert period_start(monday, 'W') == date(2024, 1, 1)
+
+
+def test_daily_periods_round_trip():
+    period = to_period(np.array(['2024-02-29'], 'datetime64[D]'), 'D')[0]
+    assert period_start(period, 'D') == date(2024, 2, 29)
+
+
+def test_count_matrix_has_total_and_device_series():
+    records = pd.DataFrame({
+        'crane_id': ['A', 'A', 'A', 'B', 'A'],
+        'by_device': ['hoist', 'hoist', None, ' ', 'hoist'],
+        'date': pd.to_datetime(['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-03', '2024-01-10']),
+    })
+    first = to_period(np.array(['2024-01-01'], 'datetime64[D]'), 'D')[0]
+    keys, counts = build_count_matrix(records, 'D', first, first + 2)
+
+    rows = dict(zip(keys, counts.tolist()))
+    # The 2024-01-10 failure is outside the window; blank devices only count towards the total
+    assert rows == {
+        f'A|{CRANE_TOTAL}': [2.0, 1.0, 0.0],
+        'A|hoist': [2.0, 0.0, 0.0],
+        f'B|{CRANE_TOTAL}': [0.0, 0.0, 1.0],
+    }
+
+
+def test_ewma_scores_each_period_against_the_ones_before_it():
+    counts = np.array([[1.0, 1.0, 1.0, 9.0]])
+    z, mean, var = ewma_zscores(counts, np.array([1.0]), np.array([0.0]), alpha=0.5, min_std=0.5)
+
+    # A flat series never moves; the spike is scored against the floor std, not a zero variance
+    assert z[0, :3].tolist() == [0.0, 0.0, 0.0]
+    assert z[0, 3] == (9.0 - 1.0) / 0.5
+    assert mean[0] == 5.0
+    assert var[0] == 0.5 * (0.0 + 8.0 * 4.0)
+
+
+def test_ewma_leaves_the_stored_state_alone():
+    mean, var = np.array([2.0]), np.array([1.0])
+    ewma_zscores(np.array([[5.0]]), mean, var, alpha=0.1, min_std=0.5)
+    assert mean[0] == 2.0 and var[0] == 1.0
+
+
+def test_alert_key_names_series_freq_and_period():
+    assert alert_key('A|*', 'W', date(2024, 1, 1)) == 'A|*|W|2024-01-01'
@@ -0,0 +1,92 @@
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from failure_forecast import (
+    crane_starts, default_as_of, fit_crane_batch, fit_gamma_prior, fit_poisson_gamma, fit_weibull_process,
+    history_hash, prior_moved,
+)
+
+
+def frame(rows, columns):
+    df = pd.DataFrame(rows, columns=columns)
+    for column in ('date', 'installation_date'):
+        if column in df:
+            df[column] = pd.to_datetime(df[column])
+    return df
+
+
+def test_crane_starts_use_each_cranes_own_first_record():
+    cranes = frame([('A', '2020-01-01'), ('B', '2023-05-01'), ('C', None)], ['crane_id', 'installation_date'])
+    failures = frame([('A', '2024-03-01'), ('B', '2024-02-01')], ['crane_id', 'date'])
+    repairs = frame([('A', '2024-01-15')], ['crane_id', 'date'])
+    starts = crane_starts(cranes, failures, repairs, date(2024, 6, 30))
+
+    # A's first record is a repair; C has neither records nor an installation date
+    assert starts == {'A': date(2024, 1, 15), 'B': date(2024, 2, 1), 'C': date(2024, 6, 30)}
+
+
+def test_crane_starts_fall_back_to_installation():
+    cranes = frame([('A', '2024-04-01'), ('B', '2025-01-01')], ['crane_id', 'installation_date'])
+    empty = frame([], ['crane_id', 'date'])
+    starts = crane_starts(cranes, empty, empty, date(2024, 6, 30))
+    assert starts == {'A': date(2024, 4, 1), 'B': date(2024, 6, 30)}
+
+
+def test_history_hash_depends_only_on_the_cranes_own_window():
+    digest = history_hash([3, 1, 2], date(2024, 1, 1), date(2024, 6, 30))
+    assert digest == history_hash([1, 2, 3], date(2024, 1, 1), date(2024, 6, 30))
+    assert digest != history_hash([1, 2, 3], date(2023, 12, 1), date(2024, 6, 30))
+    assert digest != history_hash([1, 2, 4], date(2024, 1, 1), date(2024, 6, 30))
+
+
+def test_gamma_prior_matches_the_fleet_mean_rate():
+    prior = fit_gamma_prior([2, 10, 30], [100, 200, 300])
+    assert prior['alpha'] / prior['beta'] == pytest.approx(np.mean([0.02, 0.05, 0.1]))
+
+
+def test_gamma_prior_weighs_rates_by_each_cranes_exposure():
+    # Same counts; the crane tracked for a tenth of the time has ten times the rate
+    assert fit_gamma_prior([5, 5], [100, 1000]) != fit_gamma_prior([5, 5], 550)
+
+
+def test_gamma_prior_without_failures_is_weak():
+    assert fit_gamma_prior([0, 0], [100, 300]) == {'alpha': 0.5, 'beta': 100.0}
+    assert fit_gamma_prior([], 365)['alpha'] == 0.5
+
+
+def test_default_as_of_is_the_previous_sunday():
+    assert default_as_of(date(2024, 6, 5)) == date(2024, 6, 2)  # Wednesday
+    assert default_as_of(date(2024, 6, 2)) == date(2024, 5, 26)  # a Sunday itself moves back a week
+
+
+def test_prior_moved_beyond_tolerance():
+    params = json.dumps({'alpha': 1.0, 'beta': 100.0})
+    assert not prior_moved(params, {'alpha': 1.04, 'beta': 100.0})
+    assert prior_moved(params, {'alpha': 1.0, 'beta': 110.0})
+
+
+def test_poisson_gamma_shrinks_towards_the_prior():
+    model, params, expected = fit_poisson_gamma([10], 100, {'alpha': 1.0, 'beta': 100.0}, [30])
+    assert model == 'poisson_gamma'
+    assert params['rate_per_day'] == pytest.approx(2.0 / 200.0)
+    assert expected == [pytest.approx(0.3)]
+
+
+def test_weibull_process_sees_failures_speeding_up():
+    _, accelerating, _ = fit_weibull_process([300, 330, 350, 360, 365], 365, [30])
+    _, settling, _ = fit_weibull_process([0, 5, 15, 35, 65], 365, [30])
+    assert accelerating['shape'] > 1 > settling['shape']
+
+
+def test_fit_crane_batch_picks_the_model_by_event_count():
+    prior = {'alpha': 1.0, 'beta': 100.0}
+    batch = [('A', list(range(0, 80, 10)), 100, date(2024, 1, 1), 'a'), ('B', [5], 100, date(2024, 2, 1), 'b')]
+    results = fit_crane_batch(batch, prior, [30], min_events=8)
+    assert [(crane_id, model, count, start) for crane_id, _, model, _, count, start, _ in results] == [
+        ('A', 'weibull_process', 8, date(2024, 1, 1)),
+        ('B', 'poisson_gamma', 1, date(2024, 2, 1)),
+    ]
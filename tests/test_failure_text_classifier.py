@@ -0,0 +1,70 @@
+import pandas as pd
+
+from failure_text_classifier import (
+    AhoCorasick, KeywordClassifier, KeywordMatcher, fill_missing_labels, normalize_text, whole_token_only,
+)
+
+
+def test_automaton_reports_overlapping_keywords():
+    automaton = AhoCorasick(['he', 'she', 'hers', '모터'])
+    found = [automaton.keywords[index] for index in automaton.find('ushers 모터모터')]
+    assert sorted(found) == ['he', 'hers', 'she', '모터', '모터']
+
+
+def test_short_latin_keywords_only_match_whole_tokens():
+    matcher = KeywordMatcher(['ac', '12', 'brake', '모터'])
+    assert sorted(matcher.keywords[i] for i in matcher.find('backup brake at 120 rpm, 모터소음')) == ['brake', '모터']
+    assert sorted(matcher.keywords[i] for i in matcher.find('ac drive fault 12')) == ['12', 'ac']
+
+
+def test_hangul_keywords_match_anywhere_at_any_length():
+    assert not whole_token_only('유압')
+    assert whole_token_only('ac')
+    assert not whole_token_only('inv')
+
+
+def test_normalize_text_skips_blank_and_non_text_parts():
+    assert normalize_text(' Hoist NOISE ', None, float('nan'), '  ', '브레이크') == 'hoist noise\n브레이크'
+
+
+def labelled_rows():
+    return (
+        ['hoist brake worn'] * 3 + ['trolley wheel crack'] * 3 + ['hoist motor 과열'] * 3,
+        ['Hoist'] * 3 + ['Trolley'] * 3 + ['Hoist'] * 3,
+    )
+
+
+def test_classifier_votes_for_the_label_its_keywords_belong_to():
+    classifier = KeywordClassifier(min_support=3).fit(*labelled_rows())
+    assert classifier.predict('the trolley wheel squeals') == ('Trolley', 1.0)
+    label, confidence = classifier.predict('hoist brake and trolley wheel')
+    assert label == 'Hoist' and 0.5 < confidence < 1.0
+
+
+def test_classifier_without_a_known_keyword_does_not_guess():
+    classifier = KeywordClassifier(min_support=3).fit(*labelled_rows())
+    assert classifier.predict('unrelated text') == (None, 0.0)
+    assert classifier.predict('') == (None, 0.0)
+    assert KeywordClassifier().predict('hoist') == (None, 0.0)
+
+
+def test_classifier_drops_rare_and_impure_keywords():
+    texts = ['shared noise a1'] * 2 + ['shared noise b1'] * 2 + ['rare thing']
+    classifier = KeywordClassifier(min_support=2, min_purity=0.6).fit(texts, ['A', 'A', 'B', 'B', 'A'])
+    assert sorted(classifier.matcher.keywords) == ['a1', 'b1']
+
+
+def test_fill_missing_labels_keeps_inferred_values_apart():
+    texts, labels = labelled_rows()
+    classifiers = {'byDevice': KeywordClassifier(min_support=3).fit(texts, labels)}
+    rows = pd.DataFrame({
+        'symptom': ['trolley wheel noise', 'hoist brake and trolley wheel', 'trolley wheel'],
+        'byDevice': [None, '', 'Hoist'],
+    })
+    filled = fill_missing_labels(rows, classifiers, min_confidence=0.9)
+
+    assert filled['byDevice'].tolist() == ['Trolley', '', 'Hoist']
+    assert filled['byDevice_inferred'].tolist() == [True, False, False]
+    # Real labels are certain; the ambiguous guess is below the threshold and not applied
+    assert filled['byDevice_confidence'].iloc[2] == 1.0
+    assert filled['byDevice_confidence'].iloc[1] < 0.9
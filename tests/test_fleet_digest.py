@@ -0,0 +1,119 @@
+from datetime import date
+
+import pandas as pd
+
+from fleet_digest import (MAX_DIGEST_BYTES, MTBF_MONTHS, bound_digest, build_digests, encoded, mtbf_trend,
+                          overdue_inspections, top_counts)
+
+AS_OF = date(2024, 6, 15)
+
+
+def frames():
+    cranes = pd.DataFrame({
+        'crane_id': ['C1', 'C2', 'C3'],
+        'crane_name': ['CT73_PCM', 'CT74_PCM', None],
+        'plant_section': ['냉연', '냉연', None],
+        'grade': ['A', 'B', 'A'],
+        'drive_type': ['인버터'] * 3,
+        'unmanned_operation': ['유인'] * 3,
+        'electrical_manager': ['김'] * 3,
+        'mechanical_manager': ['이'] * 3,
+        'installation_date': [date(2010, 1, 1), None, None],
+        'inspection_cycle': [90, None, 30],
+        'lead_time': [7, None, None],
+        'next_maintenance_date': [date(2024, 6, 1), date(2024, 7, 1), date(2024, 5, 20)],
+    })
+    failures = pd.DataFrame({
+        'crane_id': ['C1', 'C1', 'C2'],
+        'date': pd.to_datetime(['2024-06-10', '2024-05-03', '2024-06-01']),
+        'by_device': ['Hoist', None, 'Hoist'],
+        'failure_type': ['electrical', 'mechanical', 'electrical'],
+        'downtime': [2, None, 3],
+        'description': ['인버터 트립', None, '브레이크 소음'],
+    })
+    repairs = pd.DataFrame({
+        'crane_id': ['C1'], 'date': pd.to_datetime(['2024-06-02']), 'type': ['routine'],
+        'task_name': ['주유'], 'duration': [1.5],
+    })
+    alerts = pd.DataFrame({
+        'crane_id': ['C2'], 'date': pd.to_datetime(['2024-06-12']), 'type': ['anomaly'],
+        'severity': ['high'], 'message': ['x' * 120],
+    })
+    return cranes, failures, repairs, alerts
+
+
+def test_top_counts_groups_missing_values_as_other():
+    values = pd.Series(['Hoist', None, '', 'Hoist', 'Trolley'])
+    assert top_counts(values) == [['Hoist', 2], ['기타', 2], ['Trolley', 1]]
+    assert top_counts(values, n=1) == [['Hoist', 2]]
+
+
+def test_mtbf_is_fleet_days_per_failure_for_each_recent_month():
+    failures = pd.DataFrame({'date': pd.to_datetime(['2024-06-01', '2024-06-20', '2024-04-02'])})
+    trend = mtbf_trend(failures, crane_count=2, as_of=AS_OF)
+    assert len(trend) == MTBF_MONTHS
+    assert trend[0] == ['2024-01', None]
+    assert trend[3] == ['2024-04', 60.0]
+    assert trend[-1] == ['2024-06', 30.0]
+
+
+def test_overdue_inspections_oldest_first():
+    cranes, *_ = frames()
+    assert overdue_inspections(cranes, AS_OF) == {
+        'count': 2,
+        # Unnamed cranes show their code
+        'cranes': [['C3', '2024-05-20', 26], ['CT73_PCM', '2024-06-01', 14]],
+    }
+
+
+def test_digests_cover_the_fleet_each_named_factory_and_each_crane():
+    digests = {(scope, key): digest for scope, key, digest in build_digests(*frames(), AS_OF)}
+    assert set(digests) == {('fleet', 'all'), ('factory', '냉연'), ('crane', 'C1'), ('crane', 'C2'), ('crane', 'C3')}
+
+    fleet = digests['fleet', 'all']
+    assert fleet['failures'] == {'count': 3, 'downtimeHours': 5}
+    assert fleet['cranes'] == 3 and fleet['factories'] == 1
+    assert fleet['topDevices'] == [['Hoist', 2], ['기타', 1]]
+    assert fleet['anomalies'] == [['2024-06-12', 'CT74_PCM', 'high', 'x' * 80]]
+
+    factory = digests['factory', '냉연']
+    assert factory['cranes'] == 2 and factory['overdue']['count'] == 1 and 'factories' not in factory
+
+    crane = digests['crane', 'C1']
+    assert crane['crane']['installed'] == '2010-01-01' and crane['crane']['cycleDays'] == 90
+    assert crane['nextInspection'] == {'date': '2024-06-01', 'daysLeft': -14}
+    assert crane['topRepairs'] == [['주유', 1]]
+    assert crane['repairs'] == {'count': 1, 'hours': 1}
+    assert [row[0] for row in crane['recentFailures']] == ['2024-06-10', '2024-05-03']
+    assert crane['recentFailures'][1] == ['2024-05-03', None, 'mechanical', '']
+
+    # A crane with no history still gets a digest
+    quiet = digests['crane', 'C3']
+    assert quiet['failures']['count'] == 0 and quiet['recentFailures'] == [] and quiet['crane']['leadDays'] is None
+    # Missing text comes out as null, never NaN
+    assert quiet['crane']['name'] is None and 'NaN' not in encoded(quiet)
+
+
+def test_bound_digest_halves_lists_in_trim_order_until_it_fits():
+    digest = {
+        'recentFailures': [['2024-06-01', 'Hoist', 'electrical', '가' * 60]] * 40,
+        'anomalies': [['2024-06-01', 'CT73', 'high', 'a' * 80]] * 8,
+        'topDevices': [['Hoist', 1]] * 5,
+    }
+    assert len(encoded(digest).encode('utf-8')) > MAX_DIGEST_BYTES
+    bounded = bound_digest(digest)
+    assert len(encoded(bounded).encode('utf-8')) <= MAX_DIGEST_BYTES
+    # recentFailures is shortened first; the later fields are left alone once it fits
+    assert 0 < len(bounded['recentFailures']) < 40
+    assert len(bounded['anomalies']) == 8 and len(bounded['topDevices']) == 5
+
+
+def test_bound_digest_moves_on_when_a_list_is_empty():
+    digest = {'recentFailures': [], 'overdue': {'count': 200, 'cranes': [['CT73_PCM', '2024-01-01', 100]] * 200}}
+    bounded = bound_digest(digest)
+    assert len(encoded(bounded).encode('utf-8')) <= MAX_DIGEST_BYTES
+    assert bounded['overdue']['count'] == 200 and len(bounded['overdue']['cranes']) < 200
+
+
+def test_encoded_keeps_hangul_and_drops_whitespace():
+    assert encoded({'name': '냉연', 'at': date(2024, 6, 1)}) == '{"name":"냉연","at":"2024-06-01"}'
@@ -0,0 +1,26 @@
+from datetime import date
+
+from history_partitions import months_of, next_month, parse_month, partition_month, partition_name
+
+
+def test_next_month_rolls_over_the_year():
+    assert next_month(date(2024, 1, 1)) == date(2024, 2, 1)
+    assert next_month(date(2024, 12, 1)) == date(2025, 1, 1)
+
+
+def test_partition_names_round_trip():
+    name = partition_name('failure_records', date(2024, 3, 1))
+    assert name == 'failure_records_2024_03'
+    assert partition_month(name) == date(2024, 3, 1)
+    assert partition_month('failure_records_default') is None
+
+
+def test_months_of_mixed_date_values():
+    assert months_of(['2024-03-31', '2024.03.01', '2024-01-15 08:00', None, 'garbage']) == [
+        date(2024, 1, 1), date(2024, 3, 1),
+    ]
+    assert months_of([]) == []
+
+
+def test_parse_month():
+    assert parse_month('2024-03') == date(2024, 3, 1)
@@ -0,0 +1,38 @@
+from history_search_index import (
+    build_sqlite_index, like_pattern, ngram_tokens, query_terms, search_sqlite, to_fts5_query, to_tsquery,
+)
+
+
+def test_hangul_runs_become_bigrams_and_words_stay_whole():
+    assert ngram_tokens('브레이크라이닝 교체, Motor-12 과') == [
+        '브레', '레이', '이크', '크라', '라이', '이닝', '교체', 'motor', '12', '과',
+    ]
+
+
+def test_query_terms_are_distinct_and_flag_prefixes():
+    # Words and lone syllables are prefixes; bigrams must match exactly
+    assert query_terms('라이닝 Motor 라이 과') == [('라이', False), ('이닝', False), ('motor', True), ('과', True)]
+
+
+def test_tsquery_and_fts5_query():
+    assert to_tsquery('라이닝 mot') == '라이 & 이닝 & mot:*'
+    assert to_fts5_query('라이닝 mot') == '"라이" AND "이닝" AND "mot"*'
+    assert to_tsquery('!!') == ''
+
+
+def test_like_pattern_escapes_wildcards():
+    assert like_pattern(' 50%_a\\b ') == '%50\\%\\_a\\\\b%'
+
+
+def test_sqlite_index_finds_words_inside_korean_compounds(tmp_path):
+    path = str(tmp_path / 'search.db')
+    build_sqlite_index([
+        ('failure', 1, 'C1', '2024-01-01', '브레이크라이닝교체 필요'),
+        ('repair', 2, 'C2', '2024-01-02', 'Motor bearing replaced'),
+        ('repair', 3, 'C1', '2024-01-03', ''),
+    ], path)
+
+    assert [row[1] for row in search_sqlite(path, '라이닝')] == [1]
+    assert [row[1] for row in search_sqlite(path, 'bear')] == [2]
+    assert search_sqlite(path, 'bear', crane_id='C1') == []
+    assert search_sqlite(path, '...') == []
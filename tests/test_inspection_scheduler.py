@@ -0,0 +1,73 @@
+from datetime import date
+
+import pandas as pd
+
+from inspection_scheduler import DEFAULT_INSPECTION_CYCLE, DEFAULT_LEAD_TIME, compute_next_due, expand_calendar
+
+
+def schedule_inputs(*rows):
+    return pd.DataFrame(rows, columns=[
+        'crane_id', 'inspection_reference_date', 'inspection_cycle', 'lead_time', 'last_completed'
+    ])
+
+
+def test_next_due_advances_by_whole_cycles():
+    inputs = schedule_inputs(('C1', '2024-01-01', 30, 5, None))
+    next_due = compute_next_due(inputs, date(2024, 3, 15))
+    # 2024-01-01 + 3 * 30 days is the first due date on or after 2024-03-15
+    assert next_due['next_due'].iloc[0] == pd.Timestamp('2024-03-31')
+    assert next_due['inspection_cycle'].iloc[0] == 30
+    assert next_due['lead_time'].iloc[0] == 5
+
+
+def test_next_due_is_as_of_when_it_falls_on_a_cycle():
+    inputs = schedule_inputs(('C1', '2024-01-01', 30, 5, None))
+    assert compute_next_due(inputs, date(2024, 1, 31))['next_due'].iloc[0] == pd.Timestamp('2024-01-31')
+
+
+def test_next_due_keeps_a_future_anchor():
+    inputs = schedule_inputs(('C1', '2024-06-01', 30, 5, None))
+    assert compute_next_due(inputs, date(2024, 1, 1))['next_due'].iloc[0] == pd.Timestamp('2024-06-01')
+
+
+def test_next_due_falls_back_to_last_completed_and_defaults():
+    inputs = schedule_inputs(
+        ('C1', None, None, None, '2024-01-01'),
+        ('C2', None, 30, 5, None),  # no anchor at all
+        ('C3', '2024-01-01', 0, 5, None),  # no usable cycle
+    )
+    next_due = compute_next_due(inputs, date(2024, 1, 2))
+    assert next_due['crane_id'].tolist() == ['C1']
+    assert next_due['next_due'].iloc[0] == pd.Timestamp('2024-01-01') + pd.Timedelta(days=DEFAULT_INSPECTION_CYCLE)
+    assert next_due['lead_time'].iloc[0] == DEFAULT_LEAD_TIME
+
+
+def test_expand_calendar_lists_every_due_date_up_to_the_horizon():
+    next_due = pd.DataFrame({
+        'crane_id': ['A', 'B', 'C'],
+        'next_due': pd.to_datetime(['2024-01-10', '2024-01-05', '2024-03-01']),
+        'inspection_cycle': [10, 30, 7],
+        'lead_time': [2, 3, 1],
+    })
+    calendar = expand_calendar(next_due, date(2024, 1, 30))
+
+    # C is past the horizon; the horizon itself is included
+    assert list(zip(calendar['crane_id'], calendar['due_date'].dt.strftime('%Y-%m-%d'))) == [
+        ('B', '2024-01-05'), ('A', '2024-01-10'), ('A', '2024-01-20'), ('A', '2024-01-30'),
+    ]
+    assert (calendar['due_date'] - calendar['window_start']).dt.days.tolist() == [3, 2, 2, 2]
+
+
+def test_expand_calendar_with_nothing_due():
+    next_due = pd.DataFrame({
+        'crane_id': ['A'], 'next_due': pd.to_datetime(['2025-01-01']), 'inspection_cycle': [30], 'lead_time': [7],
+    })
+    assert expand_calendar(next_due, date(2024, 1, 1)).empty
+
+
+def test_parse_inspection_cycle_labels():
+    from workbook_normalize import parse_inspection_cycle
+
+    days = parse_inspection_cycle(['4주(28일)', '2주', 14, ' 30일 ', None, '수시'])
+    assert days.tolist()[:4] == [28, 14, 14, 30]
+    assert days.isna().tolist()[4:] == [True, True]
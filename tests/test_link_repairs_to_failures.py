@@ -0,0 +1,48 @@
+import pandas as pd
+
+from link_repairs_to_failures import date_range, link_repairs
+
+
+def failures(*rows):
+    df = pd.DataFrame(rows, columns=['failure_id', 'crane_id', 'failure_date'])
+    df['failure_date'] = pd.to_datetime(df['failure_date'])
+    return df
+
+
+def repairs(*rows):
+    df = pd.DataFrame(rows, columns=['id', 'crane_id', 'repair_start'])
+    df['repair_start'] = pd.to_datetime(df['repair_start'], format='mixed')
+    return df
+
+
+def links(linked):
+    return {int(row.id): (None if pd.isna(row.failure_id) else int(row.failure_id)) for row in linked.itertuples()}
+
+
+def test_repair_links_to_the_nearest_preceding_failure_on_its_crane():
+    linked = link_repairs(
+        failures((1, 'A', '2024-01-01'), (2, 'A', '2024-01-05'), (3, 'B', '2024-01-06')),
+        repairs((10, 'A', '2024-01-06 08:00'), (11, 'B', '2024-01-07')),
+    )
+    assert links(linked) == {10: 2, 11: 3}
+    assert linked.set_index('id').loc[10, 'repair_lag_hours'] == 32.0
+
+
+def test_repair_before_any_failure_is_not_linked_forward():
+    assert links(link_repairs(failures((1, 'A', '2024-01-10')), repairs((10, 'A', '2024-01-09')))) == {10: None}
+
+
+def test_tolerance_bounds_the_lag():
+    pair = failures((1, 'A', '2024-01-01')), repairs((10, 'A', '2024-01-08'), (11, 'A', '2024-01-08 00:00:01'))
+    assert links(link_repairs(*pair, tolerance_days=7)) == {10: 1, 11: None}
+    assert links(link_repairs(*pair, tolerance_days=1)) == {10: None, 11: None}
+
+
+def test_repairs_without_a_start_are_kept_unlinked():
+    linked = link_repairs(failures((1, 'A', '2024-01-01')), repairs((10, 'A', None), (11, None, '2024-01-02')))
+    assert links(linked) == {10: None, 11: None}
+
+
+def test_date_range_filters_only_when_a_window_is_given():
+    assert date_range(None) == ('', ())
+    assert date_range(('2024-01-01', '2024-02-01')) == ("WHERE date >= %s AND date < %s", ('2024-01-01', '2024-02-01'))
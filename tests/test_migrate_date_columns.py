@@ -0,0 +1,21 @@
+from migrate_date_columns import convert_values, stale_rows_sql
+
+
+def test_date_values_render_as_iso_dates():
+    values, rejected = convert_values(['2024.01.31', '2024. 1. 5', '45322', '', None, 'soon'], 'date')
+    assert values == ['2024-01-31', '2024-01-05', '2024-01-31', None, None, None]
+    # Only text that was there and could not be read is a reject
+    assert rejected == [False, False, False, False, False, True]
+
+
+def test_timestamp_values_carry_the_plant_offset():
+    values, rejected = convert_values(['2024-01-31 08:15', '2024-01-31T00:00:00Z', '2024-02-30 10:00'], 'timestamptz')
+    assert values == ['2024-01-31 08:15:00+0900', '2024-01-31 09:00:00+0900', None]
+    assert rejected == [False, False, True]
+
+
+def test_stale_rows_compare_the_rendered_shadow_with_the_raw_text():
+    assert stale_rows_sql('failure_records', 'date', 'date') == (
+        "SELECT id, date FROM failure_records WHERE date_typed::text IS DISTINCT FROM NULLIF(date, '')"
+    )
+    assert "AT TIME ZONE 'Asia/Seoul'" in stale_rows_sql('maintenance_records', 'actual_start_date_time', 'timestamptz')
@@ -0,0 +1,81 @@
+import json
+import os
+from datetime import date
+
+import pytest
+
+from snapshot_parquet import SNAPSHOT_TABLES, select_sql
+
+
+def test_select_sql_reads_numerics_as_float8_in_file_order():
+    sql = select_sql('failure_records')
+    assert 'worktime::float8 AS worktime' in sql
+    assert sql.endswith('FROM failure_records ORDER BY date, id')
+    assert select_sql('cranes').endswith('FROM cranes ORDER BY id')
+
+
+def write_snapshot(directory, rows):
+    """A snapshot laid out like export_snapshot's, from {table: [{column: value}]}"""
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    from snapshot_parquet import arrow_schema
+
+    for table, spec in SNAPSHOT_TABLES.items():
+        schema = arrow_schema(table)
+        columns = {name: [row.get(name) for row in rows.get(table, [])] for name in spec['columns']}
+        data = pa.table({name: pa.array(values, type=schema.field(name).type) for name, values in columns.items()},
+                        schema=schema)
+        if spec['monthly'] and data.num_rows:
+            months = sorted({f"{row['date']:%Y-%m}" for row in rows[table]})
+            for month in months:
+                keep = [f"{value:%Y-%m}" == month for value in columns['date']]
+                path = os.path.join(directory, table, f'month={month}')
+                os.makedirs(path)
+                pq.write_table(data.filter(pa.array(keep)), os.path.join(path, 'part-0.parquet'))
+        else:
+            os.makedirs(os.path.join(directory, table))
+            pq.write_table(data, os.path.join(directory, table, 'part-0.parquet'))
+    with open(os.path.join(directory, 'snapshot.json'), 'w') as f:
+        json.dump({'tables': list(SNAPSHOT_TABLES)}, f)
+
+
+def test_queries_reproduce_the_dashboard_analytics(tmp_path):
+    pytest.importorskip('duckdb')
+    from snapshot_queries import connect, run_query
+
+    write_snapshot(str(tmp_path), {
+        'cranes': [
+            {'id': 1, 'crane_id': 'A', 'plant_section': 'P1', 'unmanned_operation': '무인', 'grade': 'A'},
+            {'id': 2, 'crane_id': 'B', 'plant_section': 'P1', 'unmanned_operation': '유인', 'grade': 'B'},
+            {'id': 3, 'crane_id': 'C', 'plant_section': None, 'unmanned_operation': 'Y', 'grade': ''},
+        ],
+        'failure_records': [
+            {'id': 1, 'crane_id': 'A', 'date': date(2024, 1, 3), 'by_device': 'Brake', 'failure_type': 'Coil'},
+            {'id': 2, 'crane_id': 'A', 'date': date(2024, 2, 3), 'by_device': ' Brake ', 'failure_type': 'Coil'},
+            {'id': 3, 'crane_id': 'B', 'date': date(2024, 2, 9), 'by_device': '', 'failure_type': 'Cable'},
+        ],
+    })
+    con = connect(str(tmp_path))
+
+    assert run_query(con, 'factory-overview') == [
+        {'factoryName': 'P1', 'totalCranes': 2, 'mannedCranes': 1, 'unmannedCranes': 1,
+         'mannedPercentage': 50, 'unmannedPercentage': 50},
+        {'factoryName': '미분류', 'totalCranes': 1, 'mannedCranes': 0, 'unmannedCranes': 1,
+         'mannedPercentage': 0, 'unmannedPercentage': 100},
+    ]
+    assert run_query(con, 'failure-causes') == [
+        {'cause': 'Brake', 'count': 2, 'percentage': 67},
+        {'cause': 'Cable', 'count': 1, 'percentage': 33},
+    ]
+    # month comes from the partition directories
+    assert [(row['month'], row['byDevice']) for row in run_query(con, 'bydevice-trends')] == [
+        ('2024-01', 'Brake'), ('2024-02', 'Brake'), ('2024-02', '미분류'),
+    ]
+
+
+def test_connect_needs_a_snapshot(tmp_path):
+    pytest.importorskip('duckdb')
+    from snapshot_queries import connect
+
+    with pytest.raises(FileNotFoundError):
+        connect(str(tmp_path))
@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from synthetic_workbook import BASE_CRANES, BASE_FAILURES, generate_workbook, write_workbook
+from workbook_normalize import (
+    CRANE_COLUMNS, FAILURE_COLUMNS, MAINTENANCE_COLUMNS, PROVENANCE_COLUMNS, clean_text, format_date,
+    format_timestamp, normalize_workbook, parse_datetimes, parse_work_time, read_workbook, sheet_rows,
+)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-31', '2024-01-31 00:00:00'),
+    ('2024-01-31 08:15:00', '2024-01-31 08:15:00'),
+    ('2024.01.31', '2024-01-31 00:00:00'),
+    ('2024. 1. 5', '2024-01-05 00:00:00'),
+    ('2024. 01. 31. 08:30', '2024-01-31 08:30:00'),
+    ('2024/1/5', '2024-01-05 00:00:00'),
+    ('20240131', '2024-01-31 00:00:00'),
+    ('2024년 1월 31일', '2024-01-31 00:00:00'),
+    ('45322', '2024-01-31 00:00:00'),
+    ('45322.5', '2024-01-31 12:00:00'),
+    ('2024-01-31T00:00:00Z', '2024-01-31 09:00:00'),
+    ('2024-01-31 23:30:00-05:00', '2024-02-01 13:30:00'),
+    ('2024-02-30', None),
+    ('nan', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_datetimes_formats(value, expected):
+    parsed = format_timestamp([value]).iloc[0]
+    assert pd.isna(parsed) if expected is None else parsed == expected
+
+
+def test_parse_datetimes_converts_aware_series_to_plant_time():
+    aware = pd.Series(pd.to_datetime(['2024-01-31 15:00:00'], utc=True))
+    assert parse_datetimes(aware).tolist() == [pd.Timestamp('2024-02-01 00:00:00')]
+
+
+def test_format_date_drops_the_time():
+    dates = format_date(['2024-01-31 23:59:00', 'garbage'])
+    assert dates.iloc[0] == '2024-01-31' and pd.isna(dates.iloc[1])
+
+
+def test_parse_work_time():
+    hours = parse_work_time(['16:00', '9:30', '2.5', None, 'x'])
+    assert hours.fillna(-1).tolist() == [16.0, 9.5, 2.5, -1, -1]
+
+
+def test_clean_text_and_sheet_rows():
+    assert clean_text([' a ', '', 'nan', None]).fillna('-').tolist() == ['a', '-', '-', '-']
+    assert sheet_rows(pd.DataFrame({'x': [1, 2, 3]})).tolist() == [2, 3, 4]
+
+
+def test_synthetic_workbook_scales_and_is_reproducible():
+    small = generate_workbook(scale=0.1, seed=1)
+    assert len(small['CraneList']) == round(BASE_CRANES * 0.1)
+    assert len(small['FailureReport']) == round(BASE_FAILURES * 0.1)
+    assert small['FailureReport'].equals(generate_workbook(scale=0.1, seed=1)['FailureReport'])
+
+
+def test_synthetic_workbook_normalizes_like_the_real_one(tmp_path):
+    sheets = generate_workbook(scale=0.05, seed=2)
+    path = write_workbook(sheets, str(tmp_path / 'synthetic'))
+    tables = normalize_workbook(read_workbook(path), {'source_file': 'abc', 'import_batch': 'b1'})
+
+    assert list(tables['cranes'].columns) == CRANE_COLUMNS + PROVENANCE_COLUMNS
+    assert list(tables['failure_records'].columns) == FAILURE_COLUMNS + PROVENANCE_COLUMNS
+    assert list(tables['maintenance_records'].columns) == MAINTENANCE_COLUMNS + PROVENANCE_COLUMNS
+    assert tables['cranes']['crane_id'].is_unique
+    # Every failure keeps a parseable date and points back at its sheet row
+    failures = tables['failure_records']
+    assert failures['date'].notna().all()
+    assert failures['source_row'].min() >= 2
+    assert (failures['source_sheet'] == 'FailureReport').all()
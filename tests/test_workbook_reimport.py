@@ -0,0 +1,70 @@
+import argparse
+import re
+
+import pandas as pd
+import pytest
+
+from workbook_normalize import sheet_rows
+from workbook_provenance import sheet_row, workbook_provenance
+from workbook_reimport import parse_rows, section_cranes, select_rows
+
+
+def test_row_ranges_and_single_rows():
+    assert parse_rows('120-180') == (120, 180)
+    assert parse_rows('57') == (57, 57)
+
+
+@pytest.mark.parametrize('value', ['1', '1-5', '10-9', 'a-b', ''])
+def test_bad_row_ranges_are_argument_errors(value):
+    with pytest.raises((argparse.ArgumentTypeError, ValueError)):
+        parse_rows(value)
+
+
+def test_select_rows_by_range_and_crane():
+    df = pd.DataFrame({'source_row': [2, 3, 4, 5], 'crane_id': ['A', 'B', 'A', 'B']})
+    assert select_rows(df) is df
+    assert select_rows(df, rows=(3, 4))['source_row'].tolist() == [3, 4]
+    assert select_rows(df, crane_ids=['A'])['source_row'].tolist() == [2, 4]
+    assert select_rows(df, rows=(3, 5), crane_ids=['B'])['source_row'].tolist() == [3, 5]
+    # An empty crane list selects nothing, unlike no crane list at all
+    assert select_rows(df, crane_ids=[]).empty
+
+
+class FakeCursor:
+    def execute(self, sql, params=None):
+        self.params = params
+
+    def fetchall(self):
+        return [('DB1',), ('B',)]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def cursor(self):
+        return FakeCursor()
+
+
+def test_section_cranes_joins_the_workbook_and_the_database():
+    cranes = pd.DataFrame({'crane_id': ['A', 'B', 'C'], 'plant_section': ['냉연', '냉연', '열연']})
+    assert section_cranes(FakeConnection(), cranes, '냉연') == ['A', 'B', 'DB1']
+
+
+def test_sheet_row_matches_the_normalized_loaders():
+    # dropna() keeps the sheet's index, so a record keeps its Excel row number
+    df = pd.DataFrame({'value': [1, None, 3]})
+    assert [sheet_row(index) for index in df.index] == sheet_rows(df).tolist() == [2, 3, 4]
+    assert [sheet_row(index) for index in df.dropna().index] == [2, 4]
+
+
+def test_workbook_provenance_hashes_the_content(tmp_path):
+    first, second = tmp_path / 'a.xlsx', tmp_path / 'b.xlsx'
+    first.write_bytes(b'workbook')
+    second.write_bytes(b'workbook')
+    provenance = workbook_provenance(str(first))
+    assert provenance['source_file'] == workbook_provenance(str(second))['source_file']
+    assert len(provenance['source_file']) == 16
+    assert re.fullmatch(r'\d{8}T\d{6}', provenance['import_batch'])
+    second.write_bytes(b'changed')
+    assert workbook_provenance(str(second))['source_file'] != provenance['source_file']
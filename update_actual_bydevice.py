@@ -1,23 +1,22 @@
 #!/usr/bin/env python3
 import pandas as pd
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import execute_values
 import os
 
-def connect_db():
-    """Connect to PostgreSQL database"""
-    try:
-        conn = psycopg2.connect(
-            host=os.getenv('PGHOST'),
-            database=os.getenv('PGDATABASE'),
-            user=os.getenv('PGUSER'),
-            password=os.getenv('PGPASSWORD'),
-            port=os.getenv('PGPORT')
-        )
-        return conn
-    except Exception as e:
-        print(f"Database connection error: {e}")
-        return None
+from db_access import iter_chunks
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from workbook_normalize import parse_datetimes
+
+def excel_rows_by_date(df):
+    """FailureReport (crane, byDevice) pairs grouped by failure date, in sheet order"""
+    rows_by_date = {}
+    excel_dates = parse_datetimes(df['date']).dt.date
+    for day, crane, by_device in zip(excel_dates, df['crane'], df['byDevice']):
+        if pd.notna(day) and pd.notna(crane):
+            rows_by_date.setdefault(day, []).append((str(crane), by_device))
+    return rows_by_date
 
 def update_bydevice_from_excel():
     """Update failure_records with actual byDevice data from Excel"""
@@ -31,79 +30,70 @@ def update_bydevice_from_excel():
     if not conn:
         return
     
+    cursor = None
     try:
         # Read FailureReport sheet
         df = pd.read_excel(excel_file, sheet_name='FailureReport')
         print(f"Loaded {len(df)} records from FailureReport sheet")
         
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Clear existing byDevice data first
-        cursor.execute("UPDATE failure_records SET by_device = NULL")
-        print("Cleared existing byDevice data")
+        with etl_locks(conn, 'failure_records', job='update_actual_bydevice'):
+            cursor = conn.cursor()
         
-        # Get all failure records from database
-        cursor.execute("SELECT id, date, crane_id, description FROM failure_records ORDER BY date")
-        db_records = cursor.fetchall()
-        print(f"Found {len(db_records)} records in database")
+            # Clear existing byDevice data first
+            cursor.execute("UPDATE failure_records SET by_device = NULL")
+            print("Cleared existing byDevice data")
         
-        updated_count = 0
+            updated_count = 0
+            scanned = 0
+            # Grouped once: matching a record only scans the Excel rows of its own date
+            rows_by_date = excel_rows_by_date(df)
+            matches = {}  # (date, crane prefix) -> byDevice of the first matching Excel row
         
-        # Try to match Excel data with database records
-        for db_record in db_records:
-            db_date = db_record['date']
-            db_crane = db_record['crane_id']
-            
-            # Convert db_date to match Excel format if needed
-            if isinstance(db_date, str):
-                # Try to parse the date string
-                try:
-                    from datetime import datetime
-                    db_date_obj = datetime.strptime(db_date.split('T')[0], '%Y-%m-%d')
-                except:
-                    continue
-            else:
-                db_date_obj = db_date
-            
-            # Look for matching record in Excel based on date and crane
-            excel_matches = df[
-                (pd.to_datetime(df['date']).dt.date == db_date_obj.date()) &
-                (df['crane'].astype(str).str.contains(db_crane.split('_')[0] if '_' in db_crane else db_crane, na=False))
-            ]
-            
-            if len(excel_matches) > 0:
-                # Use the first match
-                excel_record = excel_matches.iloc[0]
-                bydevice_value = excel_record['byDevice']
+            # Stream the failure records and try to match each with an Excel row by date and crane
+            for db_records in iter_chunks(conn, "SELECT id, date, crane_id FROM failure_records ORDER BY date"):
+                scanned += len(db_records)
+                updates = []
+                for record_id, db_date, db_crane in db_records:
+                    # db_date is a datetime.date (failure_records.date is a date column)
+                    key = (db_date, db_crane.split('_')[0])
+                    if key not in matches:
+                        matches[key] = next((by_device for crane, by_device in rows_by_date.get(db_date, ())
+                                             if key[1] in crane), None)
                 
-                if pd.notna(bydevice_value) and bydevice_value.strip() != '':
-                    # Update database record
-                    cursor.execute(
-                        "UPDATE failure_records SET by_device = %s WHERE id = %s",
-                        (str(bydevice_value).strip(), db_record['id'])
-                    )
-                    updated_count += 1
-                    
-                    if updated_count % 100 == 0:
-                        print(f"Updated {updated_count} records...")
+                    # Use the first match
+                    bydevice_value = matches[key]
+                    if pd.notna(bydevice_value) and str(bydevice_value).strip() != '':
+                        updates.append((record_id, str(bydevice_value).strip()))
+            
+                if updates:
+                    execute_values(cursor, """
+                        UPDATE failure_records AS f
+                        SET by_device = v.by_device
+                        FROM (VALUES %s) AS v(id, by_device)
+                        WHERE f.id = v.id
+                    """, updates, page_size=1000)
+                    updated_count += len(updates)
+                print(f"Scanned {scanned} records, {updated_count} updated...")
         
-        conn.commit()
-        print(f"Successfully updated {updated_count} records with byDevice data")
+            notify_change(conn, 'failure_records', job='update_actual_bydevice')
+            conn.commit()
+            print(f"Successfully updated {updated_count} records with byDevice data")
         
-        # Verify the update
-        cursor.execute("SELECT by_device, COUNT(*) as count FROM failure_records WHERE by_device IS NOT NULL GROUP BY by_device ORDER BY count DESC LIMIT 10")
-        results = cursor.fetchall()
+            # Verify the update
+            cursor.execute("SELECT by_device, COUNT(*) as count FROM failure_records WHERE by_device IS NOT NULL GROUP BY by_device ORDER BY count DESC LIMIT 10")
+            results = cursor.fetchall()
         
-        print("\nTop byDevice categories after update:")
-        for row in results:
-            print(f"  {row['by_device']}: {row['count']} records")
+            print("\nTop byDevice categories after update:")
+            for by_device, count in results:
+                print(f"  {by_device}: {count} records")
             
     except Exception as e:
         print(f"Error updating byDevice data: {e}")
         conn.rollback()
     finally:
-        cursor.close()
-        conn.close()
+        if cursor:
+            cursor.close()
+        release_db(conn)
 
 if __name__ == "__main__":
     update_bydevice_from_excel()
\ No newline at end of file
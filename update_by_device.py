@@ -1,8 +1,11 @@
 import pandas as pd
-import psycopg2
 import os
 from datetime import datetime
 
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+
 def update_by_device_data():
     """Update failure_records with byDevice data from Excel"""
     
@@ -11,44 +14,46 @@ def update_by_device_data():
     df = pd.read_excel(excel_path, sheet_name='FailureReport')
     
     # Connect to database
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    conn = connect_db()
+    if not conn:
+        return
     cursor = conn.cursor()
     
-    updated_count = 0
+    with etl_locks(conn, 'failure_records', job='update_by_device'):
+        updated_count = 0
+        changed_cranes = set()
     
-    # Process each row
-    for index, row in df.iterrows():
-        if pd.notna(row['byDevice']) and str(row['byDevice']).strip() != '':
-            try:
-                # Format date
-                date_str = pd.to_datetime(row['date']).strftime('%Y-%m-%d')
-                crane_id = str(row['crane']).strip()
-                by_device = str(row['byDevice']).strip()
+        # Process each row
+        for index, row in df.iterrows():
+            if pd.notna(row['byDevice']) and str(row['byDevice']).strip() != '':
+                try:
+                    # Format date
+                    date_str = pd.to_datetime(row['date']).strftime('%Y-%m-%d')
+                    crane_id = str(row['crane']).strip()
+                    by_device = str(row['byDevice']).strip()
                 
-                # Update record
-                cursor.execute("""
-                    UPDATE failure_records 
-                    SET by_device = %s 
-                    WHERE date = %s AND crane_id = %s
-                """, (by_device, date_str, crane_id))
+                    # Update record
+                    cursor.execute("""
+                        UPDATE failure_records 
+                        SET by_device = %s 
+                        WHERE date = %s AND crane_id = %s
+                    """, (by_device, date_str, crane_id))
                 
-                if cursor.rowcount > 0:
-                    updated_count += 1
+                    if cursor.rowcount > 0:
+                        updated_count += 1
+                        changed_cranes.add(crane_id)
                     
-            except Exception as e:
-                print(f"Error updating row {index}: {e}")
-                continue
-    
-    # Commit changes
-    conn.commit()
-    cursor.close()
-    conn.close()
+                except Exception as e:
+                    print(f"Error updating row {index}: {e}")
+                    continue
+        
+        # Commit changes
+        notify_change(conn, 'failure_records', crane_ids=changed_cranes, job='update_by_device')
+        conn.commit()
     
     print(f"Successfully updated {updated_count} records with byDevice data")
     
     # Show updated distribution
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
-    cursor = conn.cursor()
     cursor.execute("""
         SELECT by_device, COUNT(*) as count
         FROM failure_records 
@@ -64,7 +69,7 @@ def update_by_device_data():
         print(f"{device}: {count}")
     
     cursor.close()
-    conn.close()
+    release_db(conn)
 
 if __name__ == "__main__":
     update_by_device_data()
\ No newline at end of file
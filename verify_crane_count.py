@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import pandas as pd
-import psycopg2
-import os
+
+from db_access import fetch_column
+from db_connection import connect_db, release_db
 
 def verify_crane_count():
     excel_file = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
@@ -33,13 +34,9 @@ def verify_crane_count():
         print("엑셀 파일에 중복 없음")
     
     # Connect to DB and check
-    conn = psycopg2.connect(
-        host=os.getenv('PGHOST'),
-        database=os.getenv('PGDATABASE'),
-        user=os.getenv('PGUSER'),
-        password=os.getenv('PGPASSWORD'),
-        port=os.getenv('PGPORT')
-    )
+    conn = connect_db()
+    if not conn:
+        return
     cursor = conn.cursor()
     
     cursor.execute("SELECT COUNT(*) FROM cranes")
@@ -52,11 +49,8 @@ def verify_crane_count():
     print(f"DB의 공장 수: {factory_count}개")
     
     # Find extra cranes in DB
-    cursor.execute("SELECT crane_id FROM cranes")
-    db_cranes = [row[0] for row in cursor.fetchall()]
-    
+    db_set = fetch_column(conn, "SELECT crane_id FROM cranes")
     excel_set = set(valid_excel_cranes)
-    db_set = set(db_cranes)
     
     extra_in_db = db_set - excel_set
     missing_in_db = excel_set - db_set
@@ -65,7 +59,7 @@ def verify_crane_count():
     print(f"DB에 없는 크레인 ({len(missing_in_db)}개): {list(missing_in_db)}")
     
     cursor.close()
-    conn.close()
+    release_db(conn)
 
 if __name__ == "__main__":
     verify_crane_count()
\ No newline at end of file
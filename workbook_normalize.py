@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Vectorized conversion of the crane workbook sheets into database-shaped rows.
+
+Column mapping follows the rest of the pipeline: crane_id is EquipmentCode,
+failure description/failure_type/by_device come from symptom/type/byDevice,
+and a repair's date is its actualStartDateTime.
+
+Given a provenance dict, normalize_workbook() also tags every row with where
+it came from (PROVENANCE_COLUMNS): the workbook's content hash, the sheet, the
+row number as Excel shows it, and the import batch that wrote it.
+"""
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+SHEETS = ('CraneList', 'FailureReport', 'RepairReport')
+LEAD_TIME_COLUMN = 'LeadTime\n(Days)'
+# Naive timestamps in the workbook and the database are plant-local time
+PLANT_TIMEZONE = 'Asia/Seoul'
+EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+TIME_WITH_OFFSET = r'\d:\d{2}(?::\d{2}(?:\.\d+)?)?\s*(?:Z|[+-]\d{2}(?::?\d{2})?)$'
+
+CRANE_COLUMNS = [
+    'crane_id', 'crane_name', 'plant_section', 'status', 'location', 'model', 'grade', 'drive_type',
+    'unmanned_operation', 'electrical_manager', 'mechanical_manager', 'installation_date',
+    'inspection_reference_date', 'inspection_cycle', 'lead_time',
+]
+FAILURE_COLUMNS = [
+    'crane_id', 'date', 'failure_type', 'description', 'severity', 'downtime', 'cause', 'worktime', 'by_device',
+]
+# Appended to every table when normalize_workbook() is given a provenance dict
+PROVENANCE_COLUMNS = ['source_file', 'source_sheet', 'source_row', 'import_batch']
+# Sheet each table is loaded from
+TABLE_SHEETS = {'cranes': 'CraneList', 'failure_records': 'FailureReport', 'maintenance_records': 'RepairReport'}
+MAINTENANCE_COLUMNS = [
+    'crane_id', 'date', 'type', 'technician', 'status', 'work_order', 'task_name', 'actual_start_date_time',
+    'actual_end_date_time', 'total_workers', 'total_work_time', 'area_name', 'equipment_name',
+]
+
+
+def read_workbook(path):
+    """Read the three sheets from an .xlsx file, or from <sheet>.csv files in a directory"""
+    if os.path.isdir(path):
+        return {sheet: pd.read_csv(os.path.join(path, f'{sheet}.csv')) for sheet in SHEETS}
+    return pd.read_excel(path, sheet_name=list(SHEETS))
+
+
+def file_hash(path):
+    """Short SHA-256 of the workbook's content (of every sheet CSV, in order, for a directory)"""
+    digest = hashlib.sha256()
+    paths = [os.path.join(path, f'{sheet}.csv') for sheet in SHEETS] if os.path.isdir(path) else [path]
+    for file_path in paths:
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def sheet_rows(df):
+    """Row number of each record as the spreadsheet shows it (the header is row 1)"""
+    return pd.Series(np.arange(len(df)) + 2, index=df.index, dtype='Int64')
+
+
+def clean_text(values):
+    """Strip whitespace; blanks and 'nan' become missing"""
+    text = pd.Series(values, dtype='object').astype('string').str.strip()
+    return text.mask(text.isin(['', 'nan', 'NaN', 'None']))
+
+
+def parse_datetimes(values):
+    """Parse the mixed date formats found in the workbook and the old text columns.
+
+    Besides ISO strings this accepts '2024.01.31', '2024. 1. 31.', '2024/01/31',
+    '20240131', '2024년 1월 31일', Excel serial day numbers and timestamps carrying a UTC
+    offset (converted to plant time). Returns naive plant-local timestamps,
+    NaT where a value cannot be parsed.
+    """
+    series = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is not None:
+            series = series.dt.tz_convert(PLANT_TIMEZONE).dt.tz_localize(None)
+        return series
+
+    text = clean_text(series)
+    text = text.str.replace(r'^(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일?', r'\1-\2-\3', regex=True)
+    text = text.str.replace(r'^(\d{4})\s*[./]\s*(\d{1,2})\s*[./]\s*(\d{1,2})\.?', r'\1-\2-\3', regex=True)
+    text = text.str.replace(r'^(\d{4})(\d{2})(\d{2})$', r'\1-\2-\3', regex=True)
+
+    serial = text.str.fullmatch(r'\d{5}(?:\.\d+)?').fillna(False).astype(bool)
+    offset = text.str.contains(TIME_WITH_OFFSET, regex=True).fillna(False).astype(bool)
+    plain = text.notna() & ~serial & ~offset
+
+    parsed = pd.to_datetime(text.where(plain), errors='coerce', format='mixed')
+    if offset.any():
+        aware = pd.to_datetime(text[offset], errors='coerce', format='mixed', utc=True)
+        parsed[offset] = aware.dt.tz_convert(PLANT_TIMEZONE).dt.tz_localize(None)
+    if serial.any():
+        parsed[serial] = EXCEL_EPOCH + pd.to_timedelta(pd.to_numeric(text[serial]).astype(float), unit='D')
+    return parsed
+
+
+def format_date(values):
+    return parse_datetimes(values).dt.strftime('%Y-%m-%d').astype('string')
+
+
+def format_timestamp(values):
+    return parse_datetimes(values).dt.strftime('%Y-%m-%d %H:%M:%S').astype('string')
+
+
+def parse_inspection_cycle(values):
+    """Convert InspectionCycle labels such as '4주(28일)', '2주' or 14 into days"""
+    labels = pd.Series(values, dtype='object').astype('string').str.strip()
+    days = pd.to_numeric(labels.str.extract(r'(\d+)\s*일', expand=False), errors='coerce')
+    weeks = pd.to_numeric(labels.str.extract(r'(\d+)\s*주', expand=False), errors='coerce')
+    plain = pd.to_numeric(labels, errors='coerce')
+    return days.fillna(weeks * 7).fillna(plain).round().astype('Int64')
+
+
+def parse_work_time(values):
+    """Convert totalWorkTime values ('16:00', '9:30', or plain numbers) into hours"""
+    text = pd.Series(values, dtype='object').astype('string').str.strip()
+    parts = text.str.extract(r'^(\d+):(\d{1,2})')
+    hours = pd.to_numeric(parts[0], errors='coerce') + pd.to_numeric(parts[1], errors='coerce') / 60
+    return hours.fillna(pd.to_numeric(text, errors='coerce')).astype('Float64')
+
+
+def normalize_crane_list(df):
+    cranes = pd.DataFrame({
+        'crane_id': clean_text(df['EquipmentCode']),
+        'crane_name': clean_text(df.get('CraneName')),
+        'plant_section': clean_text(df.get('Plant/Secsion')),
+        'status': 'operating',
+        'location': clean_text(df.get('InstallationLocation')).fillna(''),
+        'model': clean_text(df.get('HoistingDevice')).fillna(''),
+        'grade': clean_text(df.get('Grade')),
+        'drive_type': clean_text(df.get('DriveType')),
+        'unmanned_operation': clean_text(df.get('UnmannedOperation')),
+        'electrical_manager': clean_text(df.get('electricalManager')),
+        'mechanical_manager': clean_text(df.get('mechanicalManager')),
+        'installation_date': format_date(df.get('InstallationDate')),
+        'inspection_reference_date': format_date(df.get('InspectionReferenceDate')),
+        'inspection_cycle': parse_inspection_cycle(df.get('InspectionCycle')),
+        'lead_time': pd.to_numeric(df.get(LEAD_TIME_COLUMN), errors='coerce').round().astype('Int64'),
+        'source_row': sheet_rows(df),
+    })
+    cranes = cranes[cranes['crane_id'].notna()]
+    return cranes.drop_duplicates(subset='crane_id', keep='first').reset_index(drop=True)[CRANE_COLUMNS + ['source_row']]
+
+
+def normalize_failure_report(df):
+    worktime = pd.to_numeric(df.get('worktime'), errors='coerce').round(2)
+    failures = pd.DataFrame({
+        'crane_id': clean_text(df['EquipmentCode']),
+        'date': format_date(df['date']),
+        'failure_type': clean_text(df.get('type')).fillna('기타'),
+        'description': clean_text(df.get('symptom')).fillna('고장 발생'),
+        'severity': 'medium',
+        'downtime': np.ceil(worktime).astype('Int64'),
+        'cause': clean_text(df.get('failureDetails')),
+        'worktime': worktime.astype('Float64'),
+        'by_device': clean_text(df.get('byDevice')),
+        'source_row': sheet_rows(df),
+    })
+    failures = failures[failures['crane_id'].notna() & failures['date'].notna()]
+    return failures.reset_index(drop=True)[FAILURE_COLUMNS + ['source_row']]
+
+
+def normalize_repair_report(df):
+    start = format_timestamp(df.get('actualStartDateTime'))
+    repairs = pd.DataFrame({
+        'crane_id': clean_text(df['EquipmentCode']),
+        'date': start.str.slice(0, 10),
+        'type': 'repair',
+        'technician': '정비팀',
+        'status': 'completed',
+        'work_order': clean_text(df.get('workOrder')),
+        'task_name': clean_text(df.get('taskName')),
+        'actual_start_date_time': start,
+        'actual_end_date_time': format_timestamp(df.get('actualEndDateTime')),
+        'total_workers': pd.to_numeric(df.get('totalWorkers'), errors='coerce').round().astype('Int64'),
+        'total_work_time': parse_work_time(df.get('totalWorkTime')),
+        'area_name': clean_text(df.get('areaName')),
+        'equipment_name': clean_text(df.get('EquipmentName')),
+        'source_row': sheet_rows(df),
+    })
+    repairs = repairs[repairs['crane_id'].notna() & repairs['date'].notna()]
+    return repairs.reset_index(drop=True)[MAINTENANCE_COLUMNS + ['source_row']]
+
+
+def normalize_workbook(sheets, provenance=None):
+    """Map the workbook sheets onto the cranes / failure_records / maintenance_records tables.
+
+    provenance is {'source_file': file_hash(path), 'import_batch': ...}; with it
+    each table also gets PROVENANCE_COLUMNS, without it just the table columns.
+    """
+    tables = {
+        'cranes': normalize_crane_list(sheets['CraneList']),
+        'failure_records': normalize_failure_report(sheets['FailureReport']),
+        'maintenance_records': normalize_repair_report(sheets['RepairReport']),
+    }
+    for table, df in tables.items():
+        if provenance is None:
+            tables[table] = df.drop(columns='source_row')
+        else:
+            tables[table] = df.assign(source_file=provenance['source_file'], source_sheet=TABLE_SHEETS[table],
+                                      import_batch=provenance['import_batch'])[list(df.columns[:-1]) + PROVENANCE_COLUMNS]
+    return tables
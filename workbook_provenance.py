@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Where each imported row came from.
+
+    provenance = workbook_provenance(path)   # {'source_file': ..., 'import_batch': ...}
+    ensure_provenance(conn)                  # before the first load that writes the columns
+
+cranes, failure_records and maintenance_records carry source_file (short
+content hash of the workbook), source_sheet, source_row (as Excel numbers
+it, header = 1) and import_batch. Every workbook loader writes them;
+workbook_reimport.py uses them to re-import a sheet, row range or plant
+section in place.
+"""
+from datetime import datetime
+
+from workbook_normalize import PROVENANCE_COLUMNS, file_hash
+
+PROVENANCE_TYPES = {'source_file': 'TEXT', 'source_sheet': 'TEXT', 'source_row': 'INTEGER', 'import_batch': 'TEXT'}
+PROVENANCE_TABLES = ('cranes', 'failure_records', 'maintenance_records')
+HISTORY_TABLES = ('failure_records', 'maintenance_records')
+
+
+def workbook_provenance(path):
+    """Provenance shared by every row of one load of the workbook at path"""
+    return {'source_file': file_hash(path), 'import_batch': datetime.now().strftime('%Y%m%dT%H%M%S')}
+
+
+def sheet_row(index):
+    """Excel row number of a record read with the default RangeIndex (the header is row 1)"""
+    return int(index) + 2
+
+
+def ensure_provenance(conn):
+    """Add the provenance columns (and the history tables' source index) where they are missing"""
+    cursor = conn.cursor()
+    try:
+        for table in PROVENANCE_TABLES:
+            cursor.execute("""
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = %s
+            """, (table,))
+            existing = {row[0] for row in cursor.fetchall()}
+            missing = [column for column in PROVENANCE_COLUMNS if column not in existing]
+            # Checked first: ALTER TABLE takes an exclusive lock even when there is nothing to add
+            if missing:
+                cursor.execute(f"ALTER TABLE {table} " + ', '.join(
+                    f"ADD COLUMN {column} {PROVENANCE_TYPES[column]}" for column in missing))
+            if table in HISTORY_TABLES:
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {table}_source_idx ON {table} (source_sheet, source_row)")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Re-import part of the workbook: a sheet, a row range or a plant section.
+
+    python workbook_reimport.py --sheet FailureReport --rows 120-180     # fix a few rows
+    python workbook_reimport.py --plant-section 4후판 --sheet RepairReport
+    python workbook_reimport.py --replace-untagged                      # whole workbook, adopting old rows
+
+Every row this writes carries its provenance: source_file (content hash of
+the workbook), source_sheet, source_row (as Excel numbers it, header = 1)
+and import_batch. A re-import matches workbook rows to records by sheet and
+row inside the requested scope and then only
+  - updates records whose values changed (ids stay, so related_failure_id holds),
+  - inserts rows that have no record yet,
+  - deletes records of the scope whose row is gone or no longer valid.
+Cranes are upserted by crane_id and never deleted; their status is left to
+the app. The search index and the timelines of the touched cranes are
+refreshed afterwards, and the server gets one change event per table.
+
+Row numbers identify records only while the sheet keeps its row order:
+after inserting or deleting rows in the middle of a sheet, re-import the
+whole sheet. Records without provenance (loaded before the loaders wrote
+it, or entered in the app) are never matched; while a scope contains any,
+the re-import stops rather than duplicate them unless --replace-untagged is
+given for a whole sheet.
+"""
+import argparse
+import os
+import sys
+
+from crane_timeline import refresh_timelines
+from db_connection import connect_db, release_db
+from etl_events import notify_change
+from etl_locks import etl_locks
+from fleet_digest import refresh_digests
+from history_partitions import copy_frame, ensure_partitions
+from history_search_index import refresh_search_index
+from workbook_normalize import (CRANE_COLUMNS, FAILURE_COLUMNS, MAINTENANCE_COLUMNS, PROVENANCE_COLUMNS,
+                                SHEETS, TABLE_SHEETS, normalize_workbook, read_workbook)
+from workbook_provenance import ensure_provenance, workbook_provenance
+
+EXCEL_FILE = 'attached_assets/DB용 크레인 데이터_1749738215644.xlsx'
+
+HISTORY_COLUMNS = {'failure_records': FAILURE_COLUMNS, 'maintenance_records': MAINTENANCE_COLUMNS}
+SHEET_TABLES = {sheet: table for table, sheet in TABLE_SHEETS.items()}
+
+# Workbook rows are matched to records of the scope by (source_sheet, source_row)
+SCOPE_SQL = """
+    (t.source_sheet = %(sheet)s OR (%(untagged)s AND t.source_sheet IS NULL))
+    AND (%(all_rows)s OR t.source_row BETWEEN %(first_row)s AND %(last_row)s)
+    AND (%(all_cranes)s OR t.crane_id = ANY(%(crane_ids)s))
+"""
+
+
+def parse_rows(value):
+    """'120-180' or '57' -> (first, last) sheet rows"""
+    first, _, last = value.partition('-')
+    first, last = int(first), int(last or first)
+    if first < 2 or last < first:
+        raise argparse.ArgumentTypeError(f"bad row range {value!r}; data starts at row 2")
+    return first, last
+
+
+def select_rows(df, rows=None, crane_ids=None):
+    if rows:
+        df = df[df['source_row'].between(*rows)]
+    if crane_ids is not None:
+        df = df[df['crane_id'].isin(crane_ids)]
+    return df
+
+
+def section_cranes(conn, cranes, plant_section):
+    """Cranes of a plant section, by the workbook or by the database (a crane may be moving between them)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT crane_id FROM cranes WHERE plant_section = %s", (plant_section,))
+        in_db = {row[0] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+    return sorted(in_db | set(cranes.loc[cranes['plant_section'] == plant_section, 'crane_id']))
+
+
+def stage(cursor, table, df, columns):
+    """COPY the selected rows into a temporary table shaped like `table`; it goes away at commit"""
+    cursor.execute(f"""
+        CREATE TEMP TABLE reimport_stage ON COMMIT DROP AS
+        SELECT {', '.join(columns)} FROM {table} WITH NO DATA
+    """)
+    copy_frame(cursor, 'reimport_stage', df[columns])
+
+
+def reimport_history(conn, table, df, rows=None, crane_ids=None, replace_untagged=False):
+    """Bring the scoped records of one history table in line with df; returns (crane_ids, dates) touched"""
+    values = HISTORY_COLUMNS[table]
+    columns = values + PROVENANCE_COLUMNS
+    params = {
+        'sheet': TABLE_SHEETS[table],
+        'untagged': replace_untagged,
+        'all_rows': rows is None,
+        'first_row': rows[0] if rows else None,
+        'last_row': rows[1] if rows else None,
+        'all_cranes': crane_ids is None,
+        'crane_ids': crane_ids or [],
+    }
+    touched = []
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            SELECT count(*) FROM {table} t
+            WHERE t.source_sheet IS NULL AND (%(all_cranes)s OR t.crane_id = ANY(%(crane_ids)s))
+        """, params)
+        untagged = cursor.fetchone()[0]
+        if untagged and not replace_untagged:
+            raise RuntimeError(f"{table}: {untagged} records in scope have no provenance and would be duplicated; "
+                               f"re-import the whole {TABLE_SHEETS[table]} sheet with --replace-untagged first")
+
+        stage(cursor, table, df, columns)
+
+        cursor.execute(f"""
+            DELETE FROM {table} t
+            WHERE {SCOPE_SQL}
+              AND NOT EXISTS (SELECT 1 FROM reimport_stage s
+                              WHERE s.source_sheet = t.source_sheet AND s.source_row = t.source_row)
+            RETURNING t.crane_id, t.date
+        """, params)
+        touched += cursor.fetchall()
+        deleted = cursor.rowcount
+
+        # Before-images come from the CTE: the crane or date of a row may be what changed
+        cursor.execute(f"""
+            WITH changed AS (
+                SELECT t.id, t.date, t.crane_id
+                FROM {table} t
+                JOIN reimport_stage s ON s.source_sheet = t.source_sheet AND s.source_row = t.source_row
+                WHERE {SCOPE_SQL}
+                  AND ({', '.join(f't.{c}' for c in values)}) IS DISTINCT FROM ({', '.join(f's.{c}' for c in values)})
+            )
+            UPDATE {table} t
+            SET ({', '.join(values)}, source_file, import_batch) =
+                ({', '.join(f's.{c}' for c in values)}, s.source_file, s.import_batch)
+            FROM changed c, reimport_stage s
+            WHERE t.id = c.id AND t.date = c.date
+              AND s.source_sheet = t.source_sheet AND s.source_row = t.source_row
+            RETURNING c.crane_id, c.date, t.crane_id, t.date
+        """, params)
+        for old_crane_id, old_date, crane_id, new_date in cursor.fetchall():
+            touched += [(old_crane_id, old_date), (crane_id, new_date)]
+        updated = cursor.rowcount
+
+        cursor.execute(f"""
+            INSERT INTO {table} ({', '.join(columns)})
+            SELECT {', '.join(f's.{c}' for c in columns)} FROM reimport_stage s
+            WHERE NOT EXISTS (SELECT 1 FROM {table} t
+                              WHERE t.source_sheet = s.source_sheet AND t.source_row = s.source_row
+                                AND {SCOPE_SQL})
+            RETURNING crane_id, date
+        """, params)
+        touched += cursor.fetchall()
+        inserted = cursor.rowcount
+
+        if touched:
+            notify_change(conn, table, crane_ids={c for c, _ in touched}, months=[d for _, d in touched],
+                          job='workbook_reimport')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    print(f"  {table}: {updated} updated, {inserted} inserted, {deleted} deleted, "
+          f"{len(df) - updated - inserted} unchanged")
+    return {c for c, _ in touched}, [d for _, d in touched]
+
+
+def reimport_cranes(conn, df):
+    """Upsert CraneList rows by crane_id, rewriting only cranes whose values changed; returns their ids"""
+    values = [c for c in CRANE_COLUMNS if c not in ('crane_id', 'status')]
+    columns = CRANE_COLUMNS + PROVENANCE_COLUMNS
+    cursor = conn.cursor()
+    try:
+        stage(cursor, 'cranes', df, columns)
+        cursor.execute(f"""
+            INSERT INTO cranes AS t ({', '.join(columns)})
+            SELECT {', '.join(columns)} FROM reimport_stage
+            ON CONFLICT (crane_id) DO UPDATE
+            SET ({', '.join(values + PROVENANCE_COLUMNS)}) =
+                ({', '.join(f'EXCLUDED.{c}' for c in values + PROVENANCE_COLUMNS)})
+            WHERE ({', '.join(f't.{c}' for c in values)}) IS DISTINCT FROM ({', '.join(f'EXCLUDED.{c}' for c in values)})
+            RETURNING t.crane_id, t.plant_section
+        """)
+        changed = cursor.fetchall()
+        if changed:
+            notify_change(conn, 'cranes', plant_sections={s for _, s in changed}, crane_ids={c for c, _ in changed},
+                          job='workbook_reimport')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    print(f"  cranes: {len(changed)} inserted or updated, {len(df) - len(changed)} unchanged")
+    return {crane_id for crane_id, _ in changed}
+
+
+def reimport(conn, path, sheets=SHEETS, rows=None, plant_section=None, replace_untagged=False):
+    """Re-import the given sheets of the workbook, limited to a row range and/or a plant section"""
+    if replace_untagged and rows:
+        raise ValueError("--replace-untagged re-imports whole sheets; drop --rows")
+    provenance = workbook_provenance(path)
+    tables = normalize_workbook(read_workbook(path), provenance)
+    print(f"Batch {provenance['import_batch']} from {os.path.basename(path)} ({provenance['source_file']})")
+
+    ensure_provenance(conn)
+    crane_ids = section_cranes(conn, tables['cranes'], plant_section) if plant_section else None
+
+    touched = set()
+    for sheet in sheets:
+        table = SHEET_TABLES[sheet]
+        if table == 'cranes':
+            df = select_rows(tables['cranes'], rows)
+            if plant_section:
+                df = df[df['plant_section'] == plant_section]
+            with etl_locks(conn, f"cranes/plant={plant_section}" if plant_section else 'cranes',
+                           job='workbook_reimport'):
+                touched |= reimport_cranes(conn, df)
+            continue
+        df = select_rows(tables[table], rows, crane_ids)
+        ensure_partitions(conn, table, df['date'])
+        with etl_locks(conn, table, job='workbook_reimport'):
+            crane_ids_touched, _ = reimport_history(conn, table, df, rows, crane_ids, replace_untagged)
+        touched |= crane_ids_touched
+
+    if touched:
+        refresh_search_index(conn, touched)
+        refresh_timelines(conn, touched)
+        refresh_digests(conn)
+    return touched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-import a sheet, row range or plant section of the workbook')
+    parser.add_argument('--excel', default=EXCEL_FILE, help='.xlsx file, or a directory of <sheet>.csv files')
+    parser.add_argument('--sheet', action='append', choices=SHEETS, help='only this sheet (repeatable; default all)')
+    parser.add_argument('--rows', type=parse_rows, help='sheet rows A-B as Excel numbers them (header is row 1)')
+    parser.add_argument('--plant-section', help="only this plant section's cranes and their history")
+    parser.add_argument('--replace-untagged', action='store_true',
+                        help='replace records without provenance in the scope (whole sheets only)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.excel):
+        print(f"Excel file not found: {args.excel}")
+        sys.exit(1)
+
+    conn = connect_db()
+    if not conn:
+        sys.exit(1)
+    try:
+        touched = reimport(conn, args.excel, args.sheet or SHEETS, args.rows, args.plant_section,
+                           args.replace_untagged)
+        print(f"Re-import done: {len(touched)} cranes touched")
+    except (RuntimeError, ValueError) as e:
+        print(f"Re-import stopped: {e}")
+        sys.exit(1)
+    finally:
+        release_db(conn)
+
+
+if __name__ == "__main__":
+    main()